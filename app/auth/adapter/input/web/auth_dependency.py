@@ -1,7 +1,12 @@
-from fastapi import Header, Cookie, HTTPException, status
+from fastapi import Header, Cookie, HTTPException, Depends, status
+from sqlalchemy.orm import Session as DbSession
 
+from app.auth.infrastructure.cache.session_cache import get_session_cache
+from app.auth.infrastructure.repository.cached_session_repository import CachedSessionRepository
 from app.auth.infrastructure.repository.mysql_session_repository import MySqlSessionRepository
-from config.database import get_db_session
+from app.shared.tracing.tracer import span
+from config.database import get_db
+from config.settings import get_settings
 
 from app.auth.application.port.session_repository_port import SessionRepositoryPort
 
@@ -18,6 +23,7 @@ def set_session_repository(repo: SessionRepositoryPort) -> None:
 def get_current_user_id(
     authorization: str | None = Header(default=None),
     session_id_cookie: str | None = Cookie(default=None, alias="session_id"),
+    db: DbSession = Depends(get_db),
 ) -> str:
     """
     현재 요청의 user_id를 반환하는 의존성.
@@ -48,18 +54,21 @@ def get_current_user_id(
         )
 
     # 세션 저장소 검증
-    # 세션 저장소 준비 (주입된 fake/테스트 우선)
+    # 세션 저장소 준비 (주입된 fake/테스트 우선, 없으면 캐시 + 요청 단위 DB 세션 사용)
     repo = _session_repository
-    created_db = None
     if repo is None:
-        created_db = get_db_session()
-        repo = MySqlSessionRepository(created_db)
+        repo = CachedSessionRepository(
+            MySqlSessionRepository(db),
+            get_session_cache(),
+            negative_ttl_seconds=get_settings().AUTH_CACHE_NEGATIVE_TTL_SECONDS,
+        )
 
-    try:
+    with span("auth.session"):
         session = repo.find_by_session_id(session_id)
-    finally:
-        if created_db:
-            created_db.close()
+    if repo is not _session_repository:
+        # 조회가 끝났으면 커넥션을 풀에 돌려준다 (세션은 이후 쿼리에서 다시 커넥션을 받는다).
+        # 커넥션을 쥔 채 스레드풀 차례를 기다리면 동시 요청이 많을 때 풀과 스레드가 서로를 기다린다.
+        db.close()
 
     if not session:
         raise HTTPException(
@@ -4,6 +4,8 @@ from fastapi import APIRouter, Cookie, Request, Depends
 from fastapi.responses import RedirectResponse, JSONResponse
 from sqlalchemy.orm import Session as DbSession
 
+from app.auth.adapter.input.web.auth_dependency import get_current_user_id
+from app.auth.infrastructure.cache.session_cache import get_session_cache
 from app.auth.infrastructure.oauth.google_oauth_service import GoogleOAuthService
 from app.auth.infrastructure.repository.mysql_session_repository import (
     MySqlSessionRepository,
@@ -111,4 +113,10 @@ async def logout(session_id: str | None = Cookie(None), db: DbSession = Depends(
 
     response = JSONResponse(status_code=204, content=None)
     response.delete_cookie("session_id")
-    return response
\ No newline at end of file
+    return response
+
+
+@google_oauth_router.get("/session-cache/stats", dependencies=[Depends(get_current_user_id)])
+async def session_cache_stats():
+    """인증 세션 캐시 hit/miss 통계 (현재 워커 프로세스 기준, 로그인한 사용자만)"""
+    return get_session_cache().stats()
@@ -1,14 +1,24 @@
+from datetime import datetime
+
+
 class Session:
     """세션 정보를 담는 도메인 객체"""
 
-    def __init__(self, session_id: str, user_id: str):
+    def __init__(self, session_id: str, user_id: str, expires_at: datetime | None = None):
         self._validate(session_id, user_id)
         self.session_id = session_id
         self.user_id = user_id
+        self.expires_at = expires_at
 
     def _validate(self, session_id: str, user_id: str) -> None:
         """Session 값의 유효성을 검증한다"""
         if not session_id:
             raise ValueError("session_id는 비어있을 수 없습니다")
         if not user_id:
-            raise ValueError("user_id는 비어있을 수 없습니다")
\ No newline at end of file
+            raise ValueError("user_id는 비어있을 수 없습니다")
+
+    def is_expired(self, now: datetime | None = None) -> bool:
+        """만료 시각이 지났는지 반환한다 (만료 시각이 없으면 만료되지 않음)"""
+        if self.expires_at is None:
+            return False
+        return self.expires_at < (now or datetime.now())
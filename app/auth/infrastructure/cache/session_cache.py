@@ -0,0 +1,18 @@
+from functools import lru_cache
+
+from app.shared.cache.lru_ttl_cache import LRUTTLCache
+from config.settings import get_settings
+
+
+@lru_cache()
+def get_session_cache() -> LRUTTLCache:
+    """프로세스 전역 인증 세션 캐시 (session_id -> Session | None)
+
+    uvicorn 워커마다 따로 존재하므로, 다른 워커에서의 로그아웃은
+    AUTH_CACHE_TTL_SECONDS 안에 반영된다.
+    """
+    settings = get_settings()
+    return LRUTTLCache(
+        max_size=settings.AUTH_CACHE_MAX_SIZE,
+        ttl_seconds=settings.AUTH_CACHE_TTL_SECONDS,
+    )
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+from app.auth.application.port.session_repository_port import SessionRepositoryPort
+from app.auth.domain.session import Session
+from app.shared.cache.lru_ttl_cache import LRUTTLCache, MISSING
+
+
+class CachedSessionRepository(SessionRepositoryPort):
+    """세션 조회 결과를 LRU+TTL 캐시에 보관하는 저장소 데코레이터
+
+    - 유효한 세션은 캐시 TTL과 세션 만료 시각 중 이른 시점까지 캐시한다.
+    - 존재하지 않는 토큰(None)도 negative_ttl_seconds 동안 캐시한다.
+    - save/delete 시 해당 session_id 항목을 즉시 무효화한다.
+    """
+
+    def __init__(
+        self,
+        inner: SessionRepositoryPort,
+        cache: LRUTTLCache,
+        negative_ttl_seconds: float = 10,
+    ):
+        self._inner = inner
+        self._cache = cache
+        self._negative_ttl = negative_ttl_seconds
+
+    def save(self, session: Session) -> None:
+        """세션을 저장한다"""
+        self._inner.save(session)
+        self._cache.delete(session.session_id)
+
+    def find_by_session_id(self, session_id: str) -> Session | None:
+        """session_id로 세션을 조회한다 (캐시 우선)"""
+        cached = self._cache.get(session_id)
+        if cached is not MISSING:
+            if cached is None or not cached.is_expired():
+                return cached
+            # 만료된 세션은 원본 저장소에서 정리하도록 위임
+            self._cache.delete(session_id)
+
+        session = self._inner.find_by_session_id(session_id)
+        if session is None:
+            self._cache.set(session_id, None, ttl_seconds=self._negative_ttl)
+        else:
+            self._cache.set(session_id, session, ttl_seconds=self._positive_ttl(session))
+        return session
+
+    def delete(self, session_id: str) -> None:
+        """세션을 삭제한다"""
+        self._inner.delete(session_id)
+        self._cache.delete(session_id)
+
+    def _positive_ttl(self, session: Session) -> float:
+        """세션 만료 시각을 넘지 않는 캐시 TTL"""
+        if session.expires_at is None:
+            return self._cache.ttl_seconds
+        remaining = (session.expires_at - datetime.now()).total_seconds()
+        return min(self._cache.ttl_seconds, remaining)
@@ -4,18 +4,31 @@ from sqlalchemy.orm import Session as DbSession
 
 from app.auth.application.port.session_repository_port import SessionRepositoryPort
 from app.auth.domain.session import Session
+from app.auth.infrastructure.cache.session_cache import get_session_cache
+from app.shared.cache.lru_ttl_cache import LRUTTLCache
 from app.user.infrastructure.model.user_model import UserModel
+from app.shared.tracing.tracer import traced
 
 
 class MySqlSessionRepository(SessionRepositoryPort):
-    """MySQL 기반 세션 저장소 (User 테이블 사용)"""
+    """MySQL 기반 세션 저장소 (User 테이블 사용)
+
+    세션이 바뀌거나 삭제되면 인증 세션 캐시의 해당 항목을 즉시 무효화한다.
+    """
 
     DEFAULT_TTL_SECONDS = 60 * 60 * 6  # 6시간
 
-    def __init__(self, db_session: DbSession, ttl_seconds: int | None = None):
+    def __init__(
+        self,
+        db_session: DbSession,
+        ttl_seconds: int | None = None,
+        cache: LRUTTLCache | None = None,
+    ):
         self._db = db_session
         self._ttl = ttl_seconds if ttl_seconds is not None else self.DEFAULT_TTL_SECONDS
+        self._cache = cache if cache is not None else get_session_cache()
 
+    @traced("db.auth_session.save")
     def save(self, session: Session) -> None:
         """세션을 저장한다"""
         user = self._db.query(UserModel).filter(
@@ -23,10 +36,15 @@ class MySqlSessionRepository(SessionRepositoryPort):
         ).first()
 
         if user:
+            # 기존 세션 토큰은 더 이상 유효하지 않으므로 캐시에서 제거
+            if user.session_id:
+                self._cache.delete(user.session_id)
             user.session_id = session.session_id
             user.session_expires_at = datetime.now() + timedelta(seconds=self._ttl)
             self._db.commit()
+            self._cache.delete(session.session_id)
 
+    @traced("db.auth_session.find_by_session_id")
     def find_by_session_id(self, session_id: str) -> Session | None:
         """session_id로 세션을 조회한다"""
         user = self._db.query(UserModel).filter(
@@ -44,8 +62,10 @@ class MySqlSessionRepository(SessionRepositoryPort):
         return Session(
             session_id=user.session_id,
             user_id=user.id,
+            expires_at=user.session_expires_at,
         )
 
+    @traced("db.auth_session.delete")
     def delete(self, session_id: str) -> None:
         """세션을 삭제한다"""
         user = self._db.query(UserModel).filter(
@@ -55,4 +75,6 @@ class MySqlSessionRepository(SessionRepositoryPort):
         if user:
             user.session_id = None
             user.session_expires_at = None
-            self._db.commit()
\ No newline at end of file
+            self._db.commit()
+
+        self._cache.delete(session_id)
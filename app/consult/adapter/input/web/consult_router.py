@@ -1,29 +1,113 @@
-from fastapi import APIRouter, HTTPException, Depends, status
+import asyncio
+import json
+import logging
+
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy.orm import Session as DbSession
 
-from app.consult.application.use_case.start_consult_use_case import StartConsultUseCase
-from app.consult.application.use_case.send_message_use_case import SendMessageUseCase
+from app.consult.application.use_case.async_start_consult_use_case import AsyncStartConsultUseCase
+from app.consult.application.use_case.async_send_message_use_case import AsyncSendMessageUseCase
 from app.user.application.port.user_repository_port import UserRepositoryPort
 from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
+from app.consult.application.port.analysis_job_queue_port import AnalysisJobQueuePort
+from app.consult.application.port.analysis_job_repository_port import AnalysisJobRepositoryPort
 from app.consult.application.port.ai_counselor_port import AICounselorPort
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.infrastructure.repository.mysql_consult_repository import MySQLConsultRepository
+from app.consult.infrastructure.repository.mysql_analysis_job_repository import MySQLAnalysisJobRepository
+from app.consult.infrastructure.service.threaded_ai_counselor import ThreadedAICounselor
+from app.user.infrastructure.repository.mysql_user_repository import MySQLUserRepository
 from app.auth.adapter.input.web.auth_dependency import get_current_user_id
+from app.consult.domain.analysis import AnalysisDeferredError
 from app.consult.domain.message import Message
+from app.consult.domain.analysis_job import AnalysisJob
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.analysis_rerun_policy import AnalysisRerunPolicy
+from app.consult.domain.history_cursor import HistoryCursor
+from app.shared.llm.circuit_breaker import CircuitOpenError
+from app.shared.ratelimit.admission_dependency import require_admission
+from app.shared.sse.sse_encoder import DEFAULT_RETRY_MS, SSE_HEADERS, encode_sse_event
+from config.database import get_db
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
 
 consult_router = APIRouter()
 
-# Global repository instances (will be injected in tests)
+# Repository overrides (will be injected in tests).
+# None이면 요청마다 풀에서 DB 세션을 받아 저장소를 생성한다 (같은 요청 안에서는 세션 공유).
 _user_repository: UserRepositoryPort | None = None
 _consult_repository: ConsultRepositoryPort | None = None
-_ai_counselor: AICounselorPort | None = None
+_ai_counselor: AsyncAICounselorPort | AICounselorPort | None = None
+_analysis_job_repository: AnalysisJobRepositoryPort | None = None
+# 설정되면 5턴째 분석을 백그라운드 작업으로 처리한다 (None이면 요청 안에서 생성)
+_analysis_queue: AnalysisJobQueuePort | None = None
+
+# 분석 SSE 스트림에서 상태를 다시 확인하는 주기 (다른 워커 프로세스가 처리한 작업 대비)
+ANALYSIS_POLL_INTERVAL_SECONDS = 1.0
+
+# 히스토리 한 페이지 크기 (기본값, 최대값)
+HISTORY_DEFAULT_PAGE_SIZE = 20
+HISTORY_MAX_PAGE_SIZE = 100
+
+# 입장 제어: 요청 하나가 쓰는 추정 토큰 수 (시스템 프롬프트 + 대화 맥락 + 응답, 본문 길이는 따로 더한다)
+START_ESTIMATED_TOKENS = 300
+MESSAGE_ESTIMATED_TOKENS = 3500
+
+
+def _get_async_counselor() -> AsyncAICounselorPort:
+    """설정된 AI 상담사를 비동기 포트로 반환한다 (동기 구현체는 스레드로 감싼다)"""
+    if isinstance(_ai_counselor, AsyncAICounselorPort):
+        return _ai_counselor
+    return ThreadedAICounselor(_ai_counselor)
+
+
+def _counselor_unavailable(error: CircuitOpenError) -> HTTPException:
+    """업스트림 회로가 열려 있을 때의 503 응답"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="AI 상담사가 일시적으로 응답할 수 없습니다. 잠시 후 다시 시도해주세요",
+        headers={"Retry-After": str(int(error.retry_after))},
+    )
+
+
+def get_user_repository(db: DbSession = Depends(get_db)) -> UserRepositoryPort:
+    """요청 단위 User 저장소 (주입된 fake/테스트 우선)"""
+    if _user_repository is not None:
+        return _user_repository
+    return MySQLUserRepository(db)
+
+
+def get_consult_repository(db: DbSession = Depends(get_db)) -> ConsultRepositoryPort:
+    """요청 단위 Consult 저장소 (주입된 fake/테스트 우선)"""
+    if _consult_repository is not None:
+        return _consult_repository
+    return MySQLConsultRepository(db)
+
+
+def get_analysis_job_repository(db: DbSession = Depends(get_db)) -> AnalysisJobRepositoryPort:
+    """요청 단위 분석 작업 저장소 (주입된 fake/테스트 우선)"""
+    if _analysis_job_repository is not None:
+        return _analysis_job_repository
+    return MySQLAnalysisJobRepository(db)
 
 
 class SendMessageRequest(BaseModel):
     content: str
 
 
-@consult_router.post("/start")
-def start_consult(user_id: str = Depends(get_current_user_id)):
+@consult_router.post(
+    "/start",
+    dependencies=[Depends(require_admission("consult.start", base_tokens=START_ESTIMATED_TOKENS, subject=get_current_user_id))],
+)
+async def start_consult(
+    user_id: str = Depends(get_current_user_id),
+    user_repository: UserRepositoryPort = Depends(get_user_repository),
+    consult_repository: ConsultRepositoryPort = Depends(get_consult_repository),
+):
     """
     상담 세션을 시작한다.
 
@@ -32,15 +116,8 @@ def start_consult(user_id: str = Depends(get_current_user_id)):
     3. StartConsultUseCase 실행
     4. 세션 ID 반환
     """
-    print("hello")
     # User 조회
-    if not _user_repository:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="User repository가 설정되지 않았습니다",
-        )
-
-    user = _user_repository.find_by_id(user_id)
+    user = await run_in_threadpool(user_repository.find_by_id, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -55,29 +132,27 @@ def start_consult(user_id: str = Depends(get_current_user_id)):
         )
 
     # Use case 실행
-    if not _consult_repository:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Consult repository가 설정되지 않았습니다",
-        )
-
     if not _ai_counselor:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="AI counselor가 설정되지 않았습니다",
         )
 
-    use_case = StartConsultUseCase(_consult_repository, _ai_counselor)
-    result = use_case.execute(user_id=user_id, mbti=user.mbti, gender=user.gender)
+    use_case = AsyncStartConsultUseCase(consult_repository, _get_async_counselor())
+    result = await use_case.execute(user_id=user_id, mbti=user.mbti, gender=user.gender)
 
     return result
 
 
-@consult_router.post("/{session_id}/message")
-def send_message(
+@consult_router.post(
+    "/{session_id}/message",
+    dependencies=[Depends(require_admission("consult.message", base_tokens=MESSAGE_ESTIMATED_TOKENS, subject=get_current_user_id))],
+)
+async def send_message(
     session_id: str,
     request: SendMessageRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id),
+    consult_repository: ConsultRepositoryPort = Depends(get_consult_repository),
 ):
     """
     메시지를 전송하고 AI 응답을 받는다.
@@ -86,22 +161,25 @@ def send_message(
     2. 메시지 전송
     3. AI 응답 반환
     """
-    if not _consult_repository:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Consult repository가 설정되지 않았습니다",
-        )
-
     if not _ai_counselor:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="AI counselor가 설정되지 않았습니다",
         )
 
-    use_case = SendMessageUseCase(_consult_repository, _ai_counselor)
+    settings = get_settings()
+    use_case = AsyncSendMessageUseCase(
+        consult_repository,
+        _get_async_counselor(),
+        _analysis_queue,
+        analysis_policy=AnalysisRerunPolicy(
+            mode=settings.ANALYSIS_SPECULATION_MODE,
+            min_reply_chars=settings.ANALYSIS_RERUN_MIN_REPLY_CHARS,
+        ),
+    )
 
     try:
-        result = use_case.execute(
+        result = await use_case.execute(
             session_id=session_id,
             user_id=user_id,
             content=request.content
@@ -123,43 +201,64 @@ def send_message(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e),
         )
+    except CircuitOpenError as e:
+        raise _counselor_unavailable(e)
 
 
 @consult_router.get("/history")
-def get_history(user_id: str = Depends(get_current_user_id)):
+def get_history(
+    limit: int = Query(HISTORY_DEFAULT_PAGE_SIZE, ge=1, le=HISTORY_MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    user_id: str = Depends(get_current_user_id),
+    consult_repository: ConsultRepositoryPort = Depends(get_consult_repository),
+):
     """
-    완료된 상담 세션 히스토리를 조회한다.
+    완료된 상담 세션 히스토리를 한 페이지씩 조회한다.
+
+    목록에는 분석 요약만 담는다. 전체 분석 결과는 GET /consult/{session_id}/analysis로 조회한다.
+
+    Args:
+        limit: 페이지 크기
+        cursor: 직전 응답의 next_cursor (없으면 첫 페이지)
 
     Returns:
-        완료된 상담 세션 목록 (최신순)
+        완료된 상담 세션 요약 목록 (최신순)과 다음 페이지 커서 (마지막 페이지면 null)
     """
-    if not _consult_repository:
+    try:
+        after = HistoryCursor.decode(cursor) if cursor else None
+    except ValueError as e:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Consult repository가 설정되지 않았습니다",
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
         )
 
-    sessions = _consult_repository.find_completed_by_user_id(user_id)
+    summaries, next_cursor = consult_repository.find_completed_page(user_id, limit, after)
 
     return {
         "sessions": [
             {
-                "id": session.id,
-                "created_at": session.created_at.isoformat(),
-                "mbti": session.mbti.value,
-                "gender": session.gender.value,
-                "analysis": session.get_analysis(),
+                "id": summary.id,
+                "created_at": summary.created_at.isoformat(),
+                "mbti": summary.mbti.value,
+                "gender": summary.gender.value,
+                "summary": summary.summary,
             }
-            for session in sessions
-        ]
+            for summary in summaries
+        ],
+        "next_cursor": next_cursor.encode() if next_cursor else None,
     }
 
 
-@consult_router.post("/{session_id}/message/stream")
-def send_message_stream(
+@consult_router.post(
+    "/{session_id}/message/stream",
+    dependencies=[Depends(require_admission("consult.message", base_tokens=MESSAGE_ESTIMATED_TOKENS, subject=get_current_user_id))],
+)
+async def send_message_stream(
     session_id: str,
     request: SendMessageRequest,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = Depends(get_current_user_id),
+    consult_repository: ConsultRepositoryPort = Depends(get_consult_repository),
+    db: DbSession = Depends(get_db),
 ):
     """
     메시지를 전송하고 AI 응답을 SSE 스트리밍으로 받는다.
@@ -168,12 +267,6 @@ def send_message_stream(
     2. 메시지 저장
     3. AI 응답 스트리밍 반환
     """
-    if not _consult_repository:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Consult repository가 설정되지 않았습니다",
-        )
-
     if not _ai_counselor:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -181,7 +274,15 @@ def send_message_stream(
         )
 
     # 세션 조회 및 소유자 검증
-    session = _consult_repository.find_by_id(session_id)
+    # 조회와 같은 스레드 호출 안에서 커넥션을 풀에 반환한다 (스트리밍 동안 커넥션을 붙잡지 않도록,
+    # 마지막 저장 때 다시 받는다)
+    def load_session():
+        try:
+            return consult_repository.find_by_id(session_id)
+        finally:
+            db.close()
+
+    session = await run_in_threadpool(load_session)
     if not session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -201,24 +302,149 @@ def send_message_stream(
             detail="상담이 완료되었습니다. 추가 메시지를 보낼 수 없습니다.",
         )
 
-    # 사용자 메시지 저장
+    # 사용자 메시지 추가 (저장은 스트림이 끝날 때 AI 응답과 함께 한 번에)
     user_message = Message(role="user", content=request.content)
     session.add_message(user_message)
-    _consult_repository.save(session)
+
+    # 업스트림 회로가 열려 있으면 스트림을 시작하기 전에 503으로 답한다
+    try:
+        response_stream = _get_async_counselor().generate_response_stream(session, request.content)
+    except CircuitOpenError as e:
+        raise _counselor_unavailable(e)
 
     # SSE 스트리밍 생성
-    def event_generator():
-        full_response = ""
-        for chunk in _ai_counselor.generate_response_stream(session, request.content):
-            full_response += chunk
-            yield f"data: {chunk}\n\n"
+    async def event_generator():
+        chunks: list[str] = []
+        try:
+            async for chunk in response_stream:
+                if not chunk:
+                    continue
+                chunks.append(chunk)
+                event_id = len(chunks)
+                yield encode_sse_event(
+                    chunk,
+                    event_id=event_id,
+                    retry_ms=DEFAULT_RETRY_MS if event_id == 1 else None,
+                )
+        finally:
+            # 클라이언트가 중간에 끊어도 받은 만큼은 저장한다 (취소되어도 저장은 끝까지 진행)
+            if chunks:
+                session.add_message(Message(role="assistant", content="".join(chunks)))
+            await asyncio.shield(run_in_threadpool(consult_repository.save, session))
+            # 5턴째면 /message와 같이 분석을 시작한다 (GET /consult/{session_id}/analysis로 조회)
+            if session.is_completed():
+                await asyncio.shield(_start_analysis(session, consult_repository))
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+    )
+
+
+@consult_router.get("/{session_id}/analysis")
+async def get_analysis(
+    session_id: str,
+    stream: bool = False,
+    user_id: str = Depends(get_current_user_id),
+    consult_repository: ConsultRepositoryPort = Depends(get_consult_repository),
+    job_repository: AnalysisJobRepositoryPort = Depends(get_analysis_job_repository),
+    db: DbSession = Depends(get_db),
+):
+    """
+    상담 분석 결과(작업 상태)를 조회한다.
+
+    - 기본: 현재 상태를 바로 반환한다 (클라이언트 폴링용)
+    - stream=true: 작업이 끝날 때까지 상태가 바뀔 때마다 SSE 이벤트로 보내고 종료한다
+
+    Returns:
+        status(pending/running/done/failed)와, 완료 시 analysis
+    """
+    def load():
+        try:
+            return consult_repository.find_by_id(session_id), job_repository.find_by_session_id(session_id)
+        finally:
+            db.close()
+
+    session, job = await run_in_threadpool(load)
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="세션을 찾을 수 없습니다",
+        )
 
-        # AI 응답 저장
-        ai_message = Message(role="assistant", content=full_response)
-        session.add_message(ai_message)
-        _consult_repository.save(session)
+    if session.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="이 세션에 접근할 권한이 없습니다",
+        )
+
+    if job is None and session.get_analysis() is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="분석 작업이 없습니다",
+        )
+
+    if not stream:
+        return _analysis_payload(session_id, job, session.get_analysis())
+
+    async def event_generator():
+        nonlocal session, job
+        event_id = 0
+        last_status = None
+        while True:
+            payload = _analysis_payload(session_id, job, session.get_analysis())
+            if payload["status"] != last_status:
+                event_id += 1
+                last_status = payload["status"]
+                yield encode_sse_event(
+                    json.dumps(payload, ensure_ascii=False),
+                    event_id=event_id,
+                    event="analysis",
+                    retry_ms=DEFAULT_RETRY_MS if event_id == 1 else None,
+                )
+            if payload["status"] in (AnalysisJob.DONE, AnalysisJob.FAILED):
+                return
+
+            if _analysis_queue:
+                await _analysis_queue.wait(session_id, ANALYSIS_POLL_INTERVAL_SECONDS)
+            else:
+                await asyncio.sleep(ANALYSIS_POLL_INTERVAL_SECONDS)
+            session, job = await run_in_threadpool(load)
+            if session is None:
+                return
 
     return StreamingResponse(
         event_generator(),
-        media_type="text/event-stream"
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
     )
+
+
+async def _start_analysis(session: ConsultSession, consult_repository: ConsultRepositoryPort) -> None:
+    """완료된 세션의 분석을 시작한다 (큐가 있으면 작업만 등록하고, 없으면 바로 생성해 저장한다)
+
+    스트림 응답이 끝난 뒤에 실행되므로 실패해도 예외를 올리지 않는다.
+    (등록 전에 프로세스가 죽으면 큐의 resume()이 작업을 만들어 준다)
+    """
+    try:
+        if _analysis_queue:
+            await _analysis_queue.enqueue(session.id)
+            return
+        analysis = await _get_async_counselor().generate_analysis(session)
+        session.complete_with_analysis(analysis.to_dict())
+        await run_in_threadpool(consult_repository.save, session)
+    except AnalysisDeferredError:
+        logger.warning("업스트림 회로가 열려 있어 스트림 세션의 분석을 미룹니다 session=%s", session.id)
+    except Exception:
+        logger.exception("스트림 세션의 분석 시작 실패 session=%s", session.id)
+
+
+def _analysis_payload(session_id: str, job: AnalysisJob | None, analysis: dict | None) -> dict:
+    """분석 조회 응답 (작업 없이 요청 안에서 생성된 분석은 done으로 본다)"""
+    if analysis is not None:
+        return {"session_id": session_id, "status": AnalysisJob.DONE, "analysis": analysis}
+    payload = {"session_id": session_id, "job_id": job.id, "status": job.status}
+    if job.status == AnalysisJob.FAILED:
+        payload["error"] = job.error
+    return payload
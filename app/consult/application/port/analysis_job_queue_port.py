@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from app.consult.domain.analysis_job import AnalysisJob
+
+
+class AnalysisJobQueuePort(ABC):
+    """분석 작업 큐 포트 인터페이스"""
+
+    @abstractmethod
+    async def enqueue(self, session_id: str) -> AnalysisJob:
+        """세션의 분석 작업을 등록한다 (세션당 한 번만 실행된다)"""
+        pass
+
+    @abstractmethod
+    async def wait(self, session_id: str, timeout: float) -> None:
+        """세션의 작업 상태가 바뀌거나 timeout이 지날 때까지 기다린다"""
+        pass
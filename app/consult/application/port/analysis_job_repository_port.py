@@ -0,0 +1,48 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.consult.domain.analysis_job import AnalysisJob
+
+
+class AnalysisJobRepositoryPort(ABC):
+    """분석 작업 저장소 포트 인터페이스"""
+
+    @abstractmethod
+    def create_if_absent(self, session_id: str) -> AnalysisJob:
+        """세션의 분석 작업을 만든다 (이미 있으면 기존 작업을 반환한다)"""
+        pass
+
+    @abstractmethod
+    def find_by_session_id(self, session_id: str) -> AnalysisJob | None:
+        """세션의 분석 작업을 조회한다"""
+        pass
+
+    @abstractmethod
+    def find_unfinished(self) -> list[AnalysisJob]:
+        """아직 끝나지 않은(pending/running) 작업 목록을 조회한다"""
+        pass
+
+    @abstractmethod
+    def find_orphaned_session_ids(self, since: datetime, limit: int) -> list[str]:
+        """since 이후 만들어져 완료됐지만 분석 결과도 분석 작업도 없는 세션 id를 최대 limit개 조회한다
+
+        세션 완료 저장과 작업 등록 사이에 프로세스가 죽은 경우를 재시작 시 복구하기 위해 쓴다.
+        """
+        pass
+
+    @abstractmethod
+    def claim(self, job_id: str, stale_before: datetime) -> bool:
+        """작업을 running으로 선점한다
+
+        pending이거나, running이지만 stale_before 이후로 갱신되지 않은(중단된) 작업만 선점할 수 있다.
+        여러 워커가 같은 작업을 동시에 실행하지 않도록 조건부로 갱신한다.
+
+        Returns:
+            선점에 성공하면 True
+        """
+        pass
+
+    @abstractmethod
+    def update(self, job: AnalysisJob) -> None:
+        """작업 상태를 저장한다"""
+        pass
@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.analysis import Analysis
+
+
+class AsyncAICounselorPort(ABC):
+    """비동기 AI 상담사 포트 인터페이스
+
+    AICounselorPort와 같은 기능을 코루틴으로 제공한다.
+    LLM 호출 동안 스레드풀 워커를 점유하지 않고 이벤트 루프에서 대기한다.
+    """
+
+    @abstractmethod
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        """
+        사용자의 MBTI와 성별에 맞는 인사말을 생성한다.
+
+        Args:
+            mbti: 사용자의 MBTI
+            gender: 사용자의 성별
+
+        Returns:
+            AI가 생성한 인사말
+        """
+        pass
+
+    @abstractmethod
+    async def generate_response(self, session: ConsultSession, user_message: str) -> str:
+        """
+        사용자 메시지에 대한 AI 응답을 생성한다.
+
+        Args:
+            session: 상담 세션 (MBTI, Gender, 대화 히스토리 포함)
+            user_message: 사용자가 보낸 메시지
+
+        Returns:
+            AI 응답 메시지
+        """
+        pass
+
+    @abstractmethod
+    def generate_response_stream(self, session: ConsultSession, user_message: str) -> AsyncIterator[str]:
+        """
+        사용자 메시지에 대한 AI 응답을 스트리밍 방식으로 생성한다.
+
+        Args:
+            session: 상담 세션 (MBTI, Gender, 대화 히스토리 포함)
+            user_message: 사용자가 보낸 메시지
+
+        Returns:
+            AI 응답 메시지 스트림 (AsyncIterator)
+        """
+        pass
+
+    @abstractmethod
+    async def generate_analysis(self, session: ConsultSession) -> Analysis:
+        """
+        상담 세션을 기반으로 MBTI 관계 분석을 생성한다.
+
+        Args:
+            session: 상담 세션 (MBTI, Gender, 대화 히스토리 포함)
+
+        Returns:
+            Analysis: 4개 섹션(situation, traits, solutions, cautions)을 포함한 분석 결과
+        """
+        pass
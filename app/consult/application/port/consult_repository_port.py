@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.consult_summary import ConsultSummary
+from app.consult.domain.history_cursor import HistoryCursor
 
 
 class ConsultRepositoryPort(ABC):
@@ -20,3 +22,17 @@ class ConsultRepositoryPort(ABC):
     def find_completed_by_user_id(self, user_id: str) -> list[ConsultSession]:
         """user_id로 완료된 세션 목록을 조회한다"""
         pass
+
+    @abstractmethod
+    def find_completed_page(
+        self,
+        user_id: str,
+        limit: int,
+        after: HistoryCursor | None = None,
+    ) -> tuple[list[ConsultSummary], HistoryCursor | None]:
+        """user_id의 완료된 세션 요약을 (created_at, id) 내림차순으로 limit개 조회한다
+
+        Returns:
+            (요약 목록, 다음 페이지 커서). 마지막 페이지면 커서는 None
+        """
+        pass
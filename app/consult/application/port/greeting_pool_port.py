@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+
+from app.consult.domain.pooled_greeting import PooledGreeting
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+
+class GreetingPoolPort(ABC):
+    """미리 생성한 인사말 풀 저장소 포트 인터페이스"""
+
+    @abstractmethod
+    def find_by_profile(self, mbti: MBTI, gender: Gender) -> list[PooledGreeting]:
+        """MBTI × 성별 조합의 인사말 목록을 조회한다"""
+        pass
+
+    @abstractmethod
+    def add(self, greeting: PooledGreeting) -> None:
+        """인사말을 풀에 추가한다"""
+        pass
+
+    @abstractmethod
+    def mark_used(self, greeting_id: str) -> None:
+        """인사말 사용 횟수를 1 증가시킨다"""
+        pass
+
+    @abstractmethod
+    def delete(self, greeting_id: str) -> None:
+        """인사말을 풀에서 제거한다"""
+        pass
+
+    @abstractmethod
+    def try_claim_refill(self, mbti: MBTI, gender: Gender, lease_seconds: int) -> bool:
+        """조합의 보충 작업을 lease_seconds 동안 선점한다 (다른 프로세스가 선점 중이면 False)"""
+        pass
+
+    @abstractmethod
+    def release_refill(self, mbti: MBTI, gender: Gender) -> None:
+        """조합의 보충 선점을 해제한다"""
+        pass
@@ -0,0 +1,140 @@
+import asyncio
+
+from app.consult.application.port.analysis_job_queue_port import AnalysisJobQueuePort
+from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.domain.analysis import Analysis, AnalysisDeferredError
+from app.consult.domain.analysis_rerun_policy import AnalysisRerunPolicy
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.shared.tracing.tracer import traced
+
+
+class AsyncSendMessageUseCase:
+    """메시지 전송 유스케이스 (비동기)
+
+    LLM 호출은 이벤트 루프에서 대기하고, 동기 저장소 호출은 스레드에서 실행한다.
+    analysis_queue가 있으면 5턴째 분석은 백그라운드 작업으로 넘기고 작업 id만 반환한다.
+    큐가 없고 analysis_policy가 미리 생성하도록 되어 있으면, 5턴째 분석을 마지막 응답과 동시에 생성한다.
+    """
+
+    def __init__(
+        self,
+        repository: ConsultRepositoryPort,
+        ai_counselor: AsyncAICounselorPort,
+        analysis_queue: AnalysisJobQueuePort | None = None,
+        analysis_policy: AnalysisRerunPolicy | None = None,
+    ):
+        self._repository = repository
+        self._ai_counselor = ai_counselor
+        self._analysis_queue = analysis_queue
+        self._analysis_policy = analysis_policy or AnalysisRerunPolicy(mode="off")
+
+    @traced("usecase.send_message")
+    async def execute(self, session_id: str, user_id: str, content: str) -> dict:
+        """
+        메시지를 전송하고 AI 응답을 받는다.
+
+        1. 세션 조회
+        2. 세션 소유자 검증
+        3. 세션 완료 여부 검증
+        4. 사용자 메시지 저장
+        5. AI 응답 생성
+        6. AI 응답 저장
+        7. 응답 반환
+        """
+        # 1. 세션 조회
+        session = await asyncio.to_thread(self._repository.find_by_id, session_id)
+        if not session:
+            raise ValueError("세션을 찾을 수 없습니다")
+
+        # 2. 세션 소유자 검증
+        if session.user_id != user_id:
+            raise PermissionError("세션에 접근할 권한이 없습니다")
+
+        # 3. 세션 완료 여부 검증
+        if session.is_completed():
+            raise ValueError("상담이 완료되었습니다")
+
+        # 4. 사용자 메시지 저장
+        user_message = Message(role="user", content=content)
+        session.add_message(user_message)
+
+        # 5. AI 응답 생성 (마지막 턴이면 분석도 동시에 시작)
+        speculative_analysis = None
+        if self._speculates(session):
+            speculative_analysis = asyncio.create_task(
+                self._ai_counselor.generate_analysis(session.snapshot())
+            )
+        try:
+            ai_response = await self._ai_counselor.generate_response(session, content)
+
+            # 6. AI 응답 저장
+            assistant_message = Message(role="assistant", content=ai_response)
+            session.add_message(assistant_message)
+
+            # 7. 세션 저장 (업데이트)
+            await asyncio.to_thread(self._repository.save, session)
+        except BaseException:
+            # 응답 생성이나 저장이 실패하면 미리 시작한 분석도 버린다
+            if speculative_analysis:
+                speculative_analysis.cancel()
+            raise
+
+        # 8. 남은 턴 수 및 완료 여부 계산
+        is_completed = session.is_completed()
+        remaining_turns = max(0, 5 - session.get_user_turn_count())
+
+        result = {
+            "response": ai_response,
+            "remaining_turns": remaining_turns,
+            "is_completed": is_completed,
+        }
+
+        # 9. 5턴 완료 시 분석
+        #    큐가 있으면 작업만 등록하고 바로 반환한다 (GET /consult/{session_id}/analysis로 조회)
+        #    저장 후 등록 전에 프로세스가 죽으면 다음 시작 시 큐의 resume()이 작업을 만들어 준다
+        if is_completed and self._analysis_queue:
+            job = await self._analysis_queue.enqueue(session.id)
+            result["analysis_job_id"] = job.id
+            result["analysis_status"] = job.status
+            return result
+
+        #    큐가 없으면 직접 생성해 저장한다 (지금 만들 수 없으면 deferred로 알린다)
+        if is_completed:
+            try:
+                analysis = await self._finish_analysis(session, ai_response, speculative_analysis)
+            except AnalysisDeferredError as e:
+                result["analysis_status"] = "deferred"
+                result["analysis_retry_after"] = e.retry_after
+                return result
+            analysis_dict = analysis.to_dict()
+            result["analysis"] = analysis_dict
+
+            # 분석 결과를 세션에 저장하고 DB에 반영
+            session.complete_with_analysis(analysis_dict)
+            await asyncio.to_thread(self._repository.save, session)
+
+        return result
+
+    def _speculates(self, session: ConsultSession) -> bool:
+        """이번 턴에 분석을 미리 생성할지 (큐가 없고, 사용자 메시지로 5턴이 채워졌을 때)"""
+        return (
+            self._analysis_queue is None
+            and self._analysis_policy.is_speculative()
+            and session.is_completed()
+        )
+
+    async def _finish_analysis(
+        self,
+        session: ConsultSession,
+        final_reply: str,
+        speculative_analysis: "asyncio.Task[Analysis] | None",
+    ) -> Analysis:
+        """미리 생성한 분석을 쓰거나, 정책에 따라 전체 대화로 다시 생성한다"""
+        if speculative_analysis is None:
+            return await self._ai_counselor.generate_analysis(session)
+        if self._analysis_policy.should_rerun(final_reply):
+            speculative_analysis.cancel()
+            return await self._ai_counselor.generate_analysis(session)
+        return await speculative_analysis
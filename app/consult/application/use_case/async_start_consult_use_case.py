@@ -0,0 +1,47 @@
+import asyncio
+import uuid
+
+from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.domain.consult_session import ConsultSession
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from app.shared.tracing.tracer import traced
+
+
+class AsyncStartConsultUseCase:
+    """상담 시작 유스케이스 (비동기)"""
+
+    def __init__(self, repository: ConsultRepositoryPort, ai_counselor: AsyncAICounselorPort):
+        self._repository = repository
+        self._ai_counselor = ai_counselor
+
+    @traced("usecase.start_consult")
+    async def execute(self, user_id: str, mbti: MBTI, gender: Gender) -> dict:
+        """
+        상담을 시작한다.
+
+        1. 세션 ID 생성
+        2. ConsultSession 생성
+        3. 세션 저장과 AI 인사말 생성을 동시에 실행
+        4. 세션 ID와 인사말 반환
+        """
+        # 1. 세션 ID 생성
+        session_id = str(uuid.uuid4())
+
+        # 2. ConsultSession 생성
+        session = ConsultSession(
+            id=session_id,
+            user_id=user_id,
+            mbti=mbti,
+            gender=gender
+        )
+
+        # 3. 세션 저장 (DB는 스레드에서) + AI 인사말 생성
+        _, greeting = await asyncio.gather(
+            asyncio.to_thread(self._repository.save, session),
+            self._ai_counselor.generate_greeting(mbti, gender),
+        )
+
+        # 4. 세션 ID와 인사말 반환
+        return {"session_id": session_id, "greeting": greeting}
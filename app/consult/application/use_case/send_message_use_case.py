@@ -1,19 +1,36 @@
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+
 from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
 from app.consult.application.port.ai_counselor_port import AICounselorPort
+from app.consult.domain.analysis import Analysis
+from app.consult.domain.analysis_rerun_policy import AnalysisRerunPolicy
+from app.consult.domain.consult_session import ConsultSession
 from app.consult.domain.message import Message
+from app.shared.tracing.tracer import traced
+
+# 마지막 턴 분석을 미리 생성하는 스레드 풀 (호출마다 풀을 만들지 않도록 프로세스에서 공유)
+# Future.cancel()은 아직 시작하지 않은 작업만 취소한다. 이미 실행 중인 LLM 호출은 끝까지 진행되고 결과만 버려진다.
+_speculative_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="speculative-analysis")
 
 
 class SendMessageUseCase:
-    """메시지 전송 유스케이스"""
+    """메시지 전송 유스케이스
+
+    analysis_policy가 미리 생성하도록 되어 있으면, 5턴째 분석을 마지막 응답과 동시에(별도 스레드에서) 생성한다.
+    """
 
     def __init__(
         self,
         repository: ConsultRepositoryPort,
-        ai_counselor: AICounselorPort
+        ai_counselor: AICounselorPort,
+        analysis_policy: AnalysisRerunPolicy | None = None,
     ):
         self._repository = repository
         self._ai_counselor = ai_counselor
+        self._analysis_policy = analysis_policy or AnalysisRerunPolicy(mode="off")
 
+    @traced("usecase.send_message")
     def execute(self, session_id: str, user_id: str, content: str) -> dict:
         """
         메시지를 전송하고 AI 응답을 받는다.
@@ -43,15 +60,25 @@ class SendMessageUseCase:
         user_message = Message(role="user", content=content)
         session.add_message(user_message)
 
-        # 5. AI 응답 생성
-        ai_response = self._ai_counselor.generate_response(session, content)
+        # 5. AI 응답 생성 (마지막 턴이면 분석도 동시에 시작)
+        speculative_analysis = None
+        if self._analysis_policy.is_speculative() and session.is_completed():
+            speculative_analysis = _speculative_executor.submit(
+                contextvars.copy_context().run, self._ai_counselor.generate_analysis, session.snapshot()
+            )
+        try:
+            ai_response = self._ai_counselor.generate_response(session, content)
 
-        # 6. AI 응답 저장
-        assistant_message = Message(role="assistant", content=ai_response)
-        session.add_message(assistant_message)
+            # 6. AI 응답 저장
+            assistant_message = Message(role="assistant", content=ai_response)
+            session.add_message(assistant_message)
 
-        # 7. 세션 저장 (업데이트)
-        self._repository.save(session)
+            # 7. 세션 저장 (업데이트)
+            self._repository.save(session)
+        except BaseException:
+            if speculative_analysis:
+                speculative_analysis.cancel()
+            raise
 
         # 8. 남은 턴 수 및 완료 여부 계산
         is_completed = session.is_completed()
@@ -65,7 +92,7 @@ class SendMessageUseCase:
 
         # 9. 5턴 완료 시 분석 자동 생성 및 저장
         if is_completed:
-            analysis = self._ai_counselor.generate_analysis(session)
+            analysis = self._finish_analysis(session, ai_response, speculative_analysis)
             analysis_dict = analysis.to_dict()
             result["analysis"] = analysis_dict
 
@@ -74,3 +101,17 @@ class SendMessageUseCase:
             self._repository.save(session)
 
         return result
+
+    def _finish_analysis(
+        self,
+        session: ConsultSession,
+        final_reply: str,
+        speculative_analysis: "Future[Analysis] | None",
+    ) -> Analysis:
+        """미리 생성한 분석을 쓰거나, 정책에 따라 전체 대화로 다시 생성한다"""
+        if speculative_analysis is None:
+            return self._ai_counselor.generate_analysis(session)
+        if self._analysis_policy.should_rerun(final_reply):
+            speculative_analysis.cancel()
+            return self._ai_counselor.generate_analysis(session)
+        return speculative_analysis.result()
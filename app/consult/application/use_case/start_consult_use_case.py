@@ -5,6 +5,7 @@ from app.consult.application.port.ai_counselor_port import AICounselorPort
 from app.consult.domain.consult_session import ConsultSession
 from app.shared.vo.mbti import MBTI
 from app.shared.vo.gender import Gender
+from app.shared.tracing.tracer import traced
 
 
 class StartConsultUseCase:
@@ -14,6 +15,7 @@ class StartConsultUseCase:
         self._repository = repository
         self._ai_counselor = ai_counselor
 
+    @traced("usecase.start_consult")
     def execute(self, user_id: str, mbti: MBTI, gender: Gender) -> dict:
         """
         상담을 시작한다.
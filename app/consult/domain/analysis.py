@@ -32,3 +32,11 @@ class Analysis:
             "solutions": self.solutions,
             "cautions": self.cautions,
         }
+
+
+class AnalysisDeferredError(Exception):
+    """분석을 지금 생성할 수 없어 나중으로 미뤘다 (retry_after초 뒤 다시 시도)"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"분석 생성을 {retry_after:.0f}초 뒤로 미뤘습니다")
+        self.retry_after = retry_after
@@ -0,0 +1,42 @@
+import uuid
+from datetime import datetime
+
+
+class AnalysisJob:
+    """상담 분석 생성 작업 (세션당 하나)"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    VALID_STATUSES = (PENDING, RUNNING, DONE, FAILED)
+
+    # 클라이언트에 그대로 노출되는 오류 코드 (업스트림 예외 메시지는 로그에만 남긴다)
+    ERROR_UPSTREAM_UNAVAILABLE = "upstream_unavailable"
+    ERROR_ANALYSIS_FAILED = "analysis_failed"
+
+    def __init__(
+        self,
+        session_id: str,
+        id: str | None = None,
+        status: str = PENDING,
+        attempts: int = 0,
+        error: str | None = None,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+    ):
+        if not session_id:
+            raise ValueError("AnalysisJob session_id는 비어있을 수 없습니다")
+        if status not in self.VALID_STATUSES:
+            raise ValueError(f"지원하지 않는 작업 상태입니다: {status}")
+        self.id = id or str(uuid.uuid4())
+        self.session_id = session_id
+        self.status = status
+        self.attempts = attempts
+        self.error = error
+        self.created_at = created_at or datetime.now()
+        self.updated_at = updated_at or self.created_at
+
+    def is_finished(self) -> bool:
+        """완료 또는 최종 실패 상태인지 반환한다"""
+        return self.status in (self.DONE, self.FAILED)
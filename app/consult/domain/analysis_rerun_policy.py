@@ -0,0 +1,32 @@
+class AnalysisRerunPolicy:
+    """5턴째 분석을 마지막 응답과 동시에 미리 생성할지, 응답 후 다시 생성할지 정하는 정책
+
+    분석 프롬프트는 주로 사용자 메시지에 의존하고, 5턴째 응답 전략은 새 인사이트 없이
+    마무리하도록 되어 있어 마지막 응답 없이 만든 분석도 대부분 그대로 쓸 수 있다.
+
+    모드:
+        - "off": 미리 생성하지 않는다 (응답 후 분석, 기존 방식)
+        - "never": 미리 생성한 분석을 그대로 쓴다
+        - "long_reply": 마지막 응답이 min_reply_chars 이상이면 전체 대화로 다시 생성한다
+        - "always": 항상 다시 생성한다 (비교 측정용)
+    """
+
+    VALID_MODES = ("off", "never", "long_reply", "always")
+
+    def __init__(self, mode: str = "never", min_reply_chars: int = 400):
+        if mode not in self.VALID_MODES:
+            raise ValueError(f"지원하지 않는 분석 재생성 정책입니다: {mode}")
+        self.mode = mode
+        self.min_reply_chars = min_reply_chars
+
+    def is_speculative(self) -> bool:
+        """마지막 응답과 동시에 분석을 미리 생성하는지 반환한다"""
+        return self.mode != "off"
+
+    def should_rerun(self, final_reply: str) -> bool:
+        """미리 생성한 분석을 버리고 마지막 응답까지 포함해 다시 생성해야 하는지 반환한다"""
+        if self.mode == "always":
+            return True
+        if self.mode == "long_reply":
+            return len(final_reply) >= self.min_reply_chars
+        return False
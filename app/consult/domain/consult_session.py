@@ -17,6 +17,8 @@ class ConsultSession:
         messages: list[Message] | None = None,
         completed: bool = False,
         analysis: dict | None = None,
+        context_summary: str | None = None,
+        summarized_count: int = 0,
     ):
         self._validate(id, user_id, mbti, gender)
         self.id = id
@@ -27,6 +29,9 @@ class ConsultSession:
         self._messages: list[Message] = messages or []
         self._completed = completed
         self._analysis = analysis
+        # 프롬프트 컨텍스트용 요약: 앞에서부터 summarized_count개 메시지를 요약한 내용
+        self._context_summary = context_summary
+        self._summarized_count = summarized_count
 
     def _validate(self, id: str, user_id: str, mbti: MBTI | None, gender: Gender | None) -> None:
         """ConsultSession 값의 유효성을 검증한다"""
@@ -47,6 +52,21 @@ class ConsultSession:
         """세션의 모든 메시지를 반환한다"""
         return list(self._messages)
 
+    def snapshot(self) -> "ConsultSession":
+        """현재까지의 메시지로 고정된 사본을 반환한다 (이후 메시지 추가는 반영되지 않음)"""
+        return ConsultSession(
+            id=self.id,
+            user_id=self.user_id,
+            mbti=self.mbti,
+            gender=self.gender,
+            created_at=self.created_at,
+            messages=self.get_messages(),
+            completed=self._completed,
+            analysis=self._analysis,
+            context_summary=self._context_summary,
+            summarized_count=self._summarized_count,
+        )
+
     def get_user_turn_count(self) -> int:
         """유저 메시지(턴) 개수를 반환한다"""
         return sum(1 for msg in self._messages if msg.role == "user")
@@ -63,3 +83,20 @@ class ConsultSession:
     def get_analysis(self) -> dict | None:
         """분석 결과를 반환한다"""
         return self._analysis
+
+    def get_context_summary(self) -> str | None:
+        """앞선 대화의 누적 요약을 반환한다"""
+        return self._context_summary
+
+    def get_summarized_count(self) -> int:
+        """요약에 반영된 메시지 수 (앞에서부터)를 반환한다"""
+        return self._summarized_count
+
+    def update_context_summary(self, summary: str, summarized_count: int) -> None:
+        """앞에서부터 summarized_count개 메시지를 요약한 내용으로 누적 요약을 갱신한다"""
+        if not summary or not summary.strip():
+            raise ValueError("context_summary는 비어있을 수 없습니다")
+        if summarized_count < self._summarized_count or summarized_count > len(self._messages):
+            raise ValueError("summarized_count가 올바르지 않습니다")
+        self._context_summary = summary
+        self._summarized_count = summarized_count
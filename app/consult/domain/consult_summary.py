@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+# 히스토리 목록에 보여줄 분석 요약 최대 길이
+SUMMARY_MAX_CHARS = 120
+
+
+class ConsultSummary:
+    """히스토리 목록용 완료 상담 요약 (메시지와 전체 분석 결과는 포함하지 않음)"""
+
+    def __init__(
+        self,
+        id: str,
+        created_at: datetime,
+        mbti: MBTI,
+        gender: Gender,
+        summary: str | None = None,
+    ):
+        self.id = id
+        self.created_at = created_at
+        self.mbti = mbti
+        self.gender = gender
+        self.summary = summary
+
+    @staticmethod
+    def summarize(analysis: dict | None, max_chars: int = SUMMARY_MAX_CHARS) -> str | None:
+        """분석 결과에서 목록용 한 줄 요약(상황 분석 앞부분)을 만든다"""
+        if not analysis:
+            return None
+        situation = " ".join(str(analysis.get("situation") or "").split())
+        if not situation:
+            return None
+        if len(situation) <= max_chars:
+            return situation
+        return situation[: max_chars - 1].rstrip() + "…"
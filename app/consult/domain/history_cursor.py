@@ -0,0 +1,35 @@
+import base64
+from datetime import datetime
+
+
+class HistoryCursor:
+    """히스토리 keyset 페이지네이션 커서 (마지막 항목의 created_at, id)
+
+    목록은 (created_at, id) 내림차순이므로 다음 페이지는 이 값보다 작은 행부터 시작한다.
+    """
+
+    def __init__(self, created_at: datetime, id: str):
+        if not id:
+            raise ValueError("HistoryCursor id는 비어있을 수 없습니다")
+        self.created_at = created_at
+        self.id = id
+
+    def encode(self) -> str:
+        """클라이언트에 넘길 불투명 토큰으로 인코딩한다"""
+        raw = f"{self.created_at.isoformat()}|{self.id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "HistoryCursor":
+        """encode()로 만든 토큰을 커서로 되돌린다 (형식이 잘못되면 ValueError)"""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|", 1)
+            return cls(created_at=datetime.fromisoformat(created_at), id=id)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError("잘못된 히스토리 커서입니다") from e
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, HistoryCursor):
+            return False
+        return self.created_at == other.created_at and self.id == other.id
@@ -0,0 +1,27 @@
+import uuid
+from datetime import datetime
+
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+
+class PooledGreeting:
+    """미리 생성해 둔 상담 인사말 (MBTI × 성별 조합별 풀의 한 항목)"""
+
+    def __init__(
+        self,
+        mbti: MBTI,
+        gender: Gender,
+        content: str,
+        id: str | None = None,
+        use_count: int = 0,
+        created_at: datetime | None = None,
+    ):
+        if not content or not content.strip():
+            raise ValueError("content는 비어있을 수 없습니다")
+        self.id = id or str(uuid.uuid4())
+        self.mbti = mbti
+        self.gender = gender
+        self.content = content
+        self.use_count = use_count
+        self.created_at = created_at or datetime.now()
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, DateTime, Integer, Text
+from config.database import Base
+
+
+class AnalysisJobModel(Base):
+    """상담 분석 작업 ORM 모델"""
+
+    __tablename__ = "analysis_jobs"
+
+    id = Column(String(36), primary_key=True)
+    # 세션당 작업 하나 (중복 등록 방지)
+    session_id = Column(String(36), nullable=False, unique=True)
+    status = Column(String(20), nullable=False, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
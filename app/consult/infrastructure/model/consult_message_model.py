@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Text, Index
 from config.database import Base
 
 
@@ -6,9 +6,14 @@ class ConsultMessageModel(Base):
     """상담 메시지 ORM 모델"""
 
     __tablename__ = "consult_messages"
+    __table_args__ = (
+        # 세션 내 메시지 순번 (append-only 저장 시 다음 seq 조회에 사용)
+        Index("ix_consult_messages_session_seq", "session_id", "seq", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     session_id = Column(String(36), ForeignKey("consult_sessions.id"), nullable=False, index=True)
+    seq = Column(Integer, nullable=False, default=0)
     role = Column(String(20), nullable=False)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime, nullable=False)
\ No newline at end of file
+    created_at = Column(DateTime, nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Text, Boolean
+from sqlalchemy import Column, String, DateTime, Text, Boolean, Index, Integer
 from config.database import Base
 
 
@@ -6,6 +6,12 @@ class ConsultSessionModel(Base):
     """상담 세션 ORM 모델"""
 
     __tablename__ = "consult_sessions"
+    __table_args__ = (
+        # 히스토리 keyset 페이지네이션용 (InnoDB 보조 인덱스는 PK(id)를 포함하므로 id 정렬까지 커버)
+        Index("ix_consult_sessions_user_completed_created", "user_id", "is_completed", "created_at"),
+        # 분석 작업 큐 시작 시 작업 없이 완료된 최근 세션 조회용
+        Index("ix_consult_sessions_completed_created", "is_completed", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True)
     user_id = Column(String(255), nullable=False, index=True)
@@ -14,3 +20,6 @@ class ConsultSessionModel(Base):
     created_at = Column(DateTime, nullable=False)
     is_completed = Column(Boolean, default=False, nullable=False)
     analysis_json = Column(Text, nullable=True)  # JSON 형태로 분석 결과 저장
+    analysis_summary = Column(String(255), nullable=True)  # 히스토리 목록용 분석 요약
+    context_summary = Column(Text, nullable=True)  # 프롬프트 컨텍스트용 앞선 대화 누적 요약
+    summarized_count = Column(Integer, default=0, nullable=False)  # 요약에 반영된 메시지 수
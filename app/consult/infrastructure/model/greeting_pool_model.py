@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, DateTime, Integer, Text, Index
+from config.database import Base
+
+
+class GreetingPoolModel(Base):
+    """미리 생성한 상담 인사말 ORM 모델"""
+
+    __tablename__ = "greeting_pool"
+    __table_args__ = (
+        # /consult/start에서 MBTI × 성별 조합으로 조회
+        Index("ix_greeting_pool_profile", "mbti", "gender"),
+    )
+
+    id = Column(String(36), primary_key=True)
+    mbti = Column(String(4), nullable=False)
+    gender = Column(String(10), nullable=False)
+    content = Column(Text, nullable=False)
+    use_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, nullable=False)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, DateTime
+from config.database import Base
+
+
+class GreetingPoolRefillModel(Base):
+    """인사말 풀 보충 임대(lease) ORM 모델
+
+    여러 워커/인스턴스가 같은 조합을 동시에 채우지 않도록
+    조합별로 보충 중인 프로세스가 locked_until까지 선점한다.
+    """
+
+    __tablename__ = "greeting_pool_refills"
+
+    profile = Column(String(16), primary_key=True)     # "INTJ:MALE"
+    locked_until = Column(DateTime, nullable=False)
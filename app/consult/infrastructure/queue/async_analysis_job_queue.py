@@ -0,0 +1,194 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Callable, ContextManager, TypeVar
+
+from app.consult.application.port.analysis_job_queue_port import AnalysisJobQueuePort
+from app.consult.application.port.analysis_job_repository_port import AnalysisJobRepositoryPort
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
+from app.consult.domain.analysis import AnalysisDeferredError
+from app.consult.domain.analysis_job import AnalysisJob
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncAnalysisJobQueue(AnalysisJobQueuePort):
+    """프로세스 내 비동기 분석 작업 큐 (asyncio 워커 풀)
+
+    - 작업 상태는 DB(AnalysisJobRepositoryPort)에 기록하고, 큐에는 작업 id만 넣는다.
+    - 세션당 작업은 하나이며, 워커는 조건부 UPDATE(claim)로 작업을 선점한 뒤 실행한다.
+    - start() 시 끝나지 않은 작업을 다시 큐에 넣어 재시작 후에도 이어서 처리한다.
+      세션 완료 저장 뒤 작업 등록 전에 죽어 작업 행이 없는 완료 세션도 이때 작업을 만들어 넣는다.
+    - 실패하면 max_attempts까지 재시도하고, 그 뒤에는 failed로 남긴다.
+      (업스트림 장애로 미룬 분석(AnalysisDeferredError)은 시도 횟수에 넣지 않는다)
+
+    저장소는 요청 밖에서 쓰이므로 호출마다 새 DB 세션을 여는 scope 팩토리로 받는다.
+    """
+
+    def __init__(
+        self,
+        job_repository_scope: Callable[[], ContextManager[AnalysisJobRepositoryPort]],
+        consult_repository_scope: Callable[[], ContextManager[ConsultRepositoryPort]],
+        ai_counselor: AsyncAICounselorPort,
+        workers: int = 2,
+        max_attempts: int = 3,
+        lease_seconds: float = 300,
+        retry_delay_seconds: float = 2,
+        orphan_scan_limit: int = 1000,
+        orphan_scan_window_seconds: float = 24 * 3600,
+    ):
+        self._job_scope = job_repository_scope
+        self._consult_scope = consult_repository_scope
+        self._ai_counselor = ai_counselor
+        self._worker_count = workers
+        self._max_attempts = max_attempts
+        self._lease = timedelta(seconds=lease_seconds)
+        self._retry_delay = retry_delay_seconds
+        self._orphan_scan_limit = orphan_scan_limit
+        self._orphan_scan_window = timedelta(seconds=orphan_scan_window_seconds)
+        self._queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        self._events: dict[str, asyncio.Event] = {}
+        self._waiters: dict[str, int] = {}
+
+    async def start(self) -> None:
+        """워커를 띄우고 끝나지 않은 작업을 다시 큐에 넣는다"""
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self._worker_count)]
+        await self.resume()
+
+    async def resume(self) -> None:
+        """DB에 남아 있는 pending/running 작업을 큐에 넣는다 (실패해도 서버 시작은 막지 않는다)"""
+        try:
+            recovered = await self._with_jobs(self._create_orphaned_jobs)
+            if recovered:
+                logger.warning("작업 없이 완료된 세션의 분석 작업 %d개를 등록했습니다", recovered)
+            unfinished = await self._with_jobs(lambda jobs: jobs.find_unfinished())
+        except Exception:
+            logger.exception("미완료 분석 작업 조회 실패")
+            return
+        for job in unfinished:
+            self._queue.put_nowait((job.id, job.session_id))
+
+    def _create_orphaned_jobs(self, jobs: AnalysisJobRepositoryPort) -> int:
+        """최근 완료됐지만 분석도 작업도 없는 세션에 pending 작업을 만든다 (만든 개수 반환)
+
+        이런 세션은 저장과 등록 사이에 프로세스가 죽었을 때만 생기므로 최근 구간만 본다.
+        (워커마다 시작할 때 실행되므로 테이블 전체를 훑지 않도록)
+        """
+        since = datetime.now() - self._orphan_scan_window
+        session_ids = jobs.find_orphaned_session_ids(since, self._orphan_scan_limit)
+        for session_id in session_ids:
+            jobs.create_if_absent(session_id)
+        return len(session_ids)
+
+    async def stop(self) -> None:
+        """워커를 종료한다 (실행 중이던 작업은 다음 시작 시 lease 만료 후 재개된다)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def join(self) -> None:
+        """큐에 들어간 작업이 모두 처리될 때까지 기다린다"""
+        await self._queue.join()
+
+    async def enqueue(self, session_id: str) -> AnalysisJob:
+        """세션의 분석 작업을 등록한다 (이미 있으면 기존 작업을 반환하고 다시 넣지 않는다)"""
+        job = await self._with_jobs(lambda jobs: jobs.create_if_absent(session_id))
+        if job.status == AnalysisJob.PENDING and job.attempts == 0:
+            self._queue.put_nowait((job.id, job.session_id))
+        return job
+
+    async def wait(self, session_id: str, timeout: float) -> None:
+        """세션의 작업 상태가 바뀌거나 timeout이 지날 때까지 기다린다"""
+        event = self._events.setdefault(session_id, asyncio.Event())
+        self._waiters[session_id] = self._waiters.get(session_id, 0) + 1
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            # 마지막으로 기다리던 요청이 끝나면 이벤트를 지워 끝난 세션이 쌓이지 않게 한다
+            self._waiters[session_id] -= 1
+            if not self._waiters[session_id]:
+                del self._waiters[session_id]
+                if self._events.get(session_id) is event:
+                    del self._events[session_id]
+
+    async def _work(self) -> None:
+        while True:
+            job_id, session_id = await self._queue.get()
+            try:
+                await self._process(job_id, session_id)
+            except Exception:
+                logger.exception("분석 작업 처리 실패 (job_id=%s)", job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, job_id: str, session_id: str) -> None:
+        stale_before = datetime.now() - self._lease
+        claimed = await self._with_jobs(lambda jobs: jobs.claim(job_id, stale_before))
+        job = await self._with_jobs(lambda jobs: jobs.find_by_session_id(session_id))
+        if not claimed:
+            # 다른 워커가 실행 중인 작업: lease가 끝난 뒤 다시 확인한다
+            if job and job.status == AnalysisJob.RUNNING:
+                self._requeue_later(job, self._lease.total_seconds())
+            return
+
+        try:
+            await self._run(session_id)
+            job.status = AnalysisJob.DONE
+            job.error = None
+        except AnalysisDeferredError as e:
+            # 업스트림 장애로 미룬 작업은 시도 횟수를 쓰지 않고 retry_after 뒤에 다시 실행한다
+            job.attempts -= 1
+            job.error = AnalysisJob.ERROR_UPSTREAM_UNAVAILABLE
+            logger.warning("분석 작업 연기 (job_id=%s): %s", job_id, e)
+            job.status = AnalysisJob.PENDING
+            self._requeue_later(job, e.retry_after)
+        except Exception:
+            job.error = AnalysisJob.ERROR_ANALYSIS_FAILED
+            logger.exception("분석 작업 실패 (job_id=%s, attempts=%s)", job_id, job.attempts)
+            if job.attempts >= self._max_attempts:
+                job.status = AnalysisJob.FAILED
+            else:
+                job.status = AnalysisJob.PENDING
+                self._requeue_later(job, self._retry_delay * job.attempts)
+
+        await self._with_jobs(lambda jobs: jobs.update(job))
+        self._notify(session_id)
+
+    async def _run(self, session_id: str) -> None:
+        """분석을 생성해 세션에 저장한다 (이미 분석이 있으면 건너뛴다)"""
+        session = await self._with_consults(lambda consults: consults.find_by_id(session_id))
+        if session is None:
+            raise ValueError("세션을 찾을 수 없습니다")
+        if session.get_analysis() is not None:
+            return
+
+        analysis = await self._ai_counselor.generate_analysis(session)
+        session.complete_with_analysis(analysis.to_dict())
+        await self._with_consults(lambda consults: consults.save(session))
+
+    def _requeue_later(self, job: AnalysisJob, delay: float) -> None:
+        asyncio.get_running_loop().call_later(delay, self._queue.put_nowait, (job.id, job.session_id))
+
+    def _notify(self, session_id: str) -> None:
+        event = self._events.pop(session_id, None)
+        if event:
+            event.set()
+
+    async def _with_jobs(self, fn: Callable[[AnalysisJobRepositoryPort], R]) -> R:
+        return await asyncio.to_thread(self._in_scope, self._job_scope, fn)
+
+    async def _with_consults(self, fn: Callable[[ConsultRepositoryPort], R]) -> R:
+        return await asyncio.to_thread(self._in_scope, self._consult_scope, fn)
+
+    @staticmethod
+    def _in_scope(scope: Callable[[], ContextManager[T]], fn: Callable[[T], R]) -> R:
+        with scope() as repository:
+            return fn(repository)
@@ -0,0 +1,128 @@
+from datetime import datetime
+
+from sqlalchemy import or_, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.consult.application.port.analysis_job_repository_port import AnalysisJobRepositoryPort
+from app.consult.domain.analysis_job import AnalysisJob
+from app.consult.infrastructure.model.analysis_job_model import AnalysisJobModel
+from app.consult.infrastructure.model.consult_session_model import ConsultSessionModel
+from app.shared.tracing.tracer import traced
+
+
+class MySQLAnalysisJobRepository(AnalysisJobRepositoryPort):
+    """MySQL 기반 분석 작업 저장소"""
+
+    def __init__(self, db_session: Session):
+        self._db = db_session
+
+    @traced("db.analysis_job.create_if_absent")
+    def create_if_absent(self, session_id: str) -> AnalysisJob:
+        """세션의 분석 작업을 만든다 (session_id 유니크 제약으로 중복 등록 방지)"""
+        existing = self.find_by_session_id(session_id)
+        if existing:
+            return existing
+
+        job = AnalysisJob(session_id=session_id)
+        self._db.add(self._to_model(job))
+        try:
+            self._db.commit()
+        except IntegrityError:
+            # 동시에 다른 요청이 먼저 등록한 경우
+            self._db.rollback()
+            return self.find_by_session_id(session_id)
+        return job
+
+    @traced("db.analysis_job.find_by_session_id")
+    def find_by_session_id(self, session_id: str) -> AnalysisJob | None:
+        """세션의 분석 작업을 조회한다"""
+        model = self._db.query(AnalysisJobModel).filter(
+            AnalysisJobModel.session_id == session_id
+        ).first()
+        return self._to_domain(model) if model else None
+
+    @traced("db.analysis_job.find_unfinished")
+    def find_unfinished(self) -> list[AnalysisJob]:
+        """pending/running 작업을 오래된 순으로 조회한다"""
+        models = self._db.query(AnalysisJobModel).filter(
+            AnalysisJobModel.status.in_([AnalysisJob.PENDING, AnalysisJob.RUNNING])
+        ).order_by(AnalysisJobModel.created_at).all()
+        return [self._to_domain(model) for model in models]
+
+    @traced("db.analysis_job.find_orphaned_session_ids")
+    def find_orphaned_session_ids(self, since: datetime, limit: int) -> list[str]:
+        """완료됐지만 analysis_json도 작업 행도 없는 세션 id를 조회한다 (LEFT JOIN anti-join)
+
+        (is_completed, created_at) 인덱스로 since 이후 완료 세션만 범위 스캔하고,
+        작업 행 존재 여부는 analysis_jobs.session_id 유니크 인덱스로 확인한다.
+        """
+        rows = self._db.query(ConsultSessionModel.id).outerjoin(
+            AnalysisJobModel, AnalysisJobModel.session_id == ConsultSessionModel.id
+        ).filter(
+            ConsultSessionModel.is_completed == True,  # noqa: E712
+            ConsultSessionModel.created_at >= since,
+            ConsultSessionModel.analysis_json.is_(None),
+            AnalysisJobModel.id.is_(None),
+        ).order_by(ConsultSessionModel.created_at).limit(limit).all()
+        return [row.id for row in rows]
+
+    @traced("db.analysis_job.claim")
+    def claim(self, job_id: str, stale_before: datetime) -> bool:
+        """조건부 UPDATE로 작업을 선점한다"""
+        claimed = self._db.query(AnalysisJobModel).filter(
+            AnalysisJobModel.id == job_id,
+            or_(
+                AnalysisJobModel.status == AnalysisJob.PENDING,
+                and_(
+                    AnalysisJobModel.status == AnalysisJob.RUNNING,
+                    AnalysisJobModel.updated_at < stale_before,
+                ),
+            ),
+        ).update(
+            {
+                AnalysisJobModel.status: AnalysisJob.RUNNING,
+                AnalysisJobModel.attempts: AnalysisJobModel.attempts + 1,
+                AnalysisJobModel.updated_at: datetime.now(),
+            },
+            synchronize_session=False,
+        )
+        self._db.commit()
+        return claimed == 1
+
+    @traced("db.analysis_job.update")
+    def update(self, job: AnalysisJob) -> None:
+        """작업 상태를 저장한다"""
+        job.updated_at = datetime.now()
+        self._db.query(AnalysisJobModel).filter(AnalysisJobModel.id == job.id).update(
+            {
+                AnalysisJobModel.status: job.status,
+                AnalysisJobModel.attempts: job.attempts,
+                AnalysisJobModel.error: job.error,
+                AnalysisJobModel.updated_at: job.updated_at,
+            },
+            synchronize_session=False,
+        )
+        self._db.commit()
+
+    def _to_model(self, job: AnalysisJob) -> AnalysisJobModel:
+        return AnalysisJobModel(
+            id=job.id,
+            session_id=job.session_id,
+            status=job.status,
+            attempts=job.attempts,
+            error=job.error,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+        )
+
+    def _to_domain(self, model: AnalysisJobModel) -> AnalysisJob:
+        return AnalysisJob(
+            id=model.id,
+            session_id=model.session_id,
+            status=model.status,
+            attempts=model.attempts,
+            error=model.error,
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
@@ -1,21 +1,37 @@
 import json
+from sqlalchemy import and_, func, insert, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
 from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.consult_summary import ConsultSummary
+from app.consult.domain.history_cursor import HistoryCursor
 from app.consult.domain.message import Message
 from app.consult.infrastructure.model.consult_session_model import ConsultSessionModel
 from app.consult.infrastructure.model.consult_message_model import ConsultMessageModel
 from app.shared.vo.mbti import MBTI
 from app.shared.vo.gender import Gender
+from app.shared.tracing.tracer import traced
 
 
 class MySQLConsultRepository(ConsultRepositoryPort):
     """MySQL 기반 상담 세션 저장소"""
 
-    def __init__(self, db_session: Session):
+    # 동시 저장으로 seq/PK 충돌 시 새 트랜잭션에서 다시 시도하는 횟수
+    SAVE_RETRY_LIMIT = 2
+
+    def __init__(self, db_session: Session, append_only: bool = True):
+        """
+        Args:
+            db_session: SQLAlchemy 세션
+            append_only: True면 새 메시지만 INSERT하고 세션 메타데이터는 UPDATE로 갱신한다.
+                False면 기존 방식(merge + 메시지 전체 삭제 후 재삽입)으로 저장한다.
+        """
         self._db = db_session
+        self._append_only = append_only
 
+    @traced("db.consult.save")
     def save(self, session: ConsultSession) -> None:
         """세션을 저장한다 (insert 또는 update)"""
         # 분석 결과를 JSON으로 변환
@@ -23,35 +39,108 @@ class MySQLConsultRepository(ConsultRepositoryPort):
         if session.get_analysis():
             analysis_json = json.dumps(session.get_analysis(), ensure_ascii=False)
 
-        # 세션 저장 (merge로 insert/update 처리)
-        session_model = ConsultSessionModel(
-            id=session.id,
-            user_id=session.user_id,
-            mbti=session.mbti.value,
-            gender=session.gender.value,
-            created_at=session.created_at,
-            is_completed=session.is_completed(),
-            analysis_json=analysis_json,
+        if not self._append_only:
+            self._save_full(session, analysis_json)
+            self._db.commit()
+            return
+
+        for attempt in range(self.SAVE_RETRY_LIMIT + 1):
+            try:
+                self._save_incremental(session, analysis_json)
+                self._db.commit()
+                return
+            except IntegrityError:
+                # 같은 세션을 동시에 저장한 다른 요청과 seq(또는 신규 세션 PK)가 겹쳤다.
+                # 롤백 후 최신 max(seq)로 다시 계산하면 이미 저장된 메시지는 건너뛴다.
+                self._db.rollback()
+                if attempt == self.SAVE_RETRY_LIMIT:
+                    raise
+
+    def _save_incremental(self, session: ConsultSession, analysis_json: str | None) -> None:
+        """아직 저장되지 않은 메시지만 seq 순번으로 추가한다"""
+        # 세션 메타데이터는 변경 가능한 컬럼만 UPDATE
+        updated = self._db.query(ConsultSessionModel).filter(
+            ConsultSessionModel.id == session.id
+        ).update(
+            {
+                ConsultSessionModel.is_completed: session.is_completed(),
+                ConsultSessionModel.analysis_json: analysis_json,
+                ConsultSessionModel.analysis_summary: ConsultSummary.summarize(session.get_analysis()),
+                ConsultSessionModel.context_summary: session.get_context_summary(),
+                ConsultSessionModel.summarized_count: session.get_summarized_count(),
+            },
+            synchronize_session=False,
         )
-        self._db.merge(session_model)
 
-        # 기존 메시지 삭제 후 새로 저장 (단순한 구현)
+        if updated == 0:
+            # 신규 세션: 메시지 FK를 위해 세션 행을 먼저 flush
+            self._db.add(self._to_session_model(session, analysis_json))
+            self._db.flush()
+            next_seq = 0
+        else:
+            next_seq = self._next_seq(session.id)
+
+        new_messages = session.get_messages()[next_seq:]
+        if new_messages:
+            self._db.execute(
+                insert(ConsultMessageModel),
+                [
+                    {
+                        "session_id": session.id,
+                        "seq": next_seq + offset,
+                        "role": msg.role,
+                        "content": msg.content,
+                        "created_at": msg.timestamp,
+                    }
+                    for offset, msg in enumerate(new_messages)
+                ],
+            )
+
+    def _next_seq(self, session_id: str) -> int:
+        """세션 행을 잠근 뒤 다음 메시지 순번을 계산한다"""
+        # 같은 세션의 동시 저장이 같은 max(seq)를 읽지 않도록 커밋까지 세션 행을 잠근다
+        self._db.query(ConsultSessionModel.id).filter(
+            ConsultSessionModel.id == session_id
+        ).with_for_update().scalar()
+        max_seq = self._db.query(func.max(ConsultMessageModel.seq)).filter(
+            ConsultMessageModel.session_id == session_id
+        ).scalar()
+        return 0 if max_seq is None else max_seq + 1
+
+    def _save_full(self, session: ConsultSession, analysis_json: str | None) -> None:
+        """세션을 merge하고 메시지를 전부 삭제 후 다시 저장한다 (기존 방식)"""
+        self._db.merge(self._to_session_model(session, analysis_json))
+
         self._db.query(ConsultMessageModel).filter(
             ConsultMessageModel.session_id == session.id
         ).delete()
 
-        # 메시지 저장
-        for msg in session.get_messages():
+        for seq, msg in enumerate(session.get_messages()):
             message_model = ConsultMessageModel(
                 session_id=session.id,
+                seq=seq,
                 role=msg.role,
                 content=msg.content,
                 created_at=msg.timestamp,
             )
             self._db.add(message_model)
 
-        self._db.commit()
+    def _to_session_model(self, session: ConsultSession, analysis_json: str | None) -> ConsultSessionModel:
+        """도메인 세션을 ORM 모델로 변환"""
+        return ConsultSessionModel(
+            id=session.id,
+            user_id=session.user_id,
+            mbti=session.mbti.value,
+            gender=session.gender.value,
+            created_at=session.created_at,
+            is_completed=session.is_completed(),
+            analysis_json=analysis_json,
+            analysis_summary=ConsultSummary.summarize(session.get_analysis()),
+            context_summary=session.get_context_summary(),
+            summarized_count=session.get_summarized_count(),
+        )
 
+    @traced("db.consult.find_by_id")
     def find_by_id(self, session_id: str) -> ConsultSession | None:
         """id로 세션을 조회한다"""
         session_model = self._db.query(ConsultSessionModel).filter(
@@ -61,10 +150,10 @@ class MySQLConsultRepository(ConsultRepositoryPort):
         if session_model is None:
             return None
 
-        # 메시지 조회 (생성 시간순)
+        # 메시지 조회 (seq 순)
         message_models = self._db.query(ConsultMessageModel).filter(
             ConsultMessageModel.session_id == session_id
-        ).order_by(ConsultMessageModel.id).all()
+        ).order_by(ConsultMessageModel.seq, ConsultMessageModel.id).all()
 
         messages = [
             Message(
@@ -89,8 +178,11 @@ class MySQLConsultRepository(ConsultRepositoryPort):
             messages=messages,
             completed=session_model.is_completed or False,
             analysis=analysis,
+            context_summary=session_model.context_summary,
+            summarized_count=session_model.summarized_count or 0,
         )
 
+    @traced("db.consult.find_completed_by_user_id")
     def find_completed_by_user_id(self, user_id: str) -> list[ConsultSession]:
         """user_id로 완료된 세션 목록을 조회한다 (최신순)"""
         session_models = self._db.query(ConsultSessionModel).filter(
@@ -117,3 +209,62 @@ class MySQLConsultRepository(ConsultRepositoryPort):
             ))
 
         return sessions
+
+    @traced("db.consult.find_completed_page")
+    def find_completed_page(
+        self,
+        user_id: str,
+        limit: int,
+        after: HistoryCursor | None = None,
+    ) -> tuple[list[ConsultSummary], HistoryCursor | None]:
+        """완료된 세션 요약을 keyset 방식으로 한 페이지 조회한다
+
+        OFFSET 대신 직전 페이지 마지막 (created_at, id)보다 작은 행부터 읽으므로
+        페이지 깊이와 무관하게 (user_id, is_completed, created_at) 인덱스 범위 스캔으로 끝난다.
+        analysis_json은 읽지 않는다.
+        """
+        query = self._db.query(
+            ConsultSessionModel.id,
+            ConsultSessionModel.created_at,
+            ConsultSessionModel.mbti,
+            ConsultSessionModel.gender,
+            ConsultSessionModel.analysis_summary,
+        ).filter(
+            ConsultSessionModel.user_id == user_id,
+            ConsultSessionModel.is_completed == True
+        )
+
+        if after is not None:
+            query = query.filter(
+                or_(
+                    ConsultSessionModel.created_at < after.created_at,
+                    and_(
+                        ConsultSessionModel.created_at == after.created_at,
+                        ConsultSessionModel.id < after.id,
+                    ),
+                )
+            )
+
+        # 다음 페이지 존재 여부를 알기 위해 한 행 더 읽는다
+        rows = query.order_by(
+            ConsultSessionModel.created_at.desc(),
+            ConsultSessionModel.id.desc(),
+        ).limit(limit + 1).all()
+
+        summaries = [
+            ConsultSummary(
+                id=row.id,
+                created_at=row.created_at,
+                mbti=MBTI(row.mbti),
+                gender=Gender(row.gender),
+                summary=row.analysis_summary,
+            )
+            for row in rows[:limit]
+        ]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last = summaries[-1]
+            next_cursor = HistoryCursor(created_at=last.created_at, id=last.id)
+
+        return summaries, next_cursor
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.consult.application.port.greeting_pool_port import GreetingPoolPort
+from app.consult.domain.pooled_greeting import PooledGreeting
+from app.consult.infrastructure.model.greeting_pool_model import GreetingPoolModel
+from app.consult.infrastructure.model.greeting_pool_refill_model import GreetingPoolRefillModel
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from app.shared.tracing.tracer import traced
+
+
+class MySQLGreetingPoolRepository(GreetingPoolPort):
+    """MySQL 기반 인사말 풀 저장소
+
+    요청 밖(백그라운드 보충 작업)에서도 쓰이므로 요청 세션 대신
+    세션 팩토리를 받아 호출마다 세션을 열고 닫는다.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session]):
+        self._session_factory = session_factory
+
+    @traced("db.greeting_pool.find_by_profile")
+    def find_by_profile(self, mbti: MBTI, gender: Gender) -> list[PooledGreeting]:
+        """MBTI × 성별 조합의 인사말 목록을 조회한다"""
+        with self._session_factory() as db:
+            models = db.query(GreetingPoolModel).filter(
+                GreetingPoolModel.mbti == mbti.value,
+                GreetingPoolModel.gender == gender.value,
+            ).all()
+            return [self._to_domain(model) for model in models]
+
+    @traced("db.greeting_pool.add")
+    def add(self, greeting: PooledGreeting) -> None:
+        """인사말을 풀에 추가한다"""
+        with self._session_factory() as db:
+            db.add(
+                GreetingPoolModel(
+                    id=greeting.id,
+                    mbti=greeting.mbti.value,
+                    gender=greeting.gender.value,
+                    content=greeting.content,
+                    use_count=greeting.use_count,
+                    created_at=greeting.created_at,
+                )
+            )
+            db.commit()
+
+    @traced("db.greeting_pool.mark_used")
+    def mark_used(self, greeting_id: str) -> None:
+        """인사말 사용 횟수를 1 증가시킨다 (UPDATE 한 번)"""
+        with self._session_factory() as db:
+            db.query(GreetingPoolModel).filter(GreetingPoolModel.id == greeting_id).update(
+                {GreetingPoolModel.use_count: GreetingPoolModel.use_count + 1},
+                synchronize_session=False,
+            )
+            db.commit()
+
+    @traced("db.greeting_pool.delete")
+    def delete(self, greeting_id: str) -> None:
+        """인사말을 풀에서 제거한다"""
+        with self._session_factory() as db:
+            db.query(GreetingPoolModel).filter(GreetingPoolModel.id == greeting_id).delete(
+                synchronize_session=False,
+            )
+            db.commit()
+
+    @traced("db.greeting_pool.try_claim_refill")
+    def try_claim_refill(self, mbti: MBTI, gender: Gender, lease_seconds: int) -> bool:
+        """조건부 UPDATE로 조합의 보충을 선점하고, 행이 없으면 INSERT로 선점한다"""
+        profile = self._profile(mbti, gender)
+        now = datetime.now()
+        locked_until = now + timedelta(seconds=lease_seconds)
+        with self._session_factory() as db:
+            claimed = db.query(GreetingPoolRefillModel).filter(
+                GreetingPoolRefillModel.profile == profile,
+                GreetingPoolRefillModel.locked_until <= now,
+            ).update(
+                {GreetingPoolRefillModel.locked_until: locked_until},
+                synchronize_session=False,
+            )
+            db.commit()
+            if claimed == 1:
+                return True
+            if db.get(GreetingPoolRefillModel, profile) is not None:
+                return False
+
+            db.add(GreetingPoolRefillModel(profile=profile, locked_until=locked_until))
+            try:
+                db.commit()
+            except IntegrityError:
+                # 동시에 다른 프로세스가 먼저 선점한 경우
+                db.rollback()
+                return False
+            return True
+
+    @traced("db.greeting_pool.release_refill")
+    def release_refill(self, mbti: MBTI, gender: Gender) -> None:
+        """선점 만료 시각을 지금으로 당겨 다음 보충이 바로 선점할 수 있게 한다"""
+        with self._session_factory() as db:
+            db.query(GreetingPoolRefillModel).filter(
+                GreetingPoolRefillModel.profile == self._profile(mbti, gender),
+            ).update(
+                {GreetingPoolRefillModel.locked_until: datetime.now()},
+                synchronize_session=False,
+            )
+            db.commit()
+
+    def _profile(self, mbti: MBTI, gender: Gender) -> str:
+        return f"{mbti.value}:{gender.value}"
+
+    def _to_domain(self, model: GreetingPoolModel) -> PooledGreeting:
+        return PooledGreeting(
+            id=model.id,
+            mbti=MBTI(model.mbti),
+            gender=Gender(model.gender),
+            content=model.content,
+            use_count=model.use_count,
+            created_at=model.created_at,
+        )
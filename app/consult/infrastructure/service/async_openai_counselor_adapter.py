@@ -0,0 +1,137 @@
+from typing import AsyncIterator, Optional
+from openai import AsyncOpenAI
+
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.analysis import Analysis
+from app.consult.infrastructure.service.conversation_context_manager import (
+    ConversationContextManager,
+    log_prompt_usage,
+)
+from app.consult.infrastructure.service.counselor_prompt_builder import (
+    COUNSELOR_MODEL,
+    CounselorPromptBuilder,
+)
+from app.consult.infrastructure.service.counselor_prompt_registry import (
+    get_counselor_prompt_registry,
+    prompt_cache_options,
+    record_session_progress,
+)
+from app.shared.llm.llm_telemetry import llm_call
+from app.shared.llm.llm_gateway import get_async_llm_gateway
+from app.shared.llm.prompt_registry import PromptRegistry
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from app.shared.tracing.tracer import traced
+
+
+class AsyncOpenAICounselorAdapter(AsyncAICounselorPort):
+    """AsyncOpenAI 클라이언트를 사용하는 비동기 AI 상담사 구현체"""
+
+    def __init__(
+        self,
+        client: Optional[AsyncOpenAI] = None,
+        context: Optional[ConversationContextManager] = None,
+        prompts: Optional[PromptRegistry[CounselorPromptBuilder]] = None,
+    ):
+        """
+        Args:
+            client: 주입하지 않으면 설정한 백엔드 사이에서 라우팅하는 공유 게이트웨이(llm_gateway)를 사용한다
+            context: 설정하면 토큰 예산 안에서 오래된 턴을 누적 요약으로 대체한다
+                (None이면 매 턴 전체 히스토리를 보낸다)
+            prompts: 버전별 프롬프트 (기본: 설정 비율로 사용자를 배정하는 공유 레지스트리)
+        """
+        self._client = client or get_async_llm_gateway()
+        self._prompts = prompts or get_counselor_prompt_registry()
+        self._context = context
+
+    @traced("llm.generate_greeting")
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        """사용자의 MBTI와 성별에 맞는 인사말을 생성한다."""
+        # 인사말은 세션 전에 (풀로 미리) 만들어지므로 기본 버전을 쓴다
+        variant = self._prompts.default
+        with llm_call("consult.generate_greeting", COUNSELOR_MODEL, prompt_version=variant.label) as call:
+            response = await call.arun(
+                self._client.chat.completions.create,
+                model=COUNSELOR_MODEL,
+                messages=variant.prompts.build_greeting_messages(mbti, gender),
+                temperature=0.7,
+                max_tokens=200
+            )
+
+        return response.choices[0].message.content.strip()
+
+    @traced("llm.generate_response")
+    async def generate_response(self, session: ConsultSession, user_message: str) -> str:
+        """사용자 메시지에 대한 AI 응답을 생성한다."""
+        # 누적 요약 갱신 호출은 응답 호출 시간에 넣지 않는다
+        variant = self._prompts.assign(session.user_id)
+        messages = await self._response_messages(session, user_message, variant.prompts)
+        with llm_call("consult.generate_response", COUNSELOR_MODEL, prompt_version=variant.label) as call:
+            response = await call.arun(
+                self._client.chat.completions.create,
+                model=COUNSELOR_MODEL,
+                messages=messages,
+                temperature=0.7,
+                max_tokens=500,
+                **prompt_cache_options(variant, "response")
+            )
+        log_prompt_usage(session, response)
+        record_session_progress(self._prompts, variant, session)
+
+        return response.choices[0].message.content.strip()
+
+    @traced("llm.generate_response_stream")
+    async def generate_response_stream(self, session: ConsultSession, user_message: str) -> AsyncIterator[str]:
+        """사용자 메시지에 대한 AI 응답을 스트리밍 방식으로 생성한다."""
+        # 누적 요약 갱신 호출은 응답 호출 시간에 넣지 않는다
+        variant = self._prompts.assign(session.user_id)
+        messages = await self._response_messages(session, user_message, variant.prompts)
+        with llm_call("consult.generate_response_stream", COUNSELOR_MODEL, prompt_version=variant.label) as call:
+            stream = await call.arun(
+                self._client.chat.completions.create,
+                model=COUNSELOR_MODEL,
+                messages=messages,
+                temperature=0.7,
+                max_tokens=500,
+                stream=True,
+                **prompt_cache_options(variant, "response"),
+                stream_options={"include_usage": True}
+            )
+
+            async for chunk in stream:
+                call.observe_chunk(chunk)
+                if chunk.choices and chunk.choices[0].delta.content is not None:
+                    yield chunk.choices[0].delta.content
+        record_session_progress(self._prompts, variant, session)
+
+    @traced("llm.generate_analysis")
+    async def generate_analysis(self, session: ConsultSession) -> Analysis:
+        """상담 세션을 기반으로 MBTI 관계 분석을 생성한다."""
+        # 깨진 JSON이나 빠진 필드는 요청을 다시 보낸다
+        variant = self._prompts.assign(session.user_id)
+        with llm_call("consult.generate_analysis", COUNSELOR_MODEL, prompt_version=variant.label) as call:
+            return await call.arun_parsed(
+                self._client.chat.completions.create,
+                lambda response: variant.prompts.parse_analysis(response.choices[0].message.content),
+                model=COUNSELOR_MODEL,
+                messages=variant.prompts.build_analysis_messages(session),
+                temperature=0.7,
+                max_tokens=1000,
+                response_format={"type": "json_object"},
+                **prompt_cache_options(variant, "analysis")
+            )
+
+    async def _response_messages(
+        self, session: ConsultSession, user_message: str, prompts: CounselorPromptBuilder
+    ) -> list[dict]:
+        """상담 응답 프롬프트 (컨텍스트 관리자가 있으면 필요할 때 누적 요약을 먼저 갱신한다)"""
+        if self._context is None:
+            return prompts.build_response_messages(session, user_message)
+        await self._context.arefresh_summary(session, self._summarize)
+        return self._context.build_response_messages(session, user_message)
+
+    async def _summarize(self, request: dict) -> str:
+        with llm_call("consult.context_summary", COUNSELOR_MODEL) as call:
+            response = await call.arun(self._client.chat.completions.create, **request)
+        return response.choices[0].message.content or ""
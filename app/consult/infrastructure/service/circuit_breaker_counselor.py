@@ -0,0 +1,85 @@
+import logging
+import time
+from typing import AsyncIterator
+
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.domain.analysis import Analysis, AnalysisDeferredError
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.infrastructure.service.counselor_prompt_builder import CounselorPromptBuilder
+from app.shared.llm.circuit_breaker import CircuitBreaker, CircuitOpenError, is_upstream_failure
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreakerCounselor(AsyncAICounselorPort):
+    """회로 차단기로 감싼 AI 상담사 데코레이터
+
+    회로가 열려 있으면 업스트림을 기다리지 않고:
+    - generate_greeting: MBTI 템플릿 인사말을 바로 반환한다
+    - generate_analysis: AnalysisDeferredError로 분석을 나중으로 미룬다 (분석 작업 큐가 다시 시도)
+    - generate_response / generate_response_stream: CircuitOpenError (라우터가 503으로 응답)
+    """
+
+    def __init__(self, counselor: AsyncAICounselorPort, breaker: CircuitBreaker):
+        self._counselor = counselor
+        self._breaker = breaker
+        self._prompts = CounselorPromptBuilder()
+
+    @property
+    def inner(self) -> AsyncAICounselorPort:
+        """감싼 상담사 (인사말 풀 예열 등 원본 기능에 접근할 때)"""
+        return self._counselor
+
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        try:
+            with self._breaker.guard():
+                return await self._counselor.generate_greeting(mbti, gender)
+        except CircuitOpenError:
+            return self._prompts.build_fallback_greeting(mbti, gender)
+
+    async def generate_response(self, session: ConsultSession, user_message: str) -> str:
+        with self._breaker.guard():
+            return await self._counselor.generate_response(session, user_message)
+
+    def generate_response_stream(self, session: ConsultSession, user_message: str) -> AsyncIterator[str]:
+        # 스트림 응답을 시작하기 전에 거절되도록 호출 시점에 확인만 하고,
+        # 시험 호출 자리는 실제로 순회를 시작할 때 잡는다 (본문이 한 번도 읽히지 않으면 자리를 잡지 않는다)
+        self._breaker.check()
+        return self._guarded_stream(session, user_message)
+
+    async def generate_analysis(self, session: ConsultSession) -> Analysis:
+        try:
+            with self._breaker.guard():
+                return await self._counselor.generate_analysis(session)
+        except CircuitOpenError as e:
+            logger.warning("업스트림 회로가 열려 있어 분석을 미룹니다 session=%s", session.id)
+            raise AnalysisDeferredError(e.retry_after) from e
+
+    async def _guarded_stream(self, session: ConsultSession, user_message: str) -> AsyncIterator[str]:
+        """첫 청크까지의 시간으로 성공/지연을 기록한다 (첫 청크 전에 실패하면 실패로 기록)"""
+        self._breaker.acquire()
+        stream = self._counselor.generate_response_stream(session, user_message)
+        started = time.perf_counter()
+        recorded = False
+        try:
+            async for chunk in stream:
+                if not recorded:
+                    self._breaker.record_success(time.perf_counter() - started)
+                    recorded = True
+                yield chunk
+            if not recorded:
+                self._breaker.record_success(time.perf_counter() - started)
+                recorded = True
+        except Exception as error:
+            if not recorded:
+                recorded = True
+                if is_upstream_failure(error):
+                    self._breaker.record_failure()
+                else:
+                    self._breaker.release()
+            raise
+        finally:
+            if not recorded:
+                self._breaker.release()
@@ -0,0 +1,170 @@
+import logging
+from typing import Awaitable, Callable
+
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.service.counselor_prompt_builder import COUNSELOR_MODEL, CounselorPromptBuilder
+from app.consult.infrastructure.service.counselor_prompt_registry import counselor_prompt_variant
+from app.shared.llm.token_estimator import estimate_message_tokens
+
+logger = logging.getLogger(__name__)
+
+# 누적 요약 생성 응답 최대 토큰
+SUMMARY_MAX_TOKENS = 300
+
+
+class ConversationContextManager:
+    """토큰 예산 안에서 상담 응답 프롬프트를 구성한다
+
+    최근 keep_recent_turns턴은 그대로 보내고, 그보다 오래된 메시지는 세션에 저장된
+    누적 요약(context_summary)으로 대체한다. 요약은 밀려난 메시지가 summary_batch_turns턴 이상
+    쌓였을 때(또는 예산을 넘었을 때) 한 번에 갱신해 요약 호출 횟수를 줄인다.
+    아직 요약되지 않은 메시지는 그대로 보내므로 대화 내용이 빠지지 않는다.
+
+    요약 LLM 호출은 동기/비동기 어댑터가 요청 인자를 받아 텍스트를 돌려주는 함수로 넘기고,
+    이 클래스는 어떤 메시지를 요약할지, 요약 요청 구성, 결과 반영과 실패 처리를 담당한다.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 3000,
+        keep_recent_turns: int = 4,
+        summary_batch_turns: int = 2,
+        prompts: CounselorPromptBuilder | None = None,
+        estimator: Callable[[list[dict]], int] = estimate_message_tokens,
+    ):
+        if keep_recent_turns < 1:
+            raise ValueError("keep_recent_turns는 1 이상이어야 합니다")
+        self._token_budget = token_budget
+        self._keep_recent_turns = keep_recent_turns
+        self._summary_batch_messages = summary_batch_turns * 2
+        # None이면 세션 사용자에게 배정된 프롬프트 버전을 쓴다
+        self._prompts = prompts
+        self._estimate = estimator
+
+    def pending_summary(self, session: ConsultSession) -> list[Message]:
+        """지금 누적 요약에 합쳐야 할 메시지 목록 (요약할 필요가 없으면 빈 목록)"""
+        messages = session.get_messages()
+        summarized = session.get_summarized_count()
+        pending = messages[summarized:self._window_start(session)]
+        if not pending:
+            return []
+
+        if len(pending) >= self._summary_batch_messages:
+            return pending
+        # 배치가 덜 찼어도 요약하지 않으면 예산을 넘는 경우
+        if self._estimate(self._assemble(session, messages[summarized:])) > self._token_budget:
+            return pending
+        return []
+
+    def refresh_summary(self, session: ConsultSession, summarize: Callable[[dict], str]) -> None:
+        """필요하면 누적 요약을 갱신한다 (summarize: 요약 요청 인자를 받아 요약 텍스트를 반환)"""
+        pending = self.pending_summary(session)
+        if not pending:
+            return
+        try:
+            self.apply_summary(session, summarize(self._summary_request(session, pending)), pending)
+        except Exception:
+            # 요약에 실패해도 요약되지 않은 메시지를 그대로 보내 응답은 이어간다
+            logger.exception("상담 컨텍스트 요약 실패 session=%s", session.id)
+
+    async def arefresh_summary(self, session: ConsultSession, summarize: Callable[[dict], Awaitable[str]]) -> None:
+        """refresh_summary의 비동기 버전"""
+        pending = self.pending_summary(session)
+        if not pending:
+            return
+        try:
+            self.apply_summary(session, await summarize(self._summary_request(session, pending)), pending)
+        except Exception:
+            logger.exception("상담 컨텍스트 요약 실패 session=%s", session.id)
+
+    def build_summary_messages(self, session: ConsultSession, pending: list[Message]) -> list[dict]:
+        """누적 요약 갱신 요청 메시지 목록"""
+        return self._prompts_for(session).build_context_summary_messages(session, session.get_context_summary(), pending)
+
+    def apply_summary(self, session: ConsultSession, summary: str, pending: list[Message]) -> None:
+        """요약 결과를 세션에 반영한다 (pending만큼 요약 범위를 늘린다)"""
+        session.update_context_summary(summary.strip(), session.get_summarized_count() + len(pending))
+
+    def build_response_messages(self, session: ConsultSession, user_message: str) -> list[dict]:
+        """상담 응답 생성용 메시지 목록 (고정 앞부분 + 요약 + 요약되지 않은 메시지 + 이번 턴 전략)"""
+        history = session.get_messages()[session.get_summarized_count():]
+        messages = self._assemble(session, history)
+
+        # 유스케이스가 사용자 메시지를 세션에 먼저 추가하므로 같은 메시지를 두 번 보내지 않는다
+        last = history[-1] if history else None
+        if last is None or last.role != "user" or last.content != user_message:
+            messages.insert(len(messages) - 1, {"role": "user", "content": user_message})
+
+        prompt_tokens = self._estimate(messages)
+        logger.info(
+            "consult prompt session=%s turn=%d estimated_prompt_tokens=%d verbatim_messages=%d summarized_messages=%d",
+            session.id,
+            session.get_user_turn_count(),
+            prompt_tokens,
+            len(history),
+            session.get_summarized_count(),
+        )
+        if prompt_tokens > self._token_budget:
+            logger.warning(
+                "consult prompt over budget session=%s estimated_prompt_tokens=%d budget=%d",
+                session.id,
+                prompt_tokens,
+                self._token_budget,
+            )
+        return messages
+
+    def _summary_request(self, session: ConsultSession, pending: list[Message]) -> dict:
+        return {
+            "model": COUNSELOR_MODEL,
+            "messages": self.build_summary_messages(session, pending),
+            "temperature": 0.3,
+            "max_tokens": SUMMARY_MAX_TOKENS,
+        }
+
+    def _assemble(self, session: ConsultSession, history: list[Message]) -> list[dict]:
+        # 요약은 배치로만 바뀌므로 고정 앞부분 바로 뒤에 두고, 턴마다 바뀌는 전략은 맨 끝에 둔다
+        prompts = self._prompts_for(session)
+        messages = [prompts.build_prefix_message(session)]
+        summary = session.get_context_summary()
+        if summary:
+            messages.append({"role": "system", "content": f"지금까지의 상담 요약:\n{summary}"})
+        messages.extend({"role": msg.role, "content": msg.content} for msg in history)
+        messages.append(prompts.build_strategy_message(session))
+        return messages
+
+    def _prompts_for(self, session: ConsultSession) -> CounselorPromptBuilder:
+        return self._prompts or counselor_prompt_variant(session).prompts
+
+    def _window_start(self, session: ConsultSession) -> int:
+        """그대로 보낼 최근 메시지의 시작 위치
+
+        최근 keep_recent_turns턴부터 시작해 예산을 넘으면 한 턴씩 줄인다 (최소 1턴).
+        """
+        messages = session.get_messages()
+        summarized = session.get_summarized_count()
+        user_indexes = [i for i, msg in enumerate(messages) if msg.role == "user"]
+
+        for turns in range(self._keep_recent_turns, 0, -1):
+            if len(user_indexes) < turns:
+                start = summarized
+            else:
+                start = max(user_indexes[-turns], summarized)
+            if turns == 1 or self._estimate(self._assemble(session, messages[start:])) <= self._token_budget:
+                return start
+        return summarized
+
+
+def log_prompt_usage(session: ConsultSession, response) -> None:
+    """OpenAI 응답의 실제 프롬프트 토큰 수와 캐시된 토큰 수를 로그로 남긴다 (usage가 없으면 무시)"""
+    usage = getattr(response, "usage", None)
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    cached_tokens = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None)
+    if isinstance(prompt_tokens, int):
+        logger.info(
+            "consult prompt session=%s turn=%d prompt_tokens=%d cached_tokens=%d",
+            session.id,
+            session.get_user_turn_count(),
+            prompt_tokens,
+            cached_tokens if isinstance(cached_tokens, int) else 0,
+        )
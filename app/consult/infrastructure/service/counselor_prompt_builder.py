@@ -0,0 +1,198 @@
+import itertools
+import json
+
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.analysis import Analysis
+from app.consult.domain.message import Message
+from app.consult.infrastructure.service.counselor_prompt_templates import (
+    COUNSELOR_PROMPT_V1,
+    CounselorPromptTemplate,
+)
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+COUNSELOR_MODEL = "gpt-4o-mini"
+
+ALL_MBTI_TYPES = tuple("".join(letters) for letters in itertools.product("EI", "SN", "TF", "JP"))
+ALL_GENDERS = ("MALE", "FEMALE")
+
+# 요약/분석 프롬프트도 고정 지시를 system에 먼저 두고 세션마다 다른 대화는 user에 둔다 (프롬프트 캐시)
+CONTEXT_SUMMARY_SYSTEM_PROMPT = """당신은 MBTI 관계 상담 대화를 기록하는 요약가입니다. 이후 상담에 필요한 사실만 간결하게 정리합니다.
+
+지금까지의 요약에 이어진 대화를 합쳐 하나의 요약으로 다시 써줘.
+- 고민의 대상과 관계, 구체적인 사건, 상대방의 반응, 사용자의 감정과 바라는 점 위주로
+- 상담사가 이미 던진 질문도 짧게 남겨서 같은 질문을 반복하지 않게
+- 5문장 이내, 반말 없이 사실만 간결하게"""
+
+ANALYSIS_SYSTEM_PROMPT = """당신은 10년 경력의 MBTI 전문 상담사입니다. 대화 내용을 분석하여 MBTI 기반 관계 조언을 제공합니다. 반드시 JSON 형식으로만 응답하세요.
+
+사용자가 보내는 MBTI 관계 상담 대화를 깊이 있게 분석하여 다음 4가지 섹션으로 정리해줘.
+
+중요 원칙:
+- 반말만 사용해 (존댓말 절대 금지, 친구처럼 편하게)
+- 대화 내용을 구체적으로 인용하면서 분석해
+- 일반적인 MBTI 설명이 아닌, 이 사용자의 상황에 맞춘 맞춤형 분석을 해
+
+반드시 아래 JSON 형식으로만 응답해:
+{
+    "situation": "상황 정리 (3-4문장으로 사용자의 관계 고민을 구체적으로 요약. 대화에서 나온 핵심 내용을 포함해서 '네가 ~라고 했잖아' 같은 식으로)",
+    "traits": "MBTI 특성 분석 (4-5문장으로 사용자 MBTI 유형의 특성이 이 상황에서 어떻게 작용하는지 구체적으로 설명. 장점과 주의할 점 모두 언급)",
+    "solutions": "관계 개선 솔루션 (구체적이고 실천 가능한 행동 조언 3가지. 각 조언은 2문장 이상으로 '이렇게 해봐', '~하는 게 좋겠어' 같은 친근한 톤으로)",
+    "cautions": "주의사항 (사용자 MBTI 유형이 이 상황에서 특히 조심해야 할 점 2가지. 각 항목은 2문장 이상으로 구체적인 상황 예시와 함께)"
+}"""
+
+# 업스트림 장애 시 쓰는 템플릿 인사말 문구 (인사말 프롬프트의 E/I, T/F, J/P 가이드를 따른다)
+FALLBACK_GREETING_OPENERS = {
+    "E": "안녕! 반가워 😊",
+    "I": "안녕, 편하게 얘기해도 괜찮아.",
+}
+FALLBACK_GREETING_EMPATHY = {
+    "T": "{mbti}라면 상황을 차근차근 정리해 보고 싶을 것 같아.",
+    "F": "{mbti}라면 마음 쓰이는 관계가 있을 때 많이 고민될 것 같아.",
+}
+FALLBACK_GREETING_QUESTIONS = {
+    "J": "어떤 관계 고민이 있어? 하나씩 같이 정리해 보자.",
+    "P": "어떤 관계 고민이 있어? 생각나는 대로 편하게 말해줘.",
+}
+
+
+class CounselorPromptBuilder:
+    """AI 상담사 프롬프트 생성기 (동기/비동기 OpenAI 어댑터 공용)
+
+    템플릿 한 버전의 인사말 프롬프트와 응답 프롬프트 앞부분을 생성 시 모두 만들어 두고 요청마다 조회만 한다.
+    버전 배정은 counselor_prompt_registry가 맡는다.
+    """
+
+    def __init__(self, template: CounselorPromptTemplate = COUNSELOR_PROMPT_V1):
+        self._template = template
+        self._precompute()
+
+    @property
+    def version(self) -> str:
+        return self._template.version
+
+    def build_greeting_messages(self, mbti: MBTI, gender: Gender) -> list[dict]:
+        """인사말 생성용 OpenAI 메시지 목록"""
+        return [
+            {"role": "system", "content": self._template.greeting_system},
+            {"role": "user", "content": self.build_greeting_prompt(mbti, gender)},
+        ]
+
+    def build_response_messages(self, session: ConsultSession, user_message: str) -> list[dict]:
+        """상담 응답 생성용 OpenAI 메시지 목록
+
+        [고정 원칙 + 사용자 정보] [대화 히스토리] [사용자 메시지] [이번 턴 전략] 순서라
+        같은 세션의 다음 턴 요청은 이번 요청의 히스토리까지를 그대로 앞부분으로 공유한다 (제공자 프롬프트 캐시).
+        """
+        history = session.get_messages()
+        messages = [self.build_prefix_message(session)]
+        messages.extend({"role": msg.role, "content": msg.content} for msg in history)
+
+        # 유스케이스가 사용자 메시지를 세션에 먼저 추가하므로 같은 메시지를 두 번 보내지 않는다
+        last = history[-1] if history else None
+        if last is None or last.role != "user" or last.content != user_message:
+            messages.append({"role": "user", "content": user_message})
+        messages.append(self.build_strategy_message(session))
+        return messages
+
+    def build_analysis_messages(self, session: ConsultSession) -> list[dict]:
+        """분석 생성용 OpenAI 메시지 목록"""
+        return [
+            {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
+            {"role": "user", "content": self.build_analysis_prompt(session)},
+        ]
+
+    def parse_analysis(self, content: str) -> Analysis:
+        """분석 응답(JSON)을 Analysis로 변환한다"""
+        result = json.loads(content)
+
+        # OpenAI가 list로 반환할 경우 string으로 변환
+        def to_string(value):
+            if isinstance(value, list):
+                return "\n".join(f"{i+1}. {item}" for i, item in enumerate(value))
+            return value
+
+        return Analysis(
+            situation=to_string(result["situation"]),
+            traits=to_string(result["traits"]),
+            solutions=to_string(result["solutions"]),
+            cautions=to_string(result["cautions"]),
+        )
+
+    def build_greeting_prompt(self, mbti: MBTI, gender: Gender) -> str:
+        """MBTI 특성을 반영한 인사말 생성 프롬프트"""
+        return self._greeting_prompts[(mbti.value, gender.value)]
+
+    def build_fallback_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        """LLM 없이 만드는 MBTI 템플릿 인사말 (업스트림 장애 시 대체 응답)"""
+        return " ".join((
+            FALLBACK_GREETING_OPENERS[mbti.energy],
+            FALLBACK_GREETING_EMPATHY[mbti.decision].format(mbti=mbti.value),
+            FALLBACK_GREETING_QUESTIONS[mbti.lifestyle],
+        ))
+
+    def build_prefix_message(self, session: ConsultSession) -> dict:
+        """상담 응답 프롬프트 맨 앞의 system 메시지 (모든 요청에 같은 원칙 + 세션 동안 같은 사용자 정보)"""
+        return {"role": "system", "content": self._prefix_prompts[(session.mbti.value, session.gender.value)]}
+
+    def build_strategy_message(self, session: ConsultSession) -> dict:
+        """상담 응답 프롬프트 맨 끝의 system 메시지 (턴 수에 따른 상담 전략)"""
+        return {"role": "system", "content": self.get_strategy_by_turn(session.get_user_turn_count())}
+
+    def build_context_summary_messages(
+        self,
+        session: ConsultSession,
+        previous_summary: str | None,
+        messages: list[Message],
+    ) -> list[dict]:
+        """이전 요약에 새로 밀려난 대화를 합쳐 누적 요약을 갱신하는 OpenAI 메시지 목록"""
+        conversation = "\n".join(
+            f"{'사용자' if msg.role == 'user' else '상담사'}: {msg.content}"
+            for msg in messages
+        )
+
+        return [
+            {"role": "system", "content": CONTEXT_SUMMARY_SYSTEM_PROMPT},
+            {"role": "user", "content": f"""사용자 정보: {session.mbti.value}, {session.gender.value}
+
+지금까지의 요약:
+{previous_summary or "(없음)"}
+
+이어진 대화:
+{conversation}"""},
+        ]
+
+    def get_strategy_by_turn(self, turn_count: int) -> str:
+        """턴 수에 따른 상담 전략 가이드 (turn_count는 1부터 시작)"""
+        strategies = self._strategies
+        return strategies[turn_count - 1] if 1 <= turn_count <= len(strategies) else strategies[-1]
+
+    def _precompute(self) -> None:
+        """MBTI x 성별별로 고정된 인사말 프롬프트와 응답 프롬프트 앞부분을 미리 만들어 둔다"""
+        template = self._template
+        guides = template.greeting_guides
+        self._greeting_prompts: dict[tuple[str, str], str] = {}
+        self._prefix_prompts: dict[tuple[str, str], str] = {}
+        self._strategies = tuple(strategy.strip() for strategy in template.strategies)
+        for mbti, gender in itertools.product(ALL_MBTI_TYPES, ALL_GENDERS):
+            ei, sn, tf, jp = mbti
+            self._greeting_prompts[(mbti, gender)] = template.greeting_template.format(
+                mbti=mbti, gender=gender, ei=ei, sn=sn, tf=tf, jp=jp,
+                ei_guide=guides[ei], sn_guide=guides[sn], tf_guide=guides[tf], jp_guide=guides[jp],
+            )
+            profile = template.response_profile_template.format(mbti=mbti, gender=gender)
+            self._prefix_prompts[(mbti, gender)] = f"{template.response_system}\n\n{profile}"
+
+    def build_analysis_prompt(self, session: ConsultSession) -> str:
+        """분석할 대화 (분석 지시와 JSON 형식은 ANALYSIS_SYSTEM_PROMPT에 있다)"""
+        conversation = "\n".join([
+            f"{'사용자' if msg.role == 'user' else 'AI'}: {msg.content}"
+            for msg in session.get_messages()
+        ])
+
+        return f"""사용자 정보:
+- MBTI: {session.mbti.value}
+- 성별: {session.gender.value}
+
+대화 내용:
+{conversation}"""
@@ -0,0 +1,48 @@
+from functools import lru_cache
+
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.infrastructure.service.counselor_prompt_builder import CounselorPromptBuilder
+from app.consult.infrastructure.service.counselor_prompt_templates import COUNSELOR_PROMPT_TEMPLATES
+from app.shared.llm.prompt_registry import PromptRegistry, PromptVariant, get_variant_weights
+from config.settings import get_settings
+
+# PROMPT_VARIANTS 설정에서 쓰는 상담 프롬프트 묶음 이름
+COUNSELOR_PROMPT_NAME = "consult"
+
+
+@lru_cache()
+def get_counselor_prompt_registry() -> PromptRegistry[CounselorPromptBuilder]:
+    """버전별 상담 프롬프트 빌더 (프로세스 단위 싱글톤, 첫 호출 때 모든 버전의 고정 프롬프트를 만든다)"""
+    return PromptRegistry(
+        COUNSELOR_PROMPT_NAME,
+        {template.version: CounselorPromptBuilder(template) for template in COUNSELOR_PROMPT_TEMPLATES},
+        get_variant_weights().get(COUNSELOR_PROMPT_NAME),
+    )
+
+
+def counselor_prompt_variant(session: ConsultSession) -> PromptVariant[CounselorPromptBuilder]:
+    """세션 사용자에게 배정된 상담 프롬프트 버전 (같은 사용자는 모든 세션에서 같은 버전)"""
+    return get_counselor_prompt_registry().assign(session.user_id)
+
+
+def record_session_progress(
+    registry: PromptRegistry[CounselorPromptBuilder],
+    variant: PromptVariant[CounselorPromptBuilder],
+    session: ConsultSession,
+) -> None:
+    """상담 응답을 만든 턴이 첫 턴이면 started, 마지막 턴이면 completed로 센다 (버전별 완료율)"""
+    if session.get_user_turn_count() == 1:
+        registry.record_stage(variant, "started")
+    if session.is_completed():
+        registry.record_stage(variant, "completed")
+
+
+def prompt_cache_options(variant: PromptVariant[CounselorPromptBuilder], purpose: str) -> dict:
+    """프롬프트 버전과 용도(응답/분석) 단위 prompt_cache_key 요청 인자 (동기/비동기 어댑터 공용)
+
+    같은 정적 프롬프트 앞부분을 쓰는 요청은 세션이 달라도 같은 캐시로 가야 적중률이 오른다.
+    (세션 id로 키를 나누면 세션마다 첫 요청이 항상 캐시를 놓친다)
+    """
+    if not get_settings().OPENAI_PROMPT_CACHE_KEY:
+        return {}
+    return {"prompt_cache_key": f"{variant.label}:{purpose}"}
@@ -0,0 +1,141 @@
+import asyncio
+import itertools
+import logging
+import random
+from typing import AsyncIterator
+
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.application.port.greeting_pool_port import GreetingPoolPort
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.analysis import Analysis
+from app.consult.domain.pooled_greeting import PooledGreeting
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+logger = logging.getLogger(__name__)
+
+# 인사말은 (MBTI, 성별)에만 의존하므로 조합은 16 × 2 = 32가지
+ALL_PROFILES = [
+    (MBTI("".join(letters)), Gender(gender))
+    for letters in itertools.product("EI", "SN", "TF", "JP")
+    for gender in ("MALE", "FEMALE")
+]
+
+
+class PooledGreetingCounselor(AsyncAICounselorPort):
+    """인사말을 미리 생성해 둔 풀에서 꺼내 주는 AI 상담사 데코레이터
+
+    - generate_greeting은 풀에서 무작위로 하나를 골라 즉시 반환한다.
+    - 사용 횟수 기록, max_uses에 도달한 인사말 교체, 풀 보충은 백그라운드에서 한다.
+    - 풀이 비어 있으면 원본 상담사로 바로 생성한다.
+    - 보충은 조합별로 풀 저장소에서 선점한 프로세스만 한다.
+      (uvicorn 워커/인스턴스마다 warm_up이 돌아도 조합당 pool_size개만 생성)
+    - 인사말 외 기능은 원본 상담사에 그대로 위임한다.
+    """
+
+    def __init__(
+        self,
+        counselor: AsyncAICounselorPort,
+        pool: GreetingPoolPort,
+        pool_size: int = 5,
+        max_uses: int = 20,
+        refill_concurrency: int = 4,
+        refill_lease_seconds: int = 120,
+    ):
+        self._counselor = counselor
+        self._pool = pool
+        self._pool_size = pool_size
+        self._max_uses = max_uses
+        self._refill_lease_seconds = refill_lease_seconds
+        self._refill_semaphore = asyncio.Semaphore(refill_concurrency)
+        self._refilling: set[tuple[str, str]] = set()
+        self._background_tasks: set[asyncio.Task] = set()
+
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        greetings = await asyncio.to_thread(self._pool.find_by_profile, mbti, gender)
+        if not greetings:
+            self._schedule(self.refill(mbti, gender))
+            return await self._counselor.generate_greeting(mbti, gender)
+
+        greeting = random.choice(greetings)
+        self._schedule(self._rotate(greeting, remaining=len(greetings)))
+        return greeting.content
+
+    async def generate_response(self, session: ConsultSession, user_message: str) -> str:
+        return await self._counselor.generate_response(session, user_message)
+
+    def generate_response_stream(self, session: ConsultSession, user_message: str) -> AsyncIterator[str]:
+        return self._counselor.generate_response_stream(session, user_message)
+
+    async def generate_analysis(self, session: ConsultSession) -> Analysis:
+        return await self._counselor.generate_analysis(session)
+
+    async def refill(self, mbti: MBTI, gender: Gender) -> int:
+        """조합의 인사말이 pool_size개가 되도록 새로 생성해 채운다 (추가한 개수 반환)"""
+        key = (mbti.value, gender.value)
+        if key in self._refilling:
+            return 0
+        self._refilling.add(key)
+        try:
+            claimed = await asyncio.to_thread(
+                self._pool.try_claim_refill, mbti, gender, self._refill_lease_seconds
+            )
+            if not claimed:
+                # 다른 워커/인스턴스가 이 조합을 채우는 중
+                return 0
+            try:
+                return await self._fill(mbti, gender)
+            finally:
+                await asyncio.to_thread(self._pool.release_refill, mbti, gender)
+        finally:
+            self._refilling.discard(key)
+
+    async def _fill(self, mbti: MBTI, gender: Gender) -> int:
+        existing = await asyncio.to_thread(self._pool.find_by_profile, mbti, gender)
+        shortage = self._pool_size - len(existing)
+        if shortage <= 0:
+            return 0
+        async with self._refill_semaphore:
+            contents = await asyncio.gather(
+                *(self._counselor.generate_greeting(mbti, gender) for _ in range(shortage))
+            )
+        for content in contents:
+            await asyncio.to_thread(self._pool.add, PooledGreeting(mbti=mbti, gender=gender, content=content))
+        return len(contents)
+
+    async def warm_up(self) -> None:
+        """32개 조합 전체의 풀을 채운다 (애플리케이션 시작 시 백그라운드 실행)"""
+        results = await asyncio.gather(
+            *(self.refill(mbti, gender) for mbti, gender in ALL_PROFILES),
+            return_exceptions=True,
+        )
+        for (mbti, gender), result in zip(ALL_PROFILES, results):
+            if isinstance(result, Exception):
+                logger.warning("인사말 풀 보충 실패 (%s, %s): %s", mbti.value, gender.value, result)
+
+    async def drain(self) -> None:
+        """진행 중인 백그라운드 작업이 끝날 때까지 기다린다"""
+        while self._background_tasks:
+            await asyncio.gather(*list(self._background_tasks), return_exceptions=True)
+
+    async def _rotate(self, greeting: PooledGreeting, remaining: int) -> None:
+        """사용 횟수를 기록하고, 다 쓴 인사말은 교체한다"""
+        if greeting.use_count + 1 >= self._max_uses:
+            await asyncio.to_thread(self._pool.delete, greeting.id)
+            remaining -= 1
+        else:
+            await asyncio.to_thread(self._pool.mark_used, greeting.id)
+        if remaining < self._pool_size:
+            await self.refill(greeting.mbti, greeting.gender)
+
+    def _schedule(self, coroutine) -> None:
+        """응답을 막지 않도록 작업을 백그라운드 태스크로 실행한다"""
+        task = asyncio.create_task(self._run_quietly(coroutine))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _run_quietly(self, coroutine) -> None:
+        try:
+            await coroutine
+        except Exception:
+            logger.exception("인사말 풀 백그라운드 작업 실패")
@@ -0,0 +1,38 @@
+import asyncio
+from typing import AsyncIterator
+
+from app.consult.application.port.ai_counselor_port import AICounselorPort
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.analysis import Analysis
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+_STREAM_END = object()
+
+
+class ThreadedAICounselor(AsyncAICounselorPort):
+    """동기 AICounselorPort를 비동기 포트로 감싸는 어댑터
+
+    동기 구현체(Fake, 기존 OpenAICounselorAdapter 등)의 호출을 스레드에서 실행한다.
+    """
+
+    def __init__(self, counselor: AICounselorPort):
+        self._counselor = counselor
+
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        return await asyncio.to_thread(self._counselor.generate_greeting, mbti, gender)
+
+    async def generate_response(self, session: ConsultSession, user_message: str) -> str:
+        return await asyncio.to_thread(self._counselor.generate_response, session, user_message)
+
+    async def generate_response_stream(self, session: ConsultSession, user_message: str) -> AsyncIterator[str]:
+        iterator = iter(self._counselor.generate_response_stream(session, user_message))
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, _STREAM_END)
+            if chunk is _STREAM_END:
+                break
+            yield chunk
+
+    async def generate_analysis(self, session: ConsultSession) -> Analysis:
+        return await asyncio.to_thread(self._counselor.generate_analysis, session)
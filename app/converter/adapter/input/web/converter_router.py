@@ -1,7 +1,8 @@
 """Converter Router"""
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
+from app.auth.adapter.input.web.auth_dependency import get_current_user_id
 from app.converter.adapter.input.web.request.convert_request import ConvertRequest
 from app.converter.adapter.input.web.request.convert_three_tones_request import (
     ConvertThreeTonesRequest,
@@ -13,16 +14,58 @@ from app.converter.adapter.input.web.response.convert_three_tones_response impor
 from app.converter.application.use_case.convert_message_use_case import (
     ConvertMessageUseCase,
 )
+from app.converter.application.port.message_converter_port import MessageConverterPort
+from app.converter.infrastructure.cache.conversion_cache import (
+    get_conversion_cache,
+    get_conversion_store,
+)
+from app.converter.infrastructure.service.caching_message_converter import (
+    CachingMessageConverter,
+)
+from app.converter.infrastructure.service.circuit_breaker_message_converter import (
+    CircuitBreakerMessageConverter,
+)
 from app.converter.infrastructure.service.openai_message_converter import (
     OpenAIMessageConverter,
 )
+from app.shared.llm.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from app.shared.ratelimit.admission_dependency import require_admission
 from app.shared.vo.mbti import MBTI
+from config.settings import get_settings
 
 converter_router = APIRouter()
 
+# 입장 제어: 톤 하나 변환에 쓰는 추정 토큰 수 (프롬프트 + 응답, 본문 길이는 따로 더한다)
+CONVERT_ESTIMATED_TOKENS = 1200
+
+
+def _build_converter() -> MessageConverterPort:
+    """요청용 MessageConverter 생성 (설정에 따라 회로 차단기와 결과 캐시로 감싼다)"""
+    converter: MessageConverterPort = OpenAIMessageConverter()
+    breaker = get_circuit_breaker("converter")
+    if breaker is not None:
+        converter = CircuitBreakerMessageConverter(converter, breaker)
+    if not get_settings().CONVERTER_CACHE_ENABLED:
+        return converter
+    return CachingMessageConverter(
+        inner=converter,
+        cache=get_conversion_cache(),
+        store=get_conversion_store(),
+    )
+
+
+def _unavailable(error: CircuitOpenError) -> HTTPException:
+    """업스트림 회로가 열려 있을 때의 503 응답"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="메시지 변환 서비스가 일시적으로 원활하지 않습니다. 잠시 후 다시 시도해주세요",
+        headers={"Retry-After": str(int(error.retry_after))},
+    )
+
 
 @converter_router.post(
     "/convert",
+    dependencies=[Depends(require_admission("converter.convert", base_tokens=CONVERT_ESTIMATED_TOKENS))],
     response_model=ConvertResponse,
     status_code=status.HTTP_200_OK,
     summary="메시지 변환",
@@ -37,20 +80,23 @@ def convert_message(request: ConvertRequest) -> ConvertResponse:
     Returns:
         ConvertResponse: 변환된 메시지
     """
-    # MessageConverter 인스턴스 생성
-    converter = OpenAIMessageConverter()
+    # MessageConverter 인스턴스 생성 (결과 캐시 포함)
+    converter = _build_converter()
 
     # MBTI 값 객체 생성
     sender_mbti = MBTI(request.sender_mbti)
     receiver_mbti = MBTI(request.receiver_mbti)
 
     # 메시지 변환
-    tone_message = converter.convert(
-        original_message=request.original_message,
-        sender_mbti=sender_mbti,
-        receiver_mbti=receiver_mbti,
-        tone=request.tone,
-    )
+    try:
+        tone_message = converter.convert(
+            original_message=request.original_message,
+            sender_mbti=sender_mbti,
+            receiver_mbti=receiver_mbti,
+            tone=request.tone,
+        )
+    except CircuitOpenError as e:
+        raise _unavailable(e)
 
     # 응답 DTO로 변환
     return ConvertResponse.from_domain(tone_message)
@@ -58,6 +104,15 @@ def convert_message(request: ConvertRequest) -> ConvertResponse:
 
 @converter_router.post(
     "/convert-three-tones",
+    dependencies=[
+        Depends(
+            require_admission(
+                "converter.convert_three_tones",
+                llm_requests=3,
+                base_tokens=3 * CONVERT_ESTIMATED_TOKENS,
+            )
+        )
+    ],
     response_model=ConvertThreeTonesResponse,
     status_code=status.HTTP_200_OK,
     summary="메시지 3가지 톤 변환",
@@ -74,22 +129,38 @@ def convert_message_three_tones(
     Returns:
         ConvertThreeTonesResponse: 3가지 톤으로 변환된 메시지
     """
-    # MessageConverter 인스턴스 생성
-    converter = OpenAIMessageConverter()
+    # MessageConverter 인스턴스 생성 (결과 캐시 포함)
+    converter = _build_converter()
 
-    # UseCase 생성
-    use_case = ConvertMessageUseCase(converter=converter)
+    # UseCase 생성 (변환 전략은 설정에서)
+    use_case = ConvertMessageUseCase(
+        converter=converter,
+        strategy=get_settings().CONVERTER_THREE_TONES_STRATEGY,
+    )
 
     # MBTI 값 객체 생성
     sender_mbti = MBTI(request.sender_mbti)
     receiver_mbti = MBTI(request.receiver_mbti)
 
     # 3가지 톤으로 변환
-    tone_messages = use_case.execute(
-        original_message=request.original_message,
-        sender_mbti=sender_mbti,
-        receiver_mbti=receiver_mbti,
-    )
+    try:
+        tone_messages = use_case.execute(
+            original_message=request.original_message,
+            sender_mbti=sender_mbti,
+            receiver_mbti=receiver_mbti,
+        )
+    except CircuitOpenError as e:
+        raise _unavailable(e)
 
     # 응답 DTO로 변환
     return ConvertThreeTonesResponse.from_domain(tone_messages)
+
+
+@converter_router.get("/cache/stats", dependencies=[Depends(get_current_user_id)])
+def conversion_cache_stats():
+    """변환 결과 캐시 통계 (메모리 계층은 현재 워커 프로세스 기준)"""
+    store = get_conversion_store()
+    return {
+        "memory": get_conversion_cache().stats(),
+        "sqlite": store.stats() if store else None,
+    }
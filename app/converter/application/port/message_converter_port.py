@@ -1,6 +1,7 @@
 """MessageConverterPort 인터페이스"""
 
 from abc import ABC, abstractmethod
+from typing import List
 
 from app.converter.domain.tone_message import ToneMessage
 from app.shared.vo.mbti import MBTI
@@ -32,3 +33,34 @@ class MessageConverterPort(ABC):
             ToneMessage: 변환된 메시지
         """
         pass
+
+    def convert_tones(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tones: List[str],
+    ) -> List[ToneMessage]:
+        """메시지를 여러 톤으로 한 번에 변환
+
+        기본 구현은 톤마다 convert를 순서대로 호출한다.
+        한 번의 호출로 여러 톤을 만들 수 있는 구현체는 이 메서드를 재정의한다.
+
+        Args:
+            original_message: 원본 메시지
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tones: 변환할 톤 목록
+
+        Returns:
+            List[ToneMessage]: tones와 같은 순서의 변환된 메시지 목록
+        """
+        return [
+            self.convert(
+                original_message=original_message,
+                sender_mbti=sender_mbti,
+                receiver_mbti=receiver_mbti,
+                tone=tone,
+            )
+            for tone in tones
+        ]
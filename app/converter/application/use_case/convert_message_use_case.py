@@ -1,25 +1,47 @@
 """ConvertMessageUseCase - 3가지 톤 동시 생성"""
 
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List
 
 from app.converter.application.port.message_converter_port import MessageConverterPort
 from app.converter.domain.tone_message import ToneMessage
 from app.shared.vo.mbti import MBTI
+from app.shared.tracing.tracer import traced
+
+
+@lru_cache()
+def _tone_executor() -> ThreadPoolExecutor:
+    """톤별 변환을 동시에 호출하는 스레드풀 (프로세스 단위 싱글톤, 요청마다 풀을 만들지 않는다)"""
+    return ThreadPoolExecutor(max_workers=24, thread_name_prefix="convert-tone")
 
 
 class ConvertMessageUseCase:
-    """메시지를 3가지 톤으로 동시에 변환하는 유스케이스"""
+    """메시지를 3가지 톤으로 동시에 변환하는 유스케이스
+
+    변환 전략:
+        - "sequential": 톤마다 convert를 순서대로 호출
+        - "parallel": 톤별 convert를 동시에 호출하고 원래 톤 순서로 반환
+        - "single_call": convert_tones로 한 번에 모든 톤을 요청
+    """
 
     TONES = ["공손한", "캐주얼한", "간결한"]
+    STRATEGIES = ("sequential", "parallel", "single_call")
 
-    def __init__(self, converter: MessageConverterPort):
+    def __init__(self, converter: MessageConverterPort, strategy: str = "sequential"):
         """초기화
 
         Args:
             converter: MessageConverterPort 구현체
+            strategy: 3가지 톤 변환 전략 (STRATEGIES 중 하나)
         """
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"지원하지 않는 변환 전략입니다: {strategy}")
         self.converter = converter
+        self.strategy = strategy
 
+    @traced("usecase.convert_message")
     def execute(
         self,
         original_message: str,
@@ -34,17 +56,28 @@ class ConvertMessageUseCase:
             receiver_mbti: 수신자 MBTI
 
         Returns:
-            List[ToneMessage]: 3가지 톤으로 변환된 메시지 목록
+            List[ToneMessage]: 3가지 톤으로 변환된 메시지 목록 (TONES 순서)
         """
-        results = []
+        if self.strategy == "single_call":
+            return self.converter.convert_tones(
+                original_message=original_message,
+                sender_mbti=sender_mbti,
+                receiver_mbti=receiver_mbti,
+                tones=list(self.TONES),
+            )
 
-        for tone in self.TONES:
-            tone_message = self.converter.convert(
+        def convert(tone: str) -> ToneMessage:
+            return self.converter.convert(
                 original_message=original_message,
                 sender_mbti=sender_mbti,
                 receiver_mbti=receiver_mbti,
                 tone=tone,
             )
-            results.append(tone_message)
 
-        return results
+        if self.strategy == "parallel":
+            # executor.map은 입력 순서대로 결과를 돌려준다
+            # (작업마다 호출 스레드의 컨텍스트 사본에서 실행해 요청 trace가 이어지게 한다)
+            contexts = [contextvars.copy_context() for _ in self.TONES]
+            return list(_tone_executor().map(lambda context, tone: context.run(convert, tone), contexts, self.TONES))
+
+        return [convert(tone) for tone in self.TONES]
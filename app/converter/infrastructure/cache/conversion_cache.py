@@ -0,0 +1,71 @@
+"""메시지 변환 결과 캐시 (키 정규화 + 프로세스 전역 인스턴스)"""
+
+import hashlib
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Optional
+
+from app.converter.domain.tone_message import ToneMessage
+from app.converter.infrastructure.cache.sqlite_conversion_store import SQLiteConversionStore
+from app.shared.cache.lru_ttl_cache import LRUTTLCache
+from app.shared.vo.mbti import MBTI
+from config.settings import get_settings
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_message(message: str) -> str:
+    """캐시 키용 메시지 정규화 (NFC, 앞뒤 공백 제거, 연속 공백 축약)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", message)).strip()
+
+
+def conversion_cache_key(
+    original_message: str,
+    sender_mbti: MBTI,
+    receiver_mbti: MBTI,
+    tone: str,
+) -> str:
+    """(정규화된 메시지, 발신자 MBTI, 수신자 MBTI, 톤)의 SHA-256 키
+
+    긴 메시지도 고정 길이 키가 되도록 해시한다.
+    """
+    raw = "\x1f".join(
+        [
+            normalize_message(original_message),
+            sender_mbti.value.upper(),
+            receiver_mbti.value.upper(),
+            tone.strip(),
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def tone_message_size(message: ToneMessage) -> int:
+    """캐시 용량 집계용 ToneMessage 크기 (UTF-8 바이트)"""
+    return sum(len(text.encode("utf-8")) for text in (message.tone, message.content, message.explanation))
+
+
+@lru_cache()
+def get_conversion_cache() -> LRUTTLCache:
+    """프로세스 전역 변환 결과 메모리 캐시 (cache_key -> ToneMessage)"""
+    settings = get_settings()
+    return LRUTTLCache(
+        max_size=settings.CONVERTER_CACHE_MAX_SIZE,
+        ttl_seconds=settings.CONVERTER_CACHE_TTL_SECONDS,
+        sizeof=tone_message_size,
+        max_bytes=settings.CONVERTER_CACHE_MAX_BYTES,
+    )
+
+
+@lru_cache()
+def get_conversion_store() -> Optional[SQLiteConversionStore]:
+    """재시작 후에도 유지되는 SQLite 캐시 계층 (CONVERTER_CACHE_SQLITE_PATH가 비어 있으면 None)"""
+    settings = get_settings()
+    if not settings.CONVERTER_CACHE_SQLITE_PATH:
+        return None
+    return SQLiteConversionStore(
+        path=settings.CONVERTER_CACHE_SQLITE_PATH,
+        ttl_seconds=settings.CONVERTER_CACHE_TTL_SECONDS,
+        max_rows=settings.CONVERTER_CACHE_SQLITE_MAX_ROWS,
+    )
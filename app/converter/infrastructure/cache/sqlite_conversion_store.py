@@ -0,0 +1,118 @@
+"""SQLite 기반 변환 결과 영구 캐시 계층"""
+
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+from app.converter.domain.tone_message import ToneMessage
+
+# 이만큼 저장할 때마다 만료된 행과 max_rows를 넘는 오래된 행을 정리한다
+PRUNE_EVERY_SETS = 100
+
+
+class SQLiteConversionStore:
+    """변환 결과를 로컬 SQLite 파일에 보관하는 캐시 계층 (스레드 안전)
+
+    메모리 캐시 뒤에 두어 워커 재시작 후에도 자주 쓰는 변환 결과를 재사용한다.
+    만료된 행은 조회 시점에 지우고, 시작할 때와 prune_every번 저장할 때마다
+    만료된 행 전체와 max_rows를 넘는 행(만료가 가장 이른 것부터)을 지운다.
+    (정리 사이에는 행 수가 최대 prune_every - 1개까지 max_rows를 넘을 수 있다)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float,
+        max_rows: int = 100_000,
+        clock: Callable[[], float] = time.time,
+        prune_every: int = PRUNE_EVERY_SETS,
+    ):
+        self._ttl = ttl_seconds
+        self._max_rows = max_rows
+        self._prune_every = max(prune_every, 1)
+        self._sets_since_prune = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS conversion_cache (
+                cache_key TEXT PRIMARY KEY,
+                tone TEXT NOT NULL,
+                content TEXT NOT NULL,
+                explanation TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_conversion_cache_expires_at ON conversion_cache (expires_at)"
+        )
+        self._prune()
+        self._conn.commit()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> Optional[ToneMessage]:
+        """키에 해당하는 변환 결과 (없거나 만료되면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tone, content, explanation, expires_at FROM conversion_cache WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            tone, content, explanation, expires_at = row
+            if expires_at <= self._clock():
+                self._conn.execute("DELETE FROM conversion_cache WHERE cache_key = ?", (key,))
+                self._conn.commit()
+                self._misses += 1
+                return None
+            self._hits += 1
+            return ToneMessage(tone=tone, content=content, explanation=explanation)
+
+    def set(self, key: str, message: ToneMessage) -> None:
+        """변환 결과를 저장한다 (같은 키는 덮어쓴다)"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO conversion_cache VALUES (?, ?, ?, ?, ?)",
+                (key, message.tone, message.content, message.explanation, self._clock() + self._ttl),
+            )
+            self._sets_since_prune += 1
+            if self._sets_since_prune >= self._prune_every:
+                self._prune()
+            self._conn.commit()
+
+    def _prune(self) -> None:
+        """만료된 행과 max_rows를 넘는 행(만료가 가장 이른 것부터)을 지운다 (잠금을 쥔 상태에서 호출)"""
+        self._sets_since_prune = 0
+        self._conn.execute("DELETE FROM conversion_cache WHERE expires_at <= ?", (self._clock(),))
+        self._conn.execute(
+            "DELETE FROM conversion_cache WHERE cache_key IN ("
+            " SELECT cache_key FROM conversion_cache ORDER BY expires_at DESC LIMIT -1 OFFSET ?)",
+            (self._max_rows,),
+        )
+
+    def stats(self) -> dict:
+        """행 수, 저장 바이트, hit/miss 통계"""
+        with self._lock:
+            rows, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(CAST(tone || content || explanation AS BLOB))), 0)"
+                " FROM conversion_cache"
+            ).fetchone()
+            lookups = self._hits + self._misses
+            return {
+                "size": rows,
+                "bytes": size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
+
+    def close(self) -> None:
+        """SQLite 연결을 닫는다"""
+        with self._lock:
+            self._conn.close()
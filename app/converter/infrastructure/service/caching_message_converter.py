@@ -0,0 +1,99 @@
+"""변환 결과 캐시 데코레이터"""
+
+from typing import Dict, List, Optional
+
+from app.converter.application.port.message_converter_port import MessageConverterPort
+from app.converter.domain.tone_message import ToneMessage
+from app.converter.infrastructure.cache.conversion_cache import conversion_cache_key
+from app.converter.infrastructure.cache.sqlite_conversion_store import SQLiteConversionStore
+from app.shared.cache.lru_ttl_cache import LRUTTLCache, MISSING
+from app.shared.vo.mbti import MBTI
+
+
+class CachingMessageConverter(MessageConverterPort):
+    """변환 결과를 메모리(LRU+TTL) → SQLite 순으로 캐시하는 MessageConverterPort 데코레이터
+
+    - 키는 정규화된 (메시지, 발신자 MBTI, 수신자 MBTI, 톤)이다.
+    - SQLite 계층에서 찾은 결과는 메모리 캐시로 다시 올린다.
+    - convert_tones는 톤별로 캐시를 조회하고, 없는 톤만 원본 변환기에 요청한다.
+    """
+
+    def __init__(
+        self,
+        inner: MessageConverterPort,
+        cache: LRUTTLCache,
+        store: Optional[SQLiteConversionStore] = None,
+    ):
+        self._inner = inner
+        self._cache = cache
+        self._store = store
+
+    def convert(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str,
+    ) -> ToneMessage:
+        """메시지를 특정 톤으로 변환 (캐시 우선)"""
+        key = conversion_cache_key(original_message, sender_mbti, receiver_mbti, tone)
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+
+        result = self._inner.convert(
+            original_message=original_message,
+            sender_mbti=sender_mbti,
+            receiver_mbti=receiver_mbti,
+            tone=tone,
+        )
+        self._remember(key, result)
+        return result
+
+    def convert_tones(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tones: List[str],
+    ) -> List[ToneMessage]:
+        """여러 톤을 변환 (캐시에 없는 톤만 원본 변환기에 요청)"""
+        keys = {
+            tone: conversion_cache_key(original_message, sender_mbti, receiver_mbti, tone)
+            for tone in tones
+        }
+        found: Dict[str, ToneMessage] = {}
+        for tone, key in keys.items():
+            cached = self._lookup(key)
+            if cached is not None:
+                found[tone] = cached
+
+        missing = [tone for tone in tones if tone not in found]
+        if missing:
+            converted = self._inner.convert_tones(
+                original_message=original_message,
+                sender_mbti=sender_mbti,
+                receiver_mbti=receiver_mbti,
+                tones=missing,
+            )
+            for tone, result in zip(missing, converted):
+                self._remember(keys[tone], result)
+                found[tone] = result
+
+        return [found[tone] for tone in tones]
+
+    def _lookup(self, key: str) -> Optional[ToneMessage]:
+        cached = self._cache.get(key)
+        if cached is not MISSING:
+            return cached
+        if self._store is None:
+            return None
+        stored = self._store.get(key)
+        if stored is not None:
+            self._cache.set(key, stored)
+        return stored
+
+    def _remember(self, key: str, result: ToneMessage) -> None:
+        self._cache.set(key, result)
+        if self._store is not None:
+            self._store.set(key, result)
@@ -0,0 +1,50 @@
+"""회로 차단기 데코레이터"""
+
+from typing import List
+
+from app.converter.application.port.message_converter_port import MessageConverterPort
+from app.converter.domain.tone_message import ToneMessage
+from app.shared.llm.circuit_breaker import CircuitBreaker
+from app.shared.vo.mbti import MBTI
+
+
+class CircuitBreakerMessageConverter(MessageConverterPort):
+    """회로 차단기로 감싼 MessageConverterPort 데코레이터
+
+    회로가 열려 있으면 업스트림을 기다리지 않고 CircuitOpenError를 던진다 (라우터가 503으로 응답).
+    결과 캐시 안쪽에 두어 캐시에 있는 변환은 회로가 열려 있어도 그대로 반환한다.
+    """
+
+    def __init__(self, inner: MessageConverterPort, breaker: CircuitBreaker):
+        self._inner = inner
+        self._breaker = breaker
+
+    def convert(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tone: str,
+    ) -> ToneMessage:
+        with self._breaker.guard():
+            return self._inner.convert(
+                original_message=original_message,
+                sender_mbti=sender_mbti,
+                receiver_mbti=receiver_mbti,
+                tone=tone,
+            )
+
+    def convert_tones(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tones: List[str],
+    ) -> List[ToneMessage]:
+        with self._breaker.guard():
+            return self._inner.convert_tones(
+                original_message=original_message,
+                sender_mbti=sender_mbti,
+                receiver_mbti=receiver_mbti,
+                tones=tones,
+            )
@@ -1,22 +1,73 @@
 """OpenAI 기반 메시지 변환 어댑터"""
 
+import itertools
 import json
+from typing import List, Optional
+
 from openai import OpenAI
 
 from app.converter.application.port.message_converter_port import MessageConverterPort
 from app.converter.domain.tone_message import ToneMessage
+from app.shared.llm.llm_telemetry import llm_call
+from app.shared.llm.llm_gateway import get_llm_gateway
 from app.shared.vo.mbti import MBTI
-from config.settings import get_settings
+from app.shared.tracing.tracer import traced
+
+
+CONVERTER_MODEL = "gpt-4o-mini"
+
+# 톤별 변환 가이드라인
+TONE_GUIDELINES = {
+    "공손한": """• 존댓말 사용 (요체, 합니다체)
+• 정중한 표현과 겸손한 어조 유지
+• "~해주실 수 있을까요?", "~드립니다", "감사합니다" 등의 표현 사용
+• 격식 있는 문장 구조
+• 예시: "안녕하세요. 다음 주 회의 일정을 조율하고자 연락드렸습니다. 가능하신 시간을 알려주시면 감사하겠습니다.\"""",
+    "캐주얼한": """• 반말 또는 편한 말투 사용
+• 친근하고 부담 없는 어조
+• 이모지나 구어체 표현 활용 가능
+• 자연스럽고 편안한 문장 구조
+• 예시: "안녕! 다음 주 회의 시간 어때? 네가 편한 시간 알려줘~\"""",
+    "간결한": """• 핵심 내용만 짧고 명확하게 전달
+• 불필요한 수식어나 부연 설명 제거
+• 명사형 종결이나 짧은 문장 사용
+• 최소한의 단어로 의미 전달
+• 예시: "다음 주 회의 시간 조율 필요. 가능한 시간대 공유 부탁드림.\"""",
+}
+
+DEFAULT_TONE_GUIDELINE = "• 메시지의 의미를 유지하면서 자연스럽게 변환해주세요."
+
+# MBTI 차원별 특성 설명
+MBTI_DIMENSION_CHARACTERISTICS = {
+    "E": "- 외향적 (Extrovert): 활발하고 직접적인 소통 선호",
+    "I": "- 내향적 (Introvert): 신중하고 깊이 있는 소통 선호",
+    "S": "- 감각적 (Sensing): 구체적이고 실용적인 정보 선호",
+    "N": "- 직관적 (Intuition): 추상적이고 가능성 있는 아이디어 선호",
+    "T": "- 사고형 (Thinking): 논리적이고 객관적인 접근 선호",
+    "F": "- 감정형 (Feeling): 감정적이고 공감적인 접근 선호",
+    "J": "- 판단형 (Judging): 체계적이고 계획적인 방식 선호",
+    "P": "- 인식형 (Perceiving): 유연하고 즉흥적인 방식 선호",
+}
+
+# 16개 유형의 특성 설명 (요청마다 다시 만들지 않도록 미리 조합해 둔다)
+MBTI_CHARACTERISTICS = {
+    "".join(letters): "\n".join(MBTI_DIMENSION_CHARACTERISTICS[letter] for letter in letters)
+    for letters in itertools.product("EI", "SN", "TF", "JP")
+}
 
 
 class OpenAIMessageConverter(MessageConverterPort):
     """OpenAI API를 사용한 메시지 변환 구현체"""
 
-    def __init__(self):
-        """OpenAI 클라이언트 초기화"""
-        settings = get_settings()
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    def __init__(self, client: Optional[OpenAI] = None):
+        """초기화
 
+        Args:
+            client: 사용할 OpenAI 클라이언트 (기본: 설정한 백엔드 사이에서 라우팅하는 공유 게이트웨이)
+        """
+        self.client = client or get_llm_gateway()
+
+    @traced("llm.convert")
     def convert(
         self,
         original_message: str,
@@ -37,25 +88,85 @@ class OpenAIMessageConverter(MessageConverterPort):
         """
         prompt = self._build_prompt(original_message, sender_mbti, receiver_mbti, tone)
 
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {
-                    "role": "system",
-                    "content": "당신은 MBTI 기반 커뮤니케이션 전문가입니다. 메시지를 지정된 톤으로 변환하고 JSON 형식으로 응답하세요.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=0.7,
-        )
+        def parse(response) -> ToneMessage:
+            # JSON 응답 파싱 (깨진 JSON이나 빠진 필드는 요청을 다시 보낸다)
+            result = json.loads(response.choices[0].message.content)
+            return ToneMessage(
+                tone=tone, content=result["content"], explanation=result["explanation"]
+            )
+
+        with llm_call("converter.convert", CONVERTER_MODEL) as call:
+            return call.run_parsed(
+                self.client.chat.completions.create,
+                parse,
+                model=CONVERTER_MODEL,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "당신은 MBTI 기반 커뮤니케이션 전문가입니다. 메시지를 지정된 톤으로 변환하고 JSON 형식으로 응답하세요.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.7,
+            )
+
+    @traced("llm.convert_tones")
+    def convert_tones(
+        self,
+        original_message: str,
+        sender_mbti: MBTI,
+        receiver_mbti: MBTI,
+        tones: List[str],
+    ) -> List[ToneMessage]:
+        """한 번의 API 호출로 여러 톤을 JSON 객체로 받아 변환
 
-        # JSON 응답 파싱
-        content = response.choices[0].message.content
-        result = json.loads(content)
+        응답에 빠진 톤이 있으면 해당 톤만 convert로 개별 변환한다.
 
-        return ToneMessage(
-            tone=tone, content=result["content"], explanation=result["explanation"]
-        )
+        Args:
+            original_message: 원본 메시지
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tones: 변환할 톤 목록
+
+        Returns:
+            List[ToneMessage]: tones와 같은 순서의 변환된 메시지 목록
+        """
+        prompt = self._build_multi_tone_prompt(original_message, sender_mbti, receiver_mbti, tones)
+
+        # JSON 응답 파싱 ({톤: {content, explanation}}, 깨진 JSON은 요청을 다시 보낸다)
+        with llm_call("converter.convert_tones", CONVERTER_MODEL) as call:
+            result = call.run_parsed(
+                self.client.chat.completions.create,
+                lambda response: json.loads(response.choices[0].message.content),
+                model=CONVERTER_MODEL,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "당신은 MBTI 기반 커뮤니케이션 전문가입니다. 메시지를 지정된 여러 톤으로 각각 변환하고 JSON 형식으로 응답하세요.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.7,
+                response_format={"type": "json_object"},
+            )
+
+        if not isinstance(result, dict):
+            # JSON 객체가 아니면 모든 톤을 개별 변환한다
+            result = {}
+
+        tone_messages = []
+        for tone in tones:
+            item = result.get(tone)
+            if isinstance(item, dict) and item.get("content") and item.get("explanation"):
+                tone_messages.append(
+                    ToneMessage(tone=tone, content=item["content"], explanation=item["explanation"])
+                )
+            else:
+                tone_messages.append(
+                    self.convert(original_message, sender_mbti, receiver_mbti, tone)
+                )
+
+        return tone_messages
 
     def _build_prompt(
         self, original_message: str, sender_mbti: MBTI, receiver_mbti: MBTI, tone: str
@@ -99,6 +210,51 @@ JSON 형식으로 응답:
     "explanation": "왜 이 표현이 효과적인지 설명 (2-3줄)"
 }}"""
 
+    def _build_multi_tone_prompt(
+        self, original_message: str, sender_mbti: MBTI, receiver_mbti: MBTI, tones: List[str]
+    ) -> str:
+        """여러 톤을 한 번에 요청하는 프롬프트 생성
+
+        Args:
+            original_message: 원본 메시지
+            sender_mbti: 발신자 MBTI
+            receiver_mbti: 수신자 MBTI
+            tones: 변환할 톤 목록
+
+        Returns:
+            str: 생성된 프롬프트
+        """
+        receiver_characteristics = self._get_mbti_characteristics(receiver_mbti)
+
+        tone_sections = "\n\n".join(
+            f"[{tone} 톤 변환 가이드라인]\n{self._get_tone_guidelines(tone)}"
+            for tone in tones
+        )
+        json_fields = ",\n".join(
+            f'    "{tone}": {{"content": "{tone} 톤으로 변환된 메시지", "explanation": "왜 이 표현이 효과적인지 설명 (2-3줄)"}}'
+            for tone in tones
+        )
+
+        return f"""다음 메시지를 {", ".join(f"'{tone}'" for tone in tones)} 톤으로 각각 변환해주세요.
+
+발신자 MBTI: {sender_mbti.value}
+수신자 MBTI: {receiver_mbti.value}
+
+수신자의 MBTI 특성:
+{receiver_characteristics}
+
+원본 메시지: {original_message}
+
+{tone_sections}
+
+각 톤의 가이드라인을 정확히 따라 메시지를 변환하고,
+수신자의 MBTI 특성과 톤을 고려하여 왜 이 표현이 {receiver_mbti.value} 유형에게 효과적인지 톤별로 설명해주세요.
+
+JSON 형식으로 응답:
+{{
+{json_fields}
+}}"""
+
     def _get_tone_guidelines(self, tone: str) -> str:
         """톤별 변환 가이드라인을 반환
 
@@ -108,34 +264,7 @@ JSON 형식으로 응답:
         Returns:
             str: 톤별 구체적인 가이드라인
         """
-        guidelines = {
-            "공손한": """
-• 존댓말 사용 (요체, 합니다체)
-• 정중한 표현과 겸손한 어조 유지
-• "~해주실 수 있을까요?", "~드립니다", "감사합니다" 등의 표현 사용
-• 격식 있는 문장 구조
-• 예시: "안녕하세요. 다음 주 회의 일정을 조율하고자 연락드렸습니다. 가능하신 시간을 알려주시면 감사하겠습니다."
-            """,
-            "캐주얼한": """
-• 반말 또는 편한 말투 사용
-• 친근하고 부담 없는 어조
-• 이모지나 구어체 표현 활용 가능
-• 자연스럽고 편안한 문장 구조
-• 예시: "안녕! 다음 주 회의 시간 어때? 네가 편한 시간 알려줘~"
-            """,
-            "간결한": """
-• 핵심 내용만 짧고 명확하게 전달
-• 불필요한 수식어나 부연 설명 제거
-• 명사형 종결이나 짧은 문장 사용
-• 최소한의 단어로 의미 전달
-• 예시: "다음 주 회의 시간 조율 필요. 가능한 시간대 공유 부탁드림."
-            """,
-        }
-
-        return guidelines.get(
-            tone,
-            "• 메시지의 의미를 유지하면서 자연스럽게 변환해주세요.",
-        )
+        return TONE_GUIDELINES.get(tone, DEFAULT_TONE_GUIDELINE)
 
     def _get_mbti_characteristics(self, mbti: MBTI) -> str:
         """MBTI 차원별 특성을 문자열로 반환
@@ -146,30 +275,4 @@ JSON 형식으로 응답:
         Returns:
             str: MBTI 차원별 특성 설명
         """
-        characteristics = []
-
-        # E/I 차원
-        if mbti.energy == "E":
-            characteristics.append("- 외향적 (Extrovert): 활발하고 직접적인 소통 선호")
-        else:
-            characteristics.append("- 내향적 (Introvert): 신중하고 깊이 있는 소통 선호")
-
-        # S/N 차원
-        if mbti.information == "S":
-            characteristics.append("- 감각적 (Sensing): 구체적이고 실용적인 정보 선호")
-        else:
-            characteristics.append("- 직관적 (Intuition): 추상적이고 가능성 있는 아이디어 선호")
-
-        # T/F 차원
-        if mbti.decision == "T":
-            characteristics.append("- 사고형 (Thinking): 논리적이고 객관적인 접근 선호")
-        else:
-            characteristics.append("- 감정형 (Feeling): 감정적이고 공감적인 접근 선호")
-
-        # J/P 차원
-        if mbti.lifestyle == "J":
-            characteristics.append("- 판단형 (Judging): 체계적이고 계획적인 방식 선호")
-        else:
-            characteristics.append("- 인식형 (Perceiving): 유연하고 즉흥적인 방식 선호")
-
-        return "\n".join(characteristics)
+        return MBTI_CHARACTERISTICS[mbti.value]
@@ -1,30 +1,82 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+import os
+
+from fastapi import Depends, FastAPI, Response
 from contextlib import asynccontextmanager
 
+from app.auth.adapter.input.web.auth_dependency import get_current_user_id
+from app.consult.adapter.input.web import consult_router as consult_router_module
 from app.consult.adapter.input.web.consult_router import consult_router
+from app.consult.infrastructure.queue.async_analysis_job_queue import AsyncAnalysisJobQueue
+from app.consult.infrastructure.service.circuit_breaker_counselor import CircuitBreakerCounselor
+from app.consult.infrastructure.service.pooled_greeting_counselor import PooledGreetingCounselor
 from app.converter.adapter.input.web.converter_router import converter_router
 from app.router import setup_routers
+from app.shared.llm.llm_telemetry import mark_worker_dead, render_metrics
+from app.shared.log.queue_logging import configure_logging, shutdown_logging
+from app.shared.tracing.jsonl_trace_exporter import JsonlTraceExporter
+from app.shared.tracing.tracing_middleware import TracingMiddleware
+from app.shared.llm.llm_gateway import close_llm_gateways, get_llm_router
+from app.shared.llm.openai_client_registry import openai_connection_stats
 from app.user.adapter.input.web.user_router import user_router
-from config.database import engine, Base
+from config.database import engine
+from config.settings import get_settings
 from fastapi.middleware.cors import CORSMiddleware
+from migrations.runner import check_schema_version, upgrade as upgrade_schema
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 시작/종료 시 실행되는 로직"""
     # Startup
-    print("[+] Starting HexaCore AI Server...")
+    settings = get_settings()
+    configure_logging(
+        level=settings.LOG_LEVEL,
+        module_levels=settings.LOG_LEVELS,
+        log_format=settings.LOG_FORMAT,
+        queue_size=settings.LOG_QUEUE_SIZE,
+    )
+    logger.info("Starting HexaCore AI Server")
+
+    # 스키마 버전 확인 (마이그레이션은 Procfile web 명령에서 uvicorn 시작 전에 python -m migrations upgrade로 실행)
+    # 운영 환경에서는 스키마가 뒤처진 채로 요청을 받지 않도록 항상 엄격하게 확인한다
+    if settings.DB_AUTO_MIGRATE:
+        upgrade_schema(engine)
+    schema_version = check_schema_version(
+        engine, strict=settings.DB_SCHEMA_CHECK_STRICT or settings.is_production
+    )
+    logger.info("Database schema version %d", schema_version)
 
-    # 데이터베이스 테이블 생성
-    Base.metadata.create_all(bind=engine)
-    print("[+] Database tables created")
+    # 인사말 풀 채우기 (요청 처리를 막지 않도록 백그라운드에서)
+    counselor = consult_router_module._ai_counselor
+    if isinstance(counselor, CircuitBreakerCounselor):
+        counselor = counselor.inner
+    warm_up_task = None
+    if isinstance(counselor, PooledGreetingCounselor) and settings.GREETING_POOL_WARM_ON_STARTUP:
+        warm_up_task = asyncio.create_task(counselor.warm_up())
+
+    # 분석 작업 큐 시작 (끝나지 않은 작업 재개)
+    analysis_queue = consult_router_module._analysis_queue
+    if isinstance(analysis_queue, AsyncAnalysisJobQueue):
+        await analysis_queue.start()
 
     yield
 
+    if isinstance(analysis_queue, AsyncAnalysisJobQueue):
+        await analysis_queue.stop()
+    if warm_up_task and not warm_up_task.done():
+        warm_up_task.cancel()
+
     # Shutdown
-    print("[-] Shutting down HexaCore AI Server...")
+    logger.info("Shutting down HexaCore AI Server")
     engine.dispose()
-    print("[+] Database connections closed")
+    logger.info("Database connections closed")
+    await close_llm_gateways()
+    mark_worker_dead(os.getpid())
+    shutdown_logging()
 
 
 app = FastAPI(
@@ -48,6 +100,15 @@ app.add_middleware(
     allow_headers=["*"],         # 모든 헤더 허용
 )
 
+# 요청별 구간 소요 시간 (Server-Timing 헤더, 샘플링된 요청은 trace 파일로)
+settings = get_settings()
+if settings.TRACING_ENABLED:
+    app.add_middleware(
+        TracingMiddleware,
+        sample_rate=settings.TRACE_SAMPLE_RATE,
+        exporter=JsonlTraceExporter(settings.TRACE_EXPORT_PATH) if settings.TRACE_EXPORT_PATH else None,
+    )
+
 
 # app.include_router(google_oauth_router, prefix="/oauth")
 app.include_router(consult_router, prefix="/consult")
@@ -64,3 +125,23 @@ async def health_check():
         "database": "ok"
     }
 
+
+# 내부 통계/메트릭은 /auth/session-cache/stats와 같이 로그인한 요청에만 보여준다
+# (Prometheus는 scrape 설정의 authorization으로 세션 토큰을 Bearer 헤더에 담아 보낸다)
+@app.get("/health/openai-connections", dependencies=[Depends(get_current_user_id)])
+async def openai_connections():
+    """OpenAI 공유 클라이언트 커넥션 재사용 통계 (현재 워커 프로세스 기준)"""
+    return openai_connection_stats()
+
+
+@app.get("/health/llm-backends", dependencies=[Depends(get_current_user_id)])
+async def llm_backends():
+    """LLM 게이트웨이 백엔드별 순위, 지연 시간/오류율 EWMA, 회로 상태 (현재 워커 프로세스 기준)"""
+    return get_llm_router().snapshot()
+
+
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(get_current_user_id)])
+async def metrics():
+    """Prometheus 메트릭 (PROMETHEUS_MULTIPROC_DIR가 설정되면 전체 워커 합계)"""
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
@@ -3,23 +3,85 @@ Centralized router configuration.
 All application routers are registered here and imported into main.py.
 """
 
+from contextlib import contextmanager
+
 from fastapi import FastAPI
 
 from app.auth.adapter.input.web.google_oauth_router import google_oauth_router
 from app.user.infrastructure.model.user_model import UserModel  # noqa: F401
 from app.consult.infrastructure.model.consult_session_model import ConsultSessionModel  # noqa: F401
+from app.consult.infrastructure.model.greeting_pool_model import GreetingPoolModel  # noqa: F401
+from app.consult.infrastructure.model.greeting_pool_refill_model import GreetingPoolRefillModel  # noqa: F401
+from app.consult.infrastructure.model.analysis_job_model import AnalysisJobModel  # noqa: F401
 from app.consult.adapter.input.web.consult_router import consult_router
 from app.consult.adapter.input.web import consult_router as consult_router_module
 from app.converter.adapter.input.web.converter_router import converter_router
 from app.auth.adapter.input.web import auth_dependency
 from app.user.adapter.input.web.user_router import user_router
-from app.user.adapter.input.web import user_router as user_router_module
 
-from config.database import get_db_session
-from config.settings import get_settings
-from app.user.infrastructure.repository.mysql_user_repository import MySQLUserRepository
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.infrastructure.queue.async_analysis_job_queue import AsyncAnalysisJobQueue
+from app.consult.infrastructure.repository.mysql_analysis_job_repository import MySQLAnalysisJobRepository
 from app.consult.infrastructure.repository.mysql_consult_repository import MySQLConsultRepository
-from app.consult.infrastructure.service.openai_counselor_adapter import OpenAICounselorAdapter
+from app.consult.infrastructure.repository.mysql_greeting_pool_repository import MySQLGreetingPoolRepository
+from app.consult.infrastructure.service.async_openai_counselor_adapter import AsyncOpenAICounselorAdapter
+from app.consult.infrastructure.service.circuit_breaker_counselor import CircuitBreakerCounselor
+from app.consult.infrastructure.service.conversation_context_manager import ConversationContextManager
+from app.consult.infrastructure.service.pooled_greeting_counselor import PooledGreetingCounselor
+from app.shared.llm.circuit_breaker import get_circuit_breaker
+from config.database import SessionLocal
+from config.settings import get_settings
+
+
+def build_ai_counselor() -> AsyncAICounselorPort:
+    """운영용 AI 상담사 (설정에 따라 인사말 풀과 회로 차단기로 감싼다)"""
+    settings = get_settings()
+    context = None
+    if settings.CONSULT_CONTEXT_ENABLED:
+        context = ConversationContextManager(
+            token_budget=settings.CONSULT_CONTEXT_TOKEN_BUDGET,
+            keep_recent_turns=settings.CONSULT_CONTEXT_KEEP_RECENT_TURNS,
+            summary_batch_turns=settings.CONSULT_CONTEXT_SUMMARY_BATCH_TURNS,
+        )
+    counselor: AsyncAICounselorPort = AsyncOpenAICounselorAdapter(context=context)
+    if settings.GREETING_POOL_ENABLED:
+        counselor = PooledGreetingCounselor(
+            counselor,
+            MySQLGreetingPoolRepository(SessionLocal),
+            pool_size=settings.GREETING_POOL_SIZE,
+            max_uses=settings.GREETING_POOL_MAX_USES,
+            refill_lease_seconds=settings.GREETING_POOL_REFILL_LEASE_SECONDS,
+        )
+    # 회로 차단기는 가장 바깥에 둔다 (템플릿 인사말이 인사말 풀에 저장되지 않도록)
+    breaker = get_circuit_breaker("consult")
+    if breaker is None:
+        return counselor
+    return CircuitBreakerCounselor(counselor, breaker)
+
+
+def _repository_scope(repository_class):
+    """호출마다 새 DB 세션으로 저장소를 만들고 끝나면 닫는 scope 팩토리 (백그라운드 작업용)"""
+    @contextmanager
+    def scope():
+        db = SessionLocal()
+        try:
+            yield repository_class(db)
+        finally:
+            db.close()
+    return scope
+
+
+def build_analysis_queue(ai_counselor: AsyncAICounselorPort) -> AsyncAnalysisJobQueue:
+    """5턴째 분석을 처리하는 백그라운드 작업 큐 (시작/종료는 main.lifespan에서)"""
+    settings = get_settings()
+    return AsyncAnalysisJobQueue(
+        _repository_scope(MySQLAnalysisJobRepository),
+        _repository_scope(MySQLConsultRepository),
+        ai_counselor,
+        workers=settings.ANALYSIS_QUEUE_WORKERS,
+        max_attempts=settings.ANALYSIS_JOB_MAX_ATTEMPTS,
+        lease_seconds=settings.ANALYSIS_JOB_LEASE_SECONDS,
+    )
 
 
 def setup_routers(app: FastAPI) -> None:
@@ -33,12 +95,8 @@ def setup_routers(app: FastAPI) -> None:
     app.include_router(converter_router, prefix="/converter")
 
     # Consult router with real implementations
-    settings = get_settings()
-    db_session = get_db_session()
-
-    user_repository = MySQLUserRepository(db_session)
-    consult_router_module._user_repository = user_repository
-    consult_router_module._consult_repository = MySQLConsultRepository(db_session)
-    consult_router_module._ai_counselor = OpenAICounselorAdapter(api_key=settings.OPENAI_API_KEY)
-    user_router_module._user_repository = user_repository
+    # (저장소는 요청마다 커넥션 풀에서 받은 DB 세션으로 생성된다)
+    consult_router_module._ai_counselor = build_ai_counselor()
+    if get_settings().ANALYSIS_QUEUE_ENABLED:
+        consult_router_module._analysis_queue = build_analysis_queue(consult_router_module._ai_counselor)
     app.include_router(consult_router, prefix="/consult")
\ No newline at end of file
@@ -0,0 +1,126 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+# 캐시에 없는 키를 나타내는 센티넬 (None도 캐시 값으로 쓸 수 있도록)
+MISSING = object()
+
+
+class LRUTTLCache:
+    """크기 제한 LRU + 항목별 TTL 캐시 (스레드 안전)
+
+    max_size를 넘으면 가장 오래 사용하지 않은 항목부터 제거하고,
+    만료된 항목은 조회 시점에 제거한다.
+    sizeof를 주면 항목별 크기(바이트)를 합산하고, max_bytes를 넘을 때도 LRU 순으로 제거한다.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+        sizeof: Callable[[Any], int] | None = None,
+        max_bytes: int | None = None,
+    ):
+        if max_size <= 0:
+            raise ValueError("max_size는 1 이상이어야 합니다")
+        if max_bytes is not None and sizeof is None:
+            raise ValueError("max_bytes를 쓰려면 sizeof가 필요합니다")
+        self._max_size = max_size
+        self._ttl = ttl_seconds
+        self._clock = clock
+        self._sizeof = sizeof
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple[Any, float, int]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def ttl_seconds(self) -> float:
+        """기본 TTL (초)"""
+        return self._ttl
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """값을 조회한다 (없거나 만료되면 default)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+
+            value, expires_at, _ = entry
+            if expires_at <= self._clock():
+                self._remove(key)
+                self._expirations += 1
+                self._misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float | None = None) -> None:
+        """값을 저장한다 (ttl_seconds가 없으면 기본 TTL)"""
+        ttl = self._ttl if ttl_seconds is None else ttl_seconds
+        if ttl <= 0:
+            self.delete(key)
+            return
+
+        size = self._sizeof(value) if self._sizeof else 0
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (value, self._clock() + ttl, size)
+            self._bytes += size
+            while len(self._entries) > self._max_size or self._over_bytes():
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """항목을 즉시 제거한다"""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """모든 항목을 제거한다 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        """락을 잡은 상태에서 항목과 크기 합계를 함께 제거한다"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _over_bytes(self) -> bool:
+        # 방금 넣은 항목 하나만 남았다면 max_bytes보다 커도 유지한다
+        return (
+            self._max_bytes is not None
+            and self._bytes > self._max_bytes
+            and len(self._entries) > 1
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """hit/miss 등 캐시 통계를 반환한다"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+            }
@@ -0,0 +1,219 @@
+"""
+LLM 업스트림 회로 차단기
+
+업스트림(OpenAI)이 장애일 때 요청마다 타임아웃까지 기다리며 워커와 소켓을 붙잡지 않도록,
+최근 호출의 실패율이나 느린 호출 비율이 기준을 넘으면 회로를 열고 즉시 거절(CircuitOpenError)한다.
+호출하는 쪽은 거절되면 빠른 대체 응답을 주거나 503으로 답한다.
+
+- closed: 모두 통과, 최근 window_seconds 동안의 호출 결과를 모은다
+- open: 모두 거절, open_seconds가 지나면 half_open
+- half_open: half_open_calls개의 시험 호출만 통과, 모두 성공하면 closed, 하나라도 실패/느리면 다시 open
+
+상태는 llm_circuit_state 게이지(0=closed, 1=half_open, 2=open)로 내보낸다.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
+
+from prometheus_client import Counter, Gauge
+
+from app.shared.llm.llm_resilience import retry_reason
+from config.settings import get_settings
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+LLM_CIRCUIT_STATE = Gauge(
+    "llm_circuit_state",
+    "회로 차단기 상태 (0=closed, 1=half_open, 2=open)",
+    ("name",),
+    multiprocess_mode="livemax",
+)
+LLM_CIRCUIT_TRANSITIONS = Counter(
+    "llm_circuit_transitions",
+    "회로 차단기 상태 전환 수",
+    ("name", "state"),
+)
+LLM_CIRCUIT_REJECTED = Counter(
+    "llm_circuit_rejected",
+    "회로가 열려 있어 업스트림에 보내지 않은 호출 수",
+    ("name",),
+)
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 업스트림을 호출하지 않았다"""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(f"{name} 업스트림 회로가 열려 있습니다 (retry_after={retry_after:.0f}s)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    window_seconds: float = 30.0
+    min_calls: int = 10                 # 창 안의 호출이 이보다 적으면 판단하지 않는다
+    failure_rate: float = 0.5
+    slow_call_seconds: float = 15.0
+    slow_call_rate: float = 0.8
+    open_seconds: float = 30.0
+    half_open_calls: int = 2
+
+
+def is_upstream_failure(error: BaseException) -> bool:
+    """업스트림 장애로 볼 실패인지 (429/5xx/연결 실패/타임아웃, 요청 자체의 오류는 제외)"""
+    return retry_reason(error) is not None
+
+
+class CircuitBreaker:
+    """실패율/지연 기준 회로 차단기 (스레드 안전)
+
+        with breaker.guard():       # 열려 있으면 CircuitOpenError
+            response = await client.chat.completions.create(...)
+    """
+
+    def __init__(self, name: str, config: CircuitBreakerConfig, clock: Callable[[], float] = time.monotonic):
+        self.name = name
+        self._config = config
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes = 0            # half_open에서 진행 중인 시험 호출 수
+        self._probe_successes = 0
+        # (시각, 실패 여부, 느림 여부)
+        self._calls: deque[tuple[float, bool, bool]] = deque()
+        LLM_CIRCUIT_STATE.labels(name).set(_STATE_VALUES[CLOSED])
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open(self._clock())
+            return self._state
+
+    def acquire(self) -> None:
+        """호출해도 되는지 확인한다 (거절되면 CircuitOpenError)"""
+        self._admit(reserve=True)
+
+    def check(self) -> None:
+        """시험 호출 자리를 잡지 않고 지금 호출하면 거절될지만 확인한다 (거절되면 CircuitOpenError)
+
+        호출이 실제로 시작될지 모르는 시점(스트림 생성 등)에 미리 거절할 때 쓴다.
+        자리는 호출을 시작할 때 acquire로 잡는다.
+        """
+        self._admit(reserve=False)
+
+    def _admit(self, reserve: bool) -> None:
+        with self._lock:
+            now = self._clock()
+            self._maybe_half_open(now)
+            if self._state == CLOSED:
+                return
+            if self._state == HALF_OPEN and self._probes < self._config.half_open_calls:
+                if reserve:
+                    self._probes += 1
+                return
+            retry_after = max(self._opened_at + self._config.open_seconds - now, 1.0)
+        LLM_CIRCUIT_REJECTED.labels(self.name).inc()
+        raise CircuitOpenError(self.name, math.ceil(retry_after))
+
+    @contextmanager
+    def guard(self):
+        """with 블록 하나를 호출 하나로 기록한다 (동기/비동기 코드 공용)"""
+        self.acquire()
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception as error:
+            if is_upstream_failure(error):
+                self.record_failure()
+            else:
+                self.release()
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.record_success(time.perf_counter() - started)
+
+    def record_success(self, duration: float) -> None:
+        self._record(failed=False, slow=duration >= self._config.slow_call_seconds)
+
+    def record_failure(self) -> None:
+        self._record(failed=True, slow=False)
+
+    def release(self) -> None:
+        """결과를 판단할 수 없는 호출(취소, 요청 자체의 오류)을 끝낸다"""
+        with self._lock:
+            if self._state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        with self._lock:
+            now = self._clock()
+            if self._state == HALF_OPEN:
+                self._probes = max(self._probes - 1, 0)
+                if failed or slow:
+                    self._transition(OPEN, now)
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self._config.half_open_calls:
+                    self._transition(CLOSED, now)
+                return
+            if self._state == OPEN:
+                # 회로가 열리기 전에 시작된 호출의 결과
+                return
+
+            self._calls.append((now, failed, slow))
+            while self._calls and self._calls[0][0] < now - self._config.window_seconds:
+                self._calls.popleft()
+            total = len(self._calls)
+            if total < self._config.min_calls:
+                return
+            failures = sum(1 for _, f, _ in self._calls if f)
+            slow_calls = sum(1 for _, _, s in self._calls if s)
+            if failures / total >= self._config.failure_rate or slow_calls / total >= self._config.slow_call_rate:
+                self._transition(OPEN, now)
+
+    def _maybe_half_open(self, now: float) -> None:
+        if self._state == OPEN and now - self._opened_at >= self._config.open_seconds:
+            self._transition(HALF_OPEN, now)
+
+    def _transition(self, state: str, now: float) -> None:
+        self._state = state
+        self._probes = 0
+        self._probe_successes = 0
+        self._calls.clear()
+        if state == OPEN:
+            self._opened_at = now
+        LLM_CIRCUIT_STATE.labels(self.name).set(_STATE_VALUES[state])
+        LLM_CIRCUIT_TRANSITIONS.labels(self.name, state).inc()
+
+
+@lru_cache()
+def get_circuit_breaker(name: str) -> CircuitBreaker | None:
+    """설정 기반 이름별 회로 차단기 (프로세스 단위 싱글톤, CIRCUIT_BREAKER_ENABLED가 꺼져 있으면 None)"""
+    settings = get_settings()
+    if not settings.CIRCUIT_BREAKER_ENABLED:
+        return None
+    return CircuitBreaker(
+        name,
+        CircuitBreakerConfig(
+            window_seconds=settings.CIRCUIT_BREAKER_WINDOW_SECONDS,
+            min_calls=settings.CIRCUIT_BREAKER_MIN_CALLS,
+            failure_rate=settings.CIRCUIT_BREAKER_FAILURE_RATE,
+            slow_call_seconds=settings.CIRCUIT_BREAKER_SLOW_CALL_SECONDS,
+            slow_call_rate=settings.CIRCUIT_BREAKER_SLOW_CALL_RATE,
+            open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+            half_open_calls=settings.CIRCUIT_BREAKER_HALF_OPEN_CALLS,
+        ),
+    )
@@ -0,0 +1,426 @@
+"""
+LLM 백엔드 게이트웨이 (지연 시간/오류율/쿼터 기반 라우팅과 장애 시 넘김)
+
+AI 포트 구현체(상담사, 변환기)는 OpenAI 클라이언트 자리에 게이트웨이를 받아 그대로
+gateway.chat.completions.create(...)를 호출하고, 게이트웨이가 요청마다 보낼 백엔드를 고른다.
+
+- 백엔드: openai(OPENAI_*), azure(AZURE_OPENAI_*), local(LOCAL_LLM_*, OpenAI 호환 서버)
+  LLM_BACKENDS에 나열한 순서가 우선순위이며 점수가 같으면 앞의 백엔드를 고른다
+- 점수 = 성공 지연 시간 EWMA × (1 + LLM_GATEWAY_ERROR_PENALTY × 오류율 EWMA), 낮을수록 먼저
+  (표본이 없는 백엔드는 가장 빠른 백엔드와 같다고 보고 먼저 한 번 보내 본다, 스트림은 응답 헤더까지의 시간)
+  오류율은 LLM_GATEWAY_ERROR_HALF_LIFE_SECONDS마다 절반으로 줄어 장애가 끝난 백엔드도 다시 순위가 오른다
+- 건너뜀: 백엔드별 회로 차단기("backend:<이름>")가 열려 있거나 분당 요청 수(LLM_BACKEND_RPM)를 다 쓴 백엔드
+- 넘김(failover): 429/5xx/연결 실패/타임아웃이면 같은 요청을 다음 순위 백엔드로 보낸다
+  (400 같은 요청 자체의 오류는 어느 백엔드든 같으므로 바로 올린다, 스트림은 응답 헤더를 받기 전까지만 넘긴다)
+- 모든 백엔드를 건너뛰면 NoBackendAvailableError (CircuitOpenError라 기존처럼 대체 응답이나 503 + Retry-After)
+
+재시도/헤징(llm_resilience)은 게이트웨이 호출 전체를 요청 한 번으로 보고 그 바깥에서 동작한다.
+
+메트릭:
+- llm_gateway_requests_total{backend, outcome}: 백엔드별 요청 결과 (success/upstream_error/request_error)
+- llm_gateway_routed_total{backend, choice}: 첫 후보(primary)/넘김(failover)으로 보낸 요청 수
+- llm_gateway_skipped_total{backend, reason}: circuit_open/quota로 건너뛴 수
+- llm_gateway_latency_ewma_seconds / llm_gateway_error_rate{backend}: 라우팅 점수의 입력값
+현재 워커의 백엔드별 상태는 /health/llm-backends로 본다.
+
+로컬에서 stub 두 개로 넘김 확인:
+python -m benchmarks.openai_stub_server --port 8900 --error-rate 0.5
+python -m benchmarks.openai_stub_server --port 8901
+LLM_BACKENDS=openai,local OPENAI_BASE_URL=http://127.0.0.1:8900/v1 LOCAL_LLM_BASE_URL=http://127.0.0.1:8901/v1 uvicorn app.main:app
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator, Mapping
+
+import openai
+from prometheus_client import Counter, Gauge
+
+from app.shared.llm.circuit_breaker import CircuitBreaker, CircuitOpenError, get_circuit_breaker, is_upstream_failure
+from app.shared.llm.openai_client_registry import close_openai_clients, get_async_backend_client, get_backend_client
+from app.shared.ratelimit.memory_token_bucket_backend import MemoryTokenBucketBackend
+from app.shared.ratelimit.token_bucket import BucketSpec
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+LLM_GATEWAY_REQUESTS = Counter(
+    "llm_gateway_requests",
+    "게이트웨이가 백엔드에 보낸 요청 결과",
+    ("backend", "outcome"),
+)
+LLM_GATEWAY_ROUTED = Counter(
+    "llm_gateway_routed",
+    "첫 후보(primary) 또는 넘김(failover)으로 백엔드에 보낸 요청 수",
+    ("backend", "choice"),
+)
+LLM_GATEWAY_SKIPPED = Counter(
+    "llm_gateway_skipped",
+    "회로 차단기(circuit_open) 또는 분당 요청 수(quota) 때문에 건너뛴 백엔드 수",
+    ("backend", "reason"),
+)
+LLM_GATEWAY_LATENCY = Gauge(
+    "llm_gateway_latency_ewma_seconds",
+    "백엔드별 성공 지연 시간 EWMA",
+    ("backend",),
+    multiprocess_mode="livemax",
+)
+LLM_GATEWAY_ERROR_RATE = Gauge(
+    "llm_gateway_error_rate",
+    "백엔드별 오류율 EWMA",
+    ("backend",),
+    multiprocess_mode="livemax",
+)
+
+# 분당 요청 수 버킷은 이 시간 동안 채워지는 만큼 몰아서 쓸 수 있다
+QUOTA_BURST_SECONDS = 10.0
+
+# 보내지 않는 요청 인자 (OpenAI 호환 로컬 서버는 prompt_cache_key를 모르거나 거절한다)
+DROP_PARAMS = {"local": frozenset({"prompt_cache_key"})}
+
+
+class NoBackendAvailableError(CircuitOpenError):
+    """모든 백엔드의 회로가 열려 있거나 분당 요청 수를 다 썼다"""
+
+    def __init__(self, retry_after: float):
+        super().__init__("llm_gateway", retry_after)
+
+
+@dataclass(frozen=True)
+class GatewayBackend:
+    """게이트웨이 뒤의 백엔드 하나"""
+
+    name: str
+    client: Any                         # OpenAI 호환 클라이언트 (LLMGateway는 동기, AsyncLLMGateway는 비동기)
+    # 요청 모델 -> 백엔드 모델/배포 이름 ("*"는 나머지 모든 모델, 없으면 요청 모델 그대로)
+    models: Mapping[str, str] = field(default_factory=dict)
+    drop_params: frozenset[str] = frozenset()
+
+    def request_kwargs(self, kwargs: dict) -> dict:
+        """이 백엔드로 보낼 요청 인자 (모델 이름을 바꾸고 지원하지 않는 인자를 뺀다)"""
+        kwargs = {key: value for key, value in kwargs.items() if key not in self.drop_params}
+        if "model" in kwargs:
+            kwargs["model"] = self.models.get(kwargs["model"], self.models.get("*", kwargs["model"]))
+        return kwargs
+
+
+@dataclass(frozen=True)
+class RoutingConfig:
+    ewma_alpha: float = 0.2
+    error_penalty: float = 10.0
+    error_half_life_seconds: float = 60.0
+
+
+@dataclass
+class _BackendStats:
+    latency: float | None = None        # 성공 지연 시간 EWMA (초)
+    error_rate: float = 0.0             # 오류율 EWMA (updated_at 기준)
+    updated_at: float = 0.0
+
+
+class LLMRouter:
+    """백엔드 순위와 상태 (스레드 안전, 동기/비동기 게이트웨이가 함께 쓴다)"""
+
+    def __init__(
+        self,
+        names: list[str],
+        config: RoutingConfig,
+        rpm: Mapping[str, float] | None = None,
+        breakers: Mapping[str, CircuitBreaker | None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not names:
+            raise ValueError("LLM 백엔드가 하나 이상 있어야 합니다")
+        self.names = list(names)
+        self.clock = clock
+        self._config = config
+        self._breakers = dict(breakers or {})
+        self._lock = threading.Lock()
+        self._stats = {name: _BackendStats(updated_at=clock()) for name in self.names}
+        self._quota = MemoryTokenBucketBackend(clock=clock)
+        self._quota_specs = {
+            name: BucketSpec(f"llm_backend:{name}", max(limit * QUOTA_BURST_SECONDS / 60, 1.0), limit / 60)
+            for name, limit in (rpm or {}).items()
+            if limit > 0
+        }
+
+    def _error_rate(self, stats: _BackendStats, now: float) -> float:
+        """now 시점까지 반감기만큼 줄어든 오류율"""
+        elapsed = max(now - stats.updated_at, 0.0)
+        return stats.error_rate * 0.5 ** (elapsed / self._config.error_half_life_seconds)
+
+    def scores(self) -> dict[str, tuple[float, float]]:
+        """백엔드별 (점수, 오류율)
+
+        지연 시간 표본이 아직 없는 백엔드는 가장 빠른 백엔드와 같은 지연 시간으로 본다.
+        """
+        with self._lock:
+            now = self.clock()
+            known = [stats.latency for stats in self._stats.values() if stats.latency is not None]
+            fallback = min(known, default=0.0)
+            result = {}
+            for name, stats in self._stats.items():
+                error_rate = self._error_rate(stats, now)
+                latency = stats.latency if stats.latency is not None else fallback
+                result[name] = (latency * (1 + self._config.error_penalty * error_rate), error_rate)
+            return result
+
+    def ranked(self) -> list[str]:
+        """점수가 낮은 순서
+
+        점수가 같으면 오류율이 낮은 백엔드, 그다음 지연 시간 표본이 없는 백엔드(한 번 보내 본다), 그다음 설정한 우선순위 순.
+        """
+        scores = self.scores()
+        with self._lock:
+            sampled = {name: stats.latency is not None for name, stats in self._stats.items()}
+        return sorted(self.names, key=lambda name: (*scores[name], sampled[name], self.names.index(name)))
+
+    def route(self) -> Iterator[tuple[str, str]]:
+        """점수 순으로 지금 보낼 수 있는 (백엔드 이름, primary|failover)
+
+        꺼낸 백엔드는 회로 차단기와 분당 요청 수 자리를 잡은 상태이므로 record_success/record_failure/release로 끝낸다.
+        하나도 꺼내지 못하면 NoBackendAvailableError.
+        """
+        retry_after = math.inf
+        choice = "primary"
+        for name in self.ranked():
+            wait = self._acquire(name)
+            if wait:
+                retry_after = min(retry_after, wait)
+                continue
+            LLM_GATEWAY_ROUTED.labels(name, choice).inc()
+            yield name, choice
+            choice = "failover"
+        if choice == "primary":
+            raise NoBackendAvailableError(math.ceil(retry_after))
+
+    def _acquire(self, name: str) -> float:
+        """0이면 보내도 된다, 아니면 다시 보낼 수 있을 때까지의 초"""
+        breaker = self._breakers.get(name)
+        if breaker is not None:
+            try:
+                breaker.acquire()
+            except CircuitOpenError as error:
+                LLM_GATEWAY_SKIPPED.labels(name, "circuit_open").inc()
+                return error.retry_after
+        spec = self._quota_specs.get(name)
+        wait = self._quota.acquire([(spec, 1.0)]) if spec is not None else 0.0
+        if wait:
+            if breaker is not None:
+                breaker.release()
+            LLM_GATEWAY_SKIPPED.labels(name, "quota").inc()
+        return wait
+
+    def record_success(self, name: str, duration: float) -> None:
+        breaker = self._breakers.get(name)
+        if breaker is not None:
+            breaker.record_success(duration)
+        self._observe(name, duration, failed=False)
+        LLM_GATEWAY_REQUESTS.labels(name, "success").inc()
+
+    def record_failure(self, name: str) -> None:
+        breaker = self._breakers.get(name)
+        if breaker is not None:
+            breaker.record_failure()
+        self._observe(name, None, failed=True)
+        LLM_GATEWAY_REQUESTS.labels(name, "upstream_error").inc()
+
+    def release(self, name: str, request_error: bool = False) -> None:
+        """결과를 판단할 수 없는 요청(취소, 요청 자체의 오류)을 끝낸다"""
+        breaker = self._breakers.get(name)
+        if breaker is not None:
+            breaker.release()
+        if request_error:
+            LLM_GATEWAY_REQUESTS.labels(name, "request_error").inc()
+
+    def _observe(self, name: str, duration: float | None, failed: bool) -> None:
+        alpha = self._config.ewma_alpha
+        with self._lock:
+            stats = self._stats[name]
+            now = self.clock()
+            stats.error_rate = (1 - alpha) * self._error_rate(stats, now) + alpha * (1.0 if failed else 0.0)
+            stats.updated_at = now
+            if duration is not None:
+                stats.latency = duration if stats.latency is None else (1 - alpha) * stats.latency + alpha * duration
+            latency, error_rate = stats.latency, stats.error_rate
+        if latency is not None:
+            LLM_GATEWAY_LATENCY.labels(name).set(latency)
+        LLM_GATEWAY_ERROR_RATE.labels(name).set(error_rate)
+
+    def snapshot(self) -> dict:
+        """백엔드별 순위, 점수, 지연 시간/오류율 EWMA, 회로 상태"""
+        scores = self.scores()
+        result = {}
+        for rank, name in enumerate(self.ranked(), start=1):
+            with self._lock:
+                latency = self._stats[name].latency
+            breaker = self._breakers.get(name)
+            result[name] = {
+                "rank": rank,
+                "score": scores[name][0],
+                "latency_ewma_ms": latency * 1000 if latency is not None else None,
+                "error_rate": scores[name][1],
+                "circuit": breaker.state if breaker is not None else None,
+            }
+        return result
+
+
+def is_failover_error(error: BaseException) -> bool:
+    """다음 백엔드로 넘길 실패인지 (업스트림 장애, 쿼터 소진 429 포함)"""
+    return is_upstream_failure(error) or isinstance(error, openai.RateLimitError)
+
+
+class _GatewayBase:
+    def __init__(self, backends: list[GatewayBackend], router: LLMRouter):
+        self._backends = {backend.name: backend for backend in backends}
+        self.router = router
+        # OpenAI 클라이언트와 같은 호출 경로 (client.chat.completions.create)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        raise NotImplementedError
+
+    def _failed(self, name: str, error: Exception) -> bool:
+        """실패한 요청을 기록하고 다음 백엔드로 넘길지 돌려준다"""
+        if not is_failover_error(error):
+            self.router.release(name, request_error=True)
+            return False
+        self.router.record_failure(name)
+        logger.warning("LLM 백엔드 %s 실패, 다음 백엔드로 넘김: %s", name, type(error).__name__)
+        return True
+
+
+class LLMGateway(_GatewayBase):
+    """동기 OpenAI 클라이언트 자리에 쓰는 게이트웨이"""
+
+    def create(self, **kwargs):
+        last_error: Exception | None = None
+        for name, _ in self.router.route():
+            backend = self._backends[name]
+            started = self.router.clock()
+            try:
+                response = backend.client.chat.completions.create(**backend.request_kwargs(kwargs))
+            except Exception as error:
+                if not self._failed(name, error):
+                    raise
+                last_error = error
+                continue
+            except BaseException:
+                self.router.release(name)
+                raise
+            self.router.record_success(name, self.router.clock() - started)
+            return response
+        raise last_error
+
+
+class AsyncLLMGateway(_GatewayBase):
+    """비동기 OpenAI 클라이언트 자리에 쓰는 게이트웨이"""
+
+    async def create(self, **kwargs):
+        last_error: Exception | None = None
+        for name, _ in self.router.route():
+            backend = self._backends[name]
+            started = self.router.clock()
+            try:
+                response = await backend.client.chat.completions.create(**backend.request_kwargs(kwargs))
+            except Exception as error:
+                if not self._failed(name, error):
+                    raise
+                last_error = error
+                continue
+            except BaseException:
+                self.router.release(name)
+                raise
+            self.router.record_success(name, self.router.clock() - started)
+            return response
+        raise last_error
+
+
+def _parse_backend_values(spec: str, setting: str) -> dict[str, str]:
+    """"이름=값,이름=값" 형식"""
+    values = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, sep, value = item.partition("=")
+        if not sep or not name.strip() or not value.strip():
+            raise ValueError(f"{setting} 형식이 올바르지 않습니다: {item!r}")
+        values[name.strip()] = value.strip()
+    return values
+
+
+def backend_names() -> list[str]:
+    """설정한 백엔드 이름 (우선순위 순)"""
+    names = [name.strip() for name in get_settings().LLM_BACKENDS.split(",") if name.strip()]
+    if len(set(names)) != len(names):
+        raise ValueError(f"LLM_BACKENDS에 같은 백엔드가 여러 번 있습니다: {names}")
+    return names
+
+
+def _backend_models(name: str) -> dict[str, str]:
+    settings = get_settings()
+    if name == "azure":
+        return _parse_backend_values(settings.AZURE_OPENAI_DEPLOYMENTS, "AZURE_OPENAI_DEPLOYMENTS")
+    if name == "local" and settings.LOCAL_LLM_MODEL:
+        return {"*": settings.LOCAL_LLM_MODEL}
+    return {}
+
+
+@lru_cache()
+def get_llm_router() -> LLMRouter:
+    """설정 기반 백엔드 라우터 (프로세스 단위 싱글톤)"""
+    settings = get_settings()
+    names = backend_names()
+    rpm = _parse_backend_values(settings.LLM_BACKEND_RPM, "LLM_BACKEND_RPM")
+    unknown = set(rpm) - set(names)
+    if unknown:
+        raise ValueError(f"LLM_BACKEND_RPM에 LLM_BACKENDS에 없는 백엔드가 있습니다: {', '.join(sorted(unknown))}")
+    try:
+        limits = {name: float(value) for name, value in rpm.items()}
+    except ValueError:
+        raise ValueError(f"LLM_BACKEND_RPM 형식이 올바르지 않습니다: {settings.LLM_BACKEND_RPM!r}") from None
+    return LLMRouter(
+        names,
+        RoutingConfig(
+            ewma_alpha=settings.LLM_GATEWAY_EWMA_ALPHA,
+            error_penalty=settings.LLM_GATEWAY_ERROR_PENALTY,
+            error_half_life_seconds=settings.LLM_GATEWAY_ERROR_HALF_LIFE_SECONDS,
+        ),
+        rpm=limits,
+        breakers={name: get_circuit_breaker(f"backend:{name}") for name in names},
+    )
+
+
+@lru_cache()
+def get_llm_gateway() -> LLMGateway:
+    """프로세스 전체가 공유하는 동기 게이트웨이 (백엔드별 공유 클라이언트 사용)"""
+    return LLMGateway(
+        [
+            GatewayBackend(name, get_backend_client(name), _backend_models(name), DROP_PARAMS.get(name, frozenset()))
+            for name in backend_names()
+        ],
+        get_llm_router(),
+    )
+
+
+@lru_cache()
+def get_async_llm_gateway() -> AsyncLLMGateway:
+    """프로세스 전체가 공유하는 비동기 게이트웨이 (백엔드별 공유 클라이언트 사용)"""
+    return AsyncLLMGateway(
+        [
+            GatewayBackend(name, get_async_backend_client(name), _backend_models(name), DROP_PARAMS.get(name, frozenset()))
+            for name in backend_names()
+        ],
+        get_llm_router(),
+    )
+
+
+async def close_llm_gateways() -> None:
+    """종료 시 공유 게이트웨이/라우터를 버리고 백엔드 클라이언트의 커넥션 풀을 닫는다"""
+    get_llm_gateway.cache_clear()
+    get_async_llm_gateway.cache_clear()
+    get_llm_router.cache_clear()
+    await close_openai_clients()
@@ -0,0 +1,340 @@
+"""
+LLM 호출 재시도 / 백오프 / 헤징 정책
+
+호출 위치(call_site)마다 요청 타임아웃을 두고, 일시적인 실패는 지터를 섞은 지수 백오프로 다시 보낸다.
+- 재시도 대상: 429(쿼터 소진 제외), 5xx, 408/409, 연결 실패, 타임아웃
+- 응답 파싱(JSON) 실패는 별도 분류로, 같은 요청을 다시 보내 새 응답을 받는다
+- 헤징: 설정한 호출 위치는 최근 지연 시간의 p95가 지나도 응답이 없으면 같은 요청을 하나 더 보내고
+  먼저 끝난 응답을 쓴다 (스트림 요청은 헤징하지 않는다)
+
+재시도는 이 모듈이 맡으므로 OpenAI SDK 내부 재시도(OPENAI_MAX_RETRIES)는 0으로 둔다.
+재시도/헤징 횟수는 llm_call_retries_total, llm_hedged_requests_total로 집계한다.
+"""
+
+import asyncio
+import contextvars
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Awaitable, Callable, TypeVar
+
+import openai
+from prometheus_client import Counter
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+LLM_CALL_RETRIES = Counter(
+    "llm_call_retries",
+    "재시도 정책으로 다시 보낸 LLM 요청 수",
+    ("call_site", "model", "reason"),
+)
+LLM_HEDGED_REQUESTS = Counter(
+    "llm_hedged_requests",
+    "헤징 요청 수 (launched: 보냄, won: 헤징 요청이 먼저 끝남)",
+    ("call_site", "model", "outcome"),
+)
+
+# 호출 위치별 기본 요청 타임아웃 (초, LLM_CALL_TIMEOUTS로 덮어쓴다)
+DEFAULT_TIMEOUTS = {
+    "consult.generate_greeting": 15.0,
+    "consult.generate_response": 30.0,
+    "consult.generate_response_stream": 30.0,
+    "consult.generate_analysis": 45.0,
+    "consult.context_summary": 20.0,
+    "converter.convert": 20.0,
+    "converter.convert_tones": 30.0,
+}
+
+# 응답을 파싱하지 못했을 때 재시도 분류로 보는 예외 (json.JSONDecodeError는 ValueError)
+PARSE_ERRORS = (ValueError, KeyError, TypeError)
+
+# 헤징 지연을 계산하는 최근 지연 시간 표본 수
+LATENCY_WINDOW_SIZE = 200
+
+
+@dataclass(frozen=True)
+class CallPolicy:
+    timeout_seconds: float
+    max_attempts: int = 3                   # 첫 요청 포함
+    base_delay_seconds: float = 0.5
+    max_delay_seconds: float = 8.0
+    parse_max_attempts: int = 2             # 응답 파싱 실패 시 요청을 다시 보내는 횟수 (첫 요청 포함)
+    hedge: bool = False
+    hedge_min_delay_seconds: float = 0.5
+    hedge_min_samples: int = 20             # 표본이 이만큼 쌓이기 전에는 헤징하지 않는다
+
+
+class LatencyTracker:
+    """호출 위치 하나의 최근 성공 지연 시간 (스레드 안전)"""
+
+    def __init__(self, size: int = LATENCY_WINDOW_SIZE):
+        self._lock = threading.Lock()
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> float | None:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(int(q * len(samples)), len(samples) - 1)]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+def _parse_site_values(spec: str) -> dict[str, float]:
+    """"consult.generate_response=20,converter.convert=10" 형식"""
+    values = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        name, sep, value = item.partition("=")
+        try:
+            if not sep or not name.strip():
+                raise ValueError
+            values[name.strip()] = float(value)
+        except ValueError:
+            raise ValueError(f"호출 위치 설정 형식이 올바르지 않습니다: {item!r}") from None
+    return values
+
+
+@lru_cache()
+def get_call_policy(call_site: str) -> CallPolicy:
+    """설정 기반 호출 위치별 정책 (프로세스 단위 캐시)"""
+    settings = get_settings()
+    timeouts = {**DEFAULT_TIMEOUTS, **_parse_site_values(settings.LLM_CALL_TIMEOUTS)}
+    hedged = {name.strip() for name in settings.LLM_HEDGE_CALL_SITES.split(",") if name.strip()}
+    return CallPolicy(
+        timeout_seconds=timeouts.get(call_site, settings.OPENAI_TIMEOUT_SECONDS),
+        max_attempts=max(settings.LLM_RETRY_MAX_ATTEMPTS, 1),
+        base_delay_seconds=settings.LLM_RETRY_BASE_DELAY_SECONDS,
+        max_delay_seconds=settings.LLM_RETRY_MAX_DELAY_SECONDS,
+        parse_max_attempts=max(settings.LLM_PARSE_MAX_ATTEMPTS, 1),
+        hedge=call_site in hedged,
+        hedge_min_delay_seconds=settings.LLM_HEDGE_MIN_DELAY_SECONDS,
+    )
+
+
+_trackers: dict[str, LatencyTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def latency_tracker(call_site: str) -> LatencyTracker:
+    with _trackers_lock:
+        return _trackers.setdefault(call_site, LatencyTracker())
+
+
+@lru_cache()
+def _hedge_executor() -> ThreadPoolExecutor:
+    """동기 헤징 요청을 보내는 스레드풀 (프로세스 단위 싱글톤)"""
+    return ThreadPoolExecutor(max_workers=32, thread_name_prefix="llm-hedge")
+
+
+def retry_reason(error: BaseException) -> str | None:
+    """재시도할 실패면 분류 이름, 아니면 None"""
+    if isinstance(error, openai.APITimeoutError):
+        return "timeout"
+    if isinstance(error, openai.APIConnectionError):
+        return "connection"
+    if isinstance(error, openai.RateLimitError):
+        # 결제/쿼터 소진은 기다려도 풀리지 않는다
+        return None if getattr(error, "code", None) == "insufficient_quota" else "rate_limit"
+    if isinstance(error, openai.InternalServerError):
+        return "server_error"
+    if isinstance(error, openai.APIStatusError) and error.status_code in (408, 409):
+        return "server_error"
+    return None
+
+
+def _retry_after(error: BaseException) -> float | None:
+    """429/503 응답의 Retry-After (초)"""
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class RetryPolicyRunner:
+    """정책에 따라 요청 한 번(attempt)을 재시도/헤징하며 실행한다"""
+
+    def __init__(
+        self,
+        call_site: str,
+        model: str,
+        policy: CallPolicy,
+        tracker: LatencyTracker | None = None,
+        rng: random.Random | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.call_site = call_site
+        self.model = model
+        self.policy = policy
+        self._tracker = tracker or latency_tracker(call_site)
+        self._random = rng or random.Random()
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+
+    def backoff(self, retry: int, error: BaseException | None) -> float:
+        """retry번째 재시도 전 대기 시간 (full jitter, Retry-After가 있으면 그 이상)"""
+        ceiling = min(self.policy.max_delay_seconds, self.policy.base_delay_seconds * 2 ** retry)
+        delay = self._random.uniform(0, ceiling)
+        retry_after = _retry_after(error) if error is not None else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.policy.max_delay_seconds))
+        return delay
+
+    def hedge_delay(self) -> float | None:
+        """헤징 요청을 보낼 때까지 기다릴 시간 (헤징하지 않으면 None)"""
+        if not self.policy.hedge or len(self._tracker) < self.policy.hedge_min_samples:
+            return None
+        return max(self._tracker.percentile(0.95), self.policy.hedge_min_delay_seconds)
+
+    def _record_retry(self, reason: str, error: BaseException, delay: float) -> None:
+        LLM_CALL_RETRIES.labels(self.call_site, self.model, reason).inc()
+        logger.warning(
+            "LLM 요청 재시도 call_site=%s reason=%s delay=%.2fs error=%s",
+            self.call_site, reason, delay, type(error).__name__,
+        )
+
+    def _transport_retry_delay(self, error: BaseException, retries: int) -> float | None:
+        """요청 실패를 다시 보낼 거면 대기 시간, 아니면 None"""
+        reason = retry_reason(error)
+        if reason is None or retries + 1 >= self.policy.max_attempts:
+            return None
+        delay = self.backoff(retries, error)
+        self._record_retry(reason, error, delay)
+        return delay
+
+    def _parse_retry(self, error: BaseException, retries: int) -> bool:
+        """응답 파싱 실패를 다시 보낼지 (새 응답은 바로 요청한다)"""
+        if retries + 1 >= self.policy.parse_max_attempts:
+            return False
+        self._record_retry("parse", error, 0.0)
+        return True
+
+    def run(self, attempt: Callable[[], T], parse: Callable[[T], object] | None = None, hedge: bool = True):
+        """동기 실행 (parse가 있으면 파싱 결과를 반환한다)"""
+        transport_retries = parse_retries = 0
+        while True:
+            try:
+                response = self._run_hedged(attempt) if hedge else self._timed(attempt)
+            except Exception as error:
+                delay = self._transport_retry_delay(error, transport_retries)
+                if delay is None:
+                    raise
+                transport_retries += 1
+                self._sleep(delay)
+                continue
+            if parse is None:
+                return response
+            try:
+                return parse(response)
+            except PARSE_ERRORS as error:
+                if not self._parse_retry(error, parse_retries):
+                    raise
+                parse_retries += 1
+
+    async def arun(self, attempt: Callable[[], Awaitable[T]], parse: Callable[[T], object] | None = None, hedge: bool = True):
+        """비동기 실행 (parse가 있으면 파싱 결과를 반환한다)"""
+        transport_retries = parse_retries = 0
+        while True:
+            try:
+                response = await (self._arun_hedged(attempt) if hedge else self._atimed(attempt))
+            except Exception as error:
+                delay = self._transport_retry_delay(error, transport_retries)
+                if delay is None:
+                    raise
+                transport_retries += 1
+                await self._async_sleep(delay)
+                continue
+            if parse is None:
+                return response
+            try:
+                return parse(response)
+            except PARSE_ERRORS as error:
+                if not self._parse_retry(error, parse_retries):
+                    raise
+                parse_retries += 1
+
+    def _timed(self, attempt: Callable[[], T]) -> T:
+        started = time.perf_counter()
+        response = attempt()
+        self._tracker.observe(time.perf_counter() - started)
+        return response
+
+    async def _atimed(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        response = await attempt()
+        self._tracker.observe(time.perf_counter() - started)
+        return response
+
+    def _run_hedged(self, attempt: Callable[[], T]) -> T:
+        delay = self.hedge_delay()
+        if delay is None:
+            return self._timed(attempt)
+
+        # 헤징 요청이 이긴 뒤에도 먼저 보낸 요청은 끝까지 실행된다 (동기 요청은 중단할 수 없다)
+        executor = _hedge_executor()
+        primary = executor.submit(contextvars.copy_context().run, self._timed, attempt)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        LLM_HEDGED_REQUESTS.labels(self.call_site, self.model, "launched").inc()
+        hedged = executor.submit(contextvars.copy_context().run, self._timed, attempt)
+        pending = {primary, hedged}
+        error: BaseException | None = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedged:
+                        LLM_HEDGED_REQUESTS.labels(self.call_site, self.model, "won").inc()
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    async def _arun_hedged(self, attempt: Callable[[], Awaitable[T]]) -> T:
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._atimed(attempt)
+
+        primary = asyncio.ensure_future(self._atimed(attempt))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+
+        LLM_HEDGED_REQUESTS.labels(self.call_site, self.model, "launched").inc()
+        hedged = asyncio.ensure_future(self._atimed(attempt))
+        pending = {primary, hedged}
+        error: BaseException | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedged:
+                            LLM_HEDGED_REQUESTS.labels(self.call_site, self.model, "won").inc()
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # 진 요청은 취소한다 (호출자가 취소된 경우 두 요청 모두)
+            for task in (primary, hedged):
+                task.cancel()
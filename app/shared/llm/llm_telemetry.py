@@ -0,0 +1,228 @@
+"""
+LLM 호출 텔레메트리 (Prometheus 메트릭)
+
+모든 OpenAI 호출을 호출 위치(call_site)와 모델(model) 라벨로 집계한다.
+- llm_request_duration_seconds: 호출 지연 시간 (스트림은 마지막 청크까지, outcome=success/error/cancelled)
+- llm_time_to_first_token_seconds / llm_inter_token_gap_seconds: 스트림 첫 토큰까지의 시간과 토큰 간 간격
+- llm_tokens_total: usage의 prompt/completion/cached 토큰 수
+- llm_retries_total: OpenAI SDK가 내부에서 다시 보낸 요청 수
+  (재시도/헤징 정책의 요청 수는 llm_resilience의 llm_call_retries_total, llm_hedged_requests_total)
+- llm_errors_total: 예외 타입별 실패 수
+- llm_prompt_duration_seconds / llm_prompt_tokens_total: prompt_version을 넘긴 호출의 프롬프트 버전별 지연 시간과 토큰 수
+  (A/B 비교용, 버전 배정은 prompt_registry)
+
+uvicorn 워커가 여러 개면 PROMETHEUS_MULTIPROC_DIR 환경 변수에 워커들이 공유하는 빈 디렉터리를 지정한다.
+각 워커가 그 디렉터리에 값을 기록하고, /metrics는 어느 워커가 받든 전체 워커 합계를 반환한다.
+(디렉터리는 서버를 시작하기 전에 비워야 한다)
+"""
+
+import asyncio
+import contextvars
+import os
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest
+from prometheus_client import multiprocess
+
+from app.shared.llm.llm_resilience import RetryPolicyRunner, get_call_policy
+
+LABELS = ("call_site", "model")
+
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds",
+    "LLM 호출 지연 시간",
+    LABELS + ("outcome",),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 21.0, 34.0, 60.0),
+)
+LLM_TIME_TO_FIRST_TOKEN = Histogram(
+    "llm_time_to_first_token_seconds",
+    "스트림 요청부터 첫 토큰까지의 시간",
+    LABELS,
+    buckets=(0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 10.0),
+)
+LLM_INTER_TOKEN_GAP = Histogram(
+    "llm_inter_token_gap_seconds",
+    "스트림 토큰(청크) 사이 간격",
+    LABELS,
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+LLM_TOKENS = Counter(
+    "llm_tokens",
+    "LLM 응답 usage 토큰 수",
+    LABELS + ("kind",),
+)
+LLM_RETRIES = Counter(
+    "llm_retries",
+    "OpenAI SDK 내부 재시도 요청 수",
+    LABELS,
+)
+LLM_ERRORS = Counter(
+    "llm_errors",
+    "LLM 호출 실패 수",
+    LABELS + ("error_type",),
+)
+LLM_PROMPT_DURATION = Histogram(
+    "llm_prompt_duration_seconds",
+    "프롬프트 버전별 LLM 호출 지연 시간",
+    ("call_site", "prompt_version", "outcome"),
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 8.0, 13.0, 21.0, 34.0, 60.0),
+)
+LLM_PROMPT_TOKENS = Counter(
+    "llm_prompt_tokens",
+    "프롬프트 버전별 LLM 응답 usage 토큰 수",
+    ("call_site", "prompt_version", "kind"),
+)
+
+# 지금 진행 중인 요청의 (call_site, model) - httpx 훅에서 재시도를 라벨링할 때 쓴다
+_current_call: contextvars.ContextVar[tuple[str, str] | None] = contextvars.ContextVar("llm_call", default=None)
+
+# OpenAI SDK가 요청마다 붙이는 재시도 횟수 헤더
+_RETRY_COUNT_HEADER = "x-stainless-retry-count"
+
+
+class LLMCall:
+    """LLM 호출 한 번의 텔레메트리
+
+    with 블록 전체(스트림이면 마지막 청크를 받을 때까지)를 호출 시간으로 기록한다.
+    실제 API 요청은 run/arun으로 보내야 호출 위치 정책(타임아웃/재시도/헤징)이 적용되고
+    SDK 내부 재시도가 이 호출 위치로 집계된다.
+
+        with llm_call("consult.generate_response", COUNSELOR_MODEL) as call:
+            response = await call.arun(client.chat.completions.create, model=..., messages=...)
+    """
+
+    def __init__(self, call_site: str, model: str, clock=time.perf_counter, prompt_version: str | None = None):
+        self.call_site = call_site
+        self.model = model
+        self.prompt_version = prompt_version
+        self._clock = clock
+        self._started = 0.0
+        self._last_token_at: float | None = None
+
+    def __enter__(self) -> "LLMCall":
+        self._started = self._clock()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is None:
+            outcome = "success"
+        elif issubclass(exc_type, (GeneratorExit, asyncio.CancelledError)):
+            # 클라이언트 연결 끊김 등으로 소비자가 스트림을 중단한 경우
+            outcome = "cancelled"
+        else:
+            outcome = "error"
+            LLM_ERRORS.labels(self.call_site, self.model, exc_type.__name__).inc()
+        duration = self._clock() - self._started
+        LLM_REQUEST_DURATION.labels(self.call_site, self.model, outcome).observe(duration)
+        if self.prompt_version:
+            LLM_PROMPT_DURATION.labels(self.call_site, self.prompt_version, outcome).observe(duration)
+        return False
+
+    def run(self, create, **kwargs):
+        """동기 API 요청 (호출 위치 정책으로 타임아웃/재시도/헤징, 응답에 usage가 있으면 함께 기록)"""
+        return self.run_parsed(create, None, **kwargs)
+
+    def run_parsed(self, create, parse, **kwargs):
+        """동기 API 요청 후 parse(response)를 반환한다 (파싱 실패는 요청을 다시 보낸다)"""
+        runner, kwargs = self._runner(kwargs)
+
+        def attempt():
+            token = _current_call.set((self.call_site, self.model))
+            try:
+                response = create(**kwargs)
+            finally:
+                _current_call.reset(token)
+            self.record_usage(response)
+            return response
+
+        return runner.run(attempt, parse, hedge=not kwargs.get("stream"))
+
+    async def arun(self, create, **kwargs):
+        """비동기 API 요청 (호출 위치 정책으로 타임아웃/재시도/헤징, 응답에 usage가 있으면 함께 기록)"""
+        return await self.arun_parsed(create, None, **kwargs)
+
+    async def arun_parsed(self, create, parse, **kwargs):
+        """비동기 API 요청 후 parse(response)를 반환한다 (파싱 실패는 요청을 다시 보낸다)"""
+        runner, kwargs = self._runner(kwargs)
+
+        async def attempt():
+            token = _current_call.set((self.call_site, self.model))
+            try:
+                response = await create(**kwargs)
+            finally:
+                _current_call.reset(token)
+            self.record_usage(response)
+            return response
+
+        return await runner.arun(attempt, parse, hedge=not kwargs.get("stream"))
+
+    def _runner(self, kwargs: dict) -> tuple[RetryPolicyRunner, dict]:
+        """호출 위치 정책의 실행기와 요청 타임아웃을 넣은 요청 인자"""
+        policy = get_call_policy(self.call_site)
+        return RetryPolicyRunner(self.call_site, self.model, policy), {"timeout": policy.timeout_seconds, **kwargs}
+
+    def observe_chunk(self, chunk) -> None:
+        """스트림 청크 하나를 기록한다 (내용이 있으면 토큰 시각, usage가 있으면 토큰 수)"""
+        if chunk.choices and chunk.choices[0].delta.content:
+            now = self._clock()
+            if self._last_token_at is None:
+                LLM_TIME_TO_FIRST_TOKEN.labels(self.call_site, self.model).observe(now - self._started)
+            else:
+                LLM_INTER_TOKEN_GAP.labels(self.call_site, self.model).observe(now - self._last_token_at)
+            self._last_token_at = now
+        self.record_usage(chunk)
+
+    def record_usage(self, response) -> None:
+        """응답 usage의 prompt/completion/cached 토큰 수를 더한다 (없으면 무시)"""
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        for kind, value in (
+            ("prompt", getattr(usage, "prompt_tokens", None)),
+            ("completion", getattr(usage, "completion_tokens", None)),
+            ("cached", getattr(details, "cached_tokens", None)),
+        ):
+            if isinstance(value, int) and value > 0:
+                LLM_TOKENS.labels(self.call_site, self.model, kind).inc(value)
+                if self.prompt_version:
+                    LLM_PROMPT_TOKENS.labels(self.call_site, self.prompt_version, kind).inc(value)
+
+
+def llm_call(call_site: str, model: str, prompt_version: str | None = None) -> LLMCall:
+    """LLM 호출 텔레메트리 컨텍스트 (prompt_version을 넘기면 프롬프트 버전별로도 집계한다)"""
+    return LLMCall(call_site, model, prompt_version=prompt_version)
+
+
+def _record_retry(request) -> None:
+    retry_count = request.headers.get(_RETRY_COUNT_HEADER, "0")
+    if retry_count.isdigit() and int(retry_count) > 0:
+        call_site, model = _current_call.get() or ("unknown", "unknown")
+        LLM_RETRIES.labels(call_site, model).inc()
+
+
+def on_request(request) -> None:
+    """동기 httpx 요청 훅: SDK 재시도 요청을 집계한다"""
+    _record_retry(request)
+
+
+async def on_async_request(request) -> None:
+    """비동기 httpx 요청 훅: SDK 재시도 요청을 집계한다"""
+    _record_retry(request)
+
+
+def _multiprocess_enabled() -> bool:
+    return bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Prometheus 텍스트 형식 메트릭과 Content-Type (멀티 워커면 전체 워커 합계)"""
+    registry = REGISTRY
+    if _multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead(pid: int) -> None:
+    """종료한 워커의 live 게이지 파일을 정리한다 (멀티 워커 모드에서만)"""
+    if _multiprocess_enabled():
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,226 @@
+import importlib.util
+import threading
+import warnings
+from functools import lru_cache
+
+import openai
+from openai import AsyncAzureOpenAI, AsyncOpenAI, AzureOpenAI, OpenAI
+
+from app.shared.llm import llm_telemetry
+from config.settings import get_settings
+
+# httpcore trace 이벤트 이름 (HTTP/1.1, HTTP/2 공통 접미사로 판별)
+_CONNECT_EVENT = "connection.connect_tcp.started"
+_TLS_EVENT = "connection.start_tls.started"
+_REQUEST_EVENT_SUFFIX = ".send_request_headers.started"
+
+
+class ConnectionReuseStats:
+    """OpenAI HTTP 커넥션 재사용 통계 (스레드 안전)
+
+    httpx 요청 훅으로 httpcore trace 콜백을 달아
+    요청 수와 새로 맺은 TCP/TLS 커넥션 수를 센다.
+    새 커넥션 없이 처리된 요청은 keep-alive 풀에서 재사용된 것이다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._new_connections = 0
+        self._tls_handshakes = 0
+
+    def record(self, event_name: str) -> None:
+        """trace 이벤트 하나를 집계한다"""
+        with self._lock:
+            if event_name == _CONNECT_EVENT:
+                self._new_connections += 1
+            elif event_name == _TLS_EVENT:
+                self._tls_handshakes += 1
+            elif event_name.endswith(_REQUEST_EVENT_SUFFIX):
+                self._requests += 1
+
+    def trace(self, event_name: str, info: dict) -> None:
+        """동기 클라이언트용 httpcore trace 콜백"""
+        self.record(event_name)
+
+    async def async_trace(self, event_name: str, info: dict) -> None:
+        """비동기 클라이언트용 httpcore trace 콜백"""
+        self.record(event_name)
+
+    def on_request(self, request) -> None:
+        """동기 httpx 요청 훅: 요청에 trace 콜백을 단다"""
+        request.extensions["trace"] = self.trace
+
+    async def on_async_request(self, request) -> None:
+        """비동기 httpx 요청 훅: 요청에 trace 콜백을 단다"""
+        request.extensions["trace"] = self.async_trace
+
+    def stats(self) -> dict:
+        """요청 수, 새 커넥션 수, 재사용 비율"""
+        with self._lock:
+            requests = self._requests
+            reused = max(requests - self._new_connections, 0)
+            return {
+                "requests": requests,
+                "new_connections": self._new_connections,
+                "tls_handshakes": self._tls_handshakes,
+                "reused_requests": reused,
+                "reuse_ratio": reused / requests if requests else 0.0,
+            }
+
+
+def _http2_enabled() -> bool:
+    """HTTP/2 설정이 켜져 있고 h2 패키지가 설치되어 있을 때만 True"""
+    if not get_settings().OPENAI_HTTP2:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        warnings.warn("OPENAI_HTTP2가 켜져 있지만 h2 패키지가 없어 HTTP/1.1을 사용합니다 (pip install h2)")
+        return False
+    return True
+
+
+def _http_client_options() -> dict:
+    """공유 httpx 클라이언트의 커넥션 풀/타임아웃 옵션"""
+    settings = get_settings()
+    # openai가 사용하는 httpx 구현의 Limits 타입을 그대로 쓴다
+    limits_type = type(openai.DEFAULT_CONNECTION_LIMITS)
+    return {
+        "limits": limits_type(
+            max_connections=settings.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        "timeout": openai.Timeout(
+            settings.OPENAI_TIMEOUT_SECONDS,
+            connect=settings.OPENAI_CONNECT_TIMEOUT_SECONDS,
+        ),
+        "http2": _http2_enabled(),
+    }
+
+
+@lru_cache()
+def _reuse_stats() -> dict:
+    """클라이언트별 커넥션 재사용 통계 객체 (프로세스 단위 싱글톤)"""
+    return {"sync": ConnectionReuseStats(), "async": ConnectionReuseStats()}
+
+
+def _http_client() -> openai.DefaultHttpxClient:
+    """커넥션 풀/재사용 통계/텔레메트리 훅을 단 동기 httpx 클라이언트"""
+    stats = _reuse_stats()["sync"]
+    return openai.DefaultHttpxClient(
+        event_hooks={"request": [stats.on_request, llm_telemetry.on_request]},
+        **_http_client_options(),
+    )
+
+
+def _async_http_client() -> openai.DefaultAsyncHttpxClient:
+    """커넥션 풀/재사용 통계/텔레메트리 훅을 단 비동기 httpx 클라이언트"""
+    stats = _reuse_stats()["async"]
+    return openai.DefaultAsyncHttpxClient(
+        event_hooks={"request": [stats.on_async_request, llm_telemetry.on_async_request]},
+        **_http_client_options(),
+    )
+
+
+@lru_cache()
+def get_openai_client() -> OpenAI:
+    """프로세스 전체가 공유하는 동기 OpenAI 클라이언트
+
+    요청마다 클라이언트를 만들면 httpx 커넥션 풀도 매번 새로 생겨
+    호출할 때마다 TCP/TLS 연결을 다시 맺게 된다.
+    """
+    settings = get_settings()
+    return OpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        base_url=settings.OPENAI_BASE_URL or None,
+        max_retries=settings.OPENAI_MAX_RETRIES,
+        http_client=_http_client(),
+    )
+
+
+@lru_cache()
+def get_async_openai_client() -> AsyncOpenAI:
+    """프로세스 전체가 공유하는 비동기 OpenAI 클라이언트"""
+    settings = get_settings()
+    return AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        base_url=settings.OPENAI_BASE_URL or None,
+        max_retries=settings.OPENAI_MAX_RETRIES,
+        http_client=_async_http_client(),
+    )
+
+
+# 게이트웨이 백엔드 이름 (openai는 위의 공유 클라이언트를 그대로 쓴다)
+BACKEND_NAMES = ("openai", "azure", "local")
+
+# (백엔드 이름, 비동기 여부) -> openai 외 백엔드의 공유 클라이언트
+_backend_clients: dict[tuple[str, bool], OpenAI | AsyncOpenAI] = {}
+_backend_clients_lock = threading.Lock()
+
+
+def _backend_client(name: str, is_async: bool) -> OpenAI | AsyncOpenAI:
+    settings = get_settings()
+    if name == "azure":
+        if not settings.AZURE_OPENAI_ENDPOINT:
+            raise ValueError("azure 백엔드를 쓰려면 AZURE_OPENAI_ENDPOINT를 설정해야 합니다")
+        client_type = AsyncAzureOpenAI if is_async else AzureOpenAI
+        options = {
+            "api_key": settings.AZURE_OPENAI_API_KEY,
+            "azure_endpoint": settings.AZURE_OPENAI_ENDPOINT,
+            "api_version": settings.AZURE_OPENAI_API_VERSION,
+        }
+    elif name == "local":
+        if not settings.LOCAL_LLM_BASE_URL:
+            raise ValueError("local 백엔드를 쓰려면 LOCAL_LLM_BASE_URL을 설정해야 합니다")
+        client_type = AsyncOpenAI if is_async else OpenAI
+        options = {"api_key": settings.LOCAL_LLM_API_KEY, "base_url": settings.LOCAL_LLM_BASE_URL}
+    else:
+        raise ValueError(f"알 수 없는 LLM 백엔드입니다: {name!r} ({', '.join(BACKEND_NAMES)} 중 하나)")
+    return client_type(
+        max_retries=settings.OPENAI_MAX_RETRIES,
+        http_client=_async_http_client() if is_async else _http_client(),
+        **options,
+    )
+
+
+def get_backend_client(name: str) -> OpenAI:
+    """백엔드별 프로세스 공유 동기 클라이언트 ("openai" | "azure" | "local")"""
+    if name == "openai":
+        return get_openai_client()
+    with _backend_clients_lock:
+        if (name, False) not in _backend_clients:
+            _backend_clients[(name, False)] = _backend_client(name, is_async=False)
+        return _backend_clients[(name, False)]
+
+
+def get_async_backend_client(name: str) -> AsyncOpenAI:
+    """백엔드별 프로세스 공유 비동기 클라이언트 ("openai" | "azure" | "local")"""
+    if name == "openai":
+        return get_async_openai_client()
+    with _backend_clients_lock:
+        if (name, True) not in _backend_clients:
+            _backend_clients[(name, True)] = _backend_client(name, is_async=True)
+        return _backend_clients[(name, True)]
+
+
+def openai_connection_stats() -> dict:
+    """동기/비동기 클라이언트의 커넥션 재사용 통계"""
+    return {name: stats.stats() for name, stats in _reuse_stats().items()}
+
+
+async def close_openai_clients() -> None:
+    """종료 시 공유 클라이언트(백엔드별 포함)의 커넥션 풀을 닫는다 (생성된 것만)"""
+    if get_openai_client.cache_info().currsize:
+        get_openai_client().close()
+        get_openai_client.cache_clear()
+    if get_async_openai_client.cache_info().currsize:
+        await get_async_openai_client().close()
+        get_async_openai_client.cache_clear()
+    with _backend_clients_lock:
+        clients = list(_backend_clients.values())
+        _backend_clients.clear()
+    for client in clients:
+        if isinstance(client, AsyncOpenAI):
+            await client.close()
+        else:
+            client.close()
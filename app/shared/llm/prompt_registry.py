@@ -0,0 +1,125 @@
+"""
+버전별 프롬프트 레지스트리와 온라인 A/B 배정
+
+프롬프트 묶음(예: "consult")마다 버전별 프롬프트 빌더를 시작 시 한 번 만들어 두고,
+사용자(subject)를 해시로 버전에 배정한다. 같은 사용자는 프로세스/워커가 달라도 항상 같은 버전을 받는다.
+버전 비율은 PROMPT_VARIANTS 설정으로 정한다 (예: "consult=v1:90|v2:10", 없으면 첫 버전만 쓴다).
+
+버전별 비교 지표:
+- llm_prompt_duration_seconds / llm_prompt_tokens_total: 호출 위치 x 프롬프트 버전별 지연 시간과 토큰 수 (llm_telemetry)
+- prompt_variant_sessions_total: 버전별 시작(started)/완료(completed) 세션 수 (완료율 = completed / started)
+"""
+
+import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Generic, Mapping, TypeVar
+
+from prometheus_client import Counter
+
+from config.settings import get_settings
+
+PROMPT_VARIANT_SESSIONS = Counter(
+    "prompt_variant_sessions",
+    "프롬프트 버전별 시작/완료 세션 수",
+    ("prompt", "version", "stage"),
+)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class PromptVariant(Generic[T]):
+    """배정된 프롬프트 버전"""
+
+    name: str
+    version: str
+    prompts: T
+
+    @property
+    def label(self) -> str:
+        """메트릭 라벨용 이름 (예: "consult:v2")"""
+        return f"{self.name}:{self.version}"
+
+
+def parse_variant_weights(spec: str) -> dict[str, dict[str, float]]:
+    """"이름=버전:비율|버전:비율,..." 형식을 {이름: {버전: 비율}}로 변환한다"""
+    weights: dict[str, dict[str, float]] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, sep, versions = item.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"PROMPT_VARIANTS 형식 오류: {item!r} (예: consult=v1:90|v2:10)")
+        split: dict[str, float] = {}
+        for entry in versions.split("|"):
+            version, sep, weight = entry.strip().partition(":")
+            try:
+                if not sep or not version:
+                    raise ValueError
+                split[version] = float(weight)
+            except ValueError:
+                raise ValueError(f"PROMPT_VARIANTS 형식 오류: {item!r} (예: consult=v1:90|v2:10)") from None
+        weights[name.strip()] = split
+    return weights
+
+
+def assign_bucket(name: str, subject: str) -> float:
+    """subject의 [0, 1) 배정 위치 (프롬프트 묶음 이름을 섞어 묶음마다 독립적으로 배정한다)"""
+    digest = hashlib.sha256(f"{name}:{subject}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") / 2 ** 64
+
+
+class PromptRegistry(Generic[T]):
+    """한 프롬프트 묶음의 버전별 빌더와 배정 비율
+
+    versions의 첫 버전이 기본(대조군)이며, 사용자를 알 수 없는 호출(예: 미리 채워 두는 인사말)은 기본 버전을 쓴다.
+    """
+
+    def __init__(self, name: str, versions: Mapping[str, T], weights: Mapping[str, float] | None = None):
+        if not versions:
+            raise ValueError(f"{name} 프롬프트 버전이 없습니다")
+        weights = dict(weights or {next(iter(versions)): 1.0})
+        unknown = set(weights) - set(versions)
+        if unknown:
+            raise ValueError(f"{name} 프롬프트에 없는 버전입니다: {', '.join(sorted(unknown))}")
+        if any(weight < 0 for weight in weights.values()) or sum(weights.values()) <= 0:
+            raise ValueError(f"{name} 프롬프트 버전 비율은 0 이상이고 합이 0보다 커야 합니다")
+
+        self.name = name
+        self._variants = {version: PromptVariant(name, version, prompts) for version, prompts in versions.items()}
+        total = sum(weights.values())
+        # (누적 비율 상한, 버전) - 비율이 0인 버전은 배정하지 않는다
+        self._split: list[tuple[float, str]] = []
+        cumulative = 0.0
+        for version, weight in weights.items():
+            if weight > 0:
+                cumulative += weight / total
+                self._split.append((cumulative, version))
+
+    @property
+    def default(self) -> PromptVariant[T]:
+        return next(iter(self._variants.values()))
+
+    @property
+    def versions(self) -> list[str]:
+        return list(self._variants)
+
+    def get(self, version: str) -> PromptVariant[T]:
+        return self._variants[version]
+
+    def assign(self, subject: str) -> PromptVariant[T]:
+        """subject(사용자 ID 등)에 배정된 버전 (같은 subject는 항상 같은 버전)"""
+        bucket = assign_bucket(self.name, subject)
+        for upper, version in self._split:
+            if bucket < upper:
+                return self._variants[version]
+        return self._variants[self._split[-1][1]]
+
+    def record_stage(self, variant: PromptVariant[T], stage: str) -> None:
+        """버전별 세션 진행 단계(started/completed)를 센다"""
+        PROMPT_VARIANT_SESSIONS.labels(self.name, variant.version, stage).inc()
+
+
+@lru_cache()
+def get_variant_weights() -> dict[str, dict[str, float]]:
+    """설정의 프롬프트 묶음별 버전 비율 (프로세스 단위 캐시)"""
+    return parse_variant_weights(get_settings().PROMPT_VARIANTS)
@@ -0,0 +1,39 @@
+"""
+로컬 토큰 수 추정기 (토크나이저 의존성 없이 프롬프트 크기를 가늠한다)
+
+gpt-4o 계열(o200k) 토크나이저 기준의 보수적인 근사치다.
+- 한글/한자/가나 한 글자: 약 1토큰
+- 영문/숫자: 약 4글자당 1토큰
+- 그 밖의 기호/이모지: 1글자당 1토큰
+- 공백은 앞뒤 단어 토큰에 붙으므로 세지 않는다
+채팅 메시지는 OpenAI 안내대로 메시지당 4토큰, 응답 시작에 3토큰을 더한다.
+"""
+
+import math
+
+TOKENS_PER_MESSAGE = 4
+TOKENS_PER_REPLY = 3
+ASCII_CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """문자열의 토큰 수를 추정한다"""
+    ascii_chars = 0
+    other_tokens = 0
+    for ch in text:
+        if ch.isspace():
+            continue
+        if ch.isascii() and ch.isalnum():
+            ascii_chars += 1
+        else:
+            # 한글/한자, ASCII 구두점, 이모지 등은 글자마다 1토큰으로 본다
+            other_tokens += 1
+    return other_tokens + math.ceil(ascii_chars / ASCII_CHARS_PER_TOKEN)
+
+
+def estimate_message_tokens(messages: list[dict]) -> int:
+    """OpenAI 채팅 메시지 목록의 프롬프트 토큰 수를 추정한다"""
+    total = TOKENS_PER_REPLY
+    for message in messages:
+        total += TOKENS_PER_MESSAGE + estimate_tokens(message.get("content") or "")
+    return total
@@ -0,0 +1,39 @@
+import json
+import logging
+from datetime import datetime, timezone
+
+# LogRecord 기본 속성 (이 밖의 속성은 extra로 넘긴 필드로 보고 JSON에 그대로 싣는다)
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+# TraceContextFilter가 붙이는 속성
+CONTEXT_FIELDS = ("request_id", "trace_id", "span_id")
+
+
+class JsonLogFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON으로 만든다
+
+    시각(UTC), 레벨, 로거 이름, 메시지, 요청/trace id, 예외, extra 필드를 담는다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value:
+                entry[field] = value
+        for key, value in vars(record).items():
+            if key not in _RESERVED and key not in CONTEXT_FIELDS and not key.startswith("_"):
+                entry[key] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return json.dumps(entry, ensure_ascii=False, default=str)
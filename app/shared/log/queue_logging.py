@@ -0,0 +1,124 @@
+"""
+비동기(큐 기반) 로깅 설정
+
+요청 경로의 로그 호출은 레코드를 메모리 큐에 넣기만 하고, 포맷과 stdout 쓰기는
+QueueListener 백그라운드 스레드가 한다. 요청들이 stdout 락을 두고 줄을 서지 않는다.
+큐가 가득 차면 기다리지 않고 레코드를 버린다 (버린 수는 dropped로 확인).
+
+요청/trace id는 로그를 남긴 시점의 컨텍스트(TracingMiddleware의 Trace)에서 읽어 레코드에 붙인다.
+"""
+
+import copy
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+from app.shared.log.json_log_formatter import JsonLogFormatter
+from app.shared.tracing.tracer import current_span, current_trace
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"
+
+
+class TraceContextFilter(logging.Filter):
+    """진행 중인 요청의 request_id, trace_id, span_id를 레코드에 붙인다 (로그를 남긴 스레드에서 실행)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        trace = current_trace()
+        if trace is None:
+            record.request_id = record.trace_id = record.span_id = None
+            return True
+        span = current_span()
+        record.request_id = trace.request_id
+        record.trace_id = trace.trace_id
+        record.span_id = span.span_id if span is not None else trace.root.span_id
+        return True
+
+
+class DroppingQueueHandler(QueueHandler):
+    """큐가 가득 차면 기다리지 않고 레코드를 버리는 QueueHandler"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._exception_formatter = logging.Formatter()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """다른 스레드로 넘기기 전에 메시지와 예외를 문자열로 만든다 (JSON 필드는 리스너가 만든다)"""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_handler: DroppingQueueHandler | None = None
+_listener: QueueListener | None = None
+
+
+def parse_log_levels(spec: str) -> dict[str, str]:
+    """"sqlalchemy.engine=WARNING,app.consult=DEBUG" 형식의 로거별 레벨"""
+    levels = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        name, sep, level = item.partition("=")
+        level = level.strip().upper()
+        if not sep or not name.strip() or level not in logging.getLevelNamesMapping():
+            raise ValueError(f"로거 레벨 형식이 올바르지 않습니다: {item!r}")
+        levels[name.strip()] = level
+    return levels
+
+
+def configure_logging(
+    level: str = "INFO",
+    module_levels: str = "",
+    log_format: str = "json",
+    queue_size: int = 10000,
+    stream=None,
+) -> DroppingQueueHandler:
+    """루트 로거에 큐 핸들러를 달고 백그라운드 리스너를 시작한다
+
+    다시 호출하면 이전에 단 핸들러와 리스너를 정리하고 새로 설정한다.
+    (다른 곳에서 단 루트 핸들러는 건드리지 않는다)
+    """
+    shutdown_logging()
+    global _handler, _listener
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    if log_format == "json":
+        output.setFormatter(JsonLogFormatter())
+    else:
+        output.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+    _handler = DroppingQueueHandler(log_queue)
+    _handler.addFilter(TraceContextFilter())
+    _listener = QueueListener(log_queue, output, respect_handler_level=False)
+    _listener.start()
+
+    root = logging.getLogger()
+    root.addHandler(_handler)
+    root.setLevel(level.upper())
+    for name, module_level in parse_log_levels(module_levels).items():
+        logging.getLogger(name).setLevel(module_level)
+    return _handler
+
+
+def shutdown_logging() -> None:
+    """큐에 남은 레코드를 모두 쓰고 리스너를 멈춘다"""
+    global _handler, _listener
+    if _handler is not None:
+        logging.getLogger().removeHandler(_handler)
+        _handler = None
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -0,0 +1,61 @@
+import logging
+import random
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 로그에 싣는 SQL 문 최대 길이
+MAX_STATEMENT_CHARS = 1000
+
+
+class SqlStatementLogger:
+    """느린 SQL 문과 일부 표본만 로그로 남긴다 (engine echo 대체)
+
+    실행 시간이 slow_ms 이상이면 WARNING, 그 밖의 문은 sample_rate 확률로 INFO로 남긴다.
+    파라미터 값은 남기지 않는다.
+    """
+
+    def __init__(self, slow_ms: float = 200.0, sample_rate: float = 0.0, rng: random.Random | None = None):
+        self._slow_seconds = slow_ms / 1000
+        self._sample_rate = sample_rate
+        self._random = rng or random.Random()
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def uninstall(self, engine: Engine) -> None:
+        event.remove(engine, "before_cursor_execute", self._before)
+        event.remove(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("sql_started_at", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info.get("sql_started_at")
+        if not started:
+            return
+        duration = time.perf_counter() - started.pop()
+
+        if duration >= self._slow_seconds:
+            level, kind = logging.WARNING, "slow"
+        elif self._sample_rate > 0 and self._random.random() < self._sample_rate:
+            level, kind = logging.INFO, "sample"
+        else:
+            return
+        if not logger.isEnabledFor(level):
+            return
+        logger.log(
+            level,
+            "sql %s duration_ms=%.1f",
+            kind,
+            duration * 1000,
+            extra={
+                "duration_ms": round(duration * 1000, 1),
+                "statement": " ".join(statement.split())[:MAX_STATEMENT_CHARS],
+                "rowcount": cursor.rowcount,
+            },
+        )
@@ -0,0 +1,146 @@
+"""
+LLM 호출 엔드포인트 입장 제어 (토큰 버킷)
+
+요청 하나가 만들 LLM 요청 수와 추정 토큰 수만큼 아래 버킷들에서 한꺼번에 꺼낸다.
+- 전역: 모든 사용자/엔드포인트가 나눠 쓰는 OpenAI 한도
+- 엔드포인트별: 특정 API가 전역 한도를 다 쓰지 않도록
+- 사용자별: 한 클라이언트가 병렬 요청으로 독점하지 않도록
+
+하나라도 모자라면 아무 버킷도 차감하지 않고, 다시 시도할 때까지 기다릴 시간을 돌려준다.
+버킷 상태는 프로세스 메모리(memory) 또는 레플리카가 공유하는 DB(database)에 둔다.
+"""
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+from prometheus_client import Counter
+
+from app.shared.ratelimit.memory_token_bucket_backend import MemoryTokenBucketBackend
+from app.shared.ratelimit.token_bucket import BucketSpec, TokenBucketBackend
+from config.settings import get_settings
+
+ADMISSION_REJECTED = Counter(
+    "admission_rejected",
+    "입장 제어로 거절한 요청 수",
+    ("endpoint",),
+)
+
+# 기다릴 시간을 알 수 없을 때(채워지지 않는 버킷) 돌려주는 Retry-After
+MAX_RETRY_AFTER_SECONDS = 60
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """분당 LLM 요청 수 / 분당 토큰 수 (0이면 그 차원은 제한하지 않는다)"""
+
+    requests_per_minute: float = 0
+    tokens_per_minute: float = 0
+
+
+def parse_endpoint_limits(spec: str) -> dict[str, RateLimit]:
+    """"consult.message=600:400000,converter.convert_three_tones=300:200000" 형식의 엔드포인트별 한도"""
+    limits = {}
+    for item in spec.split(","):
+        if not item.strip():
+            continue
+        name, sep, value = item.partition("=")
+        rpm, colon, tpm = value.partition(":")
+        try:
+            if not sep or not name.strip():
+                raise ValueError
+            limits[name.strip()] = RateLimit(float(rpm), float(tpm) if colon else 0)
+        except ValueError:
+            raise ValueError(f"엔드포인트 한도 형식이 올바르지 않습니다: {item!r}") from None
+    return limits
+
+
+def retry_after_seconds(wait: float) -> int:
+    """Retry-After 헤더 값 (1초 이상 정수)"""
+    if not math.isfinite(wait):
+        return MAX_RETRY_AFTER_SECONDS
+    return min(max(math.ceil(wait), 1), MAX_RETRY_AFTER_SECONDS)
+
+
+class AdmissionController:
+    """엔드포인트 요청을 전역/엔드포인트별/사용자별 토큰 버킷으로 입장시킨다"""
+
+    def __init__(
+        self,
+        backend: TokenBucketBackend,
+        global_limit: RateLimit | None = None,
+        user_limit: RateLimit | None = None,
+        endpoint_limits: dict[str, RateLimit] | None = None,
+        burst_seconds: float = 10.0,
+    ):
+        """
+        Args:
+            burst_seconds: 버킷 용량을 이 시간 동안 채워지는 양으로 잡는다 (몰아서 보낼 수 있는 양)
+        """
+        self._backend = backend
+        self._global_limit = global_limit
+        self._user_limit = user_limit
+        self._endpoint_limits = endpoint_limits or {}
+        self._burst_seconds = burst_seconds
+
+    @property
+    def blocking(self) -> bool:
+        """버킷 저장소가 I/O를 하는지 (이벤트 루프 밖에서 호출해야 하는지)"""
+        return self._backend.blocking
+
+    def demands(self, endpoint: str, subject: str, llm_requests: int, tokens: int) -> list[tuple[BucketSpec, float]]:
+        """요청 하나가 꺼낼 (버킷, 양) 목록"""
+        scopes = (
+            ("global", self._global_limit),
+            (f"endpoint:{endpoint}", self._endpoint_limits.get(endpoint)),
+            (f"user:{subject}", self._user_limit),
+        )
+        demands = []
+        for scope, limit in scopes:
+            if limit is None:
+                continue
+            for unit, per_minute, cost in (
+                ("requests", limit.requests_per_minute, llm_requests),
+                ("tokens", limit.tokens_per_minute, tokens),
+            ):
+                if per_minute <= 0:
+                    continue
+                rate = per_minute / 60
+                demands.append((BucketSpec(f"{scope}:{unit}", rate * self._burst_seconds, rate), cost))
+        return demands
+
+    def admit(self, endpoint: str, subject: str, llm_requests: int, tokens: int) -> float:
+        """입장시키면 0, 거절하면 다시 시도할 때까지 기다릴 초"""
+        demands = self.demands(endpoint, subject, llm_requests, tokens)
+        if not demands:
+            return 0.0
+        wait = self._backend.acquire(demands)
+        if wait:
+            ADMISSION_REJECTED.labels(endpoint).inc()
+        return wait
+
+
+@lru_cache()
+def get_admission_controller() -> AdmissionController | None:
+    """설정 기반 입장 제어 (프로세스 단위 싱글톤, ADMISSION_ENABLED가 꺼져 있으면 None)"""
+    settings = get_settings()
+    if not settings.ADMISSION_ENABLED:
+        return None
+
+    if settings.ADMISSION_BACKEND == "database":
+        from app.shared.ratelimit.sql_token_bucket_backend import SqlTokenBucketBackend
+        from config.database import get_db_session
+
+        backend: TokenBucketBackend = SqlTokenBucketBackend(get_db_session)
+    elif settings.ADMISSION_BACKEND == "memory":
+        backend = MemoryTokenBucketBackend()
+    else:
+        raise ValueError(f"지원하지 않는 ADMISSION_BACKEND입니다: {settings.ADMISSION_BACKEND}")
+
+    return AdmissionController(
+        backend,
+        global_limit=RateLimit(settings.ADMISSION_GLOBAL_RPM, settings.ADMISSION_GLOBAL_TPM),
+        user_limit=RateLimit(settings.ADMISSION_USER_RPM, settings.ADMISSION_USER_TPM),
+        endpoint_limits=parse_endpoint_limits(settings.ADMISSION_ENDPOINT_LIMITS),
+        burst_seconds=settings.ADMISSION_BURST_SECONDS,
+    )
@@ -0,0 +1,59 @@
+from typing import Callable
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.shared.ratelimit.admission_controller import get_admission_controller, retry_after_seconds
+
+# 요청 본문 바이트를 토큰으로 어림하는 비율 (한글은 UTF-8 3바이트 ≈ 1토큰)
+BYTES_PER_TOKEN = 3
+
+
+def client_address(request: Request) -> str:
+    """로그인하지 않는 엔드포인트의 사용자 키 (클라이언트 IP)
+
+    프록시(Railway)가 X-Forwarded-For 끝에 실제 접속 IP를 붙이므로 마지막 항목을 쓴다.
+    (앞쪽 항목은 클라이언트가 임의로 넣을 수 있다)
+    """
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        return forwarded.split(",")[-1].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def require_admission(
+    endpoint: str,
+    llm_requests: int = 1,
+    base_tokens: int = 0,
+    subject: Callable[..., str] = client_address,
+):
+    """LLM을 호출하는 엔드포인트의 입장 제어 의존성
+
+    한도를 넘으면 LLM을 호출하기 전에 429와 Retry-After로 거절한다.
+
+    Args:
+        endpoint: 엔드포인트별 한도 이름 (ADMISSION_ENDPOINT_LIMITS의 키)
+        llm_requests: 요청 하나가 만드는 LLM 요청 수
+        base_tokens: 요청 하나가 쓰는 추정 토큰 수 (프롬프트 + 응답, 요청 본문 길이만큼 더한다)
+        subject: 사용자별 한도의 키를 돌려주는 의존성 (기본: 클라이언트 IP)
+    """
+
+    async def admission(request: Request, subject_id: str = Depends(subject)) -> None:
+        controller = get_admission_controller()
+        if controller is None:
+            return
+        body_bytes = request.headers.get("content-length", "")
+        tokens = base_tokens + (int(body_bytes) // BYTES_PER_TOKEN if body_bytes.isdigit() else 0)
+
+        if controller.blocking:
+            wait = await run_in_threadpool(controller.admit, endpoint, subject_id, llm_requests, tokens)
+        else:
+            wait = controller.admit(endpoint, subject_id, llm_requests, tokens)
+        if wait:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="요청이 많습니다. 잠시 후 다시 시도해주세요",
+                headers={"Retry-After": str(retry_after_seconds(wait))},
+            )
+
+    return admission
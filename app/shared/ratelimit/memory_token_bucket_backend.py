@@ -0,0 +1,39 @@
+import threading
+import time
+from typing import Callable
+
+from app.shared.ratelimit.token_bucket import BucketSpec, BucketState, TokenBucketBackend, plan_acquire
+
+
+class MemoryTokenBucketBackend(TokenBucketBackend):
+    """프로세스 메모리 토큰 버킷 (스레드 안전, 워커 프로세스별로 따로 센다)
+
+    가득 찬 버킷은 처음 쓰는 버킷과 같으므로 max_keys를 넘으면 가득 찬 버킷부터 지운다.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, max_keys: int = 100_000):
+        self._clock = clock
+        self._max_keys = max_keys
+        self._lock = threading.Lock()
+        self._states: dict[str, BucketState] = {}
+        self._specs: dict[str, BucketSpec] = {}
+
+    def acquire(self, demands: list[tuple[BucketSpec, float]]) -> float:
+        with self._lock:
+            now = self._clock()
+            updated, wait = plan_acquire(demands, self._states, now)
+            if wait:
+                return wait
+            self._states.update(updated)
+            for spec, _ in demands:
+                self._specs[spec.key] = spec
+            if len(self._states) > self._max_keys:
+                self._evict_full(now)
+            return 0.0
+
+    def _evict_full(self, now: float) -> None:
+        for key, state in list(self._states.items()):
+            spec = self._specs[key]
+            if state.tokens + (now - state.updated_at) * spec.refill_per_second >= spec.capacity:
+                del self._states[key]
+                del self._specs[key]
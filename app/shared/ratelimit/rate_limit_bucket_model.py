@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Double, String
+from config.database import Base
+
+
+class RateLimitBucketModel(Base):
+    """공유 토큰 버킷 상태 ORM 모델 (여러 인스턴스가 같은 한도를 나눠 쓸 때)"""
+
+    __tablename__ = "rate_limit_buckets"
+
+    bucket_key = Column(String(255), primary_key=True)
+    tokens = Column(Double, nullable=False)
+    updated_at = Column(Double, nullable=False)  # epoch 초 (인스턴스 간 공통 시계)
@@ -0,0 +1,73 @@
+import logging
+import time
+from typing import Callable
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.shared.ratelimit.rate_limit_bucket_model import RateLimitBucketModel
+from app.shared.ratelimit.token_bucket import BucketSpec, BucketState, TokenBucketBackend, plan_acquire
+from app.shared.tracing.tracer import traced
+
+logger = logging.getLogger(__name__)
+
+# 새 버킷 행을 동시에 만들다 충돌했을 때 다시 시도하는 횟수
+MAX_ATTEMPTS = 3
+
+
+class SqlTokenBucketBackend(TokenBucketBackend):
+    """DB(MySQL) 공유 토큰 버킷 (모든 레플리카가 같은 한도를 나눠 쓴다)
+
+    요청의 버킷 행들을 key 순서로 SELECT ... FOR UPDATE로 잠그고, 모두 충분할 때만 한 트랜잭션으로 차감한다.
+    전역 버킷 행은 모든 요청이 잠그므로 허용 처리량은 이 트랜잭션 지연(수 ms)에 묶이지만,
+    LLM 호출 한도보다는 훨씬 크다.
+    DB 오류가 나면 요청을 막지 않고 통과시킨다 (한도 저장소 장애가 서비스 장애가 되지 않도록).
+    """
+
+    blocking = True
+
+    def __init__(self, session_factory: Callable[[], Session], clock: Callable[[], float] = time.time):
+        self._session_factory = session_factory
+        self._clock = clock
+
+    @traced("db.rate_limit.acquire")
+    def acquire(self, demands: list[tuple[BucketSpec, float]]) -> float:
+        keys = sorted({spec.key for spec, _ in demands})
+        for _ in range(MAX_ATTEMPTS):
+            db = self._session_factory()
+            try:
+                rows = {
+                    row.bucket_key: row
+                    for row in db.execute(
+                        select(RateLimitBucketModel)
+                        .where(RateLimitBucketModel.bucket_key.in_(keys))
+                        .order_by(RateLimitBucketModel.bucket_key)
+                        .with_for_update()
+                    ).scalars()
+                }
+                states = {key: BucketState(row.tokens, row.updated_at) for key, row in rows.items()}
+                updated, wait = plan_acquire(demands, states, self._clock())
+                if wait:
+                    db.rollback()
+                    return wait
+
+                for key, state in updated.items():
+                    row = rows.get(key)
+                    if row is None:
+                        db.add(RateLimitBucketModel(bucket_key=key, tokens=state.tokens, updated_at=state.updated_at))
+                    else:
+                        row.tokens, row.updated_at = state.tokens, state.updated_at
+                db.commit()
+                return 0.0
+            except IntegrityError:
+                # 다른 인스턴스가 같은 새 버킷 행을 먼저 만든 경우 (다시 잠그고 계산한다)
+                db.rollback()
+            except SQLAlchemyError:
+                db.rollback()
+                logger.exception("rate limit 저장소 오류 - 요청을 통과시킵니다 keys=%s", keys)
+                return 0.0
+            finally:
+                db.close()
+        logger.warning("rate limit 버킷 생성 충돌이 반복되어 요청을 통과시킵니다 keys=%s", keys)
+        return 0.0
@@ -0,0 +1,73 @@
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class BucketSpec:
+    """토큰 버킷 하나 (key별로 상태를 따로 가진다)
+
+    capacity만큼 몰아서 쓸 수 있고, 초당 refill_per_second씩 다시 찬다.
+    """
+
+    key: str
+    capacity: float
+    refill_per_second: float
+
+
+@dataclass(frozen=True)
+class BucketState:
+    tokens: float
+    updated_at: float
+
+
+def refill(spec: BucketSpec, state: BucketState | None, now: float) -> float:
+    """now 시점의 남은 토큰 수 (처음 쓰는 버킷은 가득 찬 상태)"""
+    if state is None:
+        return spec.capacity
+    elapsed = max(now - state.updated_at, 0.0)
+    return min(spec.capacity, state.tokens + elapsed * spec.refill_per_second)
+
+
+def plan_acquire(
+    demands: list[tuple[BucketSpec, float]],
+    states: dict[str, BucketState],
+    now: float,
+) -> tuple[dict[str, BucketState], float]:
+    """여러 버킷에서 한꺼번에 토큰을 꺼내는 계획
+
+    모든 버킷에 충분한 토큰이 있을 때만 꺼낸다 (일부 버킷만 차감하지 않는다).
+    cost가 capacity보다 크면 버킷이 가득 찼을 때 통과시킨다.
+
+    Returns:
+        (차감 후 상태, 0) 또는 거절 시 ({}, 모든 버킷이 충분해질 때까지 기다릴 초)
+    """
+    updated: dict[str, BucketState] = {}
+    wait = 0.0
+    for spec, cost in demands:
+        cost = min(cost, spec.capacity)
+        tokens = refill(spec, states.get(spec.key), now)
+        if tokens >= cost:
+            updated[spec.key] = BucketState(tokens - cost, now)
+        elif spec.refill_per_second <= 0:
+            wait = math.inf
+        else:
+            wait = max(wait, (cost - tokens) / spec.refill_per_second)
+    if wait > 0:
+        return {}, wait
+    return updated, 0.0
+
+
+class TokenBucketBackend(ABC):
+    """토큰 버킷 상태 저장소 (프로세스 메모리 또는 여러 인스턴스가 공유하는 저장소)"""
+
+    # True면 acquire가 I/O를 하므로 이벤트 루프 밖(스레드풀)에서 호출해야 한다
+    blocking: bool = False
+
+    @abstractmethod
+    def acquire(self, demands: list[tuple[BucketSpec, float]]) -> float:
+        """demands의 모든 버킷에서 원자적으로 토큰을 꺼낸다
+
+        Returns:
+            0이면 통과, 아니면 다시 시도할 때까지 기다릴 초
+        """
@@ -0,0 +1,33 @@
+"""Server-Sent Events 인코딩"""
+
+# 연결이 끊겼을 때 브라우저 EventSource가 재연결까지 기다릴 시간 (ms)
+DEFAULT_RETRY_MS = 3000
+
+# 프록시(nginx 등)가 스트림을 버퍼링하지 않도록 하는 응답 헤더
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+
+def encode_sse_event(
+    data: str,
+    event_id: int | str | None = None,
+    event: str | None = None,
+    retry_ms: int | None = None,
+) -> str:
+    """SSE 이벤트 하나를 직렬화한다
+
+    data에 줄바꿈이 있으면 줄마다 "data:" 필드로 나눠 보낸다.
+    클라이언트는 data 줄들을 "\\n"으로 이어 붙여 원래 문자열을 복원한다.
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    if retry_ms is not None:
+        lines.append(f"retry: {retry_ms}")
+    for line in data.replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        lines.append(f"data: {line}")
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,72 @@
+import json
+import threading
+
+from app.shared.tracing.tracer import Span, Trace
+
+# OTLP span kind / status code
+_KIND_INTERNAL = 1
+_KIND_SERVER = 2
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+
+
+def _attribute(key: str, value) -> dict:
+    """OTLP KeyValue (AnyValue는 타입별 필드에 담는다)"""
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+def _span_to_otlp(trace: Trace, span: Span, kind: int) -> dict:
+    attributes = dict(span.attributes)
+    if span.error:
+        attributes["exception.type"] = span.error
+    otlp = {
+        "traceId": trace.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": kind,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns or span.start_ns),
+        "attributes": [_attribute(key, value) for key, value in attributes.items()],
+        "status": {"code": _STATUS_ERROR if span.error else _STATUS_OK},
+    }
+    if span.parent_id:
+        otlp["parentSpanId"] = span.parent_id
+    return otlp
+
+
+def trace_to_otlp(trace: Trace, service_name: str) -> dict:
+    """Trace를 OTLP/JSON ExportTraceServiceRequest 형태로 변환한다"""
+    spans = [_span_to_otlp(trace, trace.root, _KIND_SERVER)]
+    spans.extend(_span_to_otlp(trace, span, _KIND_INTERNAL) for span in trace.spans)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {"attributes": [_attribute("service.name", service_name)]},
+                "scopeSpans": [{"scope": {"name": "app.shared.tracing"}, "spans": spans}],
+            }
+        ]
+    }
+
+
+class JsonlTraceExporter:
+    """샘플링된 Trace를 한 줄에 하나씩 OTLP JSON으로 파일에 추가한다
+
+    각 줄은 OTLP/HTTP JSON 요청 본문과 같은 형태라 컬렉터로 그대로 보낼 수 있다.
+    """
+
+    def __init__(self, path: str, service_name: str = "hexa-ai-server"):
+        self._path = path
+        self._service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        line = json.dumps(trace_to_otlp(trace, self._service_name), ensure_ascii=False)
+        with self._lock:
+            with open(self._path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
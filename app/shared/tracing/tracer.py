@@ -0,0 +1,181 @@
+"""
+요청 단위 경량 트레이서
+
+요청마다 Trace 하나를 만들고(TracingMiddleware), 라우터/유스케이스/저장소/AI 포트 구현체에서
+span(이름) 또는 @traced(이름)로 구간을 기록한다. 진행 중인 Trace가 없으면 아무것도 하지 않는다.
+
+- 모든 요청: 구간별 소요 시간을 Server-Timing 헤더로 돌려준다
+- 샘플링된 요청: 전체 span을 OTLP JSON 형태로 내보낸다 (JsonlTraceExporter)
+
+현재 span은 contextvar로 전달되므로 스레드풀(run_in_threadpool, asyncio.to_thread)과
+태스크 안에서 만든 span도 같은 Trace에 부모-자식 관계로 기록된다.
+"""
+
+import contextvars
+import functools
+import inspect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+
+def _new_id(n_bytes: int) -> str:
+    return os.urandom(n_bytes).hex()
+
+
+class Span:
+    """Trace 안의 한 구간"""
+
+    __slots__ = ("name", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, name: str, parent_id: str | None, attributes: dict | None = None):
+        self.name = name
+        self.span_id = _new_id(8)
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.attributes = attributes or {}
+        self.error: str | None = None
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1_000_000
+
+
+class Trace:
+    """요청 하나의 span 모음"""
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str | None = None,
+        sampled: bool = False,
+        attributes: dict | None = None,
+        request_id: str | None = None,
+    ):
+        self.trace_id = trace_id or _new_id(16)
+        self.request_id = request_id or self.trace_id
+        self.sampled = sampled
+        self._lock = threading.Lock()
+        self.root = Span(name, parent_id=None, attributes=attributes)
+        self.spans: list[Span] = []
+
+    def start_span(self, name: str, parent: Span, attributes: dict | None = None) -> Span:
+        span = Span(name, parent.span_id, attributes)
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    def finish(self) -> None:
+        self.root.end_ns = time.time_ns()
+
+    def server_timing(self, max_entries: int = 20) -> str:
+        """Server-Timing 헤더 값 (같은 이름 span은 합산, 처음 시작한 순서, 마지막에 total)"""
+        totals: dict[str, float] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            totals[span.name] = totals.get(span.name, 0.0) + span.duration_ms
+        entries = [f"{name};dur={duration:.1f}" for name, duration in list(totals.items())[:max_entries]]
+        entries.append(f"total;dur={self.root.duration_ms:.1f}")
+        return ", ".join(entries)
+
+
+# 진행 중인 Trace와 현재(부모가 될) span
+_current_trace: contextvars.ContextVar[Trace | None] = contextvars.ContextVar("trace", default=None)
+_current_span: contextvars.ContextVar[Span | None] = contextvars.ContextVar("span", default=None)
+
+
+def current_trace() -> Trace | None:
+    """진행 중인 Trace (없으면 None)"""
+    return _current_trace.get()
+
+
+def current_span() -> Span | None:
+    """현재 컨텍스트에서 진행 중인 span (없으면 None)"""
+    return _current_span.get()
+
+
+def start_trace(trace: Trace) -> None:
+    """현재 컨텍스트에서 trace를 시작한다 (TracingMiddleware용)"""
+    _current_trace.set(trace)
+    _current_span.set(trace.root)
+
+
+def end_trace() -> None:
+    """현재 컨텍스트의 trace를 끝낸다"""
+    _current_trace.set(None)
+    _current_span.set(None)
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Span | None]:
+    """구간 하나를 기록한다 (진행 중인 Trace가 없으면 아무것도 하지 않는다)"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _current_span.get() or trace.root
+    current = trace.start_span(name, parent, attributes)
+    # 제너레이터가 스레드풀에서 이어 실행되면 컨텍스트가 바뀌므로 reset(token) 대신 부모를 다시 설정한다
+    _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = type(e).__name__
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.set(parent)
+
+
+def traced(name: str) -> Callable:
+    """함수/메서드 호출 전체를 span으로 기록하는 데코레이터
+
+    코루틴, 동기/비동기 제너레이터(스트리밍)도 지원한다. 제너레이터는 마지막 항목까지를 구간으로 본다.
+    """
+    def decorator(fn):
+        if inspect.isasyncgenfunction(fn):
+            @functools.wraps(fn)
+            async def async_gen_wrapper(*args, **kwargs):
+                if _current_trace.get() is None:
+                    async for item in fn(*args, **kwargs):
+                        yield item
+                    return
+                with span(name):
+                    async for item in fn(*args, **kwargs):
+                        yield item
+            return async_gen_wrapper
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if _current_trace.get() is None:
+                    return await fn(*args, **kwargs)
+                with span(name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        if inspect.isgeneratorfunction(fn):
+            @functools.wraps(fn)
+            def gen_wrapper(*args, **kwargs):
+                if _current_trace.get() is None:
+                    yield from fn(*args, **kwargs)
+                    return
+                with span(name):
+                    yield from fn(*args, **kwargs)
+            return gen_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _current_trace.get() is None:
+                return fn(*args, **kwargs)
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorator
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import random
+
+from app.shared.tracing.jsonl_trace_exporter import JsonlTraceExporter
+from app.shared.tracing.tracer import Trace, end_trace, start_trace
+
+logger = logging.getLogger(__name__)
+
+# 클라이언트가 보낸 X-Request-ID는 이 길이까지만 쓴다 (없으면 trace_id를 요청 id로 쓴다)
+MAX_REQUEST_ID_LENGTH = 128
+
+
+def _parse_traceparent(value: str | None) -> tuple[str | None, bool | None]:
+    """W3C traceparent 헤더에서 (trace_id, sampled)를 읽는다 (형식이 다르면 무시)"""
+    if not value:
+        return None, None
+    parts = value.strip().split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[3]) != 2:
+        return None, None
+    try:
+        flags = int(parts[3], 16)
+        int(parts[1], 16)
+    except ValueError:
+        return None, None
+    return parts[1], bool(flags & 0x01)
+
+
+class TracingMiddleware:
+    """요청마다 Trace를 만들고 응답에 Server-Timing, X-Request-ID 헤더를 붙이는 ASGI 미들웨어
+
+    샘플링된 요청(sample_rate 확률, 또는 traceparent의 sampled 플래그)은 응답이 끝난 뒤
+    exporter로 내보낸다. 스트리밍 응답의 Server-Timing에는 헤더를 보내기 전까지의 구간만 담긴다.
+    """
+
+    def __init__(self, app, sample_rate: float = 0.0, exporter: JsonlTraceExporter | None = None):
+        self.app = app
+        self._sample_rate = sample_rate
+        self._exporter = exporter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        request_id = None
+        for key, value in scope.get("headers", []):
+            if key == b"traceparent":
+                traceparent = value.decode("latin-1")
+            elif key == b"x-request-id":
+                request_id = value.decode("latin-1")[:MAX_REQUEST_ID_LENGTH]
+        trace_id, sampled = _parse_traceparent(traceparent)
+        if sampled is None:
+            sampled = self._sample_rate > 0 and random.random() < self._sample_rate
+
+        method = scope.get("method", "")
+        trace = Trace(
+            f"{method} {scope.get('path', '')}",
+            trace_id=trace_id,
+            sampled=sampled,
+            attributes={"http.method": method, "http.target": scope.get("path", "")},
+            request_id=request_id,
+        )
+        start_trace(trace)
+
+        async def send_with_server_timing(message):
+            if message["type"] == "http.response.start":
+                trace.root.attributes["http.status_code"] = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", trace.server_timing().encode("latin-1")))
+                headers.append((b"x-request-id", trace.request_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_server_timing)
+        except BaseException as e:
+            trace.root.error = type(e).__name__
+            raise
+        finally:
+            trace.finish()
+            end_trace()
+            route = scope.get("route")
+            if route is not None and getattr(route, "path", None):
+                # 경로 파라미터 대신 라우트 템플릿으로 이름을 붙여 같은 API끼리 묶이게 한다
+                trace.root.name = f"{method} {route.path}"
+                trace.root.attributes["http.route"] = route.path
+            if trace.sampled and self._exporter is not None:
+                try:
+                    await asyncio.to_thread(self._exporter.export, trace)
+                except Exception:
+                    logger.exception("trace export 실패 trace_id=%s", trace.trace_id)
@@ -8,10 +8,11 @@ def client():
     """DB 연결 없이 테스트하기 위해 lifespan을 모킹"""
     with patch('config.database.engine') as mock_engine:
         with patch('config.database.Base') as mock_base:
-            mock_engine.dispose = MagicMock()
-            from app.main import app
-            with TestClient(app) as c:
-                yield c
+            with patch('app.main.check_schema_version', return_value=0):
+                mock_engine.dispose = MagicMock()
+                from app.main import app
+                with TestClient(app) as c:
+                    yield c
 
 
 class TestHealthEndpoint:
@@ -1,33 +1,40 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
+from sqlalchemy.orm import Session as DbSession
 
 from app.auth.adapter.input.web.auth_dependency import get_current_user_id
 from app.user.application.port.user_repository_port import UserRepositoryPort
 from app.user.domain.user import User
+from app.user.infrastructure.repository.mysql_user_repository import MySQLUserRepository
 from app.shared.vo.mbti import MBTI
 from app.shared.vo.gender import Gender
+from config.database import get_db
 
 user_router = APIRouter()
 
-# Global repository instance (set in app.router or tests)
+# Repository override (set in tests). None이면 요청마다 풀에서 세션을 받아 생성한다.
 _user_repository: UserRepositoryPort | None = None
 
 
+def get_user_repository(db: DbSession = Depends(get_db)) -> UserRepositoryPort:
+    """요청 단위 User 저장소 (주입된 fake/테스트 우선)"""
+    if _user_repository is not None:
+        return _user_repository
+    return MySQLUserRepository(db)
+
+
 class UpdateProfileRequest(BaseModel):
     mbti: str
     gender: str
 
 
 @user_router.get("/profile")
-def get_profile(user_id: str = Depends(get_current_user_id)):
+def get_profile(
+    user_id: str = Depends(get_current_user_id),
+    user_repository: UserRepositoryPort = Depends(get_user_repository),
+):
     """현재 로그인한 사용자의 프로필 조회"""
-    if not _user_repository:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="User repository가 설정되지 않았습니다",
-        )
-
-    user = _user_repository.find_by_id(user_id)
+    user = user_repository.find_by_id(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -46,15 +53,10 @@ def get_profile(user_id: str = Depends(get_current_user_id)):
 def update_profile(
     request: UpdateProfileRequest,
     user_id: str = Depends(get_current_user_id),
+    user_repository: UserRepositoryPort = Depends(get_user_repository),
 ):
     """MBTI/성별 프로필 저장 (upsert)"""
-    if not _user_repository:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="User repository가 설정되지 않았습니다",
-        )
-
-    user = _user_repository.find_by_id(user_id)
+    user = user_repository.find_by_id(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -76,7 +78,7 @@ def update_profile(
         mbti=mbti,
         gender=gender,
     )
-    _user_repository.save(updated_user)
+    user_repository.save(updated_user)
 
     return {
         "id": updated_user.id,
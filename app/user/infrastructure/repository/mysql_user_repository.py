@@ -5,6 +5,7 @@ from app.user.domain.user import User
 from app.user.infrastructure.model.user_model import UserModel
 from app.shared.vo.mbti import MBTI
 from app.shared.vo.gender import Gender
+from app.shared.tracing.tracer import traced
 
 
 class MySQLUserRepository(UserRepositoryPort):
@@ -13,6 +14,7 @@ class MySQLUserRepository(UserRepositoryPort):
     def __init__(self, db_session: Session):
         self._db = db_session
 
+    @traced("db.user.save")
     def save(self, user: User) -> None:
         """유저를 저장한다 (upsert)"""
         existing = self._db.query(UserModel).filter(
@@ -34,6 +36,7 @@ class MySQLUserRepository(UserRepositoryPort):
 
         self._db.commit()
 
+    @traced("db.user.find_by_id")
     def find_by_id(self, user_id: str) -> User | None:
         """id로 유저를 조회한다"""
         model = self._db.query(UserModel).filter(
@@ -45,6 +48,7 @@ class MySQLUserRepository(UserRepositoryPort):
 
         return self._to_domain(model)
 
+    @traced("db.user.find_by_email")
     def find_by_email(self, email: str) -> User | None:
         """email로 유저를 조회한다"""
         model = self._db.query(UserModel).filter(
@@ -0,0 +1,166 @@
+"""
+/consult/history 조회 방식별 지연 시간 벤치마크
+
+합성 consult_sessions 테이블(기본 100만 세션)에서 완료 세션이 많은 사용자 한 명의
+히스토리를 다음 방식으로 조회해 비교한다.
+
+- full: 기존 find_completed_by_user_id (전체 로드 + 세션마다 analysis_json 디코딩)
+- offset: 요약 컬럼만 읽는 LIMIT/OFFSET 페이지 (깊은 페이지)
+- keyset: find_completed_page 커서 페이지 (첫 페이지, 깊은 페이지)
+
+(user_id, is_completed, created_at) 복합 인덱스를 만들기 전과 후를 각각 측정한다.
+
+실행 방법:
+python -m benchmarks.consult_history_pagination_benchmark
+python -m benchmarks.consult_history_pagination_benchmark --sessions 100000 --heavy-sessions 2000
+python -m benchmarks.consult_history_pagination_benchmark --db-url "mysql+pymysql://..."
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from app.consult.domain.consult_summary import ConsultSummary
+from app.consult.domain.history_cursor import HistoryCursor
+from app.consult.infrastructure.model.consult_message_model import ConsultMessageModel  # noqa: F401
+from app.consult.infrastructure.model.consult_session_model import ConsultSessionModel
+from app.consult.infrastructure.repository.mysql_consult_repository import MySQLConsultRepository
+from config.database import Base
+
+HEAVY_USER_ID = "heavy-user"
+INDEX_NAME = "ix_consult_sessions_user_completed_created"
+INSERT_CHUNK = 10_000
+
+
+def _analysis(i: int, detail_chars: int) -> dict:
+    return {
+        "situation": f"상담 {i}의 상황 분석 " + "가" * detail_chars,
+        "traits": "특성 " + "나" * detail_chars,
+        "solutions": "해결책 " + "다" * detail_chars,
+        "cautions": "주의사항 " + "라" * detail_chars,
+    }
+
+
+def _rows(total: int, heavy: int, users: int, detail_chars: int):
+    """합성 세션 행 (heavy개는 한 사용자에게, 나머지는 users명에게 고르게 분배)"""
+    started_at = datetime(2024, 1, 1)
+    for i in range(total):
+        user_id = HEAVY_USER_ID if i < heavy else f"user-{i % users}"
+        analysis = _analysis(i, detail_chars)
+        yield {
+            "id": f"session-{i:08d}",
+            "user_id": user_id,
+            "mbti": "INTJ",
+            "gender": "MALE",
+            # 같은 시각을 공유하는 세션도 섞이도록 초 단위를 i // 3으로 둔다
+            "created_at": started_at + timedelta(seconds=i // 3),
+            "is_completed": i % 10 != 0,
+            "analysis_json": json.dumps(analysis, ensure_ascii=False),
+            "analysis_summary": ConsultSummary.summarize(analysis),
+        }
+
+
+def load(engine, total: int, heavy: int, users: int, detail_chars: int) -> float:
+    """테이블을 다시 만들고 합성 데이터를 넣는다 (복합 인덱스는 뺀 상태로 둔다)"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP INDEX {INDEX_NAME}" + (" ON consult_sessions" if engine.dialect.name == "mysql" else "")))
+        chunk = []
+        for row in _rows(total, heavy, users, detail_chars):
+            chunk.append(row)
+            if len(chunk) == INSERT_CHUNK:
+                conn.execute(insert(ConsultSessionModel), chunk)
+                chunk = []
+        if chunk:
+            conn.execute(insert(ConsultSessionModel), chunk)
+    return time.perf_counter() - started
+
+
+def _timed(fn, repeat: int) -> tuple[float, object]:
+    latencies_ms = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+    return statistics.median(latencies_ms), result
+
+
+def measure(db, page_size: int, depth: int, repeat: int) -> list[tuple[str, float, int]]:
+    """조회 방식별 (이름, 중앙값 ms, 반환 행 수)"""
+    repository = MySQLConsultRepository(db)
+
+    # 깊은 페이지 커서 준비 (depth번째 페이지 직전까지 이동)
+    cursor = None
+    for _ in range(depth - 1):
+        _, cursor = repository.find_completed_page(HEAVY_USER_ID, page_size, cursor)
+    deep_cursor: HistoryCursor | None = cursor
+
+    def offset_page():
+        return db.query(
+            ConsultSessionModel.id,
+            ConsultSessionModel.created_at,
+            ConsultSessionModel.analysis_summary,
+        ).filter(
+            ConsultSessionModel.user_id == HEAVY_USER_ID,
+            ConsultSessionModel.is_completed == True
+        ).order_by(
+            ConsultSessionModel.created_at.desc(),
+            ConsultSessionModel.id.desc(),
+        ).offset(page_size * (depth - 1)).limit(page_size).all()
+
+    cases = [
+        ("full", lambda: repository.find_completed_by_user_id(HEAVY_USER_ID)),
+        (f"offset p{depth}", offset_page),
+        ("keyset p1", lambda: repository.find_completed_page(HEAVY_USER_ID, page_size)[0]),
+        (f"keyset p{depth}", lambda: repository.find_completed_page(HEAVY_USER_ID, page_size, deep_cursor)[0]),
+    ]
+
+    results = []
+    for name, fn in cases:
+        median_ms, rows = _timed(fn, repeat)
+        db.expunge_all()
+        results.append((name, median_ms, len(rows)))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-url", default="sqlite:///:memory:", help="벤치마크용 DB URL (기본: 인메모리 SQLite)")
+    parser.add_argument("--sessions", type=int, default=1_000_000, help="전체 세션 수")
+    parser.add_argument("--heavy-sessions", type=int, default=5_000, help="측정 대상 사용자의 세션 수")
+    parser.add_argument("--users", type=int, default=100_000, help="나머지 세션을 나눠 가질 사용자 수")
+    parser.add_argument("--detail-chars", type=int, default=80, help="분석 항목별 본문 길이")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=100, help="깊은 페이지 번호")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine(args.db_url)
+    load_seconds = load(engine, args.sessions, args.heavy_sessions, args.users, args.detail_chars)
+    print(f"loaded {args.sessions} sessions in {load_seconds:.1f}s")
+
+    db = sessionmaker(bind=engine)()
+    print(f"{'index':<12}{'query':<14}{'median ms':>11}{'rows':>7}")
+    for label in ("user_id", "composite"):
+        if label == "composite":
+            db.execute(text(
+                f"CREATE INDEX {INDEX_NAME} ON consult_sessions (user_id, is_completed, created_at)"
+            ))
+            db.commit()
+        for name, median_ms, rows in measure(db, args.page_size, args.depth, args.repeat):
+            print(f"{label:<12}{name:<14}{median_ms:>11.2f}{rows:>7}")
+
+    db.close()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
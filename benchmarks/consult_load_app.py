@@ -0,0 +1,44 @@
+"""
+부하 테스트용 앱 엔트리포인트
+
+app.main의 앱을 그대로 쓰되 외부 호출(LLM, Google OAuth)만 stub으로 교체한다.
+- AI 상담사(분석 작업 큐 포함): stub 지연 시간은 BENCH_LLM_LATENCY_MS (기본 200ms),
+  스트림 청크 수는 BENCH_STREAM_CHUNKS (기본 20)
+- 메시지 변환기: 호출당 지연은 BENCH_CONVERTER_TTFT_MS + 톤 수 x BENCH_CONVERTER_PER_TONE_MS
+  (기본 100ms + 톤당 100ms)
+- Google OAuth: /auth/google/callback?code=<사용자 ID>로 바로 로그인된다
+
+BENCH_STUB_LLM=false면 상담사/변환기는 교체하지 않고 실제 OpenAI 어댑터를 쓴다.
+이때 OPENAI_BASE_URL을 benchmarks.openai_stub_server로 지정하면 네트워크 없이
+SDK, 프롬프트 구성, 응답 파싱까지 포함한 경로를 잴 수 있다.
+
+실행 방법:
+uvicorn benchmarks.consult_load_app:app --workers 4
+"""
+
+import os
+
+from app.auth.adapter.input.web import google_oauth_router as google_oauth_router_module
+from app.consult.adapter.input.web import consult_router as consult_router_module
+from app.converter.adapter.input.web import converter_router as converter_router_module
+from app.main import app  # noqa: F401
+from app.router import build_analysis_queue
+from benchmarks.convert_three_tones_benchmark import StubMessageConverter
+from benchmarks.stub_counselor import StubAsyncCounselor
+from benchmarks.stub_google_oauth import StubGoogleOAuthService
+
+if os.environ.get("BENCH_STUB_LLM", "true").lower() == "true":
+    consult_router_module._ai_counselor = StubAsyncCounselor(
+        latency_seconds=float(os.environ.get("BENCH_LLM_LATENCY_MS", "200")) / 1000,
+        chunk_count=int(os.environ.get("BENCH_STREAM_CHUNKS", "20")),
+    )
+    if consult_router_module._analysis_queue is not None:
+        consult_router_module._analysis_queue = build_analysis_queue(consult_router_module._ai_counselor)
+
+    _converter_ttft_ms = float(os.environ.get("BENCH_CONVERTER_TTFT_MS", "100"))
+    _converter_per_tone_ms = float(os.environ.get("BENCH_CONVERTER_PER_TONE_MS", "100"))
+    converter_router_module.OpenAIMessageConverter = (
+        lambda: StubMessageConverter(_converter_ttft_ms, _converter_per_tone_ms)
+    )
+
+google_oauth_router_module.service = StubGoogleOAuthService()
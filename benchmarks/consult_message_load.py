@@ -0,0 +1,179 @@
+"""
+/consult/{id}/message 부하 테스트 (uvicorn 워커 수별 처리량 비교)
+
+워커 수(기본 1, 2, 4)마다 uvicorn을 띄우고, 동시 사용자들이 정해진 시간 동안
+메시지를 보내면서 초당 처리량과 p50/p95 지연 시간을 측정한다.
+요청마다 풀에서 DB 세션을 받으므로 처리량이 워커 수에 비례해 늘어나야 한다.
+LLM은 benchmarks.consult_load_app의 stub 상담사로 대체된다.
+
+실행 방법:
+python -m benchmarks.consult_message_load
+python -m benchmarks.consult_message_load --db-url "mysql+pymysql://..." --workers 1 2 4 8
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.infrastructure.repository.mysql_consult_repository import MySQLConsultRepository
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+from app.user.infrastructure.model.user_model import UserModel
+from migrations.runner import upgrade
+
+TURNS_PER_SESSION = 4  # 5턴째(분석 생성)는 제외하고 일반 턴만 측정
+
+
+def seed(db_url: str, users: int, sessions_per_user: int) -> list[tuple[str, list[str]]]:
+    """유저별 로그인 세션과 상담 세션을 만든다"""
+    engine = create_engine(db_url)
+    upgrade(engine)
+    if db_url.startswith("sqlite"):
+        with engine.connect() as conn:
+            conn.execute(text("PRAGMA journal_mode=WAL"))
+    db = sessionmaker(bind=engine)()
+    repository = MySQLConsultRepository(db)
+
+    seeded = []
+    for _ in range(users):
+        user_id = str(uuid.uuid4())
+        token = str(uuid.uuid4())
+        db.add(UserModel(
+            id=user_id,
+            email=f"{user_id}@bench.local",
+            mbti="INTJ",
+            gender="MALE",
+            session_id=token,
+            session_expires_at=datetime.now() + timedelta(hours=6),
+        ))
+        db.commit()
+        consult_ids = []
+        for _ in range(sessions_per_user):
+            session = ConsultSession(id=str(uuid.uuid4()), user_id=user_id, mbti=MBTI("INTJ"), gender=Gender("MALE"))
+            repository.save(session)
+            consult_ids.append(session.id)
+        seeded.append((token, consult_ids))
+
+    db.close()
+    engine.dispose()
+    return seeded
+
+
+async def virtual_user(client: httpx.AsyncClient, token: str, consult_ids: list[str], deadline: float,
+                       latencies: list[float], errors: list[int]) -> None:
+    """세션마다 TURNS_PER_SESSION번 메시지를 보내고 다음 세션으로 넘어간다"""
+    headers = {"Authorization": f"Bearer {token}"}
+    for consult_id in consult_ids:
+        for turn in range(TURNS_PER_SESSION):
+            if time.perf_counter() >= deadline:
+                return
+            started = time.perf_counter()
+            try:
+                response = await client.post(
+                    f"/consult/{consult_id}/message",
+                    headers=headers,
+                    json={"content": f"고민이 있어 {turn}"},
+                )
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - started)
+            if not ok:
+                errors.append(1)
+
+
+async def drive(base_url: str, seeded, duration: float) -> dict:
+    latencies: list[float] = []
+    errors: list[int] = []
+    limits = httpx.Limits(max_connections=len(seeded), max_keepalive_connections=len(seeded))
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        deadline = time.perf_counter() + duration
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            virtual_user(client, token, ids, deadline, latencies, errors) for token, ids in seeded
+        ])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000 if latencies else 0.0,
+    }
+
+
+def wait_until_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("서버가 시작되지 않았습니다")
+
+
+def run_for_workers(args, workers: int, port: int) -> dict:
+    db_url = args.db_url or f"sqlite:///{tempfile.mkdtemp()}/load_{workers}.db"
+    sessions_per_user = int(args.duration * 1000 / args.llm_latency_ms / TURNS_PER_SESSION) * workers + 2
+    seeded = seed(db_url, args.users, sessions_per_user)
+
+    env = {
+        **os.environ,
+        "MYSQL_URL": db_url,
+        "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "stub"),
+        "GOOGLE_CLIENT_ID": os.environ.get("GOOGLE_CLIENT_ID", "stub"),
+        "GOOGLE_CLIENT_SECRET": os.environ.get("GOOGLE_CLIENT_SECRET", "stub"),
+        # 입장 제어는 서버 처리량 측정을 가리므로 기본으로 끈다 (환경변수로 켤 수 있다)
+        "ADMISSION_ENABLED": os.environ.get("ADMISSION_ENABLED", "false"),
+        "BENCH_LLM_LATENCY_MS": str(args.llm_latency_ms),
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.consult_load_app:app",
+         "--port", str(port), "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        wait_until_ready(base_url)
+        return asyncio.run(drive(base_url, seeded, args.duration))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-url", default=None, help="공유 DB URL (기본: 워커 수별 임시 SQLite 파일)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--users", type=int, default=64, help="동시 사용자 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="워커 수별 측정 시간 (초)")
+    parser.add_argument("--llm-latency-ms", type=int, default=200, help="stub LLM 응답 지연 (ms)")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for workers in args.workers:
+        r = run_for_workers(args, workers, args.port)
+        print(f"{workers:>8}{r['requests']:>10}{r['errors']:>8}{r['rps']:>10.1f}{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
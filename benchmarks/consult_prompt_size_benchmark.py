@@ -0,0 +1,75 @@
+"""
+상담 턴 수에 따른 응답 프롬프트 크기 벤치마크
+
+기존 방식(매 턴 시스템 프롬프트 + 전체 히스토리)과 ConversationContextManager
+(최근 턴 + 누적 요약)로 20턴 대화를 진행하며 턴별 추정 프롬프트 토큰 수를 비교한다.
+요약은 LLM 대신 고정 길이 문장으로 흉내 내고, 요약 호출이 발생한 턴에 *를 표시한다.
+
+실행 방법:
+python -m benchmarks.consult_prompt_size_benchmark
+python -m benchmarks.consult_prompt_size_benchmark --turns 30 --budget 2000 --keep-recent-turns 3
+python -m benchmarks.consult_prompt_size_benchmark --prompt-version v2
+"""
+
+import argparse
+
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.service.conversation_context_manager import ConversationContextManager
+from app.consult.infrastructure.service.counselor_prompt_registry import get_counselor_prompt_registry
+from app.shared.llm.token_estimator import estimate_message_tokens
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+
+USER_MESSAGE = "요즘 친구랑 연락 문제로 자주 다퉈. 내가 먼저 연락하지 않으면 며칠씩 연락이 없고, 서운하다고 말하면 예민하다고 해."
+ASSISTANT_MESSAGE = "그런 말을 들으면 많이 서운했겠다. 그 친구는 평소에 다른 사람들한테도 연락을 잘 안 하는 편이야?"
+STUB_SUMMARY = "사용자는 연락 빈도 문제로 친구와 갈등 중이며 서운함을 표현하면 예민하다는 말을 듣는다. " * 3
+
+
+def run(
+    turns: int, budget: int, keep_recent_turns: int, batch_turns: int, prompt_version: str = "v1"
+) -> list[tuple[int, int, int, bool]]:
+    """턴별 (턴, 기존 토큰, 관리 토큰, 요약 호출 여부)"""
+    prompts = get_counselor_prompt_registry().get(prompt_version).prompts
+    manager = ConversationContextManager(
+        token_budget=budget,
+        keep_recent_turns=keep_recent_turns,
+        summary_batch_turns=batch_turns,
+        prompts=prompts,
+    )
+    session = ConsultSession(id="bench", user_id="user", mbti=MBTI("ENFP"), gender=Gender("FEMALE"))
+    session.add_message(Message(role="assistant", content="안녕! ENFP구나. 어떤 관계 고민이 있어?"))
+
+    rows = []
+    for turn in range(1, turns + 1):
+        session.add_message(Message(role="user", content=USER_MESSAGE))
+        full_tokens = estimate_message_tokens(prompts.build_response_messages(session, USER_MESSAGE))
+
+        pending = manager.pending_summary(session)
+        if pending:
+            manager.apply_summary(session, STUB_SUMMARY, pending)
+        managed_tokens = estimate_message_tokens(manager.build_response_messages(session, USER_MESSAGE))
+
+        rows.append((turn, full_tokens, managed_tokens, bool(pending)))
+        session.add_message(Message(role="assistant", content=ASSISTANT_MESSAGE))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--budget", type=int, default=3000, help="추정 프롬프트 토큰 예산")
+    parser.add_argument("--keep-recent-turns", type=int, default=4)
+    parser.add_argument("--summary-batch-turns", type=int, default=2)
+    parser.add_argument("--prompt-version", default="v1", help="상담 프롬프트 버전 (v1, v2)")
+    args = parser.parse_args()
+
+    print(f"{'turn':>5}{'full':>8}{'managed':>9}  summary")
+    for turn, full_tokens, managed_tokens, summarized in run(
+        args.turns, args.budget, args.keep_recent_turns, args.summary_batch_turns, args.prompt_version
+    ):
+        print(f"{turn:>5}{full_tokens:>8}{managed_tokens:>9}  {'*' if summarized else ''}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+MySQLConsultRepository.save 턴당 쓰기 비용 벤치마크
+
+append-only 모드와 기존 전체 재저장 모드(merge + 삭제 후 재삽입)를
+5/20/100턴 대화에서 비교한다. 턴당 쓰기 행 수(INSERT/UPDATE/DELETE)와 지연 시간을 출력한다.
+SendMessageUseCase와 동일하게 5턴째에는 분석 결과 저장을 위해 한 번 더 save한다.
+
+실행 방법:
+python -m benchmarks.consult_repository_save_benchmark
+python -m benchmarks.consult_repository_save_benchmark --db-url "mysql+pymysql://..."
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.model.consult_message_model import ConsultMessageModel  # noqa: F401
+from app.consult.infrastructure.model.consult_session_model import ConsultSessionModel  # noqa: F401
+from app.consult.infrastructure.repository.mysql_consult_repository import MySQLConsultRepository
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+from config.database import Base
+
+TURN_COUNTS = (5, 20, 100)
+WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE")
+
+
+class RowWriteCounter:
+    """엔진에서 실행된 쓰기 문장의 영향 행 수를 센다"""
+
+    def __init__(self, engine):
+        self.rows = 0
+        event.listen(engine, "after_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(WRITE_PREFIXES):
+            return
+        if cursor.rowcount >= 0:
+            self.rows += cursor.rowcount
+        elif executemany:
+            self.rows += len(parameters)
+        else:
+            self.rows += 1
+
+
+def run(db_url: str, turns: int, append_only: bool) -> dict:
+    """한 세션을 turns턴 진행하면서 턴당 쓰기 행 수와 지연 시간을 측정한다"""
+    engine = create_engine(db_url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    counter = RowWriteCounter(engine)
+    repository = MySQLConsultRepository(db, append_only=append_only)
+
+    session = ConsultSession(
+        id=f"bench-{turns}-{append_only}",
+        user_id="bench-user",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+    )
+    repository.save(session)
+
+    rows_per_turn = []
+    latencies_ms = []
+    for turn in range(1, turns + 1):
+        counter.rows = 0
+        started = time.perf_counter()
+
+        session.add_message(Message(role="user", content=f"사용자 메시지 {turn} " * 10))
+        session.add_message(Message(role="assistant", content=f"상담사 응답 {turn} " * 20))
+        repository.save(session)
+        if turn == 5:
+            session.complete_with_analysis({"situation": "상황", "traits": "특성"})
+            repository.save(session)
+
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+        rows_per_turn.append(counter.rows)
+
+    db.close()
+    engine.dispose()
+
+    return {
+        "mode": "append-only" if append_only else "full-rewrite",
+        "turns": turns,
+        "total_rows": sum(rows_per_turn),
+        "last_turn_rows": rows_per_turn[-1],
+        "mean_ms": statistics.mean(latencies_ms),
+        "last_turn_ms": latencies_ms[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-url", default="sqlite:///:memory:", help="벤치마크용 DB URL (기본: 인메모리 SQLite)")
+    args = parser.parse_args()
+
+    print(f"{'mode':<14}{'turns':>6}{'total rows':>12}{'rows@last':>11}{'mean ms':>10}{'ms@last':>10}")
+    for turns in TURN_COUNTS:
+        for append_only in (False, True):
+            r = run(args.db_url, turns, append_only)
+            print(
+                f"{r['mode']:<14}{r['turns']:>6}{r['total_rows']:>12}{r['last_turn_rows']:>11}"
+                f"{r['mean_ms']:>10.2f}{r['last_turn_ms']:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
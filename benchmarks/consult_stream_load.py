@@ -0,0 +1,133 @@
+"""
+/consult/{id}/message/stream 동시 스트림 부하 테스트 (uvicorn 워커 1개)
+
+uvicorn 워커 하나를 띄우고 동시에 N개(기본 1000)의 SSE 스트림을 연다.
+stub 상담사가 청크마다 지연을 두고 토큰을 흘려보내는 동안
+첫 이벤트까지의 시간(TTFE), 스트림 완료 시간, 수신 이벤트 수, 오류 수를 측정한다.
+스트림이 이벤트 루프에서 비동기로 처리되므로 동시 스트림 수가 스레드풀 크기(40)에 묶이지 않아야 한다.
+
+실행 방법:
+python -m benchmarks.consult_stream_load
+python -m benchmarks.consult_stream_load --streams 1000 --llm-latency-ms 2000 --chunks 40
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.consult_message_load import seed, wait_until_ready
+
+
+async def open_stream(client: httpx.AsyncClient, token: str, consult_id: str, started: float, results: list) -> None:
+    """스트림 하나를 끝까지 읽으며 첫 이벤트/완료 시각과 이벤트 수를 기록한다"""
+    first_event = None
+    events = 0
+    try:
+        async with client.stream(
+            "POST",
+            f"/consult/{consult_id}/message/stream",
+            headers={"Authorization": f"Bearer {token}"},
+            json={"content": "고민이 있어"},
+        ) as response:
+            if response.status_code != 200:
+                results.append({"ok": False})
+                return
+            async for line in response.aiter_lines():
+                if line.startswith("id:"):
+                    events += 1
+                    if first_event is None:
+                        first_event = time.perf_counter() - started
+    except httpx.HTTPError:
+        results.append({"ok": False})
+        return
+    results.append({
+        "ok": events > 0,
+        "ttfe": first_event,
+        "done": time.perf_counter() - started,
+        "events": events,
+    })
+
+
+def percentile(values: list[float], ratio: float) -> float:
+    values = sorted(values)
+    return values[max(int(len(values) * ratio) - 1, 0)] * 1000 if values else 0.0
+
+
+async def drive(base_url: str, seeded, streams: int) -> dict:
+    limits = httpx.Limits(max_connections=streams, max_keepalive_connections=streams)
+    results: list[dict] = []
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            open_stream(client, token, ids[0], started, results) for token, ids in seeded[:streams]
+        ])
+        elapsed = time.perf_counter() - started
+
+    ok = [r for r in results if r["ok"]]
+    return {
+        "streams": streams,
+        "completed": len(ok),
+        "errors": len(results) - len(ok),
+        "elapsed_s": elapsed,
+        "events": sum(r["events"] for r in ok),
+        "ttfe_p50_ms": statistics.median([r["ttfe"] for r in ok]) * 1000 if ok else 0.0,
+        "ttfe_p95_ms": percentile([r["ttfe"] for r in ok], 0.95),
+        "done_p95_ms": percentile([r["done"] for r in ok], 0.95),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-url", default=None, help="DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--streams", type=int, default=1000, help="동시 스트림 수")
+    parser.add_argument("--llm-latency-ms", type=int, default=2000, help="stub 스트림 전체 길이 (ms)")
+    parser.add_argument("--chunks", type=int, default=40, help="스트림당 청크 수")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    db_url = args.db_url or f"sqlite:///{tempfile.mkdtemp()}/stream_load.db"
+    seeded = seed(db_url, args.streams, 1)
+
+    env = {
+        **os.environ,
+        "MYSQL_URL": db_url,
+        "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "stub"),
+        "GOOGLE_CLIENT_ID": os.environ.get("GOOGLE_CLIENT_ID", "stub"),
+        "GOOGLE_CLIENT_SECRET": os.environ.get("GOOGLE_CLIENT_SECRET", "stub"),
+        # 입장 제어는 서버 처리량 측정을 가리므로 기본으로 끈다 (환경변수로 켤 수 있다)
+        "ADMISSION_ENABLED": os.environ.get("ADMISSION_ENABLED", "false"),
+        "BENCH_LLM_LATENCY_MS": str(args.llm_latency_ms),
+        "BENCH_STREAM_CHUNKS": str(args.chunks),
+        "GREETING_POOL_WARM_ON_STARTUP": "false",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.consult_load_app:app",
+         "--port", str(args.port), "--workers", "1", "--log-level", "warning", "--no-access-log",
+         "--limit-concurrency", str(args.streams * 2)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        wait_until_ready(base_url)
+        r = asyncio.run(drive(base_url, seeded, args.streams))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{'streams':>8}{'done':>7}{'errors':>8}{'events':>9}{'elapsed s':>11}"
+          f"{'ttfe p50':>10}{'ttfe p95':>10}{'done p95':>10}")
+    print(f"{r['streams']:>8}{r['completed']:>7}{r['errors']:>8}{r['events']:>9}{r['elapsed_s']:>11.2f}"
+          f"{r['ttfe_p50_ms']:>10.1f}{r['ttfe_p95_ms']:>10.1f}{r['done_p95_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+/converter/convert-three-tones 변환 전략별 지연 시간 벤치마크
+
+실제 LLM 대신 지연만 흉내 내는 스텁 변환기로 sequential / parallel / single_call
+전략을 비교한다. 스텁 호출 한 번의 지연은 첫 토큰까지의 시간(TTFT)에
+톤당 출력 생성 시간을 더한 값이다. single_call은 호출이 한 번이지만
+세 톤을 모두 생성하므로 출력 시간은 톤 수만큼 늘어난다.
+
+실행 방법:
+python -m benchmarks.convert_three_tones_benchmark
+python -m benchmarks.convert_three_tones_benchmark --ttft-ms 400 --per-tone-ms 600 --iterations 10
+"""
+
+import argparse
+import statistics
+import time
+from typing import List
+
+from app.converter.application.port.message_converter_port import MessageConverterPort
+from app.converter.application.use_case.convert_message_use_case import ConvertMessageUseCase
+from app.converter.domain.tone_message import ToneMessage
+from app.shared.vo.mbti import MBTI
+
+
+class StubMessageConverter(MessageConverterPort):
+    """LLM 호출 지연만 흉내 내는 MessageConverterPort 구현체"""
+
+    def __init__(self, ttft_ms: float, per_tone_ms: float):
+        self.ttft_ms = ttft_ms
+        self.per_tone_ms = per_tone_ms
+        self.calls = 0
+
+    def _sleep(self, tone_count: int) -> None:
+        self.calls += 1
+        time.sleep((self.ttft_ms + self.per_tone_ms * tone_count) / 1000)
+
+    def convert(self, original_message, sender_mbti, receiver_mbti, tone) -> ToneMessage:
+        self._sleep(1)
+        return ToneMessage(tone=tone, content=f"{tone} {original_message}", explanation="스텁")
+
+    def convert_tones(self, original_message, sender_mbti, receiver_mbti, tones) -> List[ToneMessage]:
+        self._sleep(len(tones))
+        return [ToneMessage(tone=tone, content=f"{tone} {original_message}", explanation="스텁") for tone in tones]
+
+
+def run(strategy: str, ttft_ms: float, per_tone_ms: float, iterations: int) -> dict:
+    """한 전략으로 iterations번 변환하며 지연 시간을 측정한다"""
+    converter = StubMessageConverter(ttft_ms, per_tone_ms)
+    use_case = ConvertMessageUseCase(converter=converter, strategy=strategy)
+
+    latencies_ms = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        use_case.execute(
+            original_message="회의 시간 바꿀 수 있어?",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+        )
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "strategy": strategy,
+        "calls": converter.calls // iterations,
+        "mean_ms": statistics.mean(latencies_ms),
+        "max_ms": max(latencies_ms),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ttft-ms", type=float, default=300, help="호출당 첫 토큰까지의 지연 (ms)")
+    parser.add_argument("--per-tone-ms", type=float, default=400, help="톤 하나의 출력 생성 시간 (ms)")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'strategy':<14}{'calls':>7}{'mean ms':>10}{'max ms':>10}")
+    for strategy in ConvertMessageUseCase.STRATEGIES:
+        r = run(strategy, args.ttft_ms, args.per_tone_ms, args.iterations)
+        print(f"{r['strategy']:<14}{r['calls']:>7}{r['mean_ms']:>10.1f}{r['max_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+5턴째(마지막 상담 턴) 종단 지연 시간 벤치마크
+
+응답 생성과 분석 생성의 지연을 따로 흉내 내는 스텁 상담사로
+AnalysisRerunPolicy 모드별 마지막 턴 지연 시간을 비교한다.
+off는 응답 뒤에 분석을 순차 생성하고, never는 분석을 응답과 겹쳐 미리 생성하며,
+always는 미리 생성한 분석을 버리고 마지막 응답까지 포함해 다시 생성한다.
+
+실행 방법:
+python -m benchmarks.final_turn_latency_benchmark
+python -m benchmarks.final_turn_latency_benchmark --response-ms 1500 --analysis-ms 3000 --iterations 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from app.consult.application.use_case.async_send_message_use_case import AsyncSendMessageUseCase
+from app.consult.domain.analysis import Analysis
+from app.consult.domain.analysis_rerun_policy import AnalysisRerunPolicy
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+from benchmarks.stub_counselor import StubAsyncCounselor
+
+
+class SplitLatencyCounselor(StubAsyncCounselor):
+    """응답과 분석의 지연을 따로 설정하는 스텁 상담사"""
+
+    def __init__(self, response_ms: float, analysis_ms: float):
+        super().__init__(latency_seconds=response_ms / 1000)
+        self._analysis_latency = analysis_ms / 1000
+
+    async def generate_analysis(self, session: ConsultSession) -> Analysis:
+        await asyncio.sleep(self._analysis_latency)
+        return Analysis(situation="상황", traits="특성", solutions="해결책", cautions="주의사항")
+
+
+class InMemoryConsultRepository:
+    """벤치마크용 메모리 저장소"""
+
+    def __init__(self):
+        self._sessions = {}
+
+    def save(self, session: ConsultSession) -> None:
+        self._sessions[session.id] = session
+
+    def find_by_id(self, session_id: str):
+        return self._sessions.get(session_id)
+
+
+def _four_turn_session() -> ConsultSession:
+    session = ConsultSession(id="bench", user_id="user", mbti=MBTI("INTJ"), gender=Gender("MALE"))
+    for i in range(4):
+        session.add_message(Message(role="user", content=f"질문 {i+1}"))
+        session.add_message(Message(role="assistant", content=f"답변 {i+1}"))
+    return session
+
+
+async def run(mode: str, response_ms: float, analysis_ms: float, iterations: int) -> dict:
+    """한 정책 모드로 마지막 턴을 iterations번 실행하며 지연 시간을 측정한다"""
+    counselor = SplitLatencyCounselor(response_ms, analysis_ms)
+    latencies_ms = []
+    for _ in range(iterations):
+        repository = InMemoryConsultRepository()
+        repository.save(_four_turn_session())
+        use_case = AsyncSendMessageUseCase(repository, counselor, analysis_policy=AnalysisRerunPolicy(mode=mode))
+
+        started = time.perf_counter()
+        await use_case.execute(session_id="bench", user_id="user", content="마지막 질문")
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "mode": mode,
+        "mean_ms": statistics.mean(latencies_ms),
+        "max_ms": max(latencies_ms),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--response-ms", type=float, default=800, help="마지막 응답 생성 지연 (ms)")
+    parser.add_argument("--analysis-ms", type=float, default=1500, help="분석 생성 지연 (ms)")
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'mode':<12}{'mean ms':>10}{'max ms':>10}")
+    for mode in ("off", "never", "always"):
+        r = asyncio.run(run(mode, args.response_ms, args.analysis_ms, args.iterations))
+        print(f"{r['mode']:<12}{r['mean_ms']:>10.1f}{r['max_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""
+OpenAI 호환 stub 서버 (POST /v1/chat/completions)
+
+네트워크 없이 실제 어댑터(OpenAICounselorAdapter, OpenAIMessageConverter 등)를 그대로 태우기 위한
+로컬 서버다. 앱의 OPENAI_BASE_URL을 이 서버의 /v1로 지정하면 된다.
+
+- 응답 지연: 첫 토큰까지의 시간(ttft)과 초당 토큰 수(tokens/s)로 만든다 (스트림/비스트림 공통)
+- 스트림: SSE chat.completion.chunk, stream_options.include_usage면 마지막에 usage 청크
+- JSON 응답: 프롬프트가 요구하는 스키마(분석 situation/traits/solutions/cautions,
+  변환 {content, explanation}, 여러 톤 {톤: {content, explanation}})에 맞는 JSON을 돌려준다
+- 장애 주입: 요청마다 정해진 비율로 429(Retry-After), 500, 타임아웃(응답 없이 대기)을 낸다
+- 프롬프트 캐시: OpenAI 자동 프롬프트 캐시처럼 이전 요청과 같은 앞부분(메시지 단위, 1024토큰 이상)을
+  usage.prompt_tokens_details.cached_tokens로 돌려주고, 캐시되지 않은 프롬프트 토큰만 prefill 지연에 더한다
+- GET /stub/stats: 결과별 요청 수
+
+실행 방법:
+python -m benchmarks.openai_stub_server --profile gpt-4o-mini
+python -m benchmarks.openai_stub_server --port 8900 --ttft-ms 300 --tokens-per-second 60 --rate-limit-rate 0.05
+OPENAI_BASE_URL=http://127.0.0.1:8900/v1 uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.shared.llm.token_estimator import TOKENS_PER_MESSAGE, estimate_message_tokens, estimate_tokens
+
+# 청크(토큰) 하나의 글자 수
+CHARS_PER_TOKEN = 2
+
+PLAIN_REPLY = (
+    "그랬구나, 그 상황이면 충분히 서운했을 것 같아. "
+    "그 사람이 왜 그렇게 행동했는지 조금 더 이야기해 줄 수 있어? "
+    "네 마음이 어땠는지도 궁금해. "
+)
+
+# OpenAI 프롬프트 캐시: 1024토큰 이상 프롬프트의 앞부분을 128토큰 단위로 캐시한다
+CACHE_MIN_TOKENS = 1024
+CACHE_INCREMENT_TOKENS = 128
+
+_TONE_FIELD = re.compile(r'"([^"\s]+)": \{"content"')
+_ORIGINAL_MESSAGE = re.compile(r"원본 메시지: (.*)")
+
+
+@dataclass(frozen=True)
+class StubProfile:
+    """stub 응답 지연과 장애 주입 설정"""
+
+    ttft_ms: float = 300.0             # 첫 토큰까지의 시간
+    tokens_per_second: float = 80.0    # 0이면 토큰 사이 지연 없음
+    completion_tokens: int = 60        # 일반 텍스트 응답 길이 (max_tokens가 더 작으면 max_tokens)
+    rate_limit_rate: float = 0.0       # 429 응답 비율
+    error_rate: float = 0.0            # 500 응답 비율
+    timeout_rate: float = 0.0          # 응답하지 않고 hang_seconds만큼 기다리는 비율
+    retry_after_seconds: float = 1.0   # 429 응답의 Retry-After
+    hang_seconds: float = 120.0
+    seed: int | None = None            # 장애 주입 난수 시드 (CI에서 재현용)
+    prefill_ms_per_1k_tokens: float = 0.0  # 캐시되지 않은 프롬프트 1000토큰당 첫 토큰 추가 지연
+    prompt_cache: bool = True          # False면 cached_tokens는 항상 0
+
+
+PROFILES = {
+    "instant": StubProfile(ttft_ms=0, tokens_per_second=0),
+    "fast": StubProfile(ttft_ms=100, tokens_per_second=200),
+    "gpt-4o-mini": StubProfile(ttft_ms=400, tokens_per_second=80, prefill_ms_per_1k_tokens=150),
+    "slow": StubProfile(ttft_ms=1500, tokens_per_second=25, prefill_ms_per_1k_tokens=500),
+}
+
+
+def _last_user_content(messages: list[dict]) -> str:
+    for message in reversed(messages):
+        if message.get("role") == "user":
+            return str(message.get("content") or "")
+    return ""
+
+
+def build_content(messages: list[dict], json_mode: bool, max_tokens: int | None, completion_tokens: int) -> str:
+    """프롬프트가 요구하는 형식의 응답 본문"""
+    prompt = _last_user_content(messages)
+    # 분석처럼 응답 형식 지시를 system 메시지에 두는 요청도 있다
+    instructions = "\n".join(str(message.get("content") or "") for message in messages)
+    original = _ORIGINAL_MESSAGE.search(prompt)
+    original_message = original.group(1).strip() if original else "메시지"
+
+    tones = _TONE_FIELD.findall(prompt)
+    if tones:
+        return json.dumps({
+            tone: {
+                "content": f"({tone}) {original_message}",
+                "explanation": f"{tone} 톤이 상대의 성향에 맞아 부담 없이 전달돼요.",
+            }
+            for tone in tones
+        }, ensure_ascii=False)
+    if '"situation"' in instructions:
+        return json.dumps({
+            "situation": "네가 친구와의 대화에서 서운함을 느꼈다고 했잖아. 그 감정을 말하지 못해 답답한 상황이야.",
+            "traits": "상대는 감정보다 사실을 먼저 보는 편이라 네 서운함을 알아채기 어려워.",
+            "solutions": ["구체적인 상황을 들어 네 감정을 먼저 말해 봐.", "상대가 답할 시간을 줘."],
+            "cautions": ["상대의 의도를 단정하지 마.", "한꺼번에 여러 불만을 꺼내지 마."],
+        }, ensure_ascii=False)
+    if json_mode or ('"content"' in prompt and '"explanation"' in prompt):
+        return json.dumps({
+            "content": original_message,
+            "explanation": "상대의 성향에 맞춰 핵심만 정중하게 전달하는 표현이에요.",
+        }, ensure_ascii=False)
+
+    length = min(completion_tokens, max_tokens or completion_tokens) * CHARS_PER_TOKEN
+    return (PLAIN_REPLY * (length // len(PLAIN_REPLY) + 1))[:length].strip()
+
+
+def split_tokens(content: str) -> list[str]:
+    return [content[i:i + CHARS_PER_TOKEN] for i in range(0, len(content), CHARS_PER_TOKEN)]
+
+
+class PrefixCache:
+    """최근 요청들의 메시지 경계별 앞부분 해시 (스레드 안전, 오래된 항목부터 버린다)"""
+
+    def __init__(self, max_entries: int = 100_000):
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, None] = OrderedDict()
+        self._max_entries = max_entries
+
+    def cached_tokens(self, messages: list[dict]) -> int:
+        """이전 요청과 같은 가장 긴 앞부분의 캐시 토큰 수를 돌려주고, 이번 요청의 앞부분을 기록한다"""
+        digest = hashlib.sha256()
+        boundaries: list[tuple[str, int]] = []
+        tokens = 0
+        for message in messages:
+            digest.update(json.dumps(message, ensure_ascii=False, sort_keys=True).encode())
+            tokens += TOKENS_PER_MESSAGE + estimate_tokens(str(message.get("content") or ""))
+            boundaries.append((digest.hexdigest(), tokens))
+
+        matched = 0
+        with self._lock:
+            for key, prefix_tokens in boundaries:
+                if key in self._entries:
+                    matched = prefix_tokens
+                    self._entries.move_to_end(key)
+                else:
+                    self._entries[key] = None
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+        if matched < CACHE_MIN_TOKENS:
+            return 0
+        return CACHE_MIN_TOKENS + (matched - CACHE_MIN_TOKENS) // CACHE_INCREMENT_TOKENS * CACHE_INCREMENT_TOKENS
+
+
+class StubStats:
+    """결과별 요청 수 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: dict[str, int] = {}
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            self._counts[outcome] = self._counts.get(outcome, 0) + 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+        return {"requests": sum(counts.values()), **counts}
+
+
+def _error(status_code: int, message: str, error_type: str, code: str, headers: dict | None = None) -> JSONResponse:
+    return JSONResponse(
+        {"error": {"message": message, "type": error_type, "param": None, "code": code}},
+        status_code=status_code,
+        headers=headers,
+    )
+
+
+def create_app(profile: StubProfile = StubProfile()) -> FastAPI:
+    """profile 설정으로 동작하는 stub 서버 앱"""
+    app = FastAPI(title="OpenAI stub")
+    stats = StubStats()
+    cache = PrefixCache()
+    rng = random.Random(profile.seed)
+    token_delay = 1 / profile.tokens_per_second if profile.tokens_per_second > 0 else 0.0
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        messages = body.get("messages") or []
+
+        roll = rng.random()
+        if roll < profile.rate_limit_rate:
+            stats.record("rate_limited")
+            return _error(
+                429, "Rate limit reached (stub)", "requests", "rate_limit_exceeded",
+                headers={"retry-after": str(profile.retry_after_seconds)},
+            )
+        roll -= profile.rate_limit_rate
+        if roll < profile.error_rate:
+            stats.record("error")
+            return _error(500, "The server had an error (stub)", "server_error", "server_error")
+        roll -= profile.error_rate
+        if roll < profile.timeout_rate:
+            stats.record("timeout")
+            await asyncio.sleep(profile.hang_seconds)
+            return _error(504, "Timed out (stub)", "server_error", "timeout")
+
+        json_mode = (body.get("response_format") or {}).get("type") == "json_object"
+        content = build_content(messages, json_mode, body.get("max_tokens"), profile.completion_tokens)
+        tokens = split_tokens(content)
+        completion_id = f"chatcmpl-stub-{uuid.uuid4().hex[:12]}"
+        created = int(time.time())
+        model = body.get("model", "stub")
+        prompt_tokens = estimate_message_tokens(messages)
+        cached_tokens = cache.cached_tokens(messages) if profile.prompt_cache else 0
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": len(tokens),
+            "total_tokens": prompt_tokens + len(tokens),
+            "prompt_tokens_details": {"cached_tokens": cached_tokens},
+        }
+        ttft = (profile.ttft_ms + profile.prefill_ms_per_1k_tokens * (prompt_tokens - cached_tokens) / 1000) / 1000
+
+        if not body.get("stream"):
+            await asyncio.sleep(ttft + token_delay * len(tokens))
+            stats.record("success")
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": usage,
+            }
+
+        include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+
+        def chunk(delta: dict, finish_reason: str | None = None, **extra) -> str:
+            payload = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                **extra,
+            }
+            return f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+        async def events():
+            await asyncio.sleep(ttft)
+            yield chunk({"role": "assistant", "content": ""})
+            for i, token in enumerate(tokens):
+                if i and token_delay:
+                    await asyncio.sleep(token_delay)
+                yield chunk({"content": token})
+            yield chunk({}, finish_reason="stop")
+            if include_usage:
+                usage_chunk = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": created,
+                    "model": model,
+                    "choices": [],
+                    "usage": usage,
+                }
+                yield f"data: {json.dumps(usage_chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+            stats.record("success")
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/stub/stats")
+    async def stub_stats():
+        return stats.snapshot()
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="gpt-4o-mini",
+                        help="기본 지연 설정 (아래 옵션으로 개별 값을 덮어쓴다)")
+    parser.add_argument("--ttft-ms", type=float, default=None)
+    parser.add_argument("--tokens-per-second", type=float, default=None)
+    parser.add_argument("--completion-tokens", type=int, default=None)
+    parser.add_argument("--rate-limit-rate", type=float, default=None, help="429 응답 비율 (0~1)")
+    parser.add_argument("--error-rate", type=float, default=None, help="500 응답 비율 (0~1)")
+    parser.add_argument("--timeout-rate", type=float, default=None, help="응답 없이 대기하는 비율 (0~1)")
+    parser.add_argument("--retry-after-seconds", type=float, default=None)
+    parser.add_argument("--hang-seconds", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--prefill-ms-per-1k-tokens", type=float, default=None)
+    parser.add_argument("--no-prompt-cache", dest="prompt_cache", action="store_false", default=None)
+    args = parser.parse_args()
+
+    overrides = {
+        field: getattr(args, field)
+        for field in StubProfile.__dataclass_fields__
+        if getattr(args, field, None) is not None
+    }
+    profile = replace(PROFILES[args.profile], **overrides)
+    print(f"OpenAI stub: http://127.0.0.1:{args.port}/v1  {profile}")
+    uvicorn.run(create_app(profile), port=args.port, log_level="warning", access_log=False)
+
+
+if __name__ == "__main__":
+    main()
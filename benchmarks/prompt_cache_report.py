@@ -0,0 +1,131 @@
+"""
+호출 위치별 프롬프트 캐시 리포트
+
+서버의 /metrics(llm_tokens_total, llm_request_duration_seconds)를 읽어 호출 위치(call_site)별로
+프롬프트 토큰 중 캐시된 토큰 비율(cached_tokens / prompt_tokens)과 호출 지연 시간(평균, p50, p95)을 보여준다.
+--out으로 저장한 리포트를 다른 커밋/설정에서 --compare로 넘기면 호출 위치별 캐시 비율과 지연 시간 변화를 함께 보여준다.
+(메트릭은 서버 시작 후 누적값이므로 비교할 두 측정은 각각 새로 띄운 서버에서 같은 부하로 만든다)
+
+실행 방법:
+python -m benchmarks.prompt_cache_report --token <세션 토큰>
+python -m benchmarks.prompt_cache_report --token <세션 토큰> --url http://127.0.0.1:8000/metrics --out benchmarks/baselines/cache_before.json
+python -m benchmarks.prompt_cache_report --compare benchmarks/baselines/cache_before.json
+python -m benchmarks.prompt_cache_report --file metrics.txt
+"""
+
+import argparse
+import json
+import math
+from collections import defaultdict
+from pathlib import Path
+
+import httpx
+from prometheus_client.parser import text_string_to_metric_families
+
+
+def _histogram_quantile(buckets: dict[float, float], ratio: float) -> float:
+    """누적 버킷에서 Prometheus histogram_quantile처럼 선형 보간한 값 (초)"""
+    bounds = sorted(buckets)
+    if not bounds or not buckets[bounds[-1]]:
+        return 0.0
+    rank = buckets[bounds[-1]] * ratio
+    lower, lower_count = 0.0, 0.0
+    for bound in bounds:
+        count = buckets[bound]
+        if count >= rank:
+            if math.isinf(bound):
+                return lower
+            if count == lower_count:
+                return bound
+            return lower + (bound - lower) * (rank - lower_count) / (count - lower_count)
+        lower, lower_count = bound, count
+    return lower
+
+
+def build_report(metrics_text: str) -> dict:
+    """Prometheus 텍스트 메트릭에서 호출 위치별 캐시 비율과 지연 시간 요약"""
+    tokens: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    durations: dict[str, dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    buckets: dict[str, dict[float, float]] = defaultdict(lambda: defaultdict(float))
+
+    for family in text_string_to_metric_families(metrics_text):
+        for sample in family.samples:
+            call_site = sample.labels.get("call_site")
+            if call_site is None:
+                continue
+            if sample.name == "llm_tokens_total":
+                tokens[call_site][sample.labels["kind"]] += sample.value
+            elif sample.labels.get("outcome") != "success":
+                continue
+            elif sample.name == "llm_request_duration_seconds_count":
+                durations[call_site]["count"] += sample.value
+            elif sample.name == "llm_request_duration_seconds_sum":
+                durations[call_site]["sum"] += sample.value
+            elif sample.name == "llm_request_duration_seconds_bucket":
+                buckets[call_site][float(sample.labels["le"])] += sample.value
+
+    report = {}
+    for call_site in sorted(set(tokens) | set(durations)):
+        prompt_tokens = tokens[call_site]["prompt"]
+        cached_tokens = tokens[call_site]["cached"]
+        count = durations[call_site]["count"]
+        report[call_site] = {
+            "requests": int(count),
+            "prompt_tokens": int(prompt_tokens),
+            "cached_tokens": int(cached_tokens),
+            "cached_ratio": cached_tokens / prompt_tokens if prompt_tokens else 0.0,
+            "mean_ms": durations[call_site]["sum"] / count * 1000 if count else 0.0,
+            "p50_ms": _histogram_quantile(buckets[call_site], 0.50) * 1000,
+            "p95_ms": _histogram_quantile(buckets[call_site], 0.95) * 1000,
+        }
+    return report
+
+
+def format_report(report: dict, baseline: dict | None = None) -> str:
+    header = f"{'call_site':<36}{'requests':>9}{'prompt':>10}{'cached':>10}{'ratio':>8}{'mean_ms':>10}{'p50_ms':>9}{'p95_ms':>9}"
+    lines = [header]
+    for call_site, row in report.items():
+        lines.append(
+            f"{call_site:<36}{row['requests']:>9}{row['prompt_tokens']:>10}{row['cached_tokens']:>10}"
+            f"{row['cached_ratio']:>8.1%}{row['mean_ms']:>10.1f}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}"
+        )
+        before = (baseline or {}).get(call_site)
+        if before:
+            lines.append(
+                f"{'  vs baseline':<36}{'':>9}{'':>10}{'':>10}"
+                f"{(row['cached_ratio'] - before['cached_ratio']) * 100:>+7.1f}p"
+                f"{row['mean_ms'] - before['mean_ms']:>+10.1f}"
+                f"{row['p50_ms'] - before['p50_ms']:>+9.1f}"
+                f"{row['p95_ms'] - before['p95_ms']:>+9.1f}"
+            )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000/metrics", help="서버 /metrics URL")
+    parser.add_argument("--token", default=None, help="/metrics 인증용 세션 토큰 (Bearer)")
+    parser.add_argument("--file", type=Path, default=None, help="URL 대신 읽을 메트릭 텍스트 파일")
+    parser.add_argument("--out", type=Path, default=None, help="리포트를 JSON으로 저장할 경로")
+    parser.add_argument("--compare", type=Path, default=None, help="비교할 이전 리포트(JSON)")
+    args = parser.parse_args()
+
+    if args.file:
+        metrics_text = args.file.read_text()
+    else:
+        headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+        response = httpx.get(args.url, headers=headers, timeout=10)
+        response.raise_for_status()
+        metrics_text = response.text
+    report = build_report(metrics_text)
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print(format_report(report, baseline))
+
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+        print(f"saved {args.out}")
+
+
+if __name__ == "__main__":
+    main()
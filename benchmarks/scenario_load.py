@@ -0,0 +1,389 @@
+"""
+엔드투엔드 HTTP 시나리오 부하 테스트 (인증 / 프로필 / 상담 / 변환)
+
+uvicorn으로 benchmarks.consult_load_app(LLM, Google OAuth만 stub)을 띄우고
+가상 사용자들이 실제 사용 흐름을 반복한다.
+
+    로그인(/auth/google/callback) → 프로필 저장(PUT /user/profile) → /consult/start
+    → 메시지 5턴(/message 또는 /message/stream) → /consult/history → /converter/convert-three-tones
+
+단계(엔드포인트)별 p50/p95/p99 지연 시간, 처리량, 오류율을 출력하고 JSON 기준선으로 저장한다.
+--compare로 이전 기준선(다른 커밋에서 저장한 파일)을 주면 단계별 변화를 보여주고
+p95/p99 지연 시간, 오류율, 처리량이 허용 범위를 벗어나면 종료 코드 1로 끝난다.
+스트림 단계는 스트림 완료까지의 시간을, .ttfe 행은 첫 이벤트까지의 시간을 기록한다.
+--llm-backend stub-server면 앱 안의 stub 대신 benchmarks.openai_stub_server를 함께 띄우고
+실제 OpenAI 어댑터가 OPENAI_BASE_URL로 그 서버를 호출한다.
+
+실행 방법:
+python -m benchmarks.scenario_load
+python -m benchmarks.scenario_load --users 32 --scenarios 3 --workers 2 --out benchmarks/baselines/main.json
+python -m benchmarks.scenario_load --compare benchmarks/baselines/main.json
+python -m benchmarks.scenario_load --db-url "mysql+pymysql://..." --message-mode stream
+python -m benchmarks.scenario_load --llm-backend stub-server --stub-profile gpt-4o-mini
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+from sqlalchemy import create_engine, text
+
+from benchmarks.consult_message_load import wait_until_ready
+from benchmarks.openai_stub_server import PROFILES
+from migrations.runner import upgrade
+
+MESSAGE_TURNS = 5
+MBTI_TYPES = ["INTJ", "ENFP", "ISTJ", "ESFP", "INFP", "ENTJ", "ISFJ", "ESTP"]
+CONVERT_MESSAGE = "이번 주 회의 시간 좀 바꿀 수 있을까?"
+
+# 비교 시 지연 시간 변화가 이 값(ms)보다 작으면 측정 잡음으로 보고 회귀로 치지 않는다
+MIN_LATENCY_DELTA_MS = 5.0
+
+
+class Recorder:
+    """단계별 지연 시간과 오류 수"""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    def record(self, step: str, seconds: float, ok: bool) -> None:
+        self.latencies[step].append(seconds)
+        if not ok:
+            self.errors[step] += 1
+
+
+async def timed(recorder: Recorder, step: str, request, expected_status: int = 200) -> httpx.Response | None:
+    """요청 하나를 보내고 단계별로 기록한다 (예상 상태 코드가 아니거나 연결 오류면 실패)"""
+    started = time.perf_counter()
+    try:
+        response = await request
+    except httpx.HTTPError:
+        recorder.record(step, time.perf_counter() - started, ok=False)
+        return None
+    ok = response.status_code == expected_status
+    recorder.record(step, time.perf_counter() - started, ok=ok)
+    return response if ok else None
+
+
+async def stream_message(client: httpx.AsyncClient, recorder: Recorder, headers: dict, consult_id: str, turn: int) -> bool:
+    """스트림 메시지 한 턴 (완료 시간과 첫 이벤트까지의 시간을 따로 기록한다)"""
+    step = "consult.message_stream"
+    started = time.perf_counter()
+    events = 0
+    try:
+        async with client.stream(
+            "POST",
+            f"/consult/{consult_id}/message/stream",
+            headers=headers,
+            json={"content": f"요즘 친구랑 사이가 어색해 {turn}"},
+        ) as response:
+            if response.status_code != 200:
+                recorder.record(step, time.perf_counter() - started, ok=False)
+                return False
+            async for line in response.aiter_lines():
+                if line.startswith("id:"):
+                    if events == 0:
+                        recorder.record(f"{step}.ttfe", time.perf_counter() - started, ok=True)
+                    events += 1
+    except httpx.HTTPError:
+        recorder.record(step, time.perf_counter() - started, ok=False)
+        return False
+    recorder.record(step, time.perf_counter() - started, ok=events > 0)
+    return events > 0
+
+
+async def run_scenario(client: httpx.AsyncClient, recorder: Recorder, use_stream: bool) -> bool:
+    """새 사용자 한 명의 전체 흐름 (중간 단계가 실패하면 거기서 멈춘다)"""
+    user_id = f"bench-{uuid.uuid4()}"
+    mbti = MBTI_TYPES[hash(user_id) % len(MBTI_TYPES)]
+
+    login = await timed(
+        recorder, "auth.login",
+        client.get("/auth/google/callback", params={"code": user_id}),
+        expected_status=307,
+    )
+    token = login.cookies.get("session_id") if login is not None else None
+    if not token:
+        return False
+    headers = {"Authorization": f"Bearer {token}"}
+
+    if await timed(recorder, "user.profile", client.put(
+        "/user/profile", headers=headers, json={"mbti": mbti, "gender": "FEMALE"},
+    )) is None:
+        return False
+
+    started = await timed(recorder, "consult.start", client.post("/consult/start", headers=headers))
+    if started is None:
+        return False
+    consult_id = started.json()["session_id"]
+
+    for turn in range(MESSAGE_TURNS):
+        if use_stream:
+            ok = await stream_message(client, recorder, headers, consult_id, turn)
+        else:
+            ok = await timed(recorder, "consult.message", client.post(
+                f"/consult/{consult_id}/message",
+                headers=headers,
+                json={"content": f"요즘 친구랑 사이가 어색해 {turn}"},
+            )) is not None
+        if not ok:
+            return False
+
+    if await timed(recorder, "consult.history", client.get("/consult/history", headers=headers)) is None:
+        return False
+
+    return await timed(recorder, "converter.convert_three_tones", client.post(
+        "/converter/convert-three-tones",
+        json={"original_message": CONVERT_MESSAGE, "sender_mbti": mbti, "receiver_mbti": "ESTP"},
+    )) is not None
+
+
+async def virtual_user(client: httpx.AsyncClient, recorder: Recorder, scenarios: int, use_stream: bool,
+                       outcomes: list[bool]) -> None:
+    for _ in range(scenarios):
+        outcomes.append(await run_scenario(client, recorder, use_stream))
+
+
+def percentile_ms(values: list[float], ratio: float) -> float:
+    """nearest-rank 백분위수 (ms)"""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[max(math.ceil(len(values) * ratio) - 1, 0)] * 1000
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict:
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "error_rate": errors / len(latencies) if latencies else 0.0,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile_ms(latencies, 0.50),
+        "p95_ms": percentile_ms(latencies, 0.95),
+        "p99_ms": percentile_ms(latencies, 0.99),
+    }
+
+
+async def drive(base_url: str, users: int, scenarios: int, message_mode: str) -> dict:
+    recorder = Recorder()
+    outcomes: list[bool] = []
+    limits = httpx.Limits(max_connections=users, max_keepalive_connections=users)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*[
+            virtual_user(
+                client, recorder, scenarios,
+                use_stream=message_mode == "stream" or (message_mode == "mixed" and i % 2 == 1),
+                outcomes=outcomes,
+            )
+            for i in range(users)
+        ])
+        elapsed = time.perf_counter() - started
+
+    endpoints = {
+        step: summarize(latencies, recorder.errors[step], elapsed)
+        for step, latencies in sorted(recorder.latencies.items())
+    }
+    # 전체 합계에는 .ttfe(스트림 요청의 중간 측정값) 행을 넣지 않는다
+    requests = [(step, r) for step, r in endpoints.items() if not step.endswith(".ttfe")]
+    total_requests = sum(r["requests"] for _, r in requests)
+    total_errors = sum(r["errors"] for _, r in requests)
+    return {
+        "elapsed_s": elapsed,
+        "scenarios": len(outcomes),
+        "scenarios_completed": sum(outcomes),
+        "scenarios_per_s": sum(outcomes) / elapsed if elapsed else 0.0,
+        "total": {
+            "requests": total_requests,
+            "errors": total_errors,
+            "error_rate": total_errors / total_requests if total_requests else 0.0,
+            "rps": total_requests / elapsed if elapsed else 0.0,
+        },
+        "endpoints": endpoints,
+    }
+
+
+def prepare_database(db_url: str) -> None:
+    """마이그레이션으로 스키마를 만든다 (SQLite는 WAL 모드)"""
+    engine = create_engine(db_url)
+    upgrade(engine)
+    if db_url.startswith("sqlite"):
+        with engine.connect() as conn:
+            conn.execute(text("PRAGMA journal_mode=WAL"))
+    engine.dispose()
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run(args) -> dict:
+    db_url = args.db_url or f"sqlite:///{tempfile.mkdtemp()}/scenario_load.db"
+    prepare_database(db_url)
+
+    env = {
+        **os.environ,
+        "MYSQL_URL": db_url,
+        "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY", "stub"),
+        "GOOGLE_CLIENT_ID": os.environ.get("GOOGLE_CLIENT_ID", "stub"),
+        "GOOGLE_CLIENT_SECRET": os.environ.get("GOOGLE_CLIENT_SECRET", "stub"),
+        # 입장 제어는 서버 처리량 측정을 가리므로 기본으로 끈다 (환경변수로 켤 수 있다)
+        "ADMISSION_ENABLED": os.environ.get("ADMISSION_ENABLED", "false"),
+        "BENCH_LLM_LATENCY_MS": str(args.llm_latency_ms),
+        "BENCH_STREAM_CHUNKS": str(args.chunks),
+        "BENCH_CONVERTER_TTFT_MS": str(args.converter_ttft_ms),
+        "BENCH_CONVERTER_PER_TONE_MS": str(args.converter_per_tone_ms),
+        "GREETING_POOL_WARM_ON_STARTUP": "false",
+    }
+    llm_server = None
+    if args.llm_backend == "stub-server":
+        llm_server = subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.openai_stub_server",
+             "--port", str(args.stub_port), "--profile", args.stub_profile],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        env["BENCH_STUB_LLM"] = "false"
+        env["OPENAI_BASE_URL"] = f"http://127.0.0.1:{args.stub_port}/v1"
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.consult_load_app:app",
+         "--port", str(args.port), "--workers", str(args.workers), "--log-level", "warning", "--no-access-log"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        wait_until_ready(base_url)
+        result = asyncio.run(drive(base_url, args.users, args.scenarios, args.message_mode))
+    finally:
+        for process in (server, llm_server):
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    return {
+        "commit": git_commit(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "host": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "config": {
+            "db": "sqlite" if db_url.startswith("sqlite") else db_url.split(":", 1)[0],
+            "workers": args.workers,
+            "users": args.users,
+            "scenarios_per_user": args.scenarios,
+            "message_mode": args.message_mode,
+            "llm_backend": args.llm_backend if args.llm_backend == "inprocess" else f"stub-server:{args.stub_profile}",
+            "llm_latency_ms": args.llm_latency_ms,
+            "chunks": args.chunks,
+            "converter_ttft_ms": args.converter_ttft_ms,
+            "converter_per_tone_ms": args.converter_per_tone_ms,
+        },
+        **result,
+    }
+
+
+def compare(baseline: dict, current: dict, tolerance: float, max_error_rate_delta: float) -> list[str]:
+    """기준선 대비 회귀 목록 (p95/p99 지연 증가, 오류율 증가, 처리량 감소)"""
+    regressions = []
+    for step, now in current["endpoints"].items():
+        before = baseline["endpoints"].get(step)
+        if before is None:
+            continue
+        for key in ("p95_ms", "p99_ms"):
+            delta = now[key] - before[key]
+            if delta > MIN_LATENCY_DELTA_MS and now[key] > before[key] * (1 + tolerance):
+                regressions.append(f"{step} {key} {before[key]:.1f} -> {now[key]:.1f}")
+        if now["error_rate"] - before["error_rate"] > max_error_rate_delta:
+            regressions.append(f"{step} error_rate {before['error_rate']:.2%} -> {now['error_rate']:.2%}")
+
+    before_rps, now_rps = baseline["total"]["rps"], current["total"]["rps"]
+    if now_rps < before_rps * (1 - tolerance):
+        regressions.append(f"total rps {before_rps:.1f} -> {now_rps:.1f}")
+    return regressions
+
+
+def print_report(result: dict, baseline: dict | None = None) -> None:
+    print(f"commit {result['commit']}  scenarios {result['scenarios_completed']}/{result['scenarios']}"
+          f"  {result['scenarios_per_s']:.2f} scenarios/s  elapsed {result['elapsed_s']:.1f}s")
+    header = f"{'step':<34}{'requests':>9}{'err %':>7}{'req/s':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+    if baseline:
+        header += f"{'Δp95 %':>9}"
+    print(header)
+    for step, r in result["endpoints"].items():
+        line = (f"{step:<34}{r['requests']:>9}{r['error_rate'] * 100:>7.1f}{r['rps']:>8.1f}"
+                f"{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}")
+        before = baseline["endpoints"].get(step) if baseline else None
+        if before and before["p95_ms"]:
+            line += f"{(r['p95_ms'] / before['p95_ms'] - 1) * 100:>+9.1f}"
+        print(line)
+    total = result["total"]
+    print(f"{'total':<34}{total['requests']:>9}{total['error_rate'] * 100:>7.1f}{total['rps']:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--db-url", default=None, help="DB URL (기본: 임시 SQLite 파일)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수")
+    parser.add_argument("--users", type=int, default=16, help="동시 가상 사용자 수")
+    parser.add_argument("--scenarios", type=int, default=2, help="가상 사용자당 시나리오 반복 횟수")
+    parser.add_argument("--message-mode", choices=["message", "stream", "mixed"], default="mixed",
+                        help="메시지 단계 방식 (mixed: 사용자 절반은 스트림)")
+    parser.add_argument("--llm-latency-ms", type=int, default=200, help="stub 상담사 응답 지연 (ms)")
+    parser.add_argument("--chunks", type=int, default=20, help="stub 스트림 청크 수")
+    parser.add_argument("--converter-ttft-ms", type=int, default=100, help="stub 변환기 호출당 지연 (ms)")
+    parser.add_argument("--converter-per-tone-ms", type=int, default=100, help="stub 변환기 톤당 지연 (ms)")
+    parser.add_argument("--llm-backend", choices=["inprocess", "stub-server"], default="inprocess",
+                        help="inprocess: 앱 안의 stub 상담사/변환기, stub-server: OpenAI 호환 stub 서버 + 실제 어댑터")
+    parser.add_argument("--stub-profile", choices=sorted(PROFILES), default="fast", help="stub 서버 지연 설정")
+    parser.add_argument("--stub-port", type=int, default=8900)
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--out", default=None,
+                        help="기준선 JSON 저장 경로 (기본: benchmarks/baselines/scenario_<commit>.json)")
+    parser.add_argument("--compare", default=None, help="비교할 기준선 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="허용 p95/p99 증가율, 처리량 감소율 (기본 20%%)")
+    parser.add_argument("--max-error-rate-delta", type=float, default=0.01, help="허용 오류율 증가 (기본 1%%p)")
+    args = parser.parse_args()
+
+    result = run(args)
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    print_report(result, baseline)
+
+    out = Path(args.out or f"benchmarks/baselines/scenario_{result['commit']}.json")
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(result, ensure_ascii=False, indent=2))
+    print(f"기준선 저장: {out}")
+
+    if baseline is None:
+        return
+    if baseline.get("config") != result["config"]:
+        print("주의: 기준선과 실행 설정이 다릅니다")
+    regressions = compare(baseline, result, args.tolerance, args.max_error_rate_delta)
+    if regressions:
+        print(f"회귀 {len(regressions)}건 (기준선 {baseline['commit']}):")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+    print(f"회귀 없음 (기준선 {baseline['commit']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""벤치마크용 stub AI 상담사 (OpenAI 호출 대신 지연 시간만 흉내낸다)"""
+
+import asyncio
+from typing import AsyncIterator
+
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.domain.analysis import Analysis
+from app.consult.domain.consult_session import ConsultSession
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+
+
+class StubAsyncCounselor(AsyncAICounselorPort):
+    """고정 응답을 latency_seconds 뒤에 돌려주는 비동기 상담사"""
+
+    def __init__(self, latency_seconds: float = 0.2, chunk_count: int = 20):
+        self._latency = latency_seconds
+        self._chunk_count = chunk_count
+
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        await asyncio.sleep(self._latency)
+        return f"안녕! {mbti.value} 유형이구나. 어떤 관계 고민이 있어?"
+
+    async def generate_response(self, session: ConsultSession, user_message: str) -> str:
+        await asyncio.sleep(self._latency)
+        return "그랬구나. 그 사람이랑은 어떤 관계야?"
+
+    async def generate_response_stream(self, session: ConsultSession, user_message: str) -> AsyncIterator[str]:
+        for i in range(self._chunk_count):
+            await asyncio.sleep(self._latency / self._chunk_count)
+            yield f"토큰{i} "
+
+    async def generate_analysis(self, session: ConsultSession) -> Analysis:
+        await asyncio.sleep(self._latency)
+        return Analysis(situation="상황", traits="특성", solutions="해결책", cautions="주의사항")
@@ -0,0 +1,17 @@
+"""벤치마크용 stub Google OAuth 서비스 (Google 호출 없이 code로 프로필을 만든다)"""
+
+from app.auth.infrastructure.oauth.google_oauth_service import GoogleAccessToken, GoogleOAuthService
+
+
+class StubGoogleOAuthService(GoogleOAuthService):
+    """authorization code를 그대로 Google 사용자 ID(sub)로 쓰는 OAuth 서비스
+
+    /auth/google/callback?code=<사용자 ID> 요청만으로 로그인 흐름(유저 생성, 세션 저장, 쿠키 발급)을 태운다.
+    """
+
+    def get_access_token(self, code: str) -> GoogleAccessToken:
+        return GoogleAccessToken(access_token=code, token_type="Bearer", expires_in=3600)
+
+    def get_user_profile(self, access_token: GoogleAccessToken) -> dict:
+        user_id = access_token.access_token
+        return {"sub": user_id, "email": f"{user_id}@bench.local"}
@@ -0,0 +1,103 @@
+"""
+요청 트레이싱 오버헤드 벤치마크
+
+실제 저장소(MySQLConsultRepository, 인메모리 SQLite)를 쓰는 작은 FastAPI 엔드포인트를
+TracingMiddleware 없이 / 샘플링 0% / 샘플링 100%(JSONL 기록)로 호출해
+요청당 평균 지연 시간을 비교한다. 네트워크 없이 ASGI로 직접 호출한다.
+
+실행 방법:
+python -m benchmarks.tracing_overhead_benchmark
+python -m benchmarks.tracing_overhead_benchmark --requests 5000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.model.consult_message_model import ConsultMessageModel  # noqa: F401
+from app.consult.infrastructure.model.consult_session_model import ConsultSessionModel  # noqa: F401
+from app.consult.infrastructure.repository.mysql_consult_repository import MySQLConsultRepository
+from app.shared.tracing.jsonl_trace_exporter import JsonlTraceExporter
+from app.shared.tracing.tracing_middleware import TracingMiddleware
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+from config.database import Base
+
+
+def _build_app(mode: str, export_path: str) -> FastAPI:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    db = SessionLocal()
+    session = ConsultSession(id="bench", user_id="user", mbti=MBTI("INTJ"), gender=Gender("MALE"))
+    for i in range(4):
+        session.add_message(Message(role="user", content=f"질문 {i}"))
+        session.add_message(Message(role="assistant", content=f"답변 {i}"))
+    MySQLConsultRepository(db).save(session)
+    db.close()
+
+    app = FastAPI()
+
+    @app.get("/consult/{session_id}")
+    def get_session(session_id: str):
+        db = SessionLocal()
+        try:
+            found = MySQLConsultRepository(db).find_by_id(session_id)
+            return {"id": found.id, "messages": len(found.get_messages())}
+        finally:
+            db.close()
+
+    if mode != "off":
+        sample_rate = 1.0 if mode == "sampled" else 0.0
+        app.add_middleware(TracingMiddleware, sample_rate=sample_rate, exporter=JsonlTraceExporter(export_path))
+    return app
+
+
+async def _measure(app: FastAPI, requests: int) -> float:
+    """요청당 평균 지연 시간 (µs)"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(50):
+            await client.get("/consult/bench")
+        started = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/consult/bench")
+        return (time.perf_counter() - started) / requests * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3, help="모드를 번갈아 반복하는 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    modes = ("off", "unsampled", "sampled")
+    with tempfile.TemporaryDirectory() as tmp:
+        export_path = os.path.join(tmp, "traces.jsonl")
+        apps = {mode: _build_app(mode, export_path) for mode in modes}
+        results = {mode: [] for mode in modes}
+        for _ in range(args.rounds):
+            for mode in modes:
+                results[mode].append(asyncio.run(_measure(apps[mode], args.requests)))
+
+    baseline = statistics.median(results["off"])
+    print(f"{'mode':<12}{'µs/request':>12}{'overhead':>10}")
+    for mode in modes:
+        latency = statistics.median(results[mode])
+        print(f"{mode:<12}{latency:>12.1f}{(latency - baseline) / baseline * 100:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
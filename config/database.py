@@ -1,16 +1,37 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from app.shared.log.sql_logging import SqlStatementLogger
 from config.settings import get_settings
 
 # 설정 가져오기
 settings = get_settings()
 
+
+def _pool_options(database_url: str) -> dict:
+    """커넥션 풀 옵션 (SQLite는 자체 풀을 사용하므로 제외)"""
+    if database_url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+    }
+
+
 engine = create_engine(
     settings.database_url,
-    echo=True,
-    pool_pre_ping=True
+    echo=False,
+    pool_pre_ping=True,
+    **_pool_options(settings.database_url),
 )
 
+# 느린 SQL 문과 표본만 로그로 남긴다
+SqlStatementLogger(
+    slow_ms=settings.DB_SLOW_QUERY_MS,
+    sample_rate=settings.DB_SQL_LOG_SAMPLE_RATE,
+).install(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -22,7 +43,7 @@ def get_db_session():
 
 
 def get_db():
-    """FastAPI dependency for database session"""
+    """FastAPI dependency for database session (요청 단위 세션, 요청 종료 시 풀에 반환)"""
     db = SessionLocal()
     try:
         yield db
@@ -18,6 +18,125 @@ class Settings(BaseSettings):
     # OpenAI Settings (필수)
     OPENAI_API_KEY: str
 
+    # OpenAI HTTP Client (프로세스 전체가 공유하는 클라이언트의 커넥션 풀)
+    OPENAI_MAX_CONNECTIONS: int = 100               # 동시에 열 수 있는 최대 커넥션 수
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS: int = 20      # 유휴 상태로 유지하는 커넥션 수
+    OPENAI_KEEPALIVE_EXPIRY_SECONDS: float = 60.0   # 유휴 커넥션 유지 시간 (초)
+    OPENAI_TIMEOUT_SECONDS: float = 60.0            # 요청 전체 타임아웃 (초)
+    OPENAI_CONNECT_TIMEOUT_SECONDS: float = 5.0     # 커넥션 수립 타임아웃 (초)
+    OPENAI_MAX_RETRIES: int = 0                     # SDK 내부 재시도 (재시도는 LLM_RETRY_* 정책이 맡는다)
+    OPENAI_HTTP2: bool = False                      # True면 HTTP/2 사용 (h2 패키지 필요)
+    OPENAI_BASE_URL: str = ""                       # 비어 있으면 OpenAI API (로컬 stub: http://127.0.0.1:8900/v1)
+    OPENAI_PROMPT_CACHE_KEY: bool = True            # 상담 요청에 프롬프트 버전 단위 prompt_cache_key를 붙인다 (지원하지 않는 호환 서버면 False)
+
+    # LLM Gateway (백엔드별 지연 시간 EWMA/오류율/분당 요청 수로 라우팅, 장애 시 다음 백엔드로 넘긴다)
+    LLM_BACKENDS: str = "openai"                    # 사용할 백엔드 (우선순위 순, "openai" | "azure" | "local")
+    LLM_BACKEND_RPM: str = ""                       # 백엔드별 분당 요청 수 상한 (예: "openai=3000,azure=600", 없으면 제한 없음)
+    LLM_GATEWAY_EWMA_ALPHA: float = 0.2             # 지연 시간/오류율 EWMA에서 새 표본의 비중
+    LLM_GATEWAY_ERROR_PENALTY: float = 10.0         # 점수 = 지연 시간 EWMA × (1 + 이 값 × 오류율 EWMA)
+    LLM_GATEWAY_ERROR_HALF_LIFE_SECONDS: float = 60.0   # 요청이 없어도 오류율은 이 시간마다 절반으로 줄어든다
+    AZURE_OPENAI_ENDPOINT: str = ""                 # 예: https://<리소스>.openai.azure.com
+    AZURE_OPENAI_API_KEY: str = ""
+    AZURE_OPENAI_API_VERSION: str = "2024-10-21"
+    AZURE_OPENAI_DEPLOYMENTS: str = ""              # 모델별 배포 이름 (예: "gpt-4o-mini=hexa-4o-mini", 없으면 모델 이름 그대로)
+    LOCAL_LLM_BASE_URL: str = ""                    # OpenAI 호환 로컬 서버 (예: http://127.0.0.1:8901/v1)
+    LOCAL_LLM_API_KEY: str = "local"
+    LOCAL_LLM_MODEL: str = ""                       # 비어 있지 않으면 모든 요청을 이 모델로 보낸다
+
+    # LLM Call Resilience (호출 위치별 타임아웃, 지터 지수 백오프 재시도, 헤징)
+    LLM_CALL_TIMEOUTS: str = ""                 # 호출 위치별 타임아웃 덮어쓰기 (예: "consult.generate_response=20")
+    LLM_RETRY_MAX_ATTEMPTS: int = 3             # 429/5xx/연결 실패/타임아웃 시 첫 요청 포함 최대 요청 수
+    LLM_RETRY_BASE_DELAY_SECONDS: float = 0.5   # 재시도 대기 상한 = base * 2^n (0~상한에서 무작위)
+    LLM_RETRY_MAX_DELAY_SECONDS: float = 8.0
+    LLM_PARSE_MAX_ATTEMPTS: int = 2             # JSON 응답 파싱 실패 시 첫 요청 포함 최대 요청 수
+    LLM_HEDGE_CALL_SITES: str = ""              # 헤징할 호출 위치 (예: "converter.convert,consult.generate_greeting")
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = 0.5    # 헤징 요청은 max(최근 p95, 이 값) 뒤에 보낸다
+
+    # LLM Circuit Breaker (업스트림 장애 시 타임아웃을 기다리지 않고 대체 응답/503)
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    CIRCUIT_BREAKER_WINDOW_SECONDS: float = 30.0    # 실패율을 계산하는 최근 구간
+    CIRCUIT_BREAKER_MIN_CALLS: int = 10             # 구간 안의 호출이 이보다 적으면 열지 않는다
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5       # 429/5xx/연결 실패/타임아웃 비율이 이 이상이면 연다
+    CIRCUIT_BREAKER_SLOW_CALL_SECONDS: float = 15.0
+    CIRCUIT_BREAKER_SLOW_CALL_RATE: float = 0.8     # 느린 호출 비율이 이 이상이면 연다
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 30.0      # 연 뒤 시험 호출을 보내기까지 기다리는 시간
+    CIRCUIT_BREAKER_HALF_OPEN_CALLS: int = 2        # 닫기 전에 성공해야 하는 시험 호출 수
+
+    # Prompt A/B (사용자 ID 해시로 프롬프트 버전 배정, 비어 있으면 묶음별 첫 버전만 사용)
+    PROMPT_VARIANTS: str = ""       # 묶음별 "이름=버전:비율|버전:비율" (예: "consult=v1:90|v2:10")
+
+    # Database Connection Pool
+    DB_POOL_SIZE: int = 10          # 풀에 유지하는 커넥션 수
+    DB_MAX_OVERFLOW: int = 20       # pool_size를 넘어 추가로 열 수 있는 커넥션 수
+    DB_POOL_RECYCLE: int = 1800     # 커넥션 재생성 주기 (초, MySQL wait_timeout보다 짧게)
+    DB_POOL_TIMEOUT: int = 30       # 풀에서 커넥션을 기다리는 최대 시간 (초)
+
+    # Logging (큐 기반 백그라운드 핸들러, JSON 한 줄 로그)
+    LOG_LEVEL: str = "INFO"
+    LOG_LEVELS: str = "httpx=WARNING,httpx2=WARNING"    # 로거별 레벨 (예: "httpx2=WARNING,app.consult=DEBUG")
+    LOG_FORMAT: str = "json"                # "json" | "text"
+    LOG_QUEUE_SIZE: int = 10000             # 가득 차면 기다리지 않고 버린다
+    DB_SLOW_QUERY_MS: float = 200.0         # 이 시간 이상 걸린 SQL 문은 WARNING으로 남긴다
+    DB_SQL_LOG_SAMPLE_RATE: float = 0.0     # 그 밖의 SQL 문을 남기는 비율 (0~1)
+
+    # Database Schema (마이그레이션은 Procfile web 명령에서 uvicorn 시작 전에 python -m migrations upgrade로 실행)
+    DB_AUTO_MIGRATE: bool = False           # True면 서버 시작 시 마이그레이션 적용 (로컬 개발용)
+    DB_SCHEMA_CHECK_STRICT: bool = False    # True면 스키마 버전이 다를 때 서버를 시작하지 않는다 (ENV=production이면 항상 True)
+
+    # Auth Session Cache (session_id -> user_id, 워커 프로세스별 인메모리)
+    AUTH_CACHE_MAX_SIZE: int = 10000
+    AUTH_CACHE_TTL_SECONDS: int = 60            # 유효 세션 캐시 시간
+    AUTH_CACHE_NEGATIVE_TTL_SECONDS: int = 10   # 존재하지 않는 토큰 캐시 시간
+
+    # Converter: 3가지 톤 변환 전략 ("sequential" | "parallel" | "single_call")
+    CONVERTER_THREE_TONES_STRATEGY: str = "parallel"
+
+    # Converter Result Cache (메모리 LRU+TTL, 선택적으로 SQLite 영구 계층)
+    CONVERTER_CACHE_ENABLED: bool = True
+    CONVERTER_CACHE_MAX_SIZE: int = 5000
+    CONVERTER_CACHE_MAX_BYTES: int = 32 * 1024 * 1024   # 메모리 캐시 최대 용량 (바이트)
+    CONVERTER_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    CONVERTER_CACHE_SQLITE_PATH: str = ""               # 비어 있으면 SQLite 계층 미사용
+    CONVERTER_CACHE_SQLITE_MAX_ROWS: int = 100_000      # 넘으면 만료가 가장 이른 행부터 지운다
+
+    # Consult Greeting Pool (MBTI × 성별 조합별로 미리 생성한 인사말)
+    GREETING_POOL_ENABLED: bool = True
+    GREETING_POOL_SIZE: int = 5             # 조합별로 유지하는 인사말 수
+    GREETING_POOL_MAX_USES: int = 20        # 이 횟수만큼 쓰인 인사말은 새로 생성해 교체
+    GREETING_POOL_WARM_ON_STARTUP: bool = True
+    GREETING_POOL_REFILL_LEASE_SECONDS: int = 120   # 조합별 보충 선점 유지 시간 (워커 간 중복 보충 방지)
+
+    # Consult Analysis Job Queue (5턴째 분석을 백그라운드 작업으로 처리)
+    ANALYSIS_QUEUE_ENABLED: bool = True
+    ANALYSIS_QUEUE_WORKERS: int = 2         # 프로세스당 동시에 실행하는 분석 작업 수
+    ANALYSIS_JOB_MAX_ATTEMPTS: int = 3
+    ANALYSIS_JOB_LEASE_SECONDS: int = 300   # running 상태가 이 시간 이상 갱신되지 않으면 중단된 작업으로 보고 재실행
+
+    # 5턴째 분석 미리 생성 정책 (큐를 쓰지 않을 때): "off" | "never" | "long_reply" | "always"
+    ANALYSIS_SPECULATION_MODE: str = "never"
+    ANALYSIS_RERUN_MIN_REPLY_CHARS: int = 400   # long_reply 모드에서 다시 생성하는 마지막 응답 길이
+
+    # Consult Prompt Context (최근 턴은 그대로, 오래된 턴은 누적 요약으로 대체)
+    CONSULT_CONTEXT_ENABLED: bool = True
+    CONSULT_CONTEXT_TOKEN_BUDGET: int = 3000        # 응답 프롬프트 추정 토큰 예산
+    CONSULT_CONTEXT_KEEP_RECENT_TURNS: int = 4      # 그대로 보내는 최근 턴 수
+    CONSULT_CONTEXT_SUMMARY_BATCH_TURNS: int = 2    # 밀려난 턴이 이만큼 쌓이면 요약을 갱신
+
+    # Admission Control (LLM 호출 엔드포인트 토큰 버킷, 초과 시 429 + Retry-After)
+    ADMISSION_ENABLED: bool = True
+    ADMISSION_BACKEND: str = "memory"           # "memory"(워커 프로세스별) | "database"(레플리카 공유)
+    ADMISSION_GLOBAL_RPM: float = 5000          # 전체 분당 LLM 요청 수 (0이면 제한 없음)
+    ADMISSION_GLOBAL_TPM: float = 2_000_000     # 전체 분당 추정 토큰 수
+    ADMISSION_USER_RPM: float = 60              # 사용자(또는 클라이언트 IP)별 분당 LLM 요청 수
+    ADMISSION_USER_TPM: float = 60_000          # 사용자별 분당 추정 토큰 수
+    ADMISSION_ENDPOINT_LIMITS: str = ""         # 엔드포인트별 "이름=rpm:tpm" (예: "consult.message=600:400000")
+    ADMISSION_BURST_SECONDS: float = 10.0       # 버킷 용량 = 이 시간 동안 채워지는 양
+
+    # Request Tracing (모든 응답에 Server-Timing, 샘플링된 요청은 OTLP JSON 줄로 파일에 기록)
+    TRACING_ENABLED: bool = True
+    TRACE_SAMPLE_RATE: float = 0.0                  # 0.0~1.0 (traceparent 헤더의 sampled 플래그가 우선)
+    TRACE_EXPORT_PATH: str = "traces.jsonl"         # 비어 있으면 내보내지 않음
+
     # Environment
     ENV: str = "development"  # "development" or "production"
 
@@ -0,0 +1,41 @@
+"""
+스키마 마이그레이션 CLI
+
+실행 방법:
+python -m migrations upgrade            # 최신 버전까지 적용 (배포 시 서버 시작 전에 실행)
+python -m migrations upgrade --target 3
+python -m migrations status
+"""
+
+import argparse
+
+from config.database import engine
+from migrations.runner import current_version, discover, upgrade
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    upgrade_parser = subparsers.add_parser("upgrade", help="적용되지 않은 마이그레이션 적용")
+    upgrade_parser.add_argument("--target", type=int, default=None, help="이 버전까지만 적용")
+    subparsers.add_parser("status", help="버전별 적용 여부")
+    args = parser.parse_args()
+
+    if args.command == "upgrade":
+        applied = upgrade(engine, target=args.target)
+        for migration in applied:
+            print(f"✅ {migration.version:04d} {migration.name}")
+        if not applied:
+            print("⏭️ 적용할 마이그레이션이 없습니다")
+        print(f"✅ 현재 스키마 버전: {current_version(engine)}")
+        return
+
+    current = current_version(engine)
+    for migration in discover():
+        mark = "✅" if migration.version <= current else "  "
+        print(f"{mark} {migration.version:04d} {migration.name}")
+    print(f"현재 스키마 버전: {current}")
+
+
+if __name__ == "__main__":
+    main()
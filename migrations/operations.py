@@ -0,0 +1,40 @@
+"""
+마이그레이션에서 쓰는 멱등 스키마 연산
+
+컬럼/인덱스가 이미 있으면 아무것도 하지 않는다. 존재 여부는 에러 메시지가 아니라
+인스펙터로 확인하므로 MySQL/SQLite 모두에서 같은 마이그레이션을 다시 실행해도 안전하다.
+(MySQL DDL은 암묵적으로 커밋되므로 중간에 실패한 마이그레이션을 다시 실행할 수 있어야 한다)
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+
+def has_table(conn: Connection, table: str) -> bool:
+    return inspect(conn).has_table(table)
+
+
+def has_column(conn: Connection, table: str, column: str) -> bool:
+    return any(c["name"] == column for c in inspect(conn).get_columns(table))
+
+
+def has_index(conn: Connection, table: str, index: str) -> bool:
+    return any(i["name"] == index for i in inspect(conn).get_indexes(table))
+
+
+def add_column(conn: Connection, table: str, column: str, definition: str) -> bool:
+    """컬럼이 없으면 추가한다 (추가했으면 True)"""
+    if has_column(conn, table, column):
+        return False
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}"))
+    return True
+
+
+def create_index(conn: Connection, table: str, index: str, columns: list[str], unique: bool = False) -> bool:
+    """인덱스가 없으면 만든다 (만들었으면 True)"""
+    if has_index(conn, table, index):
+        return False
+    conn.execute(text(
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX {index} ON {table} ({', '.join(columns)})"
+    ))
+    return True
@@ -0,0 +1,162 @@
+"""
+버전 기반 스키마 마이그레이션 러너
+
+migrations/versions/vNNNN_<이름>.py 파일이 하나의 마이그레이션이다.
+각 파일은 upgrade(conn) 함수를 가지며, 번호 순서대로 한 번씩만 적용된다.
+적용한 버전은 schema_version 테이블에 기록한다.
+
+- 마이그레이션은 서버 시작과 분리된 단계로 실행한다 (python -m migrations upgrade)
+- 서버는 시작할 때 schema_version의 최신 번호만 읽어 코드가 기대하는 버전과 비교한다
+- 여러 인스턴스가 동시에 upgrade를 실행해도 MySQL에서는 GET_LOCK으로 한 곳만 적용한다
+- 각 마이그레이션은 자기 트랜잭션 안에서 실행되고 같은 트랜잭션에서 버전을 기록한다.
+  MySQL DDL은 암묵적으로 커밋되므로 upgrade는 migrations.operations로 멱등하게 작성한다
+"""
+
+import importlib
+import logging
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+VERSIONS_DIR = Path(__file__).parent / "versions"
+_VERSION_FILE = re.compile(r"^v(\d{4})_(\w+)\.py$")
+
+# MySQL 네임드 락 (동시에 실행된 upgrade 직렬화)
+LOCK_NAME = "hexa_schema_migration"
+LOCK_TIMEOUT_SECONDS = 300
+
+_metadata = MetaData()
+schema_version_table = Table(
+    "schema_version",
+    _metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """버전 파일 하나"""
+
+    version: int
+    name: str
+    module: str
+
+    def load(self) -> Callable[[Connection], None]:
+        return importlib.import_module(self.module).upgrade
+
+
+class SchemaVersionError(RuntimeError):
+    """DB 스키마 버전이 코드가 기대하는 버전과 다르다"""
+
+
+def discover(versions_dir: Path = VERSIONS_DIR, package: str = "migrations.versions") -> list[Migration]:
+    """버전 파일 목록 (번호 순, 번호가 겹치면 ValueError)"""
+    migrations: dict[int, Migration] = {}
+    for path in sorted(versions_dir.glob("v*.py")):
+        match = _VERSION_FILE.match(path.name)
+        if not match:
+            continue
+        version = int(match.group(1))
+        if version in migrations:
+            raise ValueError(f"마이그레이션 버전이 중복됩니다: {version}")
+        migrations[version] = Migration(version, match.group(2), f"{package}.{path.stem}")
+    return [migrations[version] for version in sorted(migrations)]
+
+
+def head_version(versions_dir: Path = VERSIONS_DIR) -> int:
+    """코드가 기대하는 최신 스키마 버전 (파일 이름만 읽는다)"""
+    migrations = discover(versions_dir)
+    return migrations[-1].version if migrations else 0
+
+
+def current_version(engine: Engine) -> int:
+    """DB에 적용된 최신 버전 (schema_version 테이블이 없으면 0)
+
+    서버 시작 시 호출되므로 테이블 리플렉션 없이 쿼리 한 번만 보낸다.
+    """
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(func.max(schema_version_table.c.version))).scalar() or 0
+    except DBAPIError:
+        return 0
+
+
+def applied_versions(conn: Connection) -> set[int]:
+    return set(conn.execute(select(schema_version_table.c.version)).scalars())
+
+
+@contextmanager
+def _migration_lock(engine: Engine) -> Iterator[None]:
+    """MySQL이면 네임드 락을 잡는다 (SQLite는 파일 락으로 충분하다)"""
+    if engine.dialect.name != "mysql":
+        yield
+        return
+    with engine.connect() as conn:
+        acquired = conn.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"), {"name": LOCK_NAME, "timeout": LOCK_TIMEOUT_SECONDS}
+        ).scalar()
+        if acquired != 1:
+            raise SchemaVersionError("다른 인스턴스가 마이그레이션 중입니다 (락 대기 시간 초과)")
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": LOCK_NAME})
+
+
+def upgrade(engine: Engine, target: int | None = None, migrations: list[Migration] | None = None) -> list[Migration]:
+    """target 버전(기본: 최신)까지 적용되지 않은 마이그레이션을 순서대로 적용한다
+
+    Returns:
+        이번에 적용한 마이그레이션 목록 (이미 최신이면 빈 목록)
+    """
+    migrations = discover() if migrations is None else migrations
+    applied_now = []
+    with _migration_lock(engine):
+        _metadata.create_all(bind=engine, tables=[schema_version_table])
+        with engine.connect() as conn:
+            applied = applied_versions(conn)
+
+        for migration in migrations:
+            if migration.version in applied or (target is not None and migration.version > target):
+                continue
+            upgrade_fn = migration.load()
+            with engine.begin() as conn:
+                upgrade_fn(conn)
+                conn.execute(schema_version_table.insert().values(
+                    version=migration.version, name=migration.name, applied_at=datetime.now(),
+                ))
+            logger.info("schema migration applied version=%d name=%s", migration.version, migration.name)
+            applied_now.append(migration)
+    return applied_now
+
+
+def check_schema_version(engine: Engine, strict: bool = False) -> int:
+    """서버 시작 시 DB 스키마 버전을 확인한다
+
+    최신이 아니면 경고를 남기고, strict면 SchemaVersionError를 던진다.
+
+    Returns:
+        DB에 적용된 최신 버전
+    """
+    current, head = current_version(engine), head_version()
+    if current == head:
+        return current
+    if current < head:
+        message = f"DB 스키마가 최신이 아닙니다 (DB {current}, 코드 {head}) - python -m migrations upgrade를 실행하세요"
+    else:
+        message = f"DB 스키마가 코드보다 새 버전입니다 (DB {current}, 코드 {head})"
+    if strict:
+        raise SchemaVersionError(message)
+    logger.warning(message)
+    return current
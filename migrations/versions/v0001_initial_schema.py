@@ -0,0 +1,25 @@
+"""
+초기 스키마 (users, consult_sessions, consult_messages, greeting_pool, analysis_jobs)
+
+버전 관리 이전에 서버 시작 시 create_all로 만들던 테이블을 만든다. 이미 있는 테이블은 건드리지 않는다.
+새 DB에서는 현재 모델 기준으로 만들어지므로 이후 컬럼/인덱스 추가 마이그레이션은 건너뛰게 된다.
+"""
+
+from sqlalchemy.engine import Connection
+
+from app.consult.infrastructure.model.analysis_job_model import AnalysisJobModel
+from app.consult.infrastructure.model.consult_message_model import ConsultMessageModel
+from app.consult.infrastructure.model.consult_session_model import ConsultSessionModel
+from app.consult.infrastructure.model.greeting_pool_model import GreetingPoolModel
+from app.user.infrastructure.model.user_model import UserModel
+from config.database import Base
+
+
+def upgrade(conn: Connection) -> None:
+    Base.metadata.create_all(bind=conn, tables=[
+        UserModel.__table__,
+        ConsultSessionModel.__table__,
+        ConsultMessageModel.__table__,
+        GreetingPoolModel.__table__,
+        AnalysisJobModel.__table__,
+    ])
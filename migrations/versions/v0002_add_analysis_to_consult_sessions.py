@@ -0,0 +1,12 @@
+"""
+상담 세션 테이블에 분석 결과 컬럼 추가 (is_completed, analysis_json)
+"""
+
+from sqlalchemy.engine import Connection
+
+from migrations.operations import add_column
+
+
+def upgrade(conn: Connection) -> None:
+    add_column(conn, "consult_sessions", "is_completed", "BOOLEAN DEFAULT FALSE NOT NULL")
+    add_column(conn, "consult_sessions", "analysis_json", "TEXT NULL")
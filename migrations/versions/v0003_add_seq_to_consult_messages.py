@@ -0,0 +1,34 @@
+"""
+상담 메시지 테이블에 세션 내 순번(seq) 컬럼 추가
+
+append-only 메시지 저장을 위해 (session_id, seq) 유니크 인덱스를 만든다.
+컬럼을 새로 추가한 경우 기존 메시지는 id 순서대로 0부터 seq를 채운다.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from migrations.operations import add_column, create_index
+
+
+def upgrade(conn: Connection) -> None:
+    if add_column(conn, "consult_messages", "seq", "INT NOT NULL DEFAULT 0"):
+        if conn.dialect.name == "mysql":
+            conn.execute(text("""
+                UPDATE consult_messages m
+                JOIN (
+                    SELECT id, ROW_NUMBER() OVER (PARTITION BY session_id ORDER BY id) - 1 AS rn
+                    FROM consult_messages
+                ) t ON m.id = t.id
+                SET m.seq = t.rn
+            """))
+        else:
+            conn.execute(text("""
+                UPDATE consult_messages
+                SET seq = (
+                    SELECT COUNT(*) FROM consult_messages prev
+                    WHERE prev.session_id = consult_messages.session_id AND prev.id < consult_messages.id
+                )
+            """))
+
+    create_index(conn, "consult_messages", "ix_consult_messages_session_seq", ["session_id", "seq"], unique=True)
@@ -0,0 +1,44 @@
+"""
+상담 세션 테이블에 히스토리 조회용 요약 컬럼과 복합 인덱스 추가
+
+히스토리 목록이 analysis_json을 디코딩하지 않도록 analysis_summary 컬럼을 만들고,
+keyset 페이지네이션을 위해 (user_id, is_completed, created_at) 인덱스를 만든다.
+기존 완료 세션의 요약은 ConsultSummary.summarize로 채운다 (요약이 비어 있는 행만).
+"""
+
+import json
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.consult.domain.consult_summary import ConsultSummary
+from migrations.operations import add_column, create_index
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def upgrade(conn: Connection) -> None:
+    add_column(conn, "consult_sessions", "analysis_summary", "VARCHAR(255) NULL")
+
+    # 전체 행을 한 번에 읽지 않도록 id keyset으로 배치 단위로 읽고 갱신한다
+    last_id = ""
+    while True:
+        rows = conn.execute(text("""
+            SELECT id, analysis_json FROM consult_sessions
+            WHERE id > :last_id AND analysis_json IS NOT NULL AND analysis_summary IS NULL
+            ORDER BY id
+            LIMIT :batch
+        """), {"last_id": last_id, "batch": BACKFILL_BATCH_SIZE}).all()
+        if not rows:
+            break
+        updates = [
+            {"id": row.id, "summary": ConsultSummary.summarize(json.loads(row.analysis_json))}
+            for row in rows
+        ]
+        conn.execute(text("UPDATE consult_sessions SET analysis_summary = :summary WHERE id = :id"), updates)
+        last_id = rows[-1].id
+
+    create_index(
+        conn, "consult_sessions", "ix_consult_sessions_user_completed_created",
+        ["user_id", "is_completed", "created_at"],
+    )
@@ -0,0 +1,15 @@
+"""
+상담 세션 테이블에 프롬프트 컨텍스트 요약 컬럼 추가
+
+오래된 턴을 요약으로 대체해 프롬프트 크기를 일정하게 유지하기 위해
+누적 요약(context_summary)과 요약에 반영된 메시지 수(summarized_count)를 저장한다.
+"""
+
+from sqlalchemy.engine import Connection
+
+from migrations.operations import add_column
+
+
+def upgrade(conn: Connection) -> None:
+    add_column(conn, "consult_sessions", "context_summary", "TEXT NULL")
+    add_column(conn, "consult_sessions", "summarized_count", "INT NOT NULL DEFAULT 0")
@@ -0,0 +1,14 @@
+"""
+입장 제어 공유 토큰 버킷 테이블 (rate_limit_buckets)
+
+ADMISSION_BACKEND=database일 때 모든 레플리카가 같은 버킷 상태를 나눠 쓴다.
+"""
+
+from sqlalchemy.engine import Connection
+
+from app.shared.ratelimit.rate_limit_bucket_model import RateLimitBucketModel
+from config.database import Base
+
+
+def upgrade(conn: Connection) -> None:
+    Base.metadata.create_all(bind=conn, tables=[RateLimitBucketModel.__table__])
@@ -0,0 +1,14 @@
+"""
+인사말 풀 보충 임대 테이블 (greeting_pool_refills)
+
+워커마다 warm_up이 돌아도 조합별 보충은 한 프로세스만 하도록 선점 정보를 저장한다.
+"""
+
+from sqlalchemy.engine import Connection
+
+from app.consult.infrastructure.model.greeting_pool_refill_model import GreetingPoolRefillModel
+from config.database import Base
+
+
+def upgrade(conn: Connection) -> None:
+    Base.metadata.create_all(bind=conn, tables=[GreetingPoolRefillModel.__table__])
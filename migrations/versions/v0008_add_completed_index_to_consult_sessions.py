@@ -0,0 +1,17 @@
+"""
+상담 세션 테이블에 (is_completed, created_at) 인덱스 추가
+
+분석 작업 큐가 시작할 때 작업 없이 완료된 최근 세션을 찾는 조회가
+테이블 전체를 훑지 않고 인덱스 범위 스캔으로 끝나도록 한다.
+"""
+
+from sqlalchemy.engine import Connection
+
+from migrations.operations import create_index
+
+
+def upgrade(conn: Connection) -> None:
+    create_index(
+        conn, "consult_sessions", "ix_consult_sessions_completed_created",
+        ["is_completed", "created_at"],
+    )
@@ -19,12 +19,46 @@ def test_app():
     return app
 
 
+@pytest.fixture(autouse=True)
+def clear_conversion_cache():
+    """테스트 간 변환 결과 캐시 공유 방지"""
+    from app.converter.infrastructure.cache.conversion_cache import get_conversion_cache
+
+    get_conversion_cache().clear()
+    yield
+    get_conversion_cache().clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_admission_buckets():
+    """테스트 간 입장 제어 버킷 공유 방지"""
+    from app.shared.ratelimit.admission_controller import get_admission_controller
+
+    get_admission_controller.cache_clear()
+    yield
+    get_admission_controller.cache_clear()
+
+
 @pytest.fixture
 def client(test_app):
     """FastAPI 테스트 클라이언트"""
     return TestClient(test_app)
 
 
+@pytest.fixture
+def session_repository():
+    """캐시 통계 조회용 로그인 세션 ("valid-session")"""
+    from app.auth.adapter.input.web.auth_dependency import set_session_repository
+    from app.auth.domain.session import Session
+    from tests.auth.fixtures.fake_session_repository import FakeSessionRepository
+
+    repository = FakeSessionRepository()
+    repository.save(Session(session_id="valid-session", user_id="user-1"))
+    set_session_repository(repository)
+    yield repository
+    set_session_repository(None)
+
+
 @pytest.fixture
 def mock_converter():
     """Mock MessageConverter"""
@@ -125,6 +159,43 @@ class TestConverterRouter:
         assert call_args.kwargs["receiver_mbti"].value == "ESTP"
         assert call_args.kwargs["tone"] == "캐주얼한"
 
+    @patch("app.converter.adapter.input.web.converter_router.OpenAIMessageConverter")
+    def test_should_serve_repeated_request_from_cache(
+        self, mock_converter_class, client, mock_converter, session_repository
+    ):
+        """같은 요청이 반복되면 캐시에서 응답하고 LLM은 한 번만 호출해야 함"""
+        # Given
+        mock_converter_class.return_value = mock_converter
+        request_body = {
+            "original_message": "내일 회의 시간 바꿀 수 있어?",
+            "sender_mbti": "INTJ",
+            "receiver_mbti": "ESTP",
+            "tone": "공손한",
+        }
+
+        # When
+        first = client.post("/converter/convert", json=request_body)
+        second = client.post(
+            "/converter/convert",
+            json={**request_body, "original_message": "  내일 회의 시간  바꿀 수 있어? "},
+        )
+
+        # Then
+        assert first.json() == second.json()
+        mock_converter.convert.assert_called_once()
+        stats = client.get("/converter/cache/stats", headers={"Authorization": "Bearer valid-session"}).json()
+        assert stats["memory"]["hits"] >= 1
+        assert stats["memory"]["bytes"] > 0
+
+
+    def test_cache_stats_requires_authentication(self, client, session_repository):
+        """캐시 통계는 인증하지 않은 요청에 내부 수치를 보여주지 않아야 함"""
+        anonymous = client.get("/converter/cache/stats")
+        authenticated = client.get("/converter/cache/stats", headers={"Authorization": "Bearer valid-session"})
+
+        assert anonymous.status_code == 401
+        assert authenticated.status_code == 200
+
 
 class TestConverterRouterThreeTones:
     """Converter Router 3가지 톤 테스트 (HAIS-18)"""
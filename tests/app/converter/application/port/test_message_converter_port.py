@@ -58,3 +58,24 @@ class TestMessageConverterPort:
         # Then
         assert isinstance(result, ToneMessage)
         assert result.tone == "공손한"
+
+    def test_convert_tones_defaults_to_convert_per_tone(self):
+        """convert_tones 기본 구현은 톤마다 convert를 순서대로 호출해야 함"""
+        # Given
+        from app.converter.application.port.message_converter_port import MessageConverterPort
+        from app.shared.vo.mbti import MBTI
+
+        class FakeMessageConverter(MessageConverterPort):
+            def convert(self, original_message, sender_mbti, receiver_mbti, tone) -> ToneMessage:
+                return ToneMessage(tone=tone, content="변환된 메시지", explanation="설명")
+
+        # When
+        results = FakeMessageConverter().convert_tones(
+            original_message="안녕하세요",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+            tones=["공손한", "간결한"],
+        )
+
+        # Then
+        assert [r.tone for r in results] == ["공손한", "간결한"]
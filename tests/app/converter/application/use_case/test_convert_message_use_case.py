@@ -114,3 +114,105 @@ class TestConvertMessageUseCase:
         assert first_call.kwargs["sender_mbti"] == sender_mbti
         assert first_call.kwargs["receiver_mbti"] == receiver_mbti
         assert first_call.kwargs["original_message"] == "테스트"
+
+
+class TestConvertMessageUseCaseStrategies:
+    """ConvertMessageUseCase 변환 전략 테스트"""
+
+    def test_parallel_strategy_runs_tones_concurrently_in_order(self):
+        """parallel 전략은 톤을 동시에 변환하고 원래 톤 순서로 반환해야 함"""
+        # Given
+        import threading
+
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+        )
+
+        barrier = threading.Barrier(3, timeout=2)
+
+        def convert(original_message, sender_mbti, receiver_mbti, tone):
+            # 3개 호출이 동시에 진행되지 않으면 Barrier에서 타임아웃
+            barrier.wait()
+            return ToneMessage(tone=tone, content=f"{tone} 메시지", explanation="설명")
+
+        mock_converter = Mock()
+        mock_converter.convert.side_effect = convert
+
+        use_case = ConvertMessageUseCase(converter=mock_converter, strategy="parallel")
+
+        # When
+        results = use_case.execute(
+            original_message="테스트",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+        )
+
+        # Then
+        assert [r.tone for r in results] == ["공손한", "캐주얼한", "간결한"]
+
+    def test_parallel_strategy_reuses_shared_executor(self):
+        """parallel 전략은 요청마다 스레드풀을 만들지 않고 프로세스에서 공유하는 풀을 써야 함"""
+        # Given
+        import threading
+
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+            _tone_executor,
+        )
+
+        thread_names = []
+
+        def convert(original_message, sender_mbti, receiver_mbti, tone):
+            thread_names.append(threading.current_thread().name)
+            return ToneMessage(tone=tone, content=f"{tone} 메시지", explanation="설명")
+
+        mock_converter = Mock()
+        mock_converter.convert.side_effect = convert
+        use_case = ConvertMessageUseCase(converter=mock_converter, strategy="parallel")
+        executor = _tone_executor()
+
+        # When
+        for _ in range(2):
+            use_case.execute(original_message="테스트", sender_mbti=MBTI("INTJ"), receiver_mbti=MBTI("ESTP"))
+
+        # Then
+        assert _tone_executor() is executor
+        assert len(thread_names) == 6
+        assert all(name.startswith("convert-tone") for name in thread_names)
+
+    def test_single_call_strategy_uses_convert_tones(self):
+        """single_call 전략은 convert_tones를 한 번 호출해야 함"""
+        # Given
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+        )
+
+        mock_converter = Mock()
+        mock_converter.convert_tones.return_value = [
+            ToneMessage(tone=tone, content="내용", explanation="설명")
+            for tone in ["공손한", "캐주얼한", "간결한"]
+        ]
+
+        use_case = ConvertMessageUseCase(converter=mock_converter, strategy="single_call")
+
+        # When
+        results = use_case.execute(
+            original_message="테스트",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+        )
+
+        # Then
+        assert len(results) == 3
+        mock_converter.convert_tones.assert_called_once()
+        assert mock_converter.convert_tones.call_args.kwargs["tones"] == ["공손한", "캐주얼한", "간결한"]
+        mock_converter.convert.assert_not_called()
+
+    def test_should_reject_unknown_strategy(self):
+        """지원하지 않는 전략은 거부해야 함"""
+        from app.converter.application.use_case.convert_message_use_case import (
+            ConvertMessageUseCase,
+        )
+
+        with pytest.raises(ValueError):
+            ConvertMessageUseCase(converter=Mock(), strategy="unknown")
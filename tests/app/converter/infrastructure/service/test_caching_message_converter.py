@@ -0,0 +1,124 @@
+"""CachingMessageConverter 테스트"""
+
+from unittest.mock import Mock
+
+from app.converter.domain.tone_message import ToneMessage
+from app.shared.cache.lru_ttl_cache import LRUTTLCache
+from app.shared.vo.mbti import MBTI
+
+
+def _tone_message(tone: str) -> ToneMessage:
+    return ToneMessage(tone=tone, content=f"{tone} 메시지", explanation="설명")
+
+
+class TestCachingMessageConverter:
+    """CachingMessageConverter 테스트"""
+
+    def test_should_call_inner_once_for_same_normalized_request(self):
+        """정규화 후 같은 요청은 원본 변환기를 한 번만 호출해야 함"""
+        # Given
+        from app.converter.infrastructure.service.caching_message_converter import (
+            CachingMessageConverter,
+        )
+
+        inner = Mock()
+        inner.convert.return_value = _tone_message("공손한")
+        converter = CachingMessageConverter(inner=inner, cache=LRUTTLCache(max_size=10, ttl_seconds=60))
+
+        # When
+        first = converter.convert("회의  시간 바꿀래?", MBTI("INTJ"), MBTI("ESTP"), "공손한")
+        second = converter.convert(" 회의 시간 바꿀래? ", MBTI("intj"), MBTI("ESTP"), "공손한")
+
+        # Then
+        assert first == second
+        inner.convert.assert_called_once()
+
+    def test_should_request_only_missing_tones(self):
+        """convert_tones는 캐시에 없는 톤만 원본 변환기에 요청해야 함"""
+        # Given
+        from app.converter.infrastructure.service.caching_message_converter import (
+            CachingMessageConverter,
+        )
+
+        inner = Mock()
+        inner.convert.return_value = _tone_message("캐주얼한")
+        inner.convert_tones.return_value = [_tone_message("공손한"), _tone_message("간결한")]
+        converter = CachingMessageConverter(inner=inner, cache=LRUTTLCache(max_size=10, ttl_seconds=60))
+        converter.convert("안녕", MBTI("INTJ"), MBTI("ESTP"), "캐주얼한")
+
+        # When
+        results = converter.convert_tones("안녕", MBTI("INTJ"), MBTI("ESTP"), ["공손한", "캐주얼한", "간결한"])
+
+        # Then
+        assert [r.tone for r in results] == ["공손한", "캐주얼한", "간결한"]
+        assert inner.convert_tones.call_args.kwargs["tones"] == ["공손한", "간결한"]
+
+    def test_should_promote_sqlite_hit_to_memory(self, tmp_path):
+        """SQLite 계층에만 있는 결과는 재시작 후에도 조회되고 메모리로 올라가야 함"""
+        # Given
+        from app.converter.infrastructure.cache.sqlite_conversion_store import (
+            SQLiteConversionStore,
+        )
+        from app.converter.infrastructure.service.caching_message_converter import (
+            CachingMessageConverter,
+        )
+
+        path = str(tmp_path / "conversion_cache.db")
+        inner = Mock()
+        inner.convert.return_value = _tone_message("공손한")
+        CachingMessageConverter(
+            inner=inner,
+            cache=LRUTTLCache(max_size=10, ttl_seconds=60),
+            store=SQLiteConversionStore(path, ttl_seconds=60),
+        ).convert("안녕", MBTI("INTJ"), MBTI("ESTP"), "공손한")
+
+        # When: 메모리 캐시가 비어 있는 새 프로세스를 흉내 낸다
+        restarted_inner = Mock()
+        memory = LRUTTLCache(max_size=10, ttl_seconds=60)
+        store = SQLiteConversionStore(path, ttl_seconds=60)
+        result = CachingMessageConverter(inner=restarted_inner, cache=memory, store=store).convert(
+            "안녕", MBTI("INTJ"), MBTI("ESTP"), "공손한"
+        )
+
+        # Then
+        assert result.content == "공손한 메시지"
+        restarted_inner.convert.assert_not_called()
+        assert len(memory) == 1
+        assert store.stats()["hits"] == 1
+        assert store.stats()["bytes"] > 0
+
+    def test_expired_sqlite_entry_is_ignored(self, tmp_path):
+        """TTL이 지난 SQLite 항목은 조회되지 않아야 함"""
+        from app.converter.infrastructure.cache.sqlite_conversion_store import (
+            SQLiteConversionStore,
+        )
+
+        now = [1000.0]
+        store = SQLiteConversionStore(str(tmp_path / "c.db"), ttl_seconds=10, clock=lambda: now[0])
+        store.set("key", _tone_message("공손한"))
+
+        now[0] += 11
+
+        assert store.get("key") is None
+        assert store.stats()["size"] == 0
+
+    def test_sqlite_store_prunes_expired_and_oldest_rows(self, tmp_path):
+        """SQLite 계층은 만료된 행과 max_rows를 넘는 오래된 행을 정리해 크기가 제한되어야 함"""
+        from app.converter.infrastructure.cache.sqlite_conversion_store import (
+            SQLiteConversionStore,
+        )
+
+        now = [1000.0]
+        store = SQLiteConversionStore(
+            str(tmp_path / "c.db"), ttl_seconds=10, max_rows=3, clock=lambda: now[0], prune_every=1
+        )
+        store.set("expiring", _tone_message("공손한"))
+        now[0] += 11
+        for index in range(4):
+            now[0] += 1
+            store.set(f"key{index}", _tone_message("공손한"))
+
+        assert store.stats()["size"] == 3
+        assert store.get("expiring") is None
+        assert store.get("key0") is None
+        assert [store.get(f"key{index}") is not None for index in range(1, 4)] == [True, True, True]
@@ -21,8 +21,8 @@ class TestOpenAIMessageConverter:
         # Then
         assert issubclass(OpenAIMessageConverter, MessageConverterPort)
 
-    @patch("app.converter.infrastructure.service.openai_message_converter.OpenAI")
-    def test_should_convert_message_with_tone(self, mock_openai_class):
+    @patch("app.converter.infrastructure.service.openai_message_converter.get_llm_gateway")
+    def test_should_convert_message_with_tone(self, mock_get_client):
         """특정 톤으로 메시지를 변환해야 함"""
         # Given
         from app.converter.infrastructure.service.openai_message_converter import (
@@ -31,7 +31,7 @@ class TestOpenAIMessageConverter:
 
         # OpenAI API 응답 모킹
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         mock_response = Mock()
         mock_response.choices = [
@@ -60,8 +60,8 @@ class TestOpenAIMessageConverter:
         assert "ESTP" in result.explanation
         assert mock_client.chat.completions.create.called
 
-    @patch("app.converter.infrastructure.service.openai_message_converter.OpenAI")
-    def test_should_include_mbti_context_in_prompt(self, mock_openai_class):
+    @patch("app.converter.infrastructure.service.openai_message_converter.get_llm_gateway")
+    def test_should_include_mbti_context_in_prompt(self, mock_get_client):
         """프롬프트에 MBTI 정보를 포함해야 함"""
         # Given
         from app.converter.infrastructure.service.openai_message_converter import (
@@ -69,7 +69,7 @@ class TestOpenAIMessageConverter:
         )
 
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         mock_response = Mock()
         mock_response.choices = [
@@ -100,8 +100,8 @@ class TestOpenAIMessageConverter:
         assert "ESTP" in prompt_text
         assert "공손한" in prompt_text
 
-    @patch("app.converter.infrastructure.service.openai_message_converter.OpenAI")
-    def test_should_include_mbti_dimension_characteristics_in_prompt(self, mock_openai_class):
+    @patch("app.converter.infrastructure.service.openai_message_converter.get_llm_gateway")
+    def test_should_include_mbti_dimension_characteristics_in_prompt(self, mock_get_client):
         """프롬프트에 MBTI 차원별 특성을 포함해야 함 (HAIS-19)"""
         # Given
         from app.converter.infrastructure.service.openai_message_converter import (
@@ -109,7 +109,7 @@ class TestOpenAIMessageConverter:
         )
 
         mock_client = Mock()
-        mock_openai_class.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         mock_response = Mock()
         mock_response.choices = [
@@ -146,3 +146,94 @@ class TestOpenAIMessageConverter:
         # 최소 2개 이상의 차원 특성이 언급되어야 함
         dimension_count = sum([has_ei_dimension, has_sn_dimension, has_tf_dimension, has_jp_dimension])
         assert dimension_count >= 2, f"프롬프트에 MBTI 차원 특성이 충분히 포함되지 않았습니다. 포함된 차원 수: {dimension_count}"
+
+    @patch("app.converter.infrastructure.service.openai_message_converter.get_llm_gateway")
+    def test_should_convert_all_tones_in_single_call(self, mock_get_client):
+        """convert_tones는 한 번의 JSON 응답으로 모든 톤을 변환해야 함"""
+        # Given
+        from app.converter.infrastructure.service.openai_message_converter import (
+            OpenAIMessageConverter,
+        )
+
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+        mock_client.chat.completions.create.return_value = Mock(choices=[Mock(message=Mock(content=(
+            '{"공손한": {"content": "회의 시간을 조정해주실 수 있을까요?", "explanation": "공손한 설명"},'
+            ' "캐주얼한": {"content": "회의 시간 바꿀 수 있어?", "explanation": "캐주얼한 설명"},'
+            ' "간결한": {"content": "회의 시간 변경 가능?", "explanation": "간결한 설명"}}'
+        )))])
+
+        converter = OpenAIMessageConverter()
+
+        # When
+        results = converter.convert_tones(
+            original_message="회의 시간 바꿀 수 있어?",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+            tones=["공손한", "캐주얼한", "간결한"],
+        )
+
+        # Then
+        assert [r.tone for r in results] == ["공손한", "캐주얼한", "간결한"]
+        assert results[2].content == "회의 시간 변경 가능?"
+        assert mock_client.chat.completions.create.call_count == 1
+        call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["response_format"] == {"type": "json_object"}
+
+    @patch("app.converter.infrastructure.service.openai_message_converter.get_llm_gateway")
+    def test_should_fall_back_to_convert_for_missing_tone(self, mock_get_client):
+        """단일 호출 응답에 빠진 톤은 개별 convert로 변환해야 함"""
+        # Given
+        from app.converter.infrastructure.service.openai_message_converter import (
+            OpenAIMessageConverter,
+        )
+
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+        mock_client.chat.completions.create.side_effect = [
+            Mock(choices=[Mock(message=Mock(content='{"공손한": {"content": "공손", "explanation": "설명"}}'))]),
+            Mock(choices=[Mock(message=Mock(content='{"content": "간결", "explanation": "설명"}'))]),
+        ]
+
+        converter = OpenAIMessageConverter()
+
+        # When
+        results = converter.convert_tones(
+            original_message="안녕",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+            tones=["공손한", "간결한"],
+        )
+
+        # Then
+        assert [r.content for r in results] == ["공손", "간결"]
+        assert mock_client.chat.completions.create.call_count == 2
+
+    @patch("app.converter.infrastructure.service.openai_message_converter.get_llm_gateway")
+    def test_should_request_again_when_json_is_broken(self, mock_get_client):
+        """JSON으로 파싱할 수 없는 응답은 요청을 다시 보내야 함"""
+        # Given
+        from app.converter.infrastructure.service.openai_message_converter import (
+            OpenAIMessageConverter,
+        )
+
+        mock_client = Mock()
+        mock_get_client.return_value = mock_client
+        mock_client.chat.completions.create.side_effect = [
+            Mock(choices=[Mock(message=Mock(content='{"content": "잘린 응'))]),
+            Mock(choices=[Mock(message=Mock(content='{"content": "변환", "explanation": "설명"}'))]),
+        ]
+
+        converter = OpenAIMessageConverter()
+
+        # When
+        result = converter.convert(
+            original_message="안녕",
+            sender_mbti=MBTI("INTJ"),
+            receiver_mbti=MBTI("ESTP"),
+            tone="공손한",
+        )
+
+        # Then
+        assert result.content == "변환"
+        assert mock_client.chat.completions.create.call_count == 2
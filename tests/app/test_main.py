@@ -0,0 +1,28 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth.adapter.input.web.auth_dependency import set_session_repository
+from app.auth.domain.session import Session
+from app.main import app
+from tests.auth.fixtures.fake_session_repository import FakeSessionRepository
+
+
+@pytest.fixture
+def client():
+    """lifespan(DB 스키마 확인, 큐 시작)을 실행하지 않는 테스트 클라이언트"""
+    session_repo = FakeSessionRepository()
+    session_repo.save(Session(session_id="valid-session", user_id="user-1"))
+    set_session_repository(session_repo)
+    yield TestClient(app)
+    set_session_repository(None)
+
+
+@pytest.mark.parametrize("path", ["/health/openai-connections", "/health/llm-backends", "/metrics"])
+def test_internal_stats_require_authentication(client, path):
+    """내부 통계와 메트릭은 인증하지 않은 요청에 보여주지 않는다"""
+    assert client.get(path).status_code == 401
+    assert client.get(path, headers={"Authorization": "Bearer valid-session"}).status_code == 200
+
+
+def test_health_check_stays_public(client):
+    assert client.get("/health").status_code == 200
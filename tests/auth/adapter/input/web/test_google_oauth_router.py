@@ -0,0 +1,27 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.auth.adapter.input.web.auth_dependency import set_session_repository
+from app.auth.adapter.input.web.google_oauth_router import google_oauth_router
+from app.auth.domain.session import Session
+from tests.auth.fixtures.fake_session_repository import FakeSessionRepository
+
+
+def test_session_cache_stats_requires_authentication():
+    """세션 캐시 통계는 인증하지 않은 요청에 내부 수치를 보여주지 않는다"""
+    session_repo = FakeSessionRepository()
+    session_repo.save(Session(session_id="valid-session", user_id="user-1"))
+    set_session_repository(session_repo)
+    app = FastAPI()
+    app.include_router(google_oauth_router, prefix="/auth")
+    client = TestClient(app)
+
+    try:
+        anonymous = client.get("/auth/session-cache/stats")
+        authenticated = client.get("/auth/session-cache/stats", headers={"Authorization": "Bearer valid-session"})
+    finally:
+        set_session_repository(None)
+
+    assert anonymous.status_code == 401
+    assert authenticated.status_code == 200
+    assert "hit_ratio" in authenticated.json()
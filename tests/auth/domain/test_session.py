@@ -25,4 +25,23 @@ def test_reject_empty_session_id():
 def test_reject_empty_user_id():
     """빈 user_id를 거부한다"""
     with pytest.raises(ValueError):
-        Session(session_id="session-123", user_id="")
\ No newline at end of file
+        Session(session_id="session-123", user_id="")
+
+def test_session_without_expiry_is_not_expired():
+    """만료 시각이 없으면 만료되지 않은 것으로 본다"""
+    session = Session(session_id="session-123", user_id="user-123")
+
+    assert session.is_expired() is False
+
+
+def test_session_past_expiry_is_expired():
+    """만료 시각이 지나면 만료된 것으로 본다"""
+    from datetime import datetime, timedelta
+
+    session = Session(
+        session_id="session-123",
+        user_id="user-123",
+        expires_at=datetime.now() - timedelta(seconds=1),
+    )
+
+    assert session.is_expired() is True
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+
+from app.auth.domain.session import Session
+from app.auth.infrastructure.repository.cached_session_repository import CachedSessionRepository
+from app.shared.cache.lru_ttl_cache import LRUTTLCache
+from tests.auth.fixtures.fake_session_repository import FakeSessionRepository
+
+
+class CountingSessionRepository(FakeSessionRepository):
+    """조회 횟수를 세는 Fake 세션 저장소"""
+
+    def __init__(self):
+        super().__init__()
+        self.find_calls = 0
+
+    def find_by_session_id(self, session_id: str) -> Session | None:
+        self.find_calls += 1
+        return super().find_by_session_id(session_id)
+
+
+def _repository(inner) -> CachedSessionRepository:
+    return CachedSessionRepository(inner, LRUTTLCache(max_size=100, ttl_seconds=60), negative_ttl_seconds=10)
+
+
+def test_repeated_lookup_hits_cache():
+    """같은 토큰을 반복 조회하면 원본 저장소는 한 번만 조회한다"""
+    inner = CountingSessionRepository()
+    inner.save(Session(session_id="token", user_id="user-1"))
+    repository = _repository(inner)
+
+    first = repository.find_by_session_id("token")
+    second = repository.find_by_session_id("token")
+
+    assert first.user_id == second.user_id == "user-1"
+    assert inner.find_calls == 1
+
+
+def test_unknown_token_is_negatively_cached():
+    """존재하지 않는 토큰도 캐시하여 반복 조회하지 않는다"""
+    inner = CountingSessionRepository()
+    repository = _repository(inner)
+
+    assert repository.find_by_session_id("unknown") is None
+    assert repository.find_by_session_id("unknown") is None
+    assert inner.find_calls == 1
+
+
+def test_delete_invalidates_cached_session():
+    """삭제하면 캐시된 세션도 즉시 무효화된다"""
+    inner = CountingSessionRepository()
+    inner.save(Session(session_id="token", user_id="user-1"))
+    repository = _repository(inner)
+    repository.find_by_session_id("token")
+
+    repository.delete("token")
+
+    assert repository.find_by_session_id("token") is None
+
+
+def test_save_invalidates_negative_entry():
+    """저장하면 같은 토큰의 negative 캐시가 제거된다"""
+    inner = CountingSessionRepository()
+    repository = _repository(inner)
+    repository.find_by_session_id("token")
+
+    repository.save(Session(session_id="token", user_id="user-1"))
+
+    assert repository.find_by_session_id("token").user_id == "user-1"
+
+
+def test_expired_cached_session_is_not_returned():
+    """캐시된 세션이 만료되면 원본 저장소를 다시 조회한다"""
+    inner = CountingSessionRepository()
+    expired = Session(session_id="token", user_id="user-1", expires_at=datetime.now() - timedelta(seconds=1))
+    cache = LRUTTLCache(max_size=100, ttl_seconds=60)
+    cache.set("token", expired)
+    repository = CachedSessionRepository(inner, cache)
+
+    assert repository.find_by_session_id("token") is None
+    assert inner.find_calls == 1
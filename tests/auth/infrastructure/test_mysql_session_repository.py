@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.auth.domain.session import Session
+from app.auth.infrastructure.repository.mysql_session_repository import MySqlSessionRepository
+from app.shared.cache.lru_ttl_cache import LRUTTLCache, MISSING
+from app.user.infrastructure.model.user_model import UserModel
+from config.database import Base
+
+
+@pytest.fixture
+def db_session():
+    """테스트용 인메모리 SQLite DB 세션"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add(UserModel(id="user-1", email="user@example.com"))
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def cache():
+    return LRUTTLCache(max_size=100, ttl_seconds=60)
+
+
+def test_find_returns_session_with_expiry(db_session, cache):
+    """조회한 세션에 만료 시각이 포함된다"""
+    repository = MySqlSessionRepository(db_session, cache=cache)
+    repository.save(Session(session_id="token", user_id="user-1"))
+
+    session = repository.find_by_session_id("token")
+
+    assert session.user_id == "user-1"
+    assert session.expires_at is not None
+
+
+def test_delete_invalidates_cache_entry(db_session, cache):
+    """delete는 캐시 항목을 즉시 무효화한다 (로그아웃)"""
+    repository = MySqlSessionRepository(db_session, cache=cache)
+    repository.save(Session(session_id="token", user_id="user-1"))
+    cache.set("token", Session(session_id="token", user_id="user-1"))
+
+    repository.delete("token")
+
+    assert cache.get("token") is MISSING
+
+
+def test_save_invalidates_previous_token_of_user(db_session, cache):
+    """새 세션을 저장하면 같은 유저의 이전 토큰 캐시를 무효화한다"""
+    repository = MySqlSessionRepository(db_session, cache=cache)
+    repository.save(Session(session_id="old-token", user_id="user-1"))
+    cache.set("old-token", Session(session_id="old-token", user_id="user-1"))
+
+    repository.save(Session(session_id="new-token", user_id="user-1"))
+
+    assert cache.get("old-token") is MISSING
+    assert repository.find_by_session_id("old-token") is None
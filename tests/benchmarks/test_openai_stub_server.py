@@ -0,0 +1,170 @@
+import asyncio
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+import httpx
+import openai
+import pytest
+import uvicorn
+
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.service.async_openai_counselor_adapter import AsyncOpenAICounselorAdapter
+from app.converter.infrastructure.service.openai_message_converter import OpenAIMessageConverter
+from app.shared.llm.llm_gateway import AsyncLLMGateway, GatewayBackend, LLMGateway, LLMRouter, RoutingConfig
+from app.shared.vo.gender import Gender
+from app.shared.vo.mbti import MBTI
+from benchmarks.openai_stub_server import StubProfile, create_app
+
+INSTANT = StubProfile(ttft_ms=0, tokens_per_second=0)
+
+
+@contextmanager
+def running_stub(profile: StubProfile):
+    """stub 서버를 임의 포트에서 띄우고 /v1 base URL을 돌려준다"""
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(create_app(profile), log_level="warning", access_log=False))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{sock.getsockname()[1]}/v1"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+def _session() -> ConsultSession:
+    session = ConsultSession(id="s1", user_id="u1", mbti=MBTI("INFP"), gender=Gender("FEMALE"))
+    for turn in range(5):
+        session.add_message(Message(role="user", content=f"친구가 약속을 자꾸 바꿔 {turn}"))
+        session.add_message(Message(role="assistant", content="그랬구나"))
+    return session
+
+
+def test_converter_parses_single_and_multi_tone_json():
+    """변환기 프롬프트에 맞는 JSON을 돌려줘 실제 어댑터가 그대로 파싱한다"""
+    with running_stub(INSTANT) as base_url:
+        client = openai.OpenAI(api_key="stub", base_url=base_url)
+        converter = OpenAIMessageConverter(client=client)
+
+        single = converter.convert("회의 시간 바꿀 수 있어?", MBTI("INTJ"), MBTI("ESTP"), "공손한")
+        tones = converter.convert_tones(
+            "회의 시간 바꿀 수 있어?", MBTI("INTJ"), MBTI("ESTP"), ["공손한", "캐주얼한", "간결한"]
+        )
+        stats = httpx.get(base_url.replace("/v1", "/stub/stats")).json()
+
+    assert single.tone == "공손한" and single.content and single.explanation
+    assert [tone.tone for tone in tones] == ["공손한", "캐주얼한", "간결한"]
+    assert all("회의 시간 바꿀 수 있어?" in tone.content for tone in tones)
+    # 여러 톤 응답에 빠진 톤이 없어 개별 변환으로 넘어가지 않는다
+    assert stats == {"requests": 2, "success": 2}
+
+
+def test_counselor_analysis_and_stream_with_usage():
+    """분석 JSON 스키마와 스트림(usage 청크 포함)을 비동기 상담사 어댑터가 그대로 처리한다"""
+    async def scenario(base_url):
+        client = openai.AsyncOpenAI(api_key="stub", base_url=base_url)
+        adapter = AsyncOpenAICounselorAdapter(client=client)
+        session = _session()
+        analysis = await adapter.generate_analysis(session)
+        chunks = [chunk async for chunk in adapter.generate_response_stream(session, "어떻게 말하지?")]
+        await client.close()
+        return analysis, chunks
+
+    with running_stub(INSTANT) as base_url:
+        analysis, chunks = asyncio.run(scenario(base_url))
+
+    assert analysis.situation and analysis.traits
+    assert analysis.solutions.startswith("1. ")
+    assert len(chunks) > 1
+    assert "".join(chunks).startswith("그랬구나")
+
+
+def test_stream_respects_ttft_and_token_rate():
+    """첫 토큰은 ttft 뒤에, 나머지 토큰은 tokens_per_second 간격으로 온다"""
+    profile = StubProfile(ttft_ms=200, tokens_per_second=100, completion_tokens=10)
+    with running_stub(profile) as base_url:
+        client = openai.OpenAI(api_key="stub", base_url=base_url)
+        started = time.perf_counter()
+        stream = client.chat.completions.create(
+            model="stub", messages=[{"role": "user", "content": "안녕"}], stream=True,
+        )
+        arrivals = [time.perf_counter() - started for chunk in stream if chunk.choices and chunk.choices[0].delta.content]
+
+    assert len(arrivals) == 10
+    assert arrivals[0] >= 0.2
+    assert arrivals[-1] - arrivals[0] >= 0.09 - 0.02
+
+
+def test_repeated_prompt_prefix_reports_cached_tokens():
+    """1024토큰 이상 같은 앞부분을 다시 보내면 cached_tokens를 128토큰 단위로 돌려준다"""
+    prefix = [{"role": "system", "content": "상담 원칙 " * 600}, {"role": "user", "content": "첫 질문"}]
+    with running_stub(INSTANT) as base_url:
+        client = openai.OpenAI(api_key="stub", base_url=base_url)
+        first = client.chat.completions.create(model="stub", messages=prefix)
+        second = client.chat.completions.create(
+            model="stub", messages=prefix + [{"role": "assistant", "content": "답변"}, {"role": "user", "content": "둘째 질문"}],
+        )
+
+    assert first.usage.prompt_tokens_details.cached_tokens == 0
+    cached = second.usage.prompt_tokens_details.cached_tokens
+    assert 1024 <= cached <= first.usage.prompt_tokens
+    assert (cached - 1024) % 128 == 0
+
+
+def test_gateway_fails_over_between_stub_backends():
+    """한 stub이 500만 내면 게이트웨이가 다른 stub으로 넘기고, 이후 요청은 정상 stub으로 먼저 보낸다"""
+    async def stream_reply(router, failing_url, healthy_url):
+        clients = [openai.AsyncOpenAI(api_key="stub", base_url=url, max_retries=0) for url in (failing_url, healthy_url)]
+        gateway = AsyncLLMGateway(
+            [GatewayBackend("stub.failing", clients[0]), GatewayBackend("stub.healthy", clients[1])], router
+        )
+        adapter = AsyncOpenAICounselorAdapter(client=gateway)
+        chunks = [chunk async for chunk in adapter.generate_response_stream(_session(), "어떻게 말하지?")]
+        for client in clients:
+            await client.close()
+        return chunks
+
+    with running_stub(StubProfile(ttft_ms=0, error_rate=1.0)) as failing_url, running_stub(INSTANT) as healthy_url:
+        router = LLMRouter(["stub.failing", "stub.healthy"], RoutingConfig())
+        gateway = LLMGateway(
+            [
+                GatewayBackend("stub.failing", openai.OpenAI(api_key="stub", base_url=failing_url, max_retries=0)),
+                GatewayBackend("stub.healthy", openai.OpenAI(api_key="stub", base_url=healthy_url, max_retries=0)),
+            ],
+            router,
+        )
+        converted = OpenAIMessageConverter(client=gateway).convert(
+            "회의 시간 바꿀 수 있어?", MBTI("INTJ"), MBTI("ESTP"), "공손한"
+        )
+        chunks = asyncio.run(stream_reply(router, failing_url, healthy_url))
+        failing_stats = httpx.get(failing_url.replace("/v1", "/stub/stats")).json()
+        healthy_stats = httpx.get(healthy_url.replace("/v1", "/stub/stats")).json()
+
+    assert converted.tone == "공손한" and converted.content
+    assert "".join(chunks)
+    # 첫 요청만 실패한 stub으로 가고, 오류율 때문에 스트림 요청은 정상 stub으로 바로 간다
+    assert failing_stats == {"requests": 1, "error": 1}
+    assert healthy_stats == {"requests": 2, "success": 2}
+    assert router.ranked() == ["stub.healthy", "stub.failing"]
+
+
+def test_injected_rate_limit_returns_429_with_retry_after():
+    with running_stub(StubProfile(ttft_ms=0, rate_limit_rate=1.0, retry_after_seconds=3)) as base_url:
+        client = openai.OpenAI(api_key="stub", base_url=base_url, max_retries=0)
+        with pytest.raises(openai.RateLimitError) as exc_info:
+            client.chat.completions.create(model="stub", messages=[{"role": "user", "content": "안녕"}])
+
+    assert exc_info.value.response.headers["retry-after"] == "3"
+
+
+def test_injected_timeout_makes_client_time_out():
+    with running_stub(StubProfile(ttft_ms=0, timeout_rate=1.0, hang_seconds=1)) as base_url:
+        client = openai.OpenAI(api_key="stub", base_url=base_url, max_retries=0, timeout=0.2)
+        with pytest.raises(openai.APITimeoutError):
+            client.chat.completions.create(model="stub", messages=[{"role": "user", "content": "안녕"}])
@@ -0,0 +1,28 @@
+from benchmarks.prompt_cache_report import build_report
+
+METRICS = """\
+# TYPE llm_tokens_total counter
+llm_tokens_total{call_site="consult.generate_response",kind="prompt",model="gpt-4o-mini"} 4000.0
+llm_tokens_total{call_site="consult.generate_response",kind="cached",model="gpt-4o-mini"} 2048.0
+llm_tokens_total{call_site="converter.convert",kind="prompt",model="gpt-4o-mini"} 500.0
+# TYPE llm_request_duration_seconds histogram
+llm_request_duration_seconds_bucket{call_site="consult.generate_response",le="0.5",model="gpt-4o-mini",outcome="success"} 2.0
+llm_request_duration_seconds_bucket{call_site="consult.generate_response",le="1.0",model="gpt-4o-mini",outcome="success"} 4.0
+llm_request_duration_seconds_bucket{call_site="consult.generate_response",le="+Inf",model="gpt-4o-mini",outcome="success"} 4.0
+llm_request_duration_seconds_count{call_site="consult.generate_response",model="gpt-4o-mini",outcome="success"} 4.0
+llm_request_duration_seconds_sum{call_site="consult.generate_response",model="gpt-4o-mini",outcome="success"} 2.4
+llm_request_duration_seconds_count{call_site="consult.generate_response",model="gpt-4o-mini",outcome="error"} 3.0
+llm_request_duration_seconds_sum{call_site="consult.generate_response",model="gpt-4o-mini",outcome="error"} 30.0
+"""
+
+
+def test_report_computes_cached_ratio_and_success_latency_per_call_site():
+    report = build_report(METRICS)
+
+    response = report["consult.generate_response"]
+    assert response["cached_ratio"] == 2048 / 4000
+    assert response["requests"] == 4
+    assert response["mean_ms"] == 600.0
+    assert response["p50_ms"] == 500.0
+    assert 500.0 < response["p95_ms"] <= 1000.0
+    assert report["converter.convert"]["cached_ratio"] == 0.0
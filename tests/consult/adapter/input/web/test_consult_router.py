@@ -22,6 +22,16 @@ def app():
     return app
 
 
+@pytest.fixture(autouse=True)
+def reset_admission_buckets():
+    """테스트 간 입장 제어 버킷 공유 방지"""
+    from app.shared.ratelimit.admission_controller import get_admission_controller
+
+    get_admission_controller.cache_clear()
+    yield
+    get_admission_controller.cache_clear()
+
+
 @pytest.fixture
 def user_repo():
     """테스트용 User 저장소"""
@@ -56,6 +66,8 @@ def client(app, user_repo, session_repo, consult_repo, ai_counselor):
     router_module._user_repository = user_repo
     router_module._consult_repository = consult_repo
     router_module._ai_counselor = ai_counselor
+    router_module._analysis_queue = None
+    router_module._analysis_job_repository = None
     auth_dependency._session_repository = session_repo
 
     return TestClient(app)
@@ -456,3 +468,266 @@ def test_send_message_returns_is_completed_false_before_5th_turn(client, user_re
     data = response.json()
     assert data["is_completed"] is False
     assert "analysis" not in data
+
+
+def test_send_message_with_async_counselor(client, user_repo, session_repo, consult_repo):
+    """비동기 AI 상담사가 설정되어도 메시지 전송이 동작한다"""
+    from app.consult.adapter.input.web import consult_router as router_module
+    from tests.consult.fixtures.fake_async_ai_counselor import FakeAsyncAICounselor
+
+    # Given: 비동기 상담사와 상담 세션
+    router_module._ai_counselor = FakeAsyncAICounselor(response="비동기 응답")
+    session_repo.save(Session(session_id="valid-session-123", user_id="user-123"))
+    consult_repo.save(ConsultSession(
+        id="consult-session-123",
+        user_id="user-123",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE")
+    ))
+
+    # When: 메시지를 전송하면
+    response = client.post(
+        "/consult/consult-session-123/message",
+        headers={"Authorization": "Bearer valid-session-123"},
+        json={"content": "안녕하세요"}
+    )
+
+    # Then: 비동기 상담사의 응답을 반환한다
+    assert response.status_code == 200
+    assert response.json()["response"] == "비동기 응답"
+
+
+def test_send_message_stream_frames_multiline_chunks_and_saves_once(client, user_repo, session_repo, consult_repo):
+    """줄바꿈이 있는 청크도 SSE 형식을 지키고, 스트림 종료 시 한 번만 저장한다"""
+    from app.consult.adapter.input.web import consult_router as router_module
+    from tests.consult.fixtures.fake_async_ai_counselor import FakeAsyncAICounselor
+
+    class MultilineCounselor(FakeAsyncAICounselor):
+        async def generate_response_stream(self, session, user_message):
+            yield "첫 줄\n둘째 줄"
+            yield " 끝"
+
+    router_module._ai_counselor = MultilineCounselor()
+
+    # Given: 로그인한 사용자와 상담 세션
+    user_repo.save(User(id="user-123", email="test@example.com", mbti=MBTI("INTJ"), gender=Gender("MALE")))
+    session_repo.save(Session(session_id="valid-session-123", user_id="user-123"))
+    consult_repo.save(ConsultSession(id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE")))
+
+    saves = []
+    original_save = consult_repo.save
+    consult_repo.save = lambda session: (saves.append(session), original_save(session))
+
+    # When: 스트리밍 API를 호출하면
+    response = client.post(
+        "/consult/consult-session-123/message/stream",
+        headers={"Authorization": "Bearer valid-session-123"},
+        json={"content": "안녕하세요"}
+    )
+
+    # Then: 이벤트마다 id가 붙고 줄바꿈은 data 줄로 나뉜다
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.text == (
+        "id: 1\nretry: 3000\ndata: 첫 줄\ndata: 둘째 줄\n\n"
+        "id: 2\ndata:  끝\n\n"
+    )
+
+    # Then: 사용자 메시지와 AI 응답이 한 번에 저장된다
+    assert len(saves) == 1
+    messages = consult_repo.find_by_id("consult-session-123").get_messages()
+    assert [(m.role, m.content) for m in messages] == [("user", "안녕하세요"), ("assistant", "첫 줄\n둘째 줄 끝")]
+
+
+def _prepare_completed_consult(user_repo, session_repo, consult_repo, analysis=None):
+    from app.consult.domain.message import Message
+
+    user_repo.save(User(id="user-123", email="test@example.com", mbti=MBTI("INTJ"), gender=Gender("MALE")))
+    session_repo.save(Session(session_id="valid-session-123", user_id="user-123"))
+    consult_session = ConsultSession(id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE"))
+    for i in range(5):
+        consult_session.add_message(Message(role="user", content=f"질문 {i+1}"))
+        consult_session.add_message(Message(role="assistant", content=f"답변 {i+1}"))
+    if analysis:
+        consult_session.complete_with_analysis(analysis)
+    consult_repo.save(consult_session)
+
+
+def _prepare_final_turn_consult(user_repo, session_repo, consult_repo):
+    from app.consult.domain.message import Message
+
+    user_repo.save(User(id="user-123", email="test@example.com", mbti=MBTI("INTJ"), gender=Gender("MALE")))
+    session_repo.save(Session(session_id="valid-session-123", user_id="user-123"))
+    consult_session = ConsultSession(id="consult-session-123", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE"))
+    for i in range(4):
+        consult_session.add_message(Message(role="user", content=f"질문 {i+1}"))
+        consult_session.add_message(Message(role="assistant", content=f"답변 {i+1}"))
+    consult_repo.save(consult_session)
+
+
+def test_send_message_stream_enqueues_analysis_job_on_5th_turn(client, user_repo, session_repo, consult_repo):
+    """스트림으로 5턴째를 보내도 /message와 같이 분석 작업을 등록해 GET /analysis로 조회할 수 있다"""
+    from app.consult.adapter.input.web import consult_router as router_module
+    from app.consult.application.port.analysis_job_queue_port import AnalysisJobQueuePort
+    from tests.consult.fixtures.fake_analysis_job_repository import FakeAnalysisJobRepository
+
+    class RecordingQueue(AnalysisJobQueuePort):
+        def __init__(self, jobs):
+            self.jobs = jobs
+
+        async def enqueue(self, session_id):
+            return self.jobs.create_if_absent(session_id)
+
+        async def wait(self, session_id, timeout):
+            pass
+
+    # Given: 4턴까지 진행한 세션과 분석 작업 큐
+    _prepare_final_turn_consult(user_repo, session_repo, consult_repo)
+    jobs = FakeAnalysisJobRepository()
+    router_module._analysis_job_repository = jobs
+    router_module._analysis_queue = RecordingQueue(jobs)
+
+    # When: 스트림으로 5턴째 메시지를 보내면
+    response = client.post(
+        "/consult/consult-session-123/message/stream",
+        headers={"Authorization": "Bearer valid-session-123"},
+        json={"content": "마지막 질문"},
+    )
+    analysis = client.get(
+        "/consult/consult-session-123/analysis",
+        headers={"Authorization": "Bearer valid-session-123"},
+    )
+
+    # Then: 세션은 완료되고 분석 작업이 등록된다
+    assert response.status_code == 200
+    assert consult_repo.find_by_id("consult-session-123").is_completed()
+    assert analysis.status_code == 200
+    assert analysis.json()["status"] == "pending"
+
+
+def test_send_message_stream_generates_analysis_on_5th_turn_without_queue(client, user_repo, session_repo, consult_repo):
+    """큐가 없으면 스트림이 끝난 뒤 분석을 바로 생성해 저장한다"""
+    from app.consult.adapter.input.web import consult_router as router_module
+    from tests.consult.fixtures.fake_analysis_job_repository import FakeAnalysisJobRepository
+
+    # Given
+    _prepare_final_turn_consult(user_repo, session_repo, consult_repo)
+    router_module._analysis_job_repository = FakeAnalysisJobRepository()
+
+    # When
+    client.post(
+        "/consult/consult-session-123/message/stream",
+        headers={"Authorization": "Bearer valid-session-123"},
+        json={"content": "마지막 질문"},
+    )
+    analysis = client.get(
+        "/consult/consult-session-123/analysis",
+        headers={"Authorization": "Bearer valid-session-123"},
+    )
+
+    # Then
+    assert consult_repo.find_by_id("consult-session-123").get_analysis() is not None
+    assert analysis.json()["status"] == "done"
+
+
+def test_get_analysis_returns_pending_job_status(client, user_repo, session_repo, consult_repo):
+    """분석 작업이 진행 중이면 상태와 작업 id를 반환한다"""
+    from app.consult.adapter.input.web import consult_router as router_module
+    from tests.consult.fixtures.fake_analysis_job_repository import FakeAnalysisJobRepository
+
+    # Given: 분석 작업이 등록된 완료 세션
+    _prepare_completed_consult(user_repo, session_repo, consult_repo)
+    jobs = FakeAnalysisJobRepository()
+    job = jobs.create_if_absent("consult-session-123")
+    router_module._analysis_job_repository = jobs
+
+    # When
+    response = client.get(
+        "/consult/consult-session-123/analysis",
+        headers={"Authorization": "Bearer valid-session-123"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    assert response.json() == {"session_id": "consult-session-123", "job_id": job.id, "status": "pending"}
+
+
+def test_get_analysis_streams_until_done(client, user_repo, session_repo, consult_repo):
+    """stream=true면 분석이 끝난 상태를 SSE 이벤트로 보내고 종료한다"""
+    import json
+
+    from app.consult.adapter.input.web import consult_router as router_module
+    from tests.consult.fixtures.fake_analysis_job_repository import FakeAnalysisJobRepository
+
+    # Given: 분석이 저장된 완료 세션
+    analysis = {"situation": "상황", "traits": "특성", "solutions": "해결책", "cautions": "주의사항"}
+    _prepare_completed_consult(user_repo, session_repo, consult_repo, analysis=analysis)
+    router_module._analysis_job_repository = FakeAnalysisJobRepository()
+
+    # When
+    response = client.get(
+        "/consult/consult-session-123/analysis?stream=true",
+        headers={"Authorization": "Bearer valid-session-123"},
+    )
+
+    # Then
+    assert response.status_code == 200
+    data_line = next(line for line in response.text.splitlines() if line.startswith("data: "))
+    assert "event: analysis" in response.text
+    assert json.loads(data_line[len("data: "):])["analysis"] == analysis
+
+
+def test_get_analysis_without_job_returns_404(client, user_repo, session_repo, consult_repo):
+    """분석 작업도 결과도 없으면 404를 반환한다"""
+    from app.consult.adapter.input.web import consult_router as router_module
+    from tests.consult.fixtures.fake_analysis_job_repository import FakeAnalysisJobRepository
+
+    _prepare_completed_consult(user_repo, session_repo, consult_repo)
+    router_module._analysis_job_repository = FakeAnalysisJobRepository()
+
+    response = client.get(
+        "/consult/consult-session-123/analysis",
+        headers={"Authorization": "Bearer valid-session-123"},
+    )
+
+    assert response.status_code == 404
+
+
+def test_get_history_paginates_with_cursor(client, user_repo, session_repo, consult_repo):
+    """히스토리는 요약만 담아 페이지 단위로 반환하고 next_cursor로 이어서 조회한다"""
+    from datetime import datetime
+
+    # Given: 완료된 상담 3개
+    session_repo.save(Session(session_id="valid-session-123", user_id="user-123"))
+    analysis = {"situation": "상황", "traits": "특성", "solutions": "해결책", "cautions": "주의사항"}
+    for day in (1, 2, 3):
+        consult_session = ConsultSession(
+            id=f"consult-{day}", user_id="user-123", mbti=MBTI("INTJ"), gender=Gender("MALE"),
+            created_at=datetime(2025, 1, day),
+        )
+        consult_session.complete_with_analysis(analysis)
+        consult_repo.save(consult_session)
+    headers = {"Authorization": "Bearer valid-session-123"}
+
+    # When
+    first = client.get("/consult/history?limit=2", headers=headers).json()
+    second = client.get(f"/consult/history?limit=2&cursor={first['next_cursor']}", headers=headers).json()
+
+    # Then
+    assert [s["id"] for s in first["sessions"]] == ["consult-3", "consult-2"]
+    assert first["sessions"][0]["summary"] == "상황"
+    assert "analysis" not in first["sessions"][0]
+    assert [s["id"] for s in second["sessions"]] == ["consult-1"]
+    assert second["next_cursor"] is None
+
+
+def test_get_history_with_invalid_cursor_returns_400(client, session_repo):
+    """잘못된 커서는 400을 반환한다"""
+    session_repo.save(Session(session_id="valid-session-123", user_id="user-123"))
+
+    response = client.get(
+        "/consult/history?cursor=broken",
+        headers={"Authorization": "Bearer valid-session-123"},
+    )
+
+    assert response.status_code == 400
@@ -0,0 +1,224 @@
+import asyncio
+
+import pytest
+
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.application.use_case.async_send_message_use_case import AsyncSendMessageUseCase
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from tests.consult.fixtures.fake_consult_repository import FakeConsultRepository
+from tests.consult.fixtures.fake_async_ai_counselor import FakeAsyncAICounselor
+
+
+class TestAsyncSendMessageUseCase:
+    """AsyncSendMessageUseCase 테스트"""
+
+    def setup_method(self):
+        self.repository = FakeConsultRepository()
+        self.ai_counselor = FakeAsyncAICounselor(response="AI 응답입니다")
+        self.use_case = AsyncSendMessageUseCase(self.repository, self.ai_counselor)
+
+        self.session = ConsultSession(
+            id="session-123",
+            user_id="user-456",
+            mbti=MBTI("INTJ"),
+            gender=Gender("MALE")
+        )
+        self.repository.save(self.session)
+
+    def test_send_message_returns_ai_response(self):
+        """메시지 전송 시 AI 응답을 반환하고 대화를 저장한다"""
+        # When
+        result = asyncio.run(self.use_case.execute(
+            session_id="session-123",
+            user_id="user-456",
+            content="안녕하세요"
+        ))
+
+        # Then
+        assert result["response"] == "AI 응답입니다"
+        assert result["remaining_turns"] == 4
+        messages = self.repository.find_by_id("session-123").get_messages()
+        assert [m.role for m in messages] == ["user", "assistant"]
+
+    def test_send_message_rejects_non_owner(self):
+        """세션 소유자가 아니면 에러를 발생시킨다"""
+        with pytest.raises(PermissionError, match="세션에 접근할 권한이 없습니다"):
+            asyncio.run(self.use_case.execute(
+                session_id="session-123",
+                user_id="other-user",
+                content="안녕하세요"
+            ))
+
+    def test_send_message_rejects_nonexistent_session(self):
+        """존재하지 않는 세션이면 에러를 발생시킨다"""
+        with pytest.raises(ValueError, match="세션을 찾을 수 없습니다"):
+            asyncio.run(self.use_case.execute(
+                session_id="nonexistent",
+                user_id="user-456",
+                content="안녕하세요"
+            ))
+
+    def test_send_message_returns_analysis_on_5th_turn(self):
+        """5턴째 메시지 전송 시 분석 결과를 반환하고 세션을 완료한다"""
+        # Given: 4턴 진행된 세션
+        for i in range(4):
+            self.session.add_message(Message(role="user", content=f"질문 {i+1}"))
+            self.session.add_message(Message(role="assistant", content=f"답변 {i+1}"))
+        self.repository.save(self.session)
+
+        # When
+        result = asyncio.run(self.use_case.execute(
+            session_id="session-123",
+            user_id="user-456",
+            content="마지막 질문"
+        ))
+
+        # Then
+        assert result["is_completed"] is True
+        assert result["analysis"]["situation"] == "테스트 상황 분석"
+        assert self.repository.find_by_id("session-123").get_analysis() is not None
+
+    def test_send_message_enqueues_analysis_job_on_5th_turn(self):
+        """분석 큐가 있으면 5턴째에 분석을 생성하지 않고 작업 id만 반환한다"""
+        from app.consult.application.port.analysis_job_queue_port import AnalysisJobQueuePort
+        from app.consult.domain.analysis_job import AnalysisJob
+
+        class RecordingQueue(AnalysisJobQueuePort):
+            def __init__(self):
+                self.enqueued = []
+
+            async def enqueue(self, session_id):
+                self.enqueued.append(session_id)
+                return AnalysisJob(session_id=session_id, id="job-1")
+
+            async def wait(self, session_id, timeout):
+                pass
+
+        # Given: 4턴 진행된 세션과 분석 큐
+        for i in range(4):
+            self.session.add_message(Message(role="user", content=f"질문 {i+1}"))
+            self.session.add_message(Message(role="assistant", content=f"답변 {i+1}"))
+        self.repository.save(self.session)
+        queue = RecordingQueue()
+        use_case = AsyncSendMessageUseCase(self.repository, self.ai_counselor, queue)
+
+        # When
+        result = asyncio.run(use_case.execute(
+            session_id="session-123",
+            user_id="user-456",
+            content="마지막 질문"
+        ))
+
+        # Then
+        assert result["is_completed"] is True
+        assert result["analysis_job_id"] == "job-1"
+        assert result["analysis_status"] == "pending"
+        assert "analysis" not in result
+        assert queue.enqueued == ["session-123"]
+        assert self.repository.find_by_id("session-123").get_analysis() is None
+
+
+class RecordingAnalysisCounselor(FakeAsyncAICounselor):
+    """응답/분석 호출 시점과 분석에 넘어온 메시지 수를 기록하는 Fake 상담사"""
+
+    def __init__(self, delay: float = 0.05):
+        super().__init__(response="마무리 응답")
+        self._delay = delay
+        self.events: list[str] = []
+        self.analysis_message_counts: list[int] = []
+
+    async def generate_response(self, session, user_message):
+        self.events.append("response:start")
+        await asyncio.sleep(self._delay)
+        self.events.append("response:end")
+        return await super().generate_response(session, user_message)
+
+    async def generate_analysis(self, session):
+        self.events.append("analysis:start")
+        self.analysis_message_counts.append(len(session.get_messages()))
+        await asyncio.sleep(self._delay)
+        self.events.append("analysis:end")
+        return await super().generate_analysis(session)
+
+
+class TestAsyncSendMessageSpeculativeAnalysis:
+    """5턴째 분석 미리 생성 테스트"""
+
+    def setup_method(self):
+        self.repository = FakeConsultRepository()
+        session = ConsultSession(id="session-123", user_id="user-456", mbti=MBTI("INTJ"), gender=Gender("MALE"))
+        for i in range(4):
+            session.add_message(Message(role="user", content=f"질문 {i+1}"))
+            session.add_message(Message(role="assistant", content=f"답변 {i+1}"))
+        self.repository.save(session)
+
+    def _execute(self, counselor, mode):
+        from app.consult.domain.analysis_rerun_policy import AnalysisRerunPolicy
+
+        use_case = AsyncSendMessageUseCase(
+            self.repository, counselor, analysis_policy=AnalysisRerunPolicy(mode=mode)
+        )
+        return asyncio.run(use_case.execute(session_id="session-123", user_id="user-456", content="마지막 질문"))
+
+    def test_analysis_runs_alongside_final_reply(self):
+        """분석은 마지막 응답과 동시에 시작되고, 마지막 응답 없이 만든 분석을 그대로 쓴다"""
+        counselor = RecordingAnalysisCounselor()
+
+        result = self._execute(counselor, "never")
+
+        assert counselor.events.index("analysis:start") < counselor.events.index("response:end")
+        assert counselor.analysis_message_counts == [9]
+        assert result["analysis"]["situation"] == "테스트 상황 분석"
+        assert self.repository.find_by_id("session-123").get_analysis() is not None
+
+    def test_policy_rerun_uses_full_conversation(self):
+        """정책이 다시 생성하라고 하면 마지막 응답까지 포함한 대화로 분석한다"""
+        counselor = RecordingAnalysisCounselor()
+
+        self._execute(counselor, "always")
+
+        assert counselor.analysis_message_counts[-1] == 10
+
+    def test_off_mode_generates_analysis_after_reply(self):
+        """off 모드는 응답이 끝난 뒤에 분석을 생성한다"""
+        counselor = RecordingAnalysisCounselor()
+
+        self._execute(counselor, "off")
+
+        assert counselor.events == ["response:start", "response:end", "analysis:start", "analysis:end"]
+        assert counselor.analysis_message_counts == [10]
+
+    def test_speculative_analysis_is_cancelled_when_save_fails(self):
+        """마지막 턴 저장이 실패하면 미리 시작한 분석을 취소한다"""
+        from app.consult.domain.analysis_rerun_policy import AnalysisRerunPolicy
+
+        class FailingSaveRepository(FakeConsultRepository):
+            fail = False
+
+            def save(self, session):
+                if self.fail:
+                    raise RuntimeError("DB 오류")
+                super().save(session)
+
+        class SlowAnalysisCounselor(RecordingAnalysisCounselor):
+            async def generate_analysis(self, session):
+                await asyncio.sleep(0.05)
+                return await super().generate_analysis(session)
+
+        repository = FailingSaveRepository()
+        repository.save(self.repository.find_by_id("session-123"))
+        repository.fail = True
+        counselor = SlowAnalysisCounselor(delay=0.01)
+        use_case = AsyncSendMessageUseCase(repository, counselor, analysis_policy=AnalysisRerunPolicy(mode="never"))
+
+        async def scenario():
+            with pytest.raises(RuntimeError):
+                await use_case.execute(session_id="session-123", user_id="user-456", content="마지막 질문")
+            # 취소되지 않았다면 이 사이에 분석이 끝난다
+            await asyncio.sleep(0.1)
+
+        asyncio.run(scenario())
+
+        assert counselor.events == ["response:start", "response:end"]
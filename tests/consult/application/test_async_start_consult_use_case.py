@@ -0,0 +1,28 @@
+import asyncio
+
+from app.consult.application.use_case.async_start_consult_use_case import AsyncStartConsultUseCase
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from tests.consult.fixtures.fake_consult_repository import FakeConsultRepository
+from tests.consult.fixtures.fake_async_ai_counselor import FakeAsyncAICounselor
+
+
+class TestAsyncStartConsultUseCase:
+    """AsyncStartConsultUseCase 테스트"""
+
+    def test_start_consult_saves_session_and_returns_greeting(self):
+        """상담 시작 시 세션을 저장하고 인사말을 반환한다"""
+        # Given
+        repository = FakeConsultRepository()
+        use_case = AsyncStartConsultUseCase(repository, FakeAsyncAICounselor())
+
+        # When
+        result = asyncio.run(use_case.execute(
+            user_id="user-123", mbti=MBTI("ENFP"), gender=Gender("FEMALE")
+        ))
+
+        # Then
+        session = repository.find_by_id(result["session_id"])
+        assert session is not None
+        assert session.user_id == "user-123"
+        assert "ENFP" in result["greeting"]
@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from app.consult.domain.consult_session import ConsultSession
@@ -163,4 +165,40 @@ class TestSendMessageUseCase:
 
         # Then: is_completed가 false
         assert result["is_completed"] is False
-        assert "analysis" not in result
\ No newline at end of file
+        assert "analysis" not in result
+
+def test_sync_use_case_speculative_analysis_uses_snapshot():
+    """동기 유스케이스도 5턴째 분석을 마지막 응답 없이 미리 생성한다"""
+    from app.consult.domain.analysis_rerun_policy import AnalysisRerunPolicy
+    from app.consult.domain.message import Message
+
+    class RecordingCounselor(FakeAICounselor):
+        def __init__(self):
+            super().__init__(response="마무리 응답")
+            self.analysis_message_counts = []
+            self.analysis_threads = []
+
+        def generate_analysis(self, session):
+            self.analysis_message_counts.append(len(session.get_messages()))
+            self.analysis_threads.append(threading.current_thread().name)
+            return super().generate_analysis(session)
+
+    # Given: 4턴 진행된 세션
+    repository = FakeConsultRepository()
+    session = ConsultSession(id="session-123", user_id="user-456", mbti=MBTI("INTJ"), gender=Gender("MALE"))
+    for i in range(4):
+        session.add_message(Message(role="user", content=f"질문 {i+1}"))
+        session.add_message(Message(role="assistant", content=f"답변 {i+1}"))
+    repository.save(session)
+    counselor = RecordingCounselor()
+    use_case = SendMessageUseCase(repository, counselor, analysis_policy=AnalysisRerunPolicy(mode="never"))
+
+    # When
+    result = use_case.execute(session_id="session-123", user_id="user-456", content="마지막 질문")
+
+    # Then
+    assert result["is_completed"] is True
+    assert "analysis" in result
+    assert counselor.analysis_message_counts == [9]
+    # 호출마다 풀을 만들지 않고 모듈에서 공유하는 스레드 풀에서 실행한다
+    assert counselor.analysis_threads[0].startswith("speculative-analysis")
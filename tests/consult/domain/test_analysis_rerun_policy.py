@@ -0,0 +1,29 @@
+import pytest
+
+from app.consult.domain.analysis_rerun_policy import AnalysisRerunPolicy
+
+
+def test_off_mode_is_not_speculative():
+    """off 모드는 분석을 미리 생성하지 않는다"""
+    assert AnalysisRerunPolicy(mode="off").is_speculative() is False
+    assert AnalysisRerunPolicy(mode="never").is_speculative() is True
+
+
+def test_long_reply_mode_reruns_only_for_long_final_reply():
+    """long_reply 모드는 마지막 응답이 기준 길이 이상일 때만 다시 생성한다"""
+    policy = AnalysisRerunPolicy(mode="long_reply", min_reply_chars=10)
+
+    assert policy.should_rerun("짧은 응답") is False
+    assert policy.should_rerun("이건 충분히 긴 마지막 응답이야") is True
+
+
+def test_never_and_always_modes():
+    """never는 다시 생성하지 않고, always는 항상 다시 생성한다"""
+    assert AnalysisRerunPolicy(mode="never").should_rerun("x" * 1000) is False
+    assert AnalysisRerunPolicy(mode="always").should_rerun("") is True
+
+
+def test_rejects_unknown_mode():
+    """지원하지 않는 모드는 거부한다"""
+    with pytest.raises(ValueError):
+        AnalysisRerunPolicy(mode="sometimes")
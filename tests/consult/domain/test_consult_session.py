@@ -215,3 +215,39 @@ def test_is_completed_returns_true_when_5_turns_reached():
 
     # When & Then: 완료됨
     assert session.is_completed() is True
+
+
+def test_snapshot_is_not_affected_by_later_messages():
+    """snapshot 이후에 추가한 메시지는 사본에 반영되지 않는다"""
+    from app.consult.domain.message import Message
+
+    session = ConsultSession(id="session-1", user_id="user-1", mbti=MBTI("INTJ"), gender=Gender("MALE"))
+    session.add_message(Message(role="user", content="질문"))
+
+    snapshot = session.snapshot()
+    session.add_message(Message(role="assistant", content="답변"))
+
+    assert [m.role for m in snapshot.get_messages()] == ["user"]
+    assert snapshot.id == session.id
+
+
+def test_update_context_summary_extends_summarized_range():
+    """누적 요약은 앞에서부터 요약한 메시지 수와 함께 갱신되고, 범위를 줄일 수는 없다"""
+    from app.consult.domain.message import Message
+
+    # Given: 메시지 4개가 있는 세션
+    session = ConsultSession(id="session-1", user_id="user-1", mbti=MBTI("INTJ"), gender=Gender("MALE"))
+    for i in range(4):
+        session.add_message(Message(role="user" if i % 2 == 0 else "assistant", content=f"메시지 {i}"))
+
+    # When
+    session.update_context_summary("요약", 2)
+
+    # Then
+    assert session.get_context_summary() == "요약"
+    assert session.get_summarized_count() == 2
+    assert session.snapshot().get_summarized_count() == 2
+    with pytest.raises(ValueError):
+        session.update_context_summary("요약", 1)
+    with pytest.raises(ValueError):
+        session.update_context_summary("요약", 5)
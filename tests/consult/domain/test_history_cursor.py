@@ -0,0 +1,30 @@
+import pytest
+from datetime import datetime
+
+from app.consult.domain.consult_summary import ConsultSummary
+from app.consult.domain.history_cursor import HistoryCursor
+
+
+def test_cursor_round_trips_through_token():
+    """encode한 토큰을 decode하면 같은 커서가 된다"""
+    cursor = HistoryCursor(created_at=datetime(2025, 3, 1, 9, 30, 15, 123456), id="session-1")
+
+    assert HistoryCursor.decode(cursor.encode()) == cursor
+
+
+def test_decode_rejects_malformed_token():
+    """형식이 잘못된 토큰은 ValueError"""
+    with pytest.raises(ValueError):
+        HistoryCursor.decode("not-a-cursor")
+
+
+def test_summarize_truncates_situation():
+    """요약은 상황 분석 앞부분을 한 줄로 잘라 만든다"""
+    analysis = {"situation": "첫 줄\n둘째 줄 " + "가" * 200}
+
+    summary = ConsultSummary.summarize(analysis, max_chars=20)
+
+    assert len(summary) == 20
+    assert summary.startswith("첫 줄 둘째 줄")
+    assert summary.endswith("…")
+    assert ConsultSummary.summarize(None) is None
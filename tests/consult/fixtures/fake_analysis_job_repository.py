@@ -0,0 +1,65 @@
+from datetime import datetime
+
+from app.consult.application.port.analysis_job_repository_port import AnalysisJobRepositoryPort
+from app.consult.domain.analysis_job import AnalysisJob
+from tests.consult.fixtures.fake_consult_repository import FakeConsultRepository
+
+
+class FakeAnalysisJobRepository(AnalysisJobRepositoryPort):
+    """테스트용 Fake 분석 작업 저장소"""
+
+    def __init__(self, consult_repository: FakeConsultRepository | None = None):
+        self._jobs: dict[str, AnalysisJob] = {}
+        # find_orphaned_session_ids가 세션 테이블을 조회하는 것을 흉내 내기 위한 Fake 상담 저장소
+        self._consults = consult_repository
+
+    def create_if_absent(self, session_id: str) -> AnalysisJob:
+        if session_id not in self._jobs:
+            self._jobs[session_id] = AnalysisJob(session_id=session_id)
+        return self._copy(self._jobs[session_id])
+
+    def find_by_session_id(self, session_id: str) -> AnalysisJob | None:
+        job = self._jobs.get(session_id)
+        return self._copy(job) if job else None
+
+    def find_unfinished(self) -> list[AnalysisJob]:
+        return [self._copy(job) for job in self._jobs.values() if not job.is_finished()]
+
+    def find_orphaned_session_ids(self, since: datetime, limit: int) -> list[str]:
+        if self._consults is None:
+            return []
+        return [
+            session.id for session in self._consults._sessions.values()
+            if session.is_completed() and session.get_analysis() is None
+            and session.created_at >= since and session.id not in self._jobs
+        ][:limit]
+
+    def claim(self, job_id: str, stale_before: datetime) -> bool:
+        for job in self._jobs.values():
+            if job.id != job_id:
+                continue
+            stale = job.status == AnalysisJob.RUNNING and job.updated_at < stale_before
+            if job.status == AnalysisJob.PENDING or stale:
+                job.status = AnalysisJob.RUNNING
+                job.attempts += 1
+                job.updated_at = datetime.now()
+                return True
+        return False
+
+    def update(self, job: AnalysisJob) -> None:
+        self._jobs[job.session_id] = self._copy(job)
+
+    def save(self, job: AnalysisJob) -> None:
+        """테스트 준비용: 작업을 그대로 저장한다"""
+        self._jobs[job.session_id] = job
+
+    def _copy(self, job: AnalysisJob) -> AnalysisJob:
+        return AnalysisJob(
+            id=job.id,
+            session_id=job.session_id,
+            status=job.status,
+            attempts=job.attempts,
+            error=job.error,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+        )
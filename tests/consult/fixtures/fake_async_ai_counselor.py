@@ -0,0 +1,36 @@
+from typing import AsyncIterator
+
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.analysis import Analysis
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+
+class FakeAsyncAICounselor(AsyncAICounselorPort):
+    """테스트용 Fake 비동기 AI 상담사"""
+
+    def __init__(self, response: str = "AI 응답입니다"):
+        self._response = response
+        self._analysis = Analysis(
+            situation="테스트 상황 분석",
+            traits="테스트 특성 분석",
+            solutions="테스트 해결책",
+            cautions="테스트 주의사항"
+        )
+
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        """간단한 고정 인사말을 반환한다"""
+        return f"안녕! {mbti.value} 유형이구나. 어떤 관계 고민이 있어?"
+
+    async def generate_response(self, session: ConsultSession, user_message: str) -> str:
+        return self._response
+
+    async def generate_response_stream(self, session: ConsultSession, user_message: str) -> AsyncIterator[str]:
+        """스트리밍 응답을 생성한다 (테스트용: 한 글자씩)"""
+        for char in self._response:
+            yield char
+
+    async def generate_analysis(self, session: ConsultSession) -> Analysis:
+        """테스트용 고정 분석 결과를 반환한다"""
+        return self._analysis
@@ -1,5 +1,7 @@
 from app.consult.application.port.consult_repository_port import ConsultRepositoryPort
 from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.consult_summary import ConsultSummary
+from app.consult.domain.history_cursor import HistoryCursor
 
 
 class FakeConsultRepository(ConsultRepositoryPort):
@@ -19,3 +21,33 @@ class FakeConsultRepository(ConsultRepositoryPort):
             session for session in self._sessions.values()
             if session.user_id == user_id and session.is_completed()
         ]
+
+    def find_completed_page(
+        self,
+        user_id: str,
+        limit: int,
+        after: HistoryCursor | None = None,
+    ) -> tuple[list[ConsultSummary], HistoryCursor | None]:
+        sessions = sorted(
+            self.find_completed_by_user_id(user_id),
+            key=lambda session: (session.created_at, session.id),
+            reverse=True,
+        )
+        if after is not None:
+            sessions = [s for s in sessions if (s.created_at, s.id) < (after.created_at, after.id)]
+
+        page = sessions[:limit]
+        next_cursor = None
+        if len(sessions) > limit:
+            next_cursor = HistoryCursor(created_at=page[-1].created_at, id=page[-1].id)
+        summaries = [
+            ConsultSummary(
+                id=s.id,
+                created_at=s.created_at,
+                mbti=s.mbti,
+                gender=s.gender,
+                summary=ConsultSummary.summarize(s.get_analysis()),
+            )
+            for s in page
+        ]
+        return summaries, next_cursor
@@ -0,0 +1,37 @@
+from app.consult.application.port.greeting_pool_port import GreetingPoolPort
+from app.consult.domain.pooled_greeting import PooledGreeting
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+
+class FakeGreetingPool(GreetingPoolPort):
+    """테스트용 Fake 인사말 풀"""
+
+    def __init__(self):
+        self._greetings: dict[str, PooledGreeting] = {}
+        self._refill_claims: set[tuple[str, str]] = set()
+
+    def find_by_profile(self, mbti: MBTI, gender: Gender) -> list[PooledGreeting]:
+        return [
+            greeting for greeting in self._greetings.values()
+            if greeting.mbti.value == mbti.value and greeting.gender.value == gender.value
+        ]
+
+    def add(self, greeting: PooledGreeting) -> None:
+        self._greetings[greeting.id] = greeting
+
+    def mark_used(self, greeting_id: str) -> None:
+        self._greetings[greeting_id].use_count += 1
+
+    def delete(self, greeting_id: str) -> None:
+        self._greetings.pop(greeting_id, None)
+
+    def try_claim_refill(self, mbti: MBTI, gender: Gender, lease_seconds: int) -> bool:
+        key = (mbti.value, gender.value)
+        if key in self._refill_claims:
+            return False
+        self._refill_claims.add(key)
+        return True
+
+    def release_refill(self, mbti: MBTI, gender: Gender) -> None:
+        self._refill_claims.discard((mbti.value, gender.value))
@@ -0,0 +1,188 @@
+import asyncio
+from contextlib import nullcontext
+
+from app.consult.domain.analysis_job import AnalysisJob
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.queue.async_analysis_job_queue import AsyncAnalysisJobQueue
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from tests.consult.fixtures.fake_analysis_job_repository import FakeAnalysisJobRepository
+from tests.consult.fixtures.fake_async_ai_counselor import FakeAsyncAICounselor
+from tests.consult.fixtures.fake_consult_repository import FakeConsultRepository
+
+
+class CountingAnalysisCounselor(FakeAsyncAICounselor):
+    """분석 생성 횟수를 세고, 지정한 횟수만큼 실패하는 Fake 상담사"""
+
+    def __init__(self, failures: int = 0):
+        super().__init__()
+        self.analysis_calls = 0
+        self._failures = failures
+
+    async def generate_analysis(self, session):
+        self.analysis_calls += 1
+        if self.analysis_calls <= self._failures:
+            raise RuntimeError("LLM 오류")
+        return await super().generate_analysis(session)
+
+
+def _completed_session(session_id: str = "session-1") -> ConsultSession:
+    session = ConsultSession(id=session_id, user_id="user-1", mbti=MBTI("INTJ"), gender=Gender("MALE"))
+    for i in range(5):
+        session.add_message(Message(role="user", content=f"질문 {i}"))
+        session.add_message(Message(role="assistant", content=f"답변 {i}"))
+    return session
+
+
+def _queue(jobs, consults, counselor, **kwargs) -> AsyncAnalysisJobQueue:
+    return AsyncAnalysisJobQueue(
+        lambda: nullcontext(jobs),
+        lambda: nullcontext(consults),
+        counselor,
+        retry_delay_seconds=0,
+        **kwargs,
+    )
+
+
+def test_enqueued_job_saves_analysis_and_completes():
+    """등록한 작업은 분석을 생성해 세션에 저장하고 done이 된다"""
+    # Given
+    jobs, consults = FakeAnalysisJobRepository(), FakeConsultRepository()
+    consults.save(_completed_session())
+    queue = _queue(jobs, consults, CountingAnalysisCounselor())
+
+    async def scenario():
+        await queue.start()
+        job = await queue.enqueue("session-1")
+        await queue.join()
+        await queue.stop()
+        return job
+
+    # When
+    job = asyncio.run(scenario())
+
+    # Then
+    assert job.status == AnalysisJob.PENDING
+    assert jobs.find_by_session_id("session-1").status == AnalysisJob.DONE
+    assert consults.find_by_id("session-1").get_analysis()["situation"] == "테스트 상황 분석"
+
+
+def test_enqueue_is_idempotent_per_session():
+    """같은 세션을 여러 번 등록해도 작업은 하나이고 분석은 한 번만 생성된다"""
+    # Given
+    jobs, consults = FakeAnalysisJobRepository(), FakeConsultRepository()
+    consults.save(_completed_session())
+    counselor = CountingAnalysisCounselor()
+    queue = _queue(jobs, consults, counselor)
+
+    async def scenario():
+        await queue.start()
+        first = await queue.enqueue("session-1")
+        second = await queue.enqueue("session-1")
+        await queue.join()
+        third = await queue.enqueue("session-1")
+        await queue.join()
+        await queue.stop()
+        return first, second, third
+
+    # When
+    first, second, third = asyncio.run(scenario())
+
+    # Then
+    assert first.id == second.id == third.id
+    assert counselor.analysis_calls == 1
+
+
+def test_unfinished_jobs_resume_on_start():
+    """재시작 시 DB에 남은 pending 작업을 이어서 처리한다"""
+    # Given: 이전 프로세스가 등록만 하고 끝난 작업
+    jobs, consults = FakeAnalysisJobRepository(), FakeConsultRepository()
+    consults.save(_completed_session())
+    jobs.create_if_absent("session-1")
+    queue = _queue(jobs, consults, CountingAnalysisCounselor())
+
+    async def scenario():
+        await queue.start()
+        await queue.join()
+        await queue.stop()
+
+    # When
+    asyncio.run(scenario())
+
+    # Then
+    assert jobs.find_by_session_id("session-1").status == AnalysisJob.DONE
+
+
+def test_completed_session_without_job_is_recovered_on_start():
+    """세션 완료 저장 뒤 작업 등록 전에 죽었으면, 재시작 시 작업을 만들어 분석한다"""
+    # Given: 완료 저장만 되고 작업 행이 없는 세션과, 이미 분석이 있는 세션
+    consults = FakeConsultRepository()
+    jobs = FakeAnalysisJobRepository(consult_repository=consults)
+    consults.save(_completed_session("session-orphan"))
+    analyzed = _completed_session("session-analyzed")
+    analyzed.complete_with_analysis({"situation": "상황", "traits": "특성", "solutions": "해결책", "cautions": "주의"})
+    consults.save(analyzed)
+    counselor = CountingAnalysisCounselor()
+    queue = _queue(jobs, consults, counselor)
+
+    async def scenario():
+        await queue.start()
+        await queue.join()
+        await queue.stop()
+
+    # When
+    asyncio.run(scenario())
+
+    # Then
+    assert jobs.find_by_session_id("session-orphan").status == AnalysisJob.DONE
+    assert consults.find_by_id("session-orphan").get_analysis() is not None
+    assert jobs.find_by_session_id("session-analyzed") is None
+    assert counselor.analysis_calls == 1
+
+
+def test_failed_job_is_retried_then_marked_failed():
+    """실패한 작업은 max_attempts까지 재시도하고, 그래도 실패하면 failed로 남긴다"""
+    # Given
+    jobs, consults = FakeAnalysisJobRepository(), FakeConsultRepository()
+    consults.save(_completed_session("session-ok"))
+    consults.save(_completed_session("session-fail"))
+    retried = CountingAnalysisCounselor(failures=1)
+    always_failing = CountingAnalysisCounselor(failures=99)
+
+    async def run(counselor, session_id):
+        queue = _queue(jobs, consults, counselor, max_attempts=2)
+        await queue.start()
+        await queue.enqueue(session_id)
+        for _ in range(20):
+            if jobs.find_by_session_id(session_id).is_finished():
+                break
+            await asyncio.sleep(0.01)
+        await queue.stop()
+
+    # When
+    asyncio.run(run(retried, "session-ok"))
+    asyncio.run(run(always_failing, "session-fail"))
+
+    # Then
+    assert jobs.find_by_session_id("session-ok").status == AnalysisJob.DONE
+    failed = jobs.find_by_session_id("session-fail")
+    assert failed.status == AnalysisJob.FAILED
+    assert failed.attempts == 2
+    # 업스트림 예외 메시지 대신 고정된 오류 코드를 저장한다
+    assert failed.error == AnalysisJob.ERROR_ANALYSIS_FAILED
+
+
+def test_wait_removes_event_after_last_waiter():
+    """기다리던 요청이 모두 끝나면 (timeout이어도) 세션 이벤트를 지운다"""
+    # Given
+    queue = _queue(FakeAnalysisJobRepository(), FakeConsultRepository(), CountingAnalysisCounselor())
+
+    async def scenario():
+        await asyncio.gather(queue.wait("session-1", 0.01), queue.wait("session-1", 0.02))
+
+    # When
+    asyncio.run(scenario())
+
+    # Then
+    assert queue._events == {}
@@ -0,0 +1,181 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from app.consult.domain.consult_session import ConsultSession
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+
+def _completion(content: str) -> Mock:
+    return Mock(choices=[Mock(message=Mock(content=content))])
+
+
+def test_generate_response_awaits_async_client():
+    """AsyncOpenAI 클라이언트를 await하여 응답을 생성한다"""
+    from app.consult.infrastructure.service.async_openai_counselor_adapter import (
+        AsyncOpenAICounselorAdapter,
+    )
+
+    # Given
+    mock_client = Mock()
+    mock_client.chat.completions.create = AsyncMock(return_value=_completion("  반가워!  "))
+    adapter = AsyncOpenAICounselorAdapter(client=mock_client)
+    session = ConsultSession(id="s-1", user_id="u-1", mbti=MBTI("INFP"), gender=Gender("FEMALE"))
+
+    # When
+    result = asyncio.run(adapter.generate_response(session, "안녕"))
+
+    # Then
+    assert result == "반가워!"
+    mock_client.chat.completions.create.assert_awaited_once()
+
+
+def test_generate_analysis_parses_json():
+    """분석 JSON 응답을 Analysis로 변환한다 (list 값은 번호 목록 문자열로)"""
+    from app.consult.infrastructure.service.async_openai_counselor_adapter import (
+        AsyncOpenAICounselorAdapter,
+    )
+
+    # Given
+    mock_client = Mock()
+    mock_client.chat.completions.create = AsyncMock(return_value=_completion(
+        '{"situation": "상황", "traits": "특성", "solutions": ["첫째", "둘째"], "cautions": "주의"}'
+    ))
+    adapter = AsyncOpenAICounselorAdapter(client=mock_client)
+    session = ConsultSession(id="s-1", user_id="u-1", mbti=MBTI("INFP"), gender=Gender("FEMALE"))
+
+    # When
+    analysis = asyncio.run(adapter.generate_analysis(session))
+
+    # Then
+    assert analysis.situation == "상황"
+    assert analysis.solutions == "1. 첫째\n2. 둘째"
+
+
+def test_generate_response_refreshes_context_summary_before_reply():
+    """컨텍스트 관리자가 있으면 밀려난 턴을 먼저 요약하고 요약이 담긴 프롬프트로 응답한다"""
+    from app.consult.domain.message import Message
+    from app.consult.infrastructure.service.async_openai_counselor_adapter import (
+        AsyncOpenAICounselorAdapter,
+    )
+    from app.consult.infrastructure.service.conversation_context_manager import ConversationContextManager
+
+    # Given: 최근 1턴만 그대로 보내는 설정과 3턴 진행한 세션
+    mock_client = Mock()
+    mock_client.chat.completions.create = AsyncMock(side_effect=[_completion("앞선 대화 요약"), _completion("응답")])
+    adapter = AsyncOpenAICounselorAdapter(
+        client=mock_client,
+        context=ConversationContextManager(keep_recent_turns=1, summary_batch_turns=1),
+    )
+    session = ConsultSession(id="s-1", user_id="u-1", mbti=MBTI("INFP"), gender=Gender("FEMALE"))
+    for i in range(3):
+        session.add_message(Message(role="user", content=f"질문 {i}"))
+        session.add_message(Message(role="assistant", content=f"답변 {i}"))
+    session.add_message(Message(role="user", content="새 질문"))
+
+    # When
+    result = asyncio.run(adapter.generate_response(session, "새 질문"))
+
+    # Then
+    assert result == "응답"
+    assert session.get_context_summary() == "앞선 대화 요약"
+    assert session.get_summarized_count() == 6
+    reply_messages = mock_client.chat.completions.create.await_args_list[1].kwargs["messages"]
+    assert [m["content"] for m in reply_messages[1:-1]] == ["지금까지의 상담 요약:\n앞선 대화 요약", "새 질문"]
+
+
+def test_generate_response_continues_when_summary_fails():
+    """요약 호출이 실패해도 요약 없이 전체 대화로 응답한다"""
+    from app.consult.domain.message import Message
+    from app.consult.infrastructure.service.async_openai_counselor_adapter import (
+        AsyncOpenAICounselorAdapter,
+    )
+    from app.consult.infrastructure.service.conversation_context_manager import ConversationContextManager
+
+    mock_client = Mock()
+    mock_client.chat.completions.create = AsyncMock(side_effect=[RuntimeError("timeout"), _completion("응답")])
+    adapter = AsyncOpenAICounselorAdapter(
+        client=mock_client,
+        context=ConversationContextManager(keep_recent_turns=1, summary_batch_turns=1),
+    )
+    session = ConsultSession(id="s-1", user_id="u-1", mbti=MBTI("INFP"), gender=Gender("FEMALE"))
+    session.add_message(Message(role="user", content="질문"))
+    session.add_message(Message(role="assistant", content="답변"))
+    session.add_message(Message(role="user", content="새 질문"))
+
+    result = asyncio.run(adapter.generate_response(session, "새 질문"))
+
+    assert result == "응답"
+    assert session.get_summarized_count() == 0
+    reply_messages = mock_client.chat.completions.create.await_args_list[1].kwargs["messages"]
+    assert len(reply_messages) == 5
+
+
+def test_generate_response_uses_assigned_prompt_version():
+    """사용자에게 배정된 프롬프트 버전으로 요청하고, 버전별 토큰 수와 시작 세션을 센다"""
+    from prometheus_client import REGISTRY
+
+    from app.consult.infrastructure.service.async_openai_counselor_adapter import (
+        AsyncOpenAICounselorAdapter,
+    )
+    from app.consult.domain.message import Message
+    from app.consult.infrastructure.service.counselor_prompt_builder import CounselorPromptBuilder
+    from app.consult.infrastructure.service.counselor_prompt_templates import (
+        COUNSELOR_PROMPT_V1,
+        COUNSELOR_PROMPT_V2,
+    )
+    from app.shared.llm.prompt_registry import PromptRegistry
+
+    # Given: 모든 사용자를 v2에 배정하는 레지스트리
+    registry = PromptRegistry(
+        "test.consult",
+        {"v1": CounselorPromptBuilder(COUNSELOR_PROMPT_V1), "v2": CounselorPromptBuilder(COUNSELOR_PROMPT_V2)},
+        {"v2": 1},
+    )
+    completion = _completion("응답")
+    completion.usage = Mock(prompt_tokens=120, completion_tokens=30, prompt_tokens_details=None)
+    mock_client = Mock()
+    mock_client.chat.completions.create = AsyncMock(return_value=completion)
+    adapter = AsyncOpenAICounselorAdapter(client=mock_client, prompts=registry)
+    session = ConsultSession(id="s-1", user_id="u-1", mbti=MBTI("INFP"), gender=Gender("FEMALE"))
+    session.add_message(Message(role="user", content="안녕"))
+    token_labels = {"call_site": "consult.generate_response", "prompt_version": "test.consult:v2", "kind": "prompt"}
+    stage_labels = {"prompt": "test.consult", "version": "v2", "stage": "started"}
+    tokens_before = REGISTRY.get_sample_value("llm_prompt_tokens_total", token_labels) or 0.0
+    started_before = REGISTRY.get_sample_value("prompt_variant_sessions_total", stage_labels) or 0.0
+
+    # When
+    asyncio.run(adapter.generate_response(session, "안녕"))
+
+    # Then
+    messages = mock_client.chat.completions.create.await_args.kwargs["messages"]
+    assert messages[0] == registry.get("v2").prompts.build_prefix_message(session)
+    assert messages[-1]["content"] == COUNSELOR_PROMPT_V2.strategies[0]
+    assert REGISTRY.get_sample_value("llm_prompt_tokens_total", token_labels) == tokens_before + 120
+    assert REGISTRY.get_sample_value("prompt_variant_sessions_total", stage_labels) == started_before + 1
+
+
+def test_prompt_cache_key_is_scoped_to_prompt_version_not_session():
+    """prompt_cache_key는 세션이 아니라 프롬프트 버전과 용도로 정해져 세션끼리 캐시를 나눠 쓴다"""
+    from app.consult.infrastructure.service.async_openai_counselor_adapter import (
+        AsyncOpenAICounselorAdapter,
+    )
+    from app.consult.infrastructure.service.counselor_prompt_builder import CounselorPromptBuilder
+    from app.consult.infrastructure.service.counselor_prompt_templates import COUNSELOR_PROMPT_V2
+    from app.shared.llm.prompt_registry import PromptRegistry
+
+    # Given
+    registry = PromptRegistry("test.cache", {"v2": CounselorPromptBuilder(COUNSELOR_PROMPT_V2)}, {"v2": 1})
+    mock_client = Mock()
+    mock_client.chat.completions.create = AsyncMock(return_value=_completion("응답"))
+    adapter = AsyncOpenAICounselorAdapter(client=mock_client, prompts=registry)
+    first = ConsultSession(id="s-1", user_id="u-1", mbti=MBTI("INFP"), gender=Gender("FEMALE"))
+    second = ConsultSession(id="s-2", user_id="u-2", mbti=MBTI("ESTJ"), gender=Gender("MALE"))
+
+    # When
+    asyncio.run(adapter.generate_response(first, "안녕"))
+    asyncio.run(adapter.generate_response(second, "안녕"))
+
+    # Then
+    keys = [call.kwargs["prompt_cache_key"] for call in mock_client.chat.completions.create.await_args_list]
+    assert keys == ["test.cache:v2:response", "test.cache:v2:response"]
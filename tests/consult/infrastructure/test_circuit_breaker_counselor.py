@@ -0,0 +1,113 @@
+import asyncio
+from unittest.mock import Mock
+
+import openai
+import pytest
+
+from app.consult.domain.analysis import AnalysisDeferredError
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.infrastructure.service.circuit_breaker_counselor import CircuitBreakerCounselor
+from app.shared.llm.circuit_breaker import OPEN, CircuitBreaker, CircuitBreakerConfig, CircuitOpenError
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from tests.consult.fixtures.fake_async_ai_counselor import FakeAsyncAICounselor
+
+
+class FailingStreamCounselor(FakeAsyncAICounselor):
+    """첫 청크 전에 업스트림 오류를 내는 Fake 상담사"""
+
+    async def generate_response_stream(self, session, user_message):
+        raise openai.InternalServerError("error", response=Mock(status_code=503, headers={}), body=None)
+        yield
+
+
+def _session() -> ConsultSession:
+    return ConsultSession(id="session-1", user_id="user-1", mbti=MBTI("ENFP"), gender=Gender("FEMALE"))
+
+
+def _breaker(name: str, **config) -> CircuitBreaker:
+    return CircuitBreaker(name, CircuitBreakerConfig(min_calls=1, **config))
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    breaker.acquire()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+
+def test_greeting_falls_back_to_template_when_open():
+    """회로가 열려 있으면 MBTI 템플릿 인사말을 바로 돌려준다"""
+    # Given
+    breaker = _breaker("test.counselor.greeting")
+    _open(breaker)
+    counselor = CircuitBreakerCounselor(FakeAsyncAICounselor(), breaker)
+
+    # When
+    greeting = asyncio.run(counselor.generate_greeting(MBTI("ENFP"), Gender("FEMALE")))
+
+    # Then
+    assert "ENFP" in greeting
+    assert greeting.startswith("안녕!")
+
+
+def test_greeting_passes_through_when_closed():
+    """닫혀 있으면 감싼 상담사의 인사말을 그대로 돌려준다"""
+    counselor = CircuitBreakerCounselor(FakeAsyncAICounselor(), _breaker("test.counselor.closed"))
+
+    greeting = asyncio.run(counselor.generate_greeting(MBTI("INTJ"), Gender("MALE")))
+
+    assert greeting == "안녕! INTJ 유형이구나. 어떤 관계 고민이 있어?"
+
+
+def test_analysis_is_deferred_when_open():
+    """회로가 열려 있으면 분석을 AnalysisDeferredError로 미룬다"""
+    breaker = _breaker("test.counselor.analysis", open_seconds=30)
+    _open(breaker)
+    counselor = CircuitBreakerCounselor(FakeAsyncAICounselor(), breaker)
+
+    with pytest.raises(AnalysisDeferredError) as error:
+        asyncio.run(counselor.generate_analysis(_session()))
+
+    assert error.value.retry_after >= 1
+
+
+def test_stream_is_rejected_before_iteration_when_open():
+    """스트림은 응답을 시작하기 전(호출 시점)에 거절된다"""
+    breaker = _breaker("test.counselor.stream")
+    _open(breaker)
+    counselor = CircuitBreakerCounselor(FakeAsyncAICounselor(), breaker)
+
+    with pytest.raises(CircuitOpenError):
+        counselor.generate_response_stream(_session(), "안녕")
+
+
+def test_stream_failure_before_first_chunk_opens_circuit():
+    """첫 청크 전에 업스트림이 실패하면 실패로 기록한다"""
+    breaker = _breaker("test.counselor.stream_failure")
+    counselor = CircuitBreakerCounselor(FailingStreamCounselor(), breaker)
+
+    async def consume():
+        return [chunk async for chunk in counselor.generate_response_stream(_session(), "안녕")]
+
+    with pytest.raises(openai.InternalServerError):
+        asyncio.run(consume())
+
+    assert breaker.state == OPEN
+
+
+def test_stream_that_is_never_iterated_does_not_hold_probe_slot():
+    """만들기만 하고 순회하지 않은 스트림(본문 시작 전 연결 종료 등)은 half_open 시험 호출 자리를 잡지 않는다"""
+    now = [0.0]
+    breaker = CircuitBreaker(
+        "test.counselor.stream_unstarted",
+        CircuitBreakerConfig(min_calls=1, open_seconds=30, half_open_calls=1),
+        clock=lambda: now[0],
+    )
+    _open(breaker)
+    now[0] += 30
+    counselor = CircuitBreakerCounselor(FakeAsyncAICounselor(response="응답"), breaker)
+
+    for _ in range(3):
+        counselor.generate_response_stream(_session(), "안녕")
+
+    assert asyncio.run(counselor.generate_response(_session(), "안녕")) == "응답"
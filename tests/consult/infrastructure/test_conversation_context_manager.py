@@ -0,0 +1,129 @@
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.service.conversation_context_manager import ConversationContextManager
+from app.shared.llm.token_estimator import estimate_message_tokens
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+
+def _session(turns: int) -> ConsultSession:
+    """인사말 뒤에 turns턴(사용자+상담사)을 진행한 세션"""
+    session = ConsultSession(id="s-1", user_id="u-1", mbti=MBTI("ENFP"), gender=Gender("FEMALE"))
+    session.add_message(Message(role="assistant", content="안녕! 어떤 고민이 있어?"))
+    for i in range(turns):
+        session.add_message(Message(role="user", content=f"질문 {i+1} " + "고민 " * 30))
+        session.add_message(Message(role="assistant", content=f"답변 {i+1} " + "공감 " * 30))
+    return session
+
+
+def _take_turn(manager: ConversationContextManager, session: ConsultSession, turn: int) -> list[dict]:
+    """유스케이스처럼 사용자 메시지를 추가하고, 필요하면 요약을 갱신한 뒤 프롬프트를 만든다"""
+    content = f"질문 {turn} " + "고민 " * 30
+    session.add_message(Message(role="user", content=content))
+    pending = manager.pending_summary(session)
+    if pending:
+        manager.apply_summary(session, f"요약 ~{turn}턴", pending)
+    messages = manager.build_response_messages(session, content)
+    session.add_message(Message(role="assistant", content=f"답변 {turn} " + "공감 " * 30))
+    return messages
+
+
+def test_short_session_sends_full_history_without_duplicating_user_message():
+    """최근 턴 범위 안의 대화는 요약 없이 그대로 보내고, 사용자 메시지를 두 번 넣지 않는다"""
+    # Given
+    manager = ConversationContextManager(keep_recent_turns=4)
+    session = _session(turns=2)
+    session.add_message(Message(role="user", content="새 질문"))
+
+    # When
+    pending = manager.pending_summary(session)
+    messages = manager.build_response_messages(session, "새 질문")
+
+    # Then
+    assert pending == []
+    assert len(messages) == 2 + len(session.get_messages())
+    assert [m["content"] for m in messages].count("새 질문") == 1
+
+
+def test_old_turns_are_folded_into_summary_in_batches():
+    """최근 턴 밖으로 밀려난 메시지가 배치만큼 쌓이면 요약 대상이 된다"""
+    # Given
+    manager = ConversationContextManager(keep_recent_turns=2, summary_batch_turns=2)
+    session = _session(turns=4)
+    session.add_message(Message(role="user", content="새 질문"))
+
+    # When
+    pending = manager.pending_summary(session)
+    manager.apply_summary(session, "앞선 대화 요약", pending)
+    messages = manager.build_response_messages(session, "새 질문")
+
+    # Then: 인사말 + 1~3턴이 요약되고 4턴, 5턴 질문만 그대로 남는다
+    assert len(pending) == 7
+    assert session.get_summarized_count() == 7
+    assert messages[1] == {"role": "system", "content": "지금까지의 상담 요약:\n앞선 대화 요약"}
+    assert [m["content"] for m in messages[2:]][0].startswith("질문 4")
+    assert messages[-2]["content"] == "새 질문"
+
+
+def test_prompt_size_stays_bounded_over_long_session():
+    """20턴 대화에서도 프롬프트 크기가 턴 수에 비례해 늘지 않는다"""
+    manager = ConversationContextManager(token_budget=1500, keep_recent_turns=3, summary_batch_turns=2)
+    session = _session(turns=0)
+
+    sizes = [estimate_message_tokens(_take_turn(manager, session, turn)) for turn in range(1, 21)]
+
+    assert max(sizes) <= 1500
+    assert max(sizes[10:]) <= max(sizes[:10])
+
+
+def test_window_shrinks_when_recent_turns_exceed_budget():
+    """최근 턴만으로도 예산을 넘으면 그대로 보내는 턴 수를 줄인다"""
+    # Given: 예산이 작아 최근 1턴만 그대로 보낼 수 있는 상황
+    manager = ConversationContextManager(token_budget=450, keep_recent_turns=4, summary_batch_turns=10)
+    session = _session(turns=3)
+    session.add_message(Message(role="user", content="새 질문"))
+
+    # When
+    pending = manager.pending_summary(session)
+
+    # Then: 배치가 덜 찼어도 예산 초과라 마지막 질문 이전이 모두 요약 대상이 된다
+    assert len(pending) == len(session.get_messages()) - 1
+
+
+def test_consecutive_turns_share_prompt_prefix():
+    """다음 턴 프롬프트는 이번 턴 프롬프트에서 마지막 전략 메시지만 뺀 앞부분을 그대로 공유한다 (프롬프트 캐시)"""
+    manager = ConversationContextManager(token_budget=100000, keep_recent_turns=10)
+    session = _session(turns=0)
+
+    first = _take_turn(manager, session, 1)
+    second = _take_turn(manager, session, 2)
+
+    assert second[:len(first) - 1] == first[:-1]
+    assert first[-1] != second[-1]
+
+
+def test_refresh_summary_applies_result_and_survives_failure():
+    """refresh_summary는 요약 요청 인자를 넘겨 결과를 반영하고, 요약이 실패하면 세션을 그대로 둔다"""
+    # Given
+    manager = ConversationContextManager(keep_recent_turns=2, summary_batch_turns=2)
+    requests = []
+
+    def summarize(request: dict) -> str:
+        requests.append(request)
+        return "  앞선 대화 요약  "
+
+    def failing_summarize(request: dict) -> str:
+        raise RuntimeError("LLM 오류")
+
+    failed_session = _session(turns=4)
+    session = _session(turns=4)
+
+    # When
+    manager.refresh_summary(failed_session, failing_summarize)
+    manager.refresh_summary(session, summarize)
+
+    # Then
+    assert failed_session.get_summarized_count() == 0
+    assert session.get_context_summary() == "앞선 대화 요약"
+    assert len(requests) == 1
+    assert requests[0]["max_tokens"] == 300
@@ -0,0 +1,87 @@
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.domain.message import Message
+from app.consult.infrastructure.service.counselor_prompt_builder import CounselorPromptBuilder
+from app.consult.infrastructure.service.counselor_prompt_templates import (
+    COUNSELOR_PROMPT_V1,
+    COUNSELOR_PROMPT_V2,
+)
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+
+
+def _session(turns: int, mbti: str = "ENFP") -> ConsultSession:
+    session = ConsultSession(id="s-1", user_id="u-1", mbti=MBTI(mbti), gender=Gender("FEMALE"))
+    for i in range(turns):
+        session.add_message(Message(role="user", content=f"질문 {i}"))
+    return session
+
+
+def test_greeting_prompt_reflects_mbti_guides():
+    """인사말 프롬프트에 MBTI 글자별 가이드가 들어간다"""
+    prompt = CounselorPromptBuilder().build_greeting_prompt(MBTI("ISTJ"), Gender("MALE"))
+
+    assert "- MBTI: ISTJ" in prompt
+    assert "- 성별: MALE" in prompt
+    for letter in "ISTJ":
+        assert COUNSELOR_PROMPT_V1.greeting_guides[letter] in prompt
+
+
+def test_response_messages_put_static_prefix_first_and_strategy_last():
+    """고정 원칙과 사용자 정보가 맨 앞, 턴별 전략이 맨 끝에 온다"""
+    builder = CounselorPromptBuilder()
+    session = _session(2)
+
+    messages = builder.build_response_messages(session, "질문 1")
+
+    assert messages[0]["content"].startswith(COUNSELOR_PROMPT_V1.response_system)
+    assert "- MBTI: ENFP" in messages[0]["content"]
+    assert [m["content"] for m in messages[1:-1]] == ["질문 0", "질문 1"]
+    assert messages[-1] == {"role": "system", "content": COUNSELOR_PROMPT_V1.strategies[1].strip()}
+
+
+def test_static_prefix_is_shared_across_users_and_turns():
+    """응답 프롬프트의 앞부분은 MBTI/턴과 무관하게 같은 글자로 시작한다"""
+    builder = CounselorPromptBuilder()
+
+    prefixes = {
+        builder.build_prefix_message(_session(turns, mbti))["content"][:len(COUNSELOR_PROMPT_V1.response_system)]
+        for turns, mbti in ((1, "ENFP"), (3, "ISTJ"), (5, "INTJ"))
+    }
+
+    assert prefixes == {COUNSELOR_PROMPT_V1.response_system}
+
+
+def test_strategy_for_turn():
+    """턴 수에 맞는 상담 전략을 쓰고, 전략 수를 넘는 턴은 마지막 전략을 쓴다"""
+    builder = CounselorPromptBuilder()
+
+    assert builder.build_strategy_message(_session(2))["content"].startswith("[2턴 - 상대방 탐색]")
+    assert builder.build_strategy_message(_session(7))["content"].startswith("[5턴 - 마무리]")
+    assert builder.get_strategy_by_turn(0) == builder.get_strategy_by_turn(5)
+
+
+def test_precomputed_prompts_are_reused():
+    """같은 MBTI/성별의 프롬프트는 미리 만들어 둔 같은 문자열을 돌려준다"""
+    builder = CounselorPromptBuilder()
+
+    assert builder.build_prefix_message(_session(1))["content"] is builder.build_prefix_message(_session(3))["content"]
+
+
+def test_analysis_instructions_precede_conversation():
+    """분석 지시와 JSON 형식은 system에, 세션마다 다른 대화는 user에 둔다"""
+    messages = CounselorPromptBuilder().build_analysis_messages(_session(2))
+
+    assert '"situation"' in messages[0]["content"]
+    assert messages[1]["content"].endswith("사용자: 질문 1")
+
+
+def test_v2_is_shorter_than_v1():
+    """v2는 같은 정보를 더 짧은 프롬프트로 보낸다"""
+    v1, v2 = CounselorPromptBuilder(COUNSELOR_PROMPT_V1), CounselorPromptBuilder(COUNSELOR_PROMPT_V2)
+
+    for turns in range(1, 6):
+        v1_messages = v1.build_response_messages(_session(turns), f"질문 {turns - 1}")
+        v2_messages = v2.build_response_messages(_session(turns), f"질문 {turns - 1}")
+        assert sum(map(len, (m["content"] for m in v2_messages))) < sum(map(len, (m["content"] for m in v1_messages)))
+        assert v2_messages[-1]["content"].startswith(f"[{turns}턴]")
+    assert v2.version == "v2"
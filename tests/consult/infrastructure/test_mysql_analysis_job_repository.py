@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.consult.domain.analysis_job import AnalysisJob
+from app.consult.infrastructure.model.consult_session_model import ConsultSessionModel
+from app.consult.infrastructure.repository.mysql_analysis_job_repository import MySQLAnalysisJobRepository
+from config.database import Base
+
+
+@pytest.fixture
+def db():
+    """테스트용 인메모리 SQLite 세션"""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def repository(db):
+    return MySQLAnalysisJobRepository(db)
+
+
+def test_create_if_absent_returns_existing_job(repository):
+    """같은 세션으로 다시 등록하면 기존 작업을 반환한다"""
+    first = repository.create_if_absent("session-1")
+    second = repository.create_if_absent("session-1")
+
+    assert first.id == second.id
+    assert [job.id for job in repository.find_unfinished()] == [first.id]
+
+
+def test_claim_is_exclusive(repository):
+    """pending 작업은 한 번만 선점할 수 있다"""
+    job = repository.create_if_absent("session-1")
+    stale_before = datetime.now() - timedelta(minutes=5)
+
+    assert repository.claim(job.id, stale_before) is True
+    assert repository.claim(job.id, stale_before) is False
+
+    claimed = repository.find_by_session_id("session-1")
+    assert claimed.status == AnalysisJob.RUNNING
+    assert claimed.attempts == 1
+
+
+def test_stale_running_job_can_be_reclaimed(repository):
+    """lease가 지난 running 작업은 다시 선점할 수 있다"""
+    job = repository.create_if_absent("session-1")
+    repository.claim(job.id, datetime.now())
+
+    assert repository.claim(job.id, datetime.now() + timedelta(seconds=1)) is True
+    assert repository.find_by_session_id("session-1").attempts == 2
+
+
+def test_finished_job_is_not_unfinished(repository):
+    """done 작업은 재개 대상에서 빠진다"""
+    job = repository.create_if_absent("session-1")
+    job.status = AnalysisJob.DONE
+    repository.update(job)
+
+    assert repository.find_unfinished() == []
+    assert repository.find_by_session_id("session-1").status == AnalysisJob.DONE
+
+
+def test_find_orphaned_session_ids_skips_sessions_with_job_or_analysis(db, repository):
+    """since 이후 완료됐지만 분석 결과도 작업도 없는 세션만 찾는다"""
+    now = datetime.now()
+    for session_id, completed, analysis_json, created_at in [
+        ("session-orphan", True, None, now),
+        ("session-with-job", True, None, now),
+        ("session-analyzed", True, "{}", now),
+        ("session-in-progress", False, None, now),
+        ("session-old-orphan", True, None, now - timedelta(days=2)),
+    ]:
+        db.add(ConsultSessionModel(
+            id=session_id, user_id="user-1", mbti="INTJ", gender="MALE",
+            created_at=created_at, is_completed=completed, analysis_json=analysis_json,
+        ))
+    db.commit()
+    repository.create_if_absent("session-with-job")
+
+    assert repository.find_orphaned_session_ids(since=now - timedelta(days=1), limit=10) == ["session-orphan"]
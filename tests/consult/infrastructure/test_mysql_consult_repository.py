@@ -1,6 +1,6 @@
 import pytest
 from datetime import datetime
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 from app.consult.domain.consult_session import ConsultSession
@@ -190,3 +190,251 @@ def test_message_order_preserved(repository):
     assert len(messages) == 5
     for i, msg in enumerate(messages):
         assert msg.content == f"메시지 {i}"
+
+
+
+def _message_row_ids(db_session, session_id: str) -> list[int]:
+    """세션의 consult_messages 행 id 목록을 seq 순으로 반환한다"""
+    from app.consult.infrastructure.model.consult_message_model import ConsultMessageModel
+
+    return [
+        row.id for row in db_session.query(ConsultMessageModel.id).filter(
+            ConsultMessageModel.session_id == session_id
+        ).order_by(ConsultMessageModel.seq)
+    ]
+
+
+def test_append_only_save_inserts_only_new_messages(repository, db_session):
+    """append-only 모드에서는 새 메시지만 INSERT한다"""
+    # Given: 메시지 2개가 저장된 세션
+    session = ConsultSession(
+        id="session-append",
+        user_id="user-123",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+    )
+    session.add_message(Message(role="user", content="질문 1"))
+    session.add_message(Message(role="assistant", content="답변 1"))
+    repository.save(session)
+    original_ids = _message_row_ids(db_session, "session-append")
+
+    # When: 메시지 2개를 추가하여 다시 저장하면
+    found = repository.find_by_id("session-append")
+    found.add_message(Message(role="user", content="질문 2"))
+    found.add_message(Message(role="assistant", content="답변 2"))
+    repository.save(found)
+
+    # Then: 기존 행은 그대로 두고 새 메시지 2개만 추가된다
+    ids = _message_row_ids(db_session, "session-append")
+    assert ids[:2] == original_ids
+    assert len(ids) == 4
+    messages = repository.find_by_id("session-append").get_messages()
+    assert [m.content for m in messages] == ["질문 1", "답변 1", "질문 2", "답변 2"]
+
+
+def test_append_only_save_assigns_sequence_numbers(repository, db_session):
+    """append-only 저장 시 세션 내 순번(seq)이 0부터 부여된다"""
+    from app.consult.infrastructure.model.consult_message_model import ConsultMessageModel
+
+    # Given: 두 번에 나눠 저장한 세션
+    session = ConsultSession(
+        id="session-seq",
+        user_id="user-123",
+        mbti=MBTI("ENFP"),
+        gender=Gender("FEMALE"),
+    )
+    session.add_message(Message(role="user", content="질문 1"))
+    repository.save(session)
+    session.add_message(Message(role="assistant", content="답변 1"))
+    session.add_message(Message(role="user", content="질문 2"))
+    repository.save(session)
+
+    # Then: seq가 연속으로 부여된다
+    seqs = [
+        m.seq for m in db_session.query(ConsultMessageModel).filter(
+            ConsultMessageModel.session_id == "session-seq"
+        ).order_by(ConsultMessageModel.seq)
+    ]
+    assert seqs == [0, 1, 2]
+
+
+def test_append_only_save_updates_session_metadata(repository, db_session):
+    """append-only 저장 시 완료 여부와 분석 결과가 UPDATE로 반영된다"""
+    # Given: 저장된 세션
+    session = ConsultSession(
+        id="session-meta",
+        user_id="user-123",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+    )
+    session.add_message(Message(role="user", content="질문"))
+    repository.save(session)
+    original_ids = _message_row_ids(db_session, "session-meta")
+
+    # When: 분석 결과와 함께 세션을 완료하고 다시 저장하면
+    session.complete_with_analysis({"situation": "상황"})
+    repository.save(session)
+
+    # Then: 메시지는 다시 쓰지 않고 메타데이터만 갱신된다
+    assert _message_row_ids(db_session, "session-meta") == original_ids
+    found = repository.find_by_id("session-meta")
+    assert found.is_completed() is True
+    assert found.get_analysis() == {"situation": "상황"}
+
+
+def test_full_rewrite_mode_still_supported(db_session):
+    """append_only=False면 기존 방식(전체 삭제 후 재삽입)으로 저장한다"""
+    # Given: 전체 재저장 모드의 저장소
+    repository = MySQLConsultRepository(db_session, append_only=False)
+    session = ConsultSession(
+        id="session-full",
+        user_id="user-123",
+        mbti=MBTI("ISTP"),
+        gender=Gender("MALE"),
+    )
+    session.add_message(Message(role="user", content="질문 1"))
+    repository.save(session)
+
+    statements = []
+    event.listen(
+        db_session.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    # When: 메시지를 추가하여 다시 저장하면
+    session.add_message(Message(role="assistant", content="답변 1"))
+    repository.save(session)
+
+    # Then: 기존 메시지를 삭제하고 다시 쓴다
+    assert any(s.startswith("DELETE FROM consult_messages") for s in statements)
+    messages = repository.find_by_id("session-full").get_messages()
+    assert [m.content for m in messages] == ["질문 1", "답변 1"]
+
+
+def _completed_session(id: str, created_at: datetime, user_id: str = "user-1") -> ConsultSession:
+    session = ConsultSession(id=id, user_id=user_id, mbti=MBTI("INTJ"), gender=Gender("MALE"), created_at=created_at)
+    session.complete_with_analysis({"situation": f"{id} 상황", "traits": "특성", "solutions": "해결책", "cautions": "주의"})
+    return session
+
+
+def test_find_completed_page_walks_pages_with_cursor(repository):
+    """커서로 다음 페이지를 이어 읽으면 (created_at, id) 내림차순으로 빠짐없이 조회된다"""
+    # Given: 같은 created_at을 가진 세션이 섞인 완료 세션 5개와 미완료/다른 사용자 세션
+    same_time = datetime(2025, 1, 2, 12, 0, 0)
+    for id, created_at in [
+        ("s-a", datetime(2025, 1, 1)),
+        ("s-b", same_time),
+        ("s-c", same_time),
+        ("s-d", datetime(2025, 1, 3)),
+        ("s-e", datetime(2025, 1, 4)),
+    ]:
+        repository.save(_completed_session(id, created_at))
+    repository.save(ConsultSession(id="s-open", user_id="user-1", mbti=MBTI("INTJ"), gender=Gender("MALE")))
+    repository.save(_completed_session("s-other", datetime(2025, 1, 5), user_id="user-2"))
+
+    # When
+    first, cursor = repository.find_completed_page("user-1", limit=2)
+    second, cursor2 = repository.find_completed_page("user-1", limit=2, after=cursor)
+    third, cursor3 = repository.find_completed_page("user-1", limit=2, after=cursor2)
+
+    # Then
+    assert [s.id for s in first + second + third] == ["s-e", "s-d", "s-c", "s-b", "s-a"]
+    assert cursor3 is None
+    assert first[0].summary == "s-e 상황"
+
+
+def test_find_completed_page_does_not_read_analysis_json(repository, db_session):
+    """히스토리 페이지 조회는 analysis_json 컬럼을 읽지 않는다"""
+    repository.save(_completed_session("s-a", datetime(2025, 1, 1)))
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+    try:
+        summaries, _ = repository.find_completed_page("user-1", limit=10)
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+
+    assert len(summaries) == 1
+    assert all("analysis_json" not in statement for statement in statements)
+
+
+def test_context_summary_is_persisted(repository):
+    """프롬프트 컨텍스트 요약과 요약 범위가 저장/조회된다"""
+    session = ConsultSession(id="s-ctx", user_id="user-1", mbti=MBTI("INTJ"), gender=Gender("MALE"))
+    session.add_message(Message(role="user", content="질문"))
+    session.add_message(Message(role="assistant", content="답변"))
+    repository.save(session)
+
+    session.update_context_summary("앞선 대화 요약", 2)
+    repository.save(session)
+
+    found = repository.find_by_id("s-ctx")
+    assert found.get_context_summary() == "앞선 대화 요약"
+    assert found.get_summarized_count() == 2
+
+
+def test_append_only_save_retries_when_concurrent_save_took_same_seq(repository, db_session, monkeypatch):
+    """동시 저장이 같은 seq를 먼저 차지하면 최신 max(seq)로 다시 저장한다"""
+    from sqlalchemy import insert
+    from app.consult.infrastructure.model.consult_message_model import ConsultMessageModel
+
+    # Given: 메시지 1개가 저장된 세션
+    session = ConsultSession(
+        id="session-race",
+        user_id="user-123",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+    )
+    session.add_message(Message(role="user", content="질문 1"))
+    repository.save(session)
+    session.add_message(Message(role="assistant", content="답변 1"))
+
+    # 다른 요청이 max(seq)를 읽은 직후 같은 메시지를 먼저 커밋한 상황을 재현한다
+    original_next_seq = repository._next_seq
+    calls = []
+
+    def racing_next_seq(session_id):
+        next_seq = original_next_seq(session_id)
+        if not calls:
+            db_session.execute(insert(ConsultMessageModel), [{
+                "session_id": session_id,
+                "seq": next_seq,
+                "role": "assistant",
+                "content": "답변 1",
+                "created_at": datetime.now(),
+            }])
+        calls.append(next_seq)
+        return next_seq
+
+    monkeypatch.setattr(repository, "_next_seq", racing_next_seq)
+
+    # When: 저장하면 첫 시도는 seq 충돌로 롤백되고 재시도한다
+    repository.save(session)
+
+    # Then: 재시도에서 최신 max(seq)를 읽어 중복 없이 저장된다
+    assert calls == [1, 1]
+    messages = repository.find_by_id("session-race").get_messages()
+    assert [m.content for m in messages] == ["질문 1", "답변 1"]
+
+
+def test_append_only_save_raises_after_retry_limit(repository, monkeypatch):
+    """충돌이 계속되면 재시도 한도 후 IntegrityError를 그대로 던진다"""
+    from sqlalchemy.exc import IntegrityError
+
+    session = ConsultSession(
+        id="session-conflict",
+        user_id="user-123",
+        mbti=MBTI("INTJ"),
+        gender=Gender("MALE"),
+    )
+    session.add_message(Message(role="user", content="질문 1"))
+    repository.save(session)
+    session.add_message(Message(role="assistant", content="답변 1"))
+
+    # 항상 이미 사용된 seq를 돌려준다
+    monkeypatch.setattr(repository, "_next_seq", lambda session_id: 0)
+    session.add_message(Message(role="user", content="질문 2"))
+
+    with pytest.raises(IntegrityError):
+        repository.save(session)
@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.consult.domain.pooled_greeting import PooledGreeting
+from app.consult.infrastructure.model.greeting_pool_model import GreetingPoolModel  # noqa: F401
+from app.consult.infrastructure.model.greeting_pool_refill_model import GreetingPoolRefillModel  # noqa: F401
+from app.consult.infrastructure.repository.mysql_greeting_pool_repository import MySQLGreetingPoolRepository
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from config.database import Base
+
+
+@pytest.fixture
+def repository():
+    """세션 팩토리를 공유하는 인메모리 SQLite 저장소"""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield MySQLGreetingPoolRepository(sessionmaker(bind=engine))
+    engine.dispose()
+
+
+def test_find_by_profile_returns_only_matching_greetings(repository):
+    """MBTI × 성별 조합이 같은 인사말만 조회한다"""
+    repository.add(PooledGreeting(mbti=MBTI("INTJ"), gender=Gender("MALE"), content="INTJ 남성 인사말"))
+    repository.add(PooledGreeting(mbti=MBTI("INTJ"), gender=Gender("FEMALE"), content="INTJ 여성 인사말"))
+
+    greetings = repository.find_by_profile(MBTI("INTJ"), Gender("MALE"))
+
+    assert [g.content for g in greetings] == ["INTJ 남성 인사말"]
+
+
+def test_mark_used_and_delete(repository):
+    """사용 횟수를 올리고, 삭제하면 더 이상 조회되지 않는다"""
+    greeting = PooledGreeting(mbti=MBTI("ENFP"), gender=Gender("FEMALE"), content="안녕!")
+    repository.add(greeting)
+
+    repository.mark_used(greeting.id)
+    repository.mark_used(greeting.id)
+    assert repository.find_by_profile(MBTI("ENFP"), Gender("FEMALE"))[0].use_count == 2
+
+    repository.delete(greeting.id)
+    assert repository.find_by_profile(MBTI("ENFP"), Gender("FEMALE")) == []
+
+
+def test_refill_claim_is_exclusive_until_released_or_expired(repository):
+    """보충 선점은 한 번에 하나만 성공하고, 해제되거나 만료되면 다시 선점할 수 있다"""
+    mbti, gender = MBTI("ISTP"), Gender("MALE")
+
+    assert repository.try_claim_refill(mbti, gender, lease_seconds=60) is True
+    assert repository.try_claim_refill(mbti, gender, lease_seconds=60) is False
+    assert repository.try_claim_refill(MBTI("ISTP"), Gender("FEMALE"), lease_seconds=60) is True
+
+    repository.release_refill(mbti, gender)
+    assert repository.try_claim_refill(mbti, gender, lease_seconds=0) is True
+    # 선점 시간이 0초면 바로 만료된다
+    assert repository.try_claim_refill(mbti, gender, lease_seconds=60) is True
@@ -0,0 +1,143 @@
+import asyncio
+
+from app.consult.domain.pooled_greeting import PooledGreeting
+from app.consult.infrastructure.service.pooled_greeting_counselor import (
+    ALL_PROFILES,
+    PooledGreetingCounselor,
+)
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from tests.consult.fixtures.fake_async_ai_counselor import FakeAsyncAICounselor
+from tests.consult.fixtures.fake_greeting_pool import FakeGreetingPool
+
+
+class CountingCounselor(FakeAsyncAICounselor):
+    """인사말 생성 횟수를 세는 Fake 상담사"""
+
+    def __init__(self):
+        super().__init__()
+        self.greeting_calls = 0
+
+    async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+        self.greeting_calls += 1
+        return f"생성된 인사말 {self.greeting_calls}"
+
+
+def test_greeting_is_served_from_pool_without_llm_call():
+    """풀에 인사말이 있으면 LLM 호출 없이 바로 반환한다"""
+    # Given
+    inner = CountingCounselor()
+    pool = FakeGreetingPool()
+    pool.add(PooledGreeting(mbti=MBTI("INTJ"), gender=Gender("MALE"), content="미리 만든 인사말"))
+    counselor = PooledGreetingCounselor(inner, pool, pool_size=1)
+
+    async def scenario():
+        greeting = await counselor.generate_greeting(MBTI("INTJ"), Gender("MALE"))
+        await counselor.drain()
+        return greeting
+
+    # When
+    greeting = asyncio.run(scenario())
+
+    # Then
+    assert greeting == "미리 만든 인사말"
+    assert inner.greeting_calls == 0
+    assert pool.find_by_profile(MBTI("INTJ"), Gender("MALE"))[0].use_count == 1
+
+
+def test_empty_pool_falls_back_to_live_generation_and_refills():
+    """풀이 비어 있으면 바로 생성해 반환하고, 백그라운드에서 풀을 채운다"""
+    # Given
+    inner = CountingCounselor()
+    pool = FakeGreetingPool()
+    counselor = PooledGreetingCounselor(inner, pool, pool_size=3)
+
+    async def scenario():
+        greeting = await counselor.generate_greeting(MBTI("ENFP"), Gender("FEMALE"))
+        await counselor.drain()
+        return greeting
+
+    # When
+    greeting = asyncio.run(scenario())
+
+    # Then
+    assert greeting.startswith("생성된 인사말")
+    assert len(pool.find_by_profile(MBTI("ENFP"), Gender("FEMALE"))) == 3
+    assert inner.greeting_calls == 4
+
+
+def test_worn_out_greeting_is_rotated():
+    """max_uses에 도달한 인사말은 제거되고 새 인사말로 교체된다"""
+    # Given
+    inner = CountingCounselor()
+    pool = FakeGreetingPool()
+    pool.add(PooledGreeting(mbti=MBTI("ISTJ"), gender=Gender("MALE"), content="오래된 인사말", use_count=2))
+    counselor = PooledGreetingCounselor(inner, pool, pool_size=1, max_uses=3)
+
+    async def scenario():
+        await counselor.generate_greeting(MBTI("ISTJ"), Gender("MALE"))
+        await counselor.drain()
+
+    # When
+    asyncio.run(scenario())
+
+    # Then
+    contents = [g.content for g in pool.find_by_profile(MBTI("ISTJ"), Gender("MALE"))]
+    assert contents == ["생성된 인사말 1"]
+
+
+def test_warm_up_fills_all_profiles():
+    """warm_up은 32개 MBTI × 성별 조합을 모두 채운다"""
+    # Given
+    inner = CountingCounselor()
+    pool = FakeGreetingPool()
+    counselor = PooledGreetingCounselor(inner, pool, pool_size=2)
+
+    # When
+    asyncio.run(counselor.warm_up())
+
+    # Then
+    assert len(ALL_PROFILES) == 32
+    assert all(len(pool.find_by_profile(mbti, gender)) == 2 for mbti, gender in ALL_PROFILES)
+    assert inner.greeting_calls == 64
+
+
+def test_warm_up_in_two_workers_fills_each_profile_once():
+    """워커 두 개가 같은 풀로 동시에 warm_up해도 조합별 보충은 한쪽만 한다"""
+    # Given
+    class SlowCounselor(CountingCounselor):
+        async def generate_greeting(self, mbti: MBTI, gender: Gender) -> str:
+            await asyncio.sleep(0.01)
+            return await super().generate_greeting(mbti, gender)
+
+    pool = FakeGreetingPool()
+    first_inner, second_inner = SlowCounselor(), SlowCounselor()
+    first = PooledGreetingCounselor(first_inner, pool, pool_size=2)
+    second = PooledGreetingCounselor(second_inner, pool, pool_size=2)
+
+    # When
+    async def run():
+        await asyncio.gather(first.warm_up(), second.warm_up())
+
+    asyncio.run(run())
+
+    # Then
+    assert all(len(pool.find_by_profile(mbti, gender)) == 2 for mbti, gender in ALL_PROFILES)
+    assert first_inner.greeting_calls + second_inner.greeting_calls == 64
+
+
+def test_refill_is_skipped_while_another_worker_holds_the_claim():
+    """다른 워커가 조합을 선점 중이면 보충하지 않고, 해제되면 다시 보충한다"""
+    # Given
+    inner = CountingCounselor()
+    pool = FakeGreetingPool()
+    counselor = PooledGreetingCounselor(inner, pool, pool_size=2)
+    mbti, gender = MBTI("INFJ"), Gender("FEMALE")
+    assert pool.try_claim_refill(mbti, gender, lease_seconds=60)
+
+    # When / Then
+    assert asyncio.run(counselor.refill(mbti, gender)) == 0
+    assert inner.greeting_calls == 0
+
+    pool.release_refill(mbti, gender)
+    assert asyncio.run(counselor.refill(mbti, gender)) == 2
@@ -0,0 +1,34 @@
+import asyncio
+
+from app.consult.application.port.async_ai_counselor_port import AsyncAICounselorPort
+from app.consult.domain.consult_session import ConsultSession
+from app.consult.infrastructure.service.threaded_ai_counselor import ThreadedAICounselor
+from app.shared.vo.mbti import MBTI
+from app.shared.vo.gender import Gender
+from tests.consult.fixtures.fake_ai_counselor import FakeAICounselor
+
+
+def _session() -> ConsultSession:
+    return ConsultSession(id="session-1", user_id="user-1", mbti=MBTI("INTJ"), gender=Gender("MALE"))
+
+
+def test_threaded_counselor_implements_async_port():
+    """동기 상담사를 감싸 비동기 포트로 제공한다"""
+    assert isinstance(ThreadedAICounselor(FakeAICounselor()), AsyncAICounselorPort)
+
+
+def test_threaded_counselor_delegates_response():
+    """generate_response를 동기 구현체에 위임한다"""
+    counselor = ThreadedAICounselor(FakeAICounselor(response="응답"))
+
+    assert asyncio.run(counselor.generate_response(_session(), "안녕")) == "응답"
+
+
+def test_threaded_counselor_streams_sync_iterator():
+    """동기 스트림을 비동기 스트림으로 변환한다"""
+    counselor = ThreadedAICounselor(FakeAICounselor(response="안녕"))
+
+    async def collect():
+        return [chunk async for chunk in counselor.generate_response_stream(_session(), "안녕")]
+
+    assert asyncio.run(collect()) == ["안", "녕"]
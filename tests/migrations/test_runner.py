@@ -0,0 +1,162 @@
+import json
+import logging
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from migrations.runner import (
+    SchemaVersionError,
+    check_schema_version,
+    current_version,
+    discover,
+    head_version,
+    upgrade,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'schema.db'}")
+    yield engine
+    engine.dispose()
+
+
+def _columns(engine, table: str) -> set[str]:
+    return {c["name"] for c in inspect(engine).get_columns(table)}
+
+
+def _indexes(engine, table: str) -> set[str]:
+    return {i["name"] for i in inspect(engine).get_indexes(table)}
+
+
+def test_versions_are_numbered_without_gaps():
+    versions = [migration.version for migration in discover()]
+    assert versions == list(range(1, len(versions) + 1))
+    assert head_version() == versions[-1]
+
+
+def test_upgrade_creates_schema_and_records_versions(engine):
+    # When
+    applied = upgrade(engine)
+
+    # Then
+    assert [m.version for m in applied] == [m.version for m in discover()]
+    assert current_version(engine) == head_version()
+    assert {"users", "consult_sessions", "consult_messages", "greeting_pool", "analysis_jobs"} <= set(
+        inspect(engine).get_table_names()
+    )
+    assert {"analysis_summary", "context_summary", "summarized_count"} <= _columns(engine, "consult_sessions")
+    assert "ix_consult_sessions_user_completed_created" in _indexes(engine, "consult_sessions")
+
+
+def test_upgrade_is_noop_when_already_latest(engine):
+    upgrade(engine)
+
+    assert upgrade(engine) == []
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM schema_version")).scalar() == head_version()
+
+
+def test_upgrade_stops_at_target(engine):
+    applied = upgrade(engine, target=2)
+
+    assert [m.version for m in applied] == [1, 2]
+    assert current_version(engine) == 2
+    assert [m.version for m in upgrade(engine)] == list(range(3, head_version() + 1))
+
+
+def test_upgrade_brings_legacy_tables_up_to_date_and_backfills(engine):
+    """버전 관리 이전에 만들어진 테이블(이후 컬럼 없음)도 컬럼 추가와 기존 행 채우기를 한다"""
+    # Given: 초기 create_all로 만들어진 테이블과 기존 데이터
+    analysis = {"situation": "친구와   약속 문제로 다퉜다", "traits": "t", "solutions": "s", "cautions": "c"}
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE consult_sessions (
+                id VARCHAR(36) PRIMARY KEY, user_id VARCHAR(255) NOT NULL, mbti VARCHAR(4) NOT NULL,
+                gender VARCHAR(10) NOT NULL, created_at DATETIME NOT NULL,
+                is_completed BOOLEAN DEFAULT FALSE NOT NULL, analysis_json TEXT NULL
+            )
+        """))
+        conn.execute(text("""
+            CREATE TABLE consult_messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, session_id VARCHAR(36) NOT NULL,
+                role VARCHAR(20) NOT NULL, content TEXT NOT NULL, created_at DATETIME NOT NULL
+            )
+        """))
+        conn.execute(text(
+            "INSERT INTO consult_sessions VALUES ('s1', 'u1', 'INTJ', 'MALE', '2025-01-01 00:00:00', 1, :analysis)"
+        ), {"analysis": json.dumps(analysis, ensure_ascii=False)})
+        for session_id, role in [("s1", "assistant"), ("s2", "user"), ("s1", "user"), ("s2", "assistant")]:
+            conn.execute(text(
+                "INSERT INTO consult_messages (session_id, role, content, created_at) "
+                "VALUES (:session_id, :role, 'x', '2025-01-01 00:00:00')"
+            ), {"session_id": session_id, "role": role})
+
+    # When
+    upgrade(engine)
+
+    # Then
+    with engine.connect() as conn:
+        seqs = conn.execute(text("SELECT session_id, seq FROM consult_messages ORDER BY id")).all()
+        summary = conn.execute(text("SELECT analysis_summary FROM consult_sessions WHERE id = 's1'")).scalar()
+    assert [tuple(row) for row in seqs] == [("s1", 0), ("s2", 0), ("s1", 1), ("s2", 1)]
+    assert summary == "친구와 약속 문제로 다퉜다"
+    assert "ix_consult_messages_session_seq" in _indexes(engine, "consult_messages")
+    assert "ix_consult_sessions_completed_created" in _indexes(engine, "consult_sessions")
+    assert "summarized_count" in _columns(engine, "consult_sessions")
+
+
+def test_summary_backfill_walks_all_rows_in_batches(engine, monkeypatch):
+    """요약 채우기는 id keyset 배치로 나눠 모든 완료 세션을 채운다"""
+    from migrations.versions import v0004_add_history_index_to_consult_sessions as v0004
+
+    # Given: 배치 크기보다 많은 완료 세션 (일부는 분석 없음)
+    monkeypatch.setattr(v0004, "BACKFILL_BATCH_SIZE", 2)
+    analysis = json.dumps({"situation": "상황", "traits": "t", "solutions": "s", "cautions": "c"}, ensure_ascii=False)
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE consult_sessions (
+                id VARCHAR(36) PRIMARY KEY, user_id VARCHAR(255) NOT NULL, mbti VARCHAR(4) NOT NULL,
+                gender VARCHAR(10) NOT NULL, created_at DATETIME NOT NULL,
+                is_completed BOOLEAN DEFAULT FALSE NOT NULL, analysis_json TEXT NULL
+            )
+        """))
+        for i in range(5):
+            conn.execute(text(
+                "INSERT INTO consult_sessions (id, user_id, mbti, gender, created_at, is_completed, analysis_json) "
+                "VALUES (:id, 'u1', 'INTJ', 'MALE', '2025-01-01 00:00:00', 1, :analysis)"
+            ), {"id": f"s{i}", "analysis": analysis if i != 2 else None})
+
+    # When
+    upgrade(engine)
+
+    # Then
+    with engine.connect() as conn:
+        summaries = dict(conn.execute(text("SELECT id, analysis_summary FROM consult_sessions")).all())
+    assert summaries == {"s0": "상황", "s1": "상황", "s2": None, "s3": "상황", "s4": "상황"}
+
+
+def test_check_schema_version_warns_or_raises_when_behind(engine, caplog):
+    upgrade(engine, target=1)
+
+    with caplog.at_level(logging.WARNING):
+        assert check_schema_version(engine) == 1
+    assert "python -m migrations upgrade" in caplog.text
+
+    with pytest.raises(SchemaVersionError):
+        check_schema_version(engine, strict=True)
+
+    upgrade(engine)
+    assert check_schema_version(engine, strict=True) == head_version()
+
+
+def test_current_version_is_zero_without_version_table(engine):
+    assert current_version(engine) == 0
+
+
+def test_discover_rejects_duplicate_versions(tmp_path):
+    (tmp_path / "v0001_a.py").write_text("")
+    (tmp_path / "v0001_b.py").write_text("")
+
+    with pytest.raises(ValueError):
+        discover(tmp_path)
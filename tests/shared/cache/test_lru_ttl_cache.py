@@ -0,0 +1,108 @@
+import pytest
+
+from app.shared.cache.lru_ttl_cache import LRUTTLCache, MISSING
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_cached_value_and_counts_hit():
+    """저장한 값을 조회하면 hit로 집계된다"""
+    cache = LRUTTLCache(max_size=10, ttl_seconds=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is MISSING
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_none_can_be_cached():
+    """None도 캐시 값으로 저장할 수 있다 (negative 캐시)"""
+    cache = LRUTTLCache(max_size=10, ttl_seconds=60)
+    cache.set("unknown", None)
+
+    assert cache.get("unknown") is None
+
+
+def test_entry_expires_after_ttl():
+    """TTL이 지나면 항목이 만료된다"""
+    clock = FakeClock()
+    cache = LRUTTLCache(max_size=10, ttl_seconds=60, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=5)
+
+    clock.now += 10
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is MISSING
+    assert cache.stats()["expirations"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    """max_size를 넘으면 가장 오래 사용하지 않은 항목을 제거한다"""
+    cache = LRUTTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_delete_removes_entry():
+    """delete하면 즉시 조회되지 않는다"""
+    cache = LRUTTLCache(max_size=10, ttl_seconds=60)
+    cache.set("a", 1)
+
+    cache.delete("a")
+
+    assert cache.get("a") is MISSING
+
+
+def test_reject_non_positive_max_size():
+    """max_size는 1 이상이어야 한다"""
+    with pytest.raises(ValueError):
+        LRUTTLCache(max_size=0, ttl_seconds=60)
+
+
+def test_bytes_are_tracked_and_bounded():
+    """sizeof로 합산한 크기가 max_bytes를 넘으면 LRU 순으로 제거한다"""
+    cache = LRUTTLCache(max_size=10, ttl_seconds=60, sizeof=len, max_bytes=10)
+    cache.set("a", "1234")
+    cache.set("b", "1234")
+    assert cache.stats()["bytes"] == 8
+
+    cache.set("c", "1234")
+
+    assert cache.get("a") is MISSING
+    assert cache.stats()["bytes"] == 8
+    assert cache.stats()["evictions"] == 1
+
+
+def test_overwrite_and_delete_update_bytes():
+    """같은 키를 덮어쓰거나 삭제하면 크기 합계도 갱신된다"""
+    cache = LRUTTLCache(max_size=10, ttl_seconds=60, sizeof=len)
+    cache.set("a", "12345")
+    cache.set("a", "12")
+    assert cache.stats()["bytes"] == 2
+
+    cache.delete("a")
+    assert cache.stats()["bytes"] == 0
+
+
+def test_max_bytes_requires_sizeof():
+    """sizeof 없이 max_bytes만 주면 거부한다"""
+    with pytest.raises(ValueError):
+        LRUTTLCache(max_size=10, ttl_seconds=60, max_bytes=100)
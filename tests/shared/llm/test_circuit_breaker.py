@@ -0,0 +1,177 @@
+from unittest.mock import Mock
+
+import openai
+import pytest
+from prometheus_client import REGISTRY
+
+from app.shared.llm.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitOpenError,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _sample(metric: str, **labels) -> float:
+    return REGISTRY.get_sample_value(metric, labels) or 0.0
+
+
+def _upstream_error():
+    return openai.InternalServerError("error", response=Mock(status_code=503, headers={}), body=None)
+
+
+def _breaker(name: str, clock: FakeClock, **config) -> CircuitBreaker:
+    defaults = dict(window_seconds=30, min_calls=4, failure_rate=0.5, slow_call_seconds=10,
+                    slow_call_rate=0.8, open_seconds=30, half_open_calls=2)
+    defaults.update(config)
+    return CircuitBreaker(name, CircuitBreakerConfig(**defaults), clock=clock)
+
+
+def _fail(breaker: CircuitBreaker, times: int = 1) -> None:
+    for _ in range(times):
+        with pytest.raises(openai.InternalServerError):
+            with breaker.guard():
+                raise _upstream_error()
+
+
+def _succeed(breaker: CircuitBreaker, times: int = 1) -> None:
+    for _ in range(times):
+        with breaker.guard():
+            pass
+
+
+def test_opens_when_failure_rate_exceeded_after_min_calls():
+    """min_calls를 채운 뒤 실패율이 기준 이상이면 열린다"""
+    breaker = _breaker("test.failure_rate", FakeClock())
+
+    _succeed(breaker)
+    _fail(breaker, 2)
+    assert breaker.state == CLOSED      # 아직 3건 (min_calls 미만)
+
+    _fail(breaker)
+    assert breaker.state == OPEN
+    assert _sample("llm_circuit_state", name="test.failure_rate") == 2
+
+
+def test_opens_when_slow_call_rate_exceeded():
+    """성공했더라도 느린 호출 비율이 기준 이상이면 열린다"""
+    breaker = _breaker("test.slow_rate", FakeClock())
+
+    for _ in range(4):
+        breaker.acquire()
+        breaker.record_success(duration=12)
+
+    assert breaker.state == OPEN
+
+
+def test_old_calls_leave_the_window():
+    """window_seconds가 지난 호출 결과는 실패율 계산에서 빠진다"""
+    clock = FakeClock()
+    breaker = _breaker("test.window", clock)
+
+    _fail(breaker, 3)
+    clock.now = 31
+    _succeed(breaker, 3)
+    _fail(breaker)
+
+    assert breaker.state == CLOSED
+
+
+def test_open_circuit_rejects_with_retry_after():
+    """열린 회로는 업스트림을 부르지 않고 남은 시간을 retry_after로 알린다"""
+    clock = FakeClock()
+    breaker = _breaker("test.reject", clock)
+    _fail(breaker, 4)
+    before = _sample("llm_circuit_rejected_total", name="test.reject")
+    clock.now = 10
+    called = Mock()
+
+    with pytest.raises(CircuitOpenError) as error:
+        with breaker.guard():
+            called()
+
+    called.assert_not_called()
+    assert error.value.retry_after == 20
+    assert _sample("llm_circuit_rejected_total", name="test.reject") == before + 1
+
+
+def test_half_open_allows_limited_probes_then_closes():
+    """open_seconds 뒤에는 half_open_calls개만 시험 호출하고, 모두 성공하면 닫힌다"""
+    clock = FakeClock()
+    breaker = _breaker("test.half_open", clock)
+    _fail(breaker, 4)
+    clock.now = 30
+
+    assert breaker.state == HALF_OPEN
+    breaker.acquire()
+    breaker.acquire()
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+
+    breaker.record_success(duration=1)
+    breaker.record_success(duration=1)
+    assert breaker.state == CLOSED
+    assert _sample("llm_circuit_transitions_total", name="test.half_open", state=CLOSED) == 1
+
+
+def test_check_does_not_take_probe_slot():
+    """check는 거절 여부만 확인하고 half_open 시험 호출 자리를 잡지 않는다"""
+    clock = FakeClock()
+    breaker = _breaker("test.check", clock, half_open_calls=1)
+    _fail(breaker, 4)
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+    clock.now = 30
+    for _ in range(3):
+        breaker.check()
+    breaker.acquire()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+
+
+def test_failed_probe_reopens():
+    """시험 호출이 실패하면 다시 열리고 open_seconds를 새로 센다"""
+    clock = FakeClock()
+    breaker = _breaker("test.reopen", clock)
+    _fail(breaker, 4)
+    clock.now = 30
+
+    _fail(breaker)
+
+    assert breaker.state == OPEN
+    clock.now = 59
+    assert breaker.state == OPEN
+    clock.now = 60
+    assert breaker.state == HALF_OPEN
+
+
+def test_request_errors_and_cancellation_are_not_counted():
+    """요청 자체의 오류나 취소는 실패로 세지 않고 시험 호출 자리만 돌려준다"""
+    clock = FakeClock()
+    breaker = _breaker("test.release", clock, half_open_calls=1)
+    for _ in range(4):
+        with pytest.raises(ValueError):
+            with breaker.guard():
+                raise ValueError("bad request")
+    assert breaker.state == CLOSED
+
+    _fail(breaker, 4)
+    clock.now = 30
+    with pytest.raises(KeyboardInterrupt):
+        with breaker.guard():
+            raise KeyboardInterrupt()
+
+    # 취소된 시험 호출 자리를 다시 쓸 수 있다
+    _succeed(breaker)
+    assert breaker.state == CLOSED
@@ -0,0 +1,257 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import openai
+import pytest
+from prometheus_client import REGISTRY
+
+from app.shared.llm.circuit_breaker import OPEN, CircuitBreaker, CircuitBreakerConfig
+from app.shared.llm.llm_gateway import (
+    AsyncLLMGateway,
+    GatewayBackend,
+    LLMGateway,
+    LLMRouter,
+    NoBackendAvailableError,
+    RoutingConfig,
+    close_llm_gateways,
+    get_async_llm_gateway,
+    get_llm_router,
+)
+from config.settings import get_settings
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _sample(metric: str, **labels) -> float:
+    return REGISTRY.get_sample_value(metric, labels) or 0.0
+
+
+def _upstream_error():
+    return openai.InternalServerError("error", response=Mock(status_code=503, headers={}), body=None)
+
+
+def _request_error():
+    return openai.BadRequestError("bad", response=Mock(status_code=400, headers={}), body=None)
+
+
+class FakeClient:
+    """지연 시간과 실패를 정해 둔 OpenAI 호환 클라이언트"""
+
+    def __init__(self, name: str, clock: FakeClock, latency: float = 0.1, error: Exception | None = None):
+        self.name = name
+        self.latency = latency
+        self.error = error
+        self.requests: list[dict] = []
+        self._clock = clock
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        self._clock.now += self.latency
+        if self.error is not None:
+            raise self.error
+        return self.name
+
+
+class AsyncFakeClient(FakeClient):
+    async def create(self, **kwargs):
+        return super().create(**kwargs)
+
+
+def _gateway(clock: FakeClock, *clients: FakeClient, rpm=None, breakers=None, gateway_type=LLMGateway):
+    router = LLMRouter(
+        [client.name for client in clients],
+        RoutingConfig(ewma_alpha=0.5, error_penalty=10.0, error_half_life_seconds=60.0),
+        rpm=rpm,
+        breakers=breakers,
+        clock=clock,
+    )
+    return gateway_type([GatewayBackend(client.name, client) for client in clients], router)
+
+
+def test_routes_to_backend_with_lower_latency_ewma():
+    """표본이 쌓이면 지연 시간 EWMA가 낮은 백엔드로 보낸다 (표본이 없으면 우선순위 순으로 한 번씩 보내 본다)"""
+    clock = FakeClock()
+    slow = FakeClient("gw.slow", clock, latency=2.0)
+    fast = FakeClient("gw.fast", clock, latency=0.2)
+    gateway = _gateway(clock, slow, fast)
+
+    served = [gateway.chat.completions.create(model="m", messages=[]) for _ in range(5)]
+
+    assert served == ["gw.slow", "gw.fast", "gw.fast", "gw.fast", "gw.fast"]
+    assert gateway.router.ranked() == ["gw.fast", "gw.slow"]
+    assert gateway.router.snapshot()["gw.slow"]["latency_ewma_ms"] == pytest.approx(2000.0)
+
+
+def test_fails_over_to_next_backend_on_upstream_error():
+    """5xx면 같은 요청을 다음 백엔드로 보내고, 실패한 백엔드는 오류율 때문에 순위가 내려간다"""
+    clock = FakeClock()
+    broken = FakeClient("gw.broken", clock, latency=0.1, error=_upstream_error())
+    healthy = FakeClient("gw.healthy", clock, latency=0.5)
+    gateway = _gateway(clock, broken, healthy)
+    healthy_before = _sample("llm_gateway_routed_total", backend="gw.healthy", choice="failover")
+
+    assert gateway.chat.completions.create(model="m", messages=[]) == "gw.healthy"
+    assert healthy.requests == broken.requests
+    assert _sample("llm_gateway_routed_total", backend="gw.healthy", choice="failover") == healthy_before + 1
+    assert _sample("llm_gateway_requests_total", backend="gw.broken", outcome="upstream_error") >= 1
+
+    # 지연 시간 표본이 없어도 오류율 때문에 정상 백엔드를 먼저 쓴다
+    assert gateway.router.ranked() == ["gw.healthy", "gw.broken"]
+    assert gateway.chat.completions.create(model="m", messages=[]) == "gw.healthy"
+    assert len(broken.requests) == 1
+
+
+def test_error_rate_decays_so_recovered_backend_regains_traffic():
+    """오류율은 반감기마다 줄어 장애가 끝난 빠른 백엔드가 다시 첫 순위가 된다"""
+    clock = FakeClock()
+    fast = FakeClient("gw.recovering", clock, latency=0.1)
+    slow = FakeClient("gw.steady", clock, latency=0.4)
+    gateway = _gateway(clock, fast, slow)
+    gateway.chat.completions.create(model="m", messages=[])
+    gateway.chat.completions.create(model="m", messages=[])     # 아직 표본이 없는 gw.steady
+
+    fast.error = _upstream_error()
+    gateway.chat.completions.create(model="m", messages=[])
+    assert gateway.router.ranked()[0] == "gw.steady"
+
+    fast.error = None
+    clock.now += 600
+    assert gateway.router.ranked()[0] == "gw.recovering"
+    assert gateway.chat.completions.create(model="m", messages=[]) == "gw.recovering"
+
+
+def test_request_error_is_not_failed_over():
+    """400 같은 요청 자체의 오류는 다른 백엔드로 넘기지 않고 그대로 올린다"""
+    clock = FakeClock()
+    first = FakeClient("gw.bad_request", clock, error=_request_error())
+    second = FakeClient("gw.unused", clock)
+    gateway = _gateway(clock, first, second)
+
+    with pytest.raises(openai.BadRequestError):
+        gateway.chat.completions.create(model="m", messages=[])
+    assert second.requests == []
+
+
+def test_all_backends_failing_raises_last_upstream_error():
+    """모든 백엔드가 실패하면 마지막 업스트림 오류를 올려 바깥 재시도 정책이 다시 보낸다"""
+    clock = FakeClock()
+    gateway = _gateway(
+        clock,
+        FakeClient("gw.down1", clock, error=_upstream_error()),
+        FakeClient("gw.down2", clock, error=openai.APITimeoutError(request=Mock())),
+    )
+
+    with pytest.raises(openai.APITimeoutError):
+        gateway.chat.completions.create(model="m", messages=[])
+
+
+def test_skips_backend_over_quota_and_reports_retry_after_when_all_exhausted():
+    """분당 요청 수를 다 쓴 백엔드는 건너뛰고, 모두 다 쓰면 Retry-After와 함께 NoBackendAvailableError"""
+    clock = FakeClock()
+    primary = FakeClient("gw.quota_primary", clock, latency=0.0)
+    secondary = FakeClient("gw.quota_secondary", clock, latency=0.0)
+    # 버킷 용량 = max(rpm × 10초 / 60, 1) = 1
+    gateway = _gateway(clock, primary, secondary, rpm={"gw.quota_primary": 6, "gw.quota_secondary": 6})
+
+    assert gateway.chat.completions.create(model="m", messages=[]) == "gw.quota_primary"
+    assert gateway.chat.completions.create(model="m", messages=[]) == "gw.quota_secondary"
+    with pytest.raises(NoBackendAvailableError) as raised:
+        gateway.chat.completions.create(model="m", messages=[])
+
+    assert raised.value.retry_after == 10
+    assert _sample("llm_gateway_skipped_total", backend="gw.quota_primary", reason="quota") >= 1
+
+
+def test_skips_backend_whose_circuit_is_open():
+    """백엔드별 회로가 열려 있으면 다른 백엔드가 실패해도 그 백엔드로는 넘기지 않는다"""
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        "backend:gw.tripped",
+        CircuitBreakerConfig(window_seconds=30, min_calls=1, failure_rate=0.5, open_seconds=30),
+        clock=clock,
+    )
+    tripped = FakeClient("gw.tripped", clock, error=_upstream_error())
+    standby = FakeClient("gw.standby", clock)
+    gateway = _gateway(clock, tripped, standby, breakers={"gw.tripped": breaker})
+    skipped_before = _sample("llm_gateway_skipped_total", backend="gw.tripped", reason="circuit_open")
+
+    assert gateway.chat.completions.create(model="m", messages=[]) == "gw.standby"
+    assert breaker.state == OPEN
+
+    standby.error = _upstream_error()
+    with pytest.raises(openai.InternalServerError):
+        gateway.chat.completions.create(model="m", messages=[])
+    assert len(tripped.requests) == 1
+    assert _sample("llm_gateway_skipped_total", backend="gw.tripped", reason="circuit_open") == skipped_before + 1
+
+
+def test_backend_maps_model_and_drops_unsupported_params():
+    """백엔드별 모델/배포 이름으로 바꾸고 지원하지 않는 인자는 빼고 보낸다"""
+    backend = GatewayBackend(
+        "local", Mock(), models={"*": "llama3.1:8b"}, drop_params=frozenset({"prompt_cache_key"})
+    )
+    azure = GatewayBackend("azure", Mock(), models={"gpt-4o-mini": "hexa-4o-mini"})
+
+    assert backend.request_kwargs({"model": "gpt-4o-mini", "prompt_cache_key": "k", "temperature": 0.7}) == {
+        "model": "llama3.1:8b",
+        "temperature": 0.7,
+    }
+    assert azure.request_kwargs({"model": "gpt-4o-mini", "prompt_cache_key": "k"}) == {
+        "model": "hexa-4o-mini",
+        "prompt_cache_key": "k",
+    }
+    assert azure.request_kwargs({"model": "gpt-4o"})["model"] == "gpt-4o"
+
+
+def test_async_gateway_fails_over():
+    """비동기 게이트웨이도 업스트림 오류면 다음 백엔드로 넘긴다"""
+    clock = FakeClock()
+    gateway = _gateway(
+        clock,
+        AsyncFakeClient("gw.async_down", clock, error=_upstream_error()),
+        AsyncFakeClient("gw.async_up", clock),
+        gateway_type=AsyncLLMGateway,
+    )
+
+    assert asyncio.run(gateway.chat.completions.create(model="m", messages=[])) == "gw.async_up"
+
+
+def test_gateway_from_settings_uses_configured_backends(monkeypatch):
+    """LLM_BACKENDS 순서대로 백엔드를 만들고 local 백엔드는 모델을 바꾸고 prompt_cache_key를 뺀다"""
+    monkeypatch.setenv("LLM_BACKENDS", "openai,local")
+    monkeypatch.setenv("LLM_BACKEND_RPM", "local=120")
+    monkeypatch.setenv("LOCAL_LLM_BASE_URL", "http://127.0.0.1:8901/v1")
+    monkeypatch.setenv("LOCAL_LLM_MODEL", "llama3.1:8b")
+    asyncio.run(close_llm_gateways())
+    get_settings.cache_clear()
+    try:
+        gateway = get_async_llm_gateway()
+        local = gateway._backends["local"]
+
+        assert gateway.router.names == ["openai", "local"]
+        assert str(local.client.base_url) == "http://127.0.0.1:8901/v1/"
+        assert local.request_kwargs({"model": "gpt-4o-mini", "prompt_cache_key": "k"}) == {"model": "llama3.1:8b"}
+    finally:
+        asyncio.run(close_llm_gateways())
+        get_settings.cache_clear()
+
+
+def test_backend_rpm_must_name_configured_backend(monkeypatch):
+    monkeypatch.setenv("LLM_BACKENDS", "openai")
+    monkeypatch.setenv("LLM_BACKEND_RPM", "azure=600")
+    get_llm_router.cache_clear()
+    get_settings.cache_clear()
+    try:
+        with pytest.raises(ValueError):
+            get_llm_router()
+    finally:
+        get_llm_router.cache_clear()
+        get_settings.cache_clear()
@@ -0,0 +1,199 @@
+import asyncio
+import time
+from unittest.mock import Mock
+
+import openai
+import pytest
+from prometheus_client import REGISTRY
+
+from app.shared.llm.llm_resilience import CallPolicy, LatencyTracker, RetryPolicyRunner, get_call_policy, retry_reason
+from app.shared.llm.llm_telemetry import llm_call
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _status_error(error_type, status: int, headers: dict | None = None, code: str | None = None):
+    body = {"code": code} if code else None
+    return error_type("error", response=Mock(status_code=status, headers=headers or {}), body=body)
+
+
+def _runner(call_site: str, sleeps: list | None = None, tracker: LatencyTracker | None = None, **policy) -> RetryPolicyRunner:
+    return RetryPolicyRunner(
+        call_site,
+        "m",
+        CallPolicy(timeout_seconds=5, **policy),
+        tracker=tracker or LatencyTracker(),
+        sleep=(sleeps.append if sleeps is not None else lambda _: None),
+    )
+
+
+class _Flaky:
+    """앞의 errors를 차례로 던진 뒤 result를 돌려주는 요청"""
+
+    def __init__(self, errors: list, result="ok"):
+        self.errors = list(errors)
+        self.result = result
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.result
+
+
+def test_retryable_errors_are_classified():
+    assert retry_reason(_status_error(openai.RateLimitError, 429)) == "rate_limit"
+    assert retry_reason(_status_error(openai.InternalServerError, 503)) == "server_error"
+    assert retry_reason(openai.APITimeoutError(request=Mock())) == "timeout"
+    assert retry_reason(_status_error(openai.RateLimitError, 429, code="insufficient_quota")) is None
+    assert retry_reason(_status_error(openai.BadRequestError, 400)) is None
+
+
+def test_rate_limit_is_retried_with_retry_after():
+    """429는 Retry-After 이상 기다렸다가 다시 보내고 재시도 수를 센다"""
+    before = _sample("llm_call_retries_total", call_site="test.retry_after", model="m", reason="rate_limit")
+    sleeps = []
+    attempt = _Flaky([_status_error(openai.RateLimitError, 429, {"retry-after": "2"})])
+
+    assert _runner("test.retry_after", sleeps).run(attempt) == "ok"
+
+    assert attempt.calls == 2
+    assert sleeps and sleeps[0] >= 2
+    assert _sample("llm_call_retries_total", call_site="test.retry_after", model="m", reason="rate_limit") == before + 1
+
+
+def test_backoff_is_jittered_exponential_and_capped():
+    runner = _runner("test.backoff", base_delay_seconds=1, max_delay_seconds=4)
+
+    delays = [runner.backoff(retry, None) for retry in range(6) for _ in range(20)]
+
+    assert all(0 <= delay <= 4 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_gives_up_after_max_attempts():
+    attempt = _Flaky([openai.APITimeoutError(request=Mock())] * 5)
+
+    with pytest.raises(openai.APITimeoutError):
+        _runner("test.give_up", max_attempts=3).run(attempt)
+
+    assert attempt.calls == 3
+
+
+def test_non_retryable_error_is_raised_immediately():
+    attempt = _Flaky([_status_error(openai.BadRequestError, 400)])
+
+    with pytest.raises(openai.BadRequestError):
+        _runner("test.bad_request").run(attempt)
+
+    assert attempt.calls == 1
+
+
+def test_parse_failure_requests_a_new_response():
+    """JSON 파싱 실패는 별도 분류(parse)로 요청을 다시 보낸다"""
+    import json
+
+    before = _sample("llm_call_retries_total", call_site="test.parse", model="m", reason="parse")
+    responses = iter(['{"broken', '{"content": "ok"}'])
+
+    result = _runner("test.parse").run(lambda: next(responses), parse=lambda text: json.loads(text)["content"])
+
+    assert result == "ok"
+    assert _sample("llm_call_retries_total", call_site="test.parse", model="m", reason="parse") == before + 1
+
+
+def test_parse_failure_is_raised_after_parse_attempts():
+    with pytest.raises(ValueError):
+        _runner("test.parse_give_up", parse_max_attempts=2).run(lambda: "not json", parse=lambda text: int(text))
+
+
+def _primed_tracker(seconds: float = 0.01, samples: int = 20) -> LatencyTracker:
+    tracker = LatencyTracker()
+    for _ in range(samples):
+        tracker.observe(seconds)
+    return tracker
+
+
+def test_no_hedge_until_enough_latency_samples():
+    runner = _runner("test.hedge_cold", tracker=_primed_tracker(samples=5), hedge=True)
+
+    assert runner.hedge_delay() is None
+
+
+def test_slow_request_is_hedged_and_faster_copy_wins():
+    """p95가 지나도 응답이 없으면 같은 요청을 하나 더 보내고 먼저 끝난 응답을 쓴다"""
+    labels = {"call_site": "test.hedge", "model": "m"}
+    launched = _sample("llm_hedged_requests_total", outcome="launched", **labels)
+    won = _sample("llm_hedged_requests_total", outcome="won", **labels)
+    calls = []
+
+    def attempt():
+        calls.append(None)
+        if len(calls) == 1:
+            time.sleep(0.5)
+            return "slow"
+        return "fast"
+
+    runner = _runner("test.hedge", tracker=_primed_tracker(), hedge=True, hedge_min_delay_seconds=0.02)
+
+    assert runner.run(attempt) == "fast"
+    assert _sample("llm_hedged_requests_total", outcome="launched", **labels) == launched + 1
+    assert _sample("llm_hedged_requests_total", outcome="won", **labels) == won + 1
+
+
+def test_async_hedge_cancels_the_losing_request():
+    cancelled = []
+
+    async def attempt():
+        if not cancelled:
+            cancelled.append(False)
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled[0] = True
+                raise
+            return "slow"
+        return "fast"
+
+    async def scenario():
+        runner = _runner("test.async_hedge", tracker=_primed_tracker(), hedge=True, hedge_min_delay_seconds=0.02)
+        result = await runner.arun(attempt)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(scenario()) == "fast"
+    assert cancelled == [True]
+
+
+def test_async_retry_uses_async_sleep():
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    runner = RetryPolicyRunner(
+        "test.async_retry", "m", CallPolicy(timeout_seconds=5), tracker=LatencyTracker(), async_sleep=fake_sleep
+    )
+    attempt = _Flaky([_status_error(openai.InternalServerError, 500)])
+
+    async def call():
+        return attempt()
+
+    assert asyncio.run(runner.arun(call)) == "ok"
+    assert len(sleeps) == 1
+
+
+def test_llm_call_sends_call_site_timeout():
+    """호출 위치 정책의 타임아웃을 요청 인자로 넘긴다 (호출자가 지정하면 그 값)"""
+    create = Mock(return_value=Mock(usage=None))
+
+    with llm_call("converter.convert", "m") as call:
+        call.run(create, model="m")
+    with llm_call("converter.convert", "m") as call:
+        call.run(create, model="m", timeout=3)
+
+    assert create.call_args_list[0].kwargs["timeout"] == get_call_policy("converter.convert").timeout_seconds
+    assert create.call_args_list[1].kwargs["timeout"] == 3
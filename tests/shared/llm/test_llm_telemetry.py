@@ -0,0 +1,173 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import openai
+import pytest
+from prometheus_client import REGISTRY
+
+from app.shared.llm import llm_telemetry
+from app.shared.llm.llm_telemetry import llm_call
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _usage(prompt: int, completion: int, cached: int) -> Mock:
+    return Mock(prompt_tokens=prompt, completion_tokens=completion, prompt_tokens_details=Mock(cached_tokens=cached))
+
+
+def test_call_records_latency_and_usage():
+    """성공한 호출은 지연 시간과 usage 토큰 수를 호출 위치/모델 라벨로 기록한다"""
+    labels = {"call_site": "test.usage", "model": "m"}
+    before = _sample("llm_request_duration_seconds_count", outcome="success", **labels)
+
+    with llm_call("test.usage", "m") as call:
+        call.run(lambda **kwargs: Mock(usage=_usage(120, 30, 64)), model="m")
+
+    assert _sample("llm_request_duration_seconds_count", outcome="success", **labels) == before + 1
+    assert _sample("llm_tokens_total", kind="prompt", **labels) >= 120
+    assert _sample("llm_tokens_total", kind="completion", **labels) >= 30
+    assert _sample("llm_tokens_total", kind="cached", **labels) >= 64
+
+
+def test_call_records_errors_by_type():
+    """실패한 호출은 예외 타입별로 집계하고 예외는 그대로 전파한다"""
+    labels = {"call_site": "test.error", "model": "m"}
+    before = _sample("llm_errors_total", error_type="TimeoutError", **labels)
+
+    with pytest.raises(TimeoutError):
+        with llm_call("test.error", "m"):
+            raise TimeoutError()
+
+    assert _sample("llm_errors_total", error_type="TimeoutError", **labels) == before + 1
+    assert _sample("llm_request_duration_seconds_count", outcome="error", **labels) >= 1
+
+
+def test_stream_records_ttft_and_inter_token_gaps():
+    """스트림은 첫 토큰까지의 시간과 토큰 간 간격을 기록한다 (usage만 담긴 청크는 토큰이 아님)"""
+    labels = {"call_site": "test.stream", "model": "m"}
+    clock = _FakeClock()
+
+    def chunk(content):
+        return Mock(choices=[Mock(delta=Mock(content=content))], usage=None)
+
+    with llm_telemetry.LLMCall("test.stream", "m", clock=clock) as call:
+        for at, item in [(0.4, chunk("안")), (0.45, chunk("녕")), (0.5, Mock(choices=[], usage=_usage(10, 2, 0)))]:
+            clock.now = at
+            call.observe_chunk(item)
+
+    assert _sample("llm_time_to_first_token_seconds_sum", **labels) == pytest.approx(0.4)
+    assert _sample("llm_inter_token_gap_seconds_count", **labels) == 1
+    assert _sample("llm_tokens_total", kind="completion", **labels) == 2
+
+
+def test_async_generator_closed_early_is_recorded_as_cancelled():
+    """소비자가 스트림을 중간에 닫으면 cancelled로 기록한다"""
+    labels = {"call_site": "test.cancel", "model": "m"}
+
+    async def stream():
+        with llm_call("test.cancel", "m"):
+            for i in range(3):
+                yield i
+
+    async def consume_one():
+        gen = stream()
+        await gen.__anext__()
+        await gen.aclose()
+
+    asyncio.run(consume_one())
+
+    assert _sample("llm_request_duration_seconds_count", outcome="cancelled", **labels) == 1
+    assert _sample("llm_errors_total", error_type="GeneratorExit", **labels) == 0
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """첫 요청은 503, 이후는 정상 chat completion 응답"""
+
+    protocol_version = "HTTP/1.1"
+    calls = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        type(self).calls += 1
+        if type(self).calls == 1:
+            body, status = b'{"error": {"message": "busy"}}', 503
+        else:
+            body, status = (
+                b'{"id": "x", "object": "chat.completion", "created": 0, "model": "m", '
+                b'"choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": "ok"}}], '
+                b'"usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6}}'
+            ), 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_sdk_retries_are_counted_per_call_site():
+    """OpenAI SDK 내부 재시도는 요청 훅에서 호출 위치 라벨로 집계된다"""
+    labels = {"call_site": "test.retry", "model": "m"}
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FlakyHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = openai.OpenAI(
+        api_key="x",
+        base_url=f"http://127.0.0.1:{server.server_address[1]}/v1",
+        max_retries=2,
+        http_client=openai.DefaultHttpxClient(event_hooks={"request": [llm_telemetry.on_request]}),
+    )
+
+    try:
+        with llm_call("test.retry", "m") as call:
+            response = call.run(client.chat.completions.create, model="m", messages=[{"role": "user", "content": "hi"}])
+    finally:
+        client.close()
+        server.shutdown()
+
+    assert response.choices[0].message.content == "ok"
+    assert _sample("llm_retries_total", **labels) == 1
+    assert _sample("llm_tokens_total", kind="prompt", **labels) == 5
+
+
+_WORKER_SCRIPT = """
+from app.shared.llm.llm_telemetry import llm_call
+from unittest.mock import Mock
+with llm_call("test.multi", "m") as call:
+    call.record_usage(Mock(usage=Mock(prompt_tokens=10, completion_tokens=1, prompt_tokens_details=None)))
+"""
+
+_RENDER_SCRIPT = """
+from app.shared.llm.llm_telemetry import render_metrics
+print(render_metrics()[0].decode())
+"""
+
+
+def test_metrics_aggregate_across_worker_processes(tmp_path):
+    """PROMETHEUS_MULTIPROC_DIR를 공유하면 어느 프로세스에서 렌더링해도 전체 워커 합계가 나온다"""
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", _WORKER_SCRIPT], env=env, check=True)
+
+    output = subprocess.run(
+        [sys.executable, "-c", _RENDER_SCRIPT], env=env, check=True, capture_output=True, text=True
+    ).stdout
+
+    assert 'llm_tokens_total{call_site="test.multi",kind="prompt",model="m"} 20.0' in output
+    assert 'llm_request_duration_seconds_count{call_site="test.multi",model="m",outcome="success"} 2.0' in output
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import openai
+import pytest
+
+from app.shared.llm.openai_client_registry import (
+    ConnectionReuseStats,
+    close_openai_clients,
+    get_async_backend_client,
+    get_async_openai_client,
+    get_backend_client,
+    get_openai_client,
+)
+from config.settings import get_settings
+
+
+class _OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+def test_registry_returns_same_client_instance():
+    """동기/비동기 클라이언트는 프로세스 안에서 하나씩만 생성된다"""
+    try:
+        assert get_openai_client() is get_openai_client()
+        assert get_async_openai_client() is get_async_openai_client()
+    finally:
+        asyncio.run(close_openai_clients())
+
+
+def test_stats_count_reused_connections():
+    """keep-alive로 재사용된 요청은 새 커넥션 없이 집계된다"""
+    # Given
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stats = ConnectionReuseStats()
+    client = openai.DefaultHttpxClient(event_hooks={"request": [stats.on_request]})
+
+    # When
+    try:
+        for _ in range(3):
+            client.get(f"http://127.0.0.1:{server.server_address[1]}/")
+    finally:
+        client.close()
+        server.shutdown()
+
+    # Then
+    result = stats.stats()
+    assert result["requests"] == 3
+    assert result["new_connections"] == 1
+    assert result["reused_requests"] == 2
+    assert result["reuse_ratio"] == 2 / 3
+
+
+def test_stats_record_http2_requests():
+    """HTTP/2 trace 이벤트도 요청으로 집계된다"""
+    stats = ConnectionReuseStats()
+
+    stats.record("connection.connect_tcp.started")
+    stats.record("connection.start_tls.started")
+    stats.record("http2.send_request_headers.started")
+    stats.record("http2.send_request_headers.started")
+
+    assert stats.stats() == {
+        "requests": 2,
+        "new_connections": 1,
+        "tls_handshakes": 1,
+        "reused_requests": 1,
+        "reuse_ratio": 0.5,
+    }
+
+
+def test_clients_use_configured_base_url(monkeypatch):
+    """OPENAI_BASE_URL을 설정하면 공유 클라이언트가 그 주소(로컬 stub 등)로 요청한다"""
+    monkeypatch.setenv("OPENAI_BASE_URL", "http://127.0.0.1:8900/v1")
+    get_settings.cache_clear()
+    try:
+        assert str(get_openai_client().base_url) == "http://127.0.0.1:8900/v1/"
+        assert str(get_async_openai_client().base_url) == "http://127.0.0.1:8900/v1/"
+    finally:
+        asyncio.run(close_openai_clients())
+        monkeypatch.delenv("OPENAI_BASE_URL")
+        get_settings.cache_clear()
+
+
+def test_backend_clients_are_shared_and_require_configuration(monkeypatch):
+    """openai 백엔드는 공유 클라이언트 그대로, 설정하지 않은 azure 백엔드는 만들지 않는다"""
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "")
+    get_settings.cache_clear()
+    try:
+        assert get_backend_client("openai") is get_openai_client()
+        assert get_async_backend_client("openai") is get_async_openai_client()
+        with pytest.raises(ValueError):
+            get_backend_client("azure")
+        with pytest.raises(ValueError):
+            get_backend_client("anthropic")
+    finally:
+        asyncio.run(close_openai_clients())
+        get_settings.cache_clear()
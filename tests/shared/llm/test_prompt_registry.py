@@ -0,0 +1,64 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from app.shared.llm.prompt_registry import PromptRegistry, assign_bucket, parse_variant_weights
+
+
+def test_parse_variant_weights():
+    assert parse_variant_weights("consult=v1:90|v2:10, converter=v1:1") == {
+        "consult": {"v1": 90.0, "v2": 10.0},
+        "converter": {"v1": 1.0},
+    }
+    assert parse_variant_weights("") == {}
+
+
+@pytest.mark.parametrize("spec", ["consult", "consult=v1", "consult=v1:abc", "=v1:1"])
+def test_parse_variant_weights_rejects_bad_format(spec):
+    with pytest.raises(ValueError):
+        parse_variant_weights(spec)
+
+
+def test_assignment_is_deterministic_and_follows_weights():
+    """같은 subject는 항상 같은 버전이고, 버전별 배정 비율은 설정 비율을 따른다"""
+    registry = PromptRegistry("test", {"v1": "a", "v2": "b"}, {"v1": 80, "v2": 20})
+
+    assignments = [registry.assign(f"user-{i}").version for i in range(5000)]
+
+    assert assignments == [registry.assign(f"user-{i}").version for i in range(5000)]
+    assert 0.17 < assignments.count("v2") / len(assignments) < 0.23
+
+
+def test_assignment_is_independent_per_prompt_name():
+    """묶음 이름을 섞어 해시하므로 묶음마다 다른 사용자 집합이 배정된다"""
+    assert assign_bucket("consult", "user-1") != assign_bucket("converter", "user-1")
+
+
+def test_default_version_without_weights():
+    """비율 설정이 없으면 모두 첫 버전(기본)을 받는다"""
+    registry = PromptRegistry("test", {"v1": "a", "v2": "b"})
+
+    assert {registry.assign(f"user-{i}").version for i in range(100)} == {"v1"}
+    assert registry.default.prompts == "a"
+    assert registry.get("v2").label == "test:v2"
+
+
+def test_zero_weight_version_is_not_assigned():
+    registry = PromptRegistry("test", {"v1": "a", "v2": "b"}, {"v1": 0, "v2": 1})
+
+    assert {registry.assign(f"user-{i}").version for i in range(100)} == {"v2"}
+
+
+@pytest.mark.parametrize("weights", [{"v3": 1}, {"v1": 0}, {"v1": -1, "v2": 2}])
+def test_invalid_weights_are_rejected(weights):
+    with pytest.raises(ValueError):
+        PromptRegistry("test", {"v1": "a", "v2": "b"}, weights)
+
+
+def test_record_stage_counts_per_version():
+    registry = PromptRegistry("test.stage", {"v1": "a"})
+    labels = {"prompt": "test.stage", "version": "v1", "stage": "started"}
+    before = REGISTRY.get_sample_value("prompt_variant_sessions_total", labels) or 0.0
+
+    registry.record_stage(registry.default, "started")
+
+    assert REGISTRY.get_sample_value("prompt_variant_sessions_total", labels) == before + 1
@@ -0,0 +1,24 @@
+from app.shared.llm.token_estimator import (
+    TOKENS_PER_MESSAGE,
+    TOKENS_PER_REPLY,
+    estimate_message_tokens,
+    estimate_tokens,
+)
+
+
+def test_estimate_tokens_counts_korean_per_character():
+    """한글은 글자마다 1토큰, 공백은 세지 않는다"""
+    assert estimate_tokens("안녕 하세요") == 5
+
+
+def test_estimate_tokens_groups_ascii_words():
+    """영문/숫자는 4글자당 1토큰, 구두점은 1토큰으로 센다"""
+    assert estimate_tokens("hello world!") == 3 + 1
+    assert estimate_tokens("") == 0
+
+
+def test_estimate_message_tokens_adds_chat_overhead():
+    """메시지당 오버헤드와 응답 시작 토큰을 더한다"""
+    messages = [{"role": "system", "content": "상담사"}, {"role": "user", "content": "안녕"}]
+
+    assert estimate_message_tokens(messages) == TOKENS_PER_REPLY + 2 * TOKENS_PER_MESSAGE + 3 + 2
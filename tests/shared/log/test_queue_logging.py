@@ -0,0 +1,87 @@
+import io
+import json
+import logging
+import queue
+
+import pytest
+
+from app.shared.log.queue_logging import (
+    DroppingQueueHandler,
+    configure_logging,
+    parse_log_levels,
+    shutdown_logging,
+)
+from app.shared.tracing.tracer import Trace, end_trace, span, start_trace
+
+
+@pytest.fixture
+def output():
+    stream = io.StringIO()
+    root_level = logging.getLogger().level
+    yield stream
+    shutdown_logging()
+    logging.getLogger().setLevel(root_level)
+    logging.getLogger("tests.noisy").setLevel(logging.NOTSET)
+
+
+def _lines(stream: io.StringIO) -> list[dict]:
+    shutdown_logging()  # 큐에 남은 레코드를 모두 쓴다
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_records_are_written_as_json_with_request_context(output):
+    """요청 처리 중 남긴 로그에는 request_id, trace_id, span_id가 붙는다"""
+    configure_logging(stream=output)
+    trace = Trace("GET /items", request_id="req-1")
+    start_trace(trace)
+    try:
+        with span("db.item.find") as current:
+            logging.getLogger("tests.app").info("found %s", "item", extra={"item_id": 7})
+    finally:
+        end_trace()
+    logging.getLogger("tests.app").warning("outside")
+
+    inside, outside = _lines(output)
+    assert inside["msg"] == "found item"
+    assert inside["level"] == "INFO"
+    assert inside["logger"] == "tests.app"
+    assert inside["item_id"] == 7
+    assert (inside["request_id"], inside["trace_id"], inside["span_id"]) == ("req-1", trace.trace_id, current.span_id)
+    assert "request_id" not in outside
+
+
+def test_exception_is_formatted_before_crossing_threads(output):
+    configure_logging(stream=output)
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logging.getLogger("tests.app").exception("failed")
+
+    (line,) = _lines(output)
+    assert line["msg"] == "failed"
+    assert "RuntimeError: boom" in line["exc"]
+
+
+def test_module_levels_override_root_level(output):
+    configure_logging(level="INFO", module_levels="tests.noisy=WARNING", stream=output)
+    logging.getLogger("tests.noisy").info("hidden")
+    logging.getLogger("tests.noisy").warning("shown")
+    logging.getLogger("tests.app").info("shown too")
+
+    assert [line["msg"] for line in _lines(output)] == ["shown", "shown too"]
+
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+    record = logging.LogRecord("tests", logging.INFO, __file__, 1, "msg", None, None)
+
+    handler.emit(record)
+    handler.emit(record)
+
+    assert handler.dropped == 1
+
+
+def test_parse_log_levels_rejects_unknown_level():
+    assert parse_log_levels("httpx=warning, app.consult=DEBUG") == {"httpx": "WARNING", "app.consult": "DEBUG"}
+    with pytest.raises(ValueError):
+        parse_log_levels("httpx=LOUD")
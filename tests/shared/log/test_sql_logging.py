@@ -0,0 +1,38 @@
+import logging
+import random
+
+from sqlalchemy import create_engine, text
+
+from app.shared.log.sql_logging import SqlStatementLogger
+
+LOGGER = "app.shared.log.sql_logging"
+
+
+def _run(statement_logger: SqlStatementLogger, caplog, statements: int = 1) -> list[logging.LogRecord]:
+    engine = create_engine("sqlite:///:memory:")
+    statement_logger.install(engine)
+    with caplog.at_level(logging.INFO, logger=LOGGER):
+        with engine.connect() as conn:
+            for _ in range(statements):
+                conn.execute(text("SELECT   1"))
+    engine.dispose()
+    return [r for r in caplog.records if r.name == LOGGER]
+
+
+def test_slow_statement_is_logged_as_warning(caplog):
+    (record,) = _run(SqlStatementLogger(slow_ms=0), caplog)
+
+    assert record.levelno == logging.WARNING
+    assert record.statement == "SELECT 1"
+    assert record.duration_ms >= 0
+
+
+def test_fast_statement_is_not_logged_without_sampling(caplog):
+    assert _run(SqlStatementLogger(slow_ms=10_000), caplog, statements=5) == []
+
+
+def test_sampled_statements_are_logged_at_info(caplog):
+    records = _run(SqlStatementLogger(slow_ms=10_000, sample_rate=0.5, rng=random.Random(1)), caplog, statements=20)
+
+    assert 0 < len(records) < 20
+    assert all(r.levelno == logging.INFO for r in records)
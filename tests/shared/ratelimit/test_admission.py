@@ -0,0 +1,113 @@
+from unittest.mock import patch
+
+import pytest
+from fastapi import Depends, FastAPI, Header
+from fastapi.testclient import TestClient
+
+from app.shared.ratelimit.admission_controller import (
+    AdmissionController,
+    RateLimit,
+    parse_endpoint_limits,
+    retry_after_seconds,
+)
+from app.shared.ratelimit.admission_dependency import client_address, require_admission
+from app.shared.ratelimit.memory_token_bucket_backend import MemoryTokenBucketBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _controller(clock, **limits) -> AdmissionController:
+    return AdmissionController(MemoryTokenBucketBackend(clock=clock), burst_seconds=1, **limits)
+
+
+def test_user_limit_is_per_subject():
+    controller = _controller(FakeClock(), user_limit=RateLimit(requests_per_minute=60))
+
+    assert controller.admit("consult.message", "user-a", 1, 0) == 0
+    assert controller.admit("consult.message", "user-a", 1, 0) == 1
+    assert controller.admit("consult.message", "user-b", 1, 0) == 0
+
+
+def test_global_token_limit_applies_to_all_users():
+    controller = _controller(FakeClock(), global_limit=RateLimit(tokens_per_minute=6000))
+
+    assert controller.admit("consult.message", "user-a", 1, 100) == 0
+    assert controller.admit("consult.message", "user-b", 1, 50) == 0.5
+
+
+def test_endpoint_limit_only_applies_to_that_endpoint():
+    controller = _controller(FakeClock(), endpoint_limits={"converter.convert_three_tones": RateLimit(180)})
+
+    assert controller.admit("converter.convert_three_tones", "ip", 3, 0) == 0
+    assert controller.admit("converter.convert_three_tones", "ip", 3, 0) == 1
+    assert controller.admit("consult.message", "ip", 1, 0) == 0
+
+
+def test_parse_endpoint_limits():
+    assert parse_endpoint_limits("consult.message=600:400000, converter.convert=120") == {
+        "consult.message": RateLimit(600, 400000),
+        "converter.convert": RateLimit(120, 0),
+    }
+    assert parse_endpoint_limits("") == {}
+    with pytest.raises(ValueError):
+        parse_endpoint_limits("consult.message")
+
+
+def test_retry_after_is_positive_whole_seconds():
+    assert retry_after_seconds(0.2) == 1
+    assert retry_after_seconds(2.1) == 3
+    assert retry_after_seconds(float("inf")) == 60
+
+
+def test_client_address_uses_proxy_appended_address():
+    class FakeRequest:
+        headers = {"x-forwarded-for": "10.0.0.1, 203.0.113.7"}
+        client = None
+
+    assert client_address(FakeRequest()) == "203.0.113.7"
+
+
+@pytest.fixture
+def client():
+    """입장 제어 의존성을 단 테스트 앱 (사용자 키는 X-User 헤더)"""
+
+    def subject(x_user: str = Header(default="anonymous")) -> str:
+        return x_user
+
+    app = FastAPI()
+
+    @app.post("/llm", dependencies=[Depends(require_admission("test.llm", base_tokens=10, subject=subject))])
+    def call_llm():
+        return {"ok": True}
+
+    controller = _controller(FakeClock(), user_limit=RateLimit(requests_per_minute=60))
+    with patch("app.shared.ratelimit.admission_dependency.get_admission_controller", return_value=controller):
+        yield TestClient(app)
+
+
+def test_over_limit_request_gets_429_with_retry_after(client):
+    assert client.post("/llm", headers={"X-User": "a"}).status_code == 200
+
+    response = client.post("/llm", headers={"X-User": "a"})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    assert client.post("/llm", headers={"X-User": "b"}).status_code == 200
+
+
+def test_disabled_admission_lets_everything_through():
+    app = FastAPI()
+
+    @app.post("/llm", dependencies=[Depends(require_admission("test.llm"))])
+    def call_llm():
+        return {"ok": True}
+
+    with patch("app.shared.ratelimit.admission_dependency.get_admission_controller", return_value=None):
+        client = TestClient(app)
+        assert all(client.post("/llm").status_code == 200 for _ in range(5))
@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.shared.ratelimit.rate_limit_bucket_model import RateLimitBucketModel
+from app.shared.ratelimit.sql_token_bucket_backend import SqlTokenBucketBackend
+from app.shared.ratelimit.token_bucket import BucketSpec
+from config.database import Base
+
+
+@pytest.fixture
+def session_factory():
+    """테스트용 SQLite 세션 팩토리"""
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine, tables=[RateLimitBucketModel.__table__])
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def test_buckets_are_shared_between_backend_instances(session_factory):
+    """같은 DB를 쓰는 인스턴스끼리 같은 버킷을 나눠 쓴다"""
+    now = [1000.0]
+    first = SqlTokenBucketBackend(session_factory, clock=lambda: now[0])
+    second = SqlTokenBucketBackend(session_factory, clock=lambda: now[0])
+    spec = BucketSpec("global:requests", capacity=2, refill_per_second=1)
+
+    assert first.acquire([(spec, 1)]) == 0
+    assert second.acquire([(spec, 1)]) == 0
+    assert first.acquire([(spec, 1)]) == 1
+
+    now[0] += 1
+    assert second.acquire([(spec, 1)]) == 0
+
+
+def test_rejection_does_not_consume_other_buckets(session_factory):
+    backend = SqlTokenBucketBackend(session_factory, clock=lambda: 1000.0)
+    roomy = BucketSpec("global:requests", capacity=10, refill_per_second=1)
+    tight = BucketSpec("user:a:requests", capacity=1, refill_per_second=1)
+
+    assert backend.acquire([(roomy, 1), (tight, 1)]) == 0
+    assert backend.acquire([(roomy, 1), (tight, 1)]) == 1
+
+    db = session_factory()
+    assert db.get(RateLimitBucketModel, "global:requests").tokens == 9
+    db.close()
+
+
+def test_database_error_fails_open():
+    """버킷 테이블을 쓸 수 없으면 요청을 막지 않는다"""
+    engine = create_engine("sqlite:///:memory:")
+    backend = SqlTokenBucketBackend(sessionmaker(bind=engine))
+
+    assert backend.acquire([(BucketSpec("global:requests", capacity=1, refill_per_second=1), 1)]) == 0
@@ -0,0 +1,75 @@
+import math
+
+from app.shared.ratelimit.memory_token_bucket_backend import MemoryTokenBucketBackend
+from app.shared.ratelimit.token_bucket import BucketSpec, BucketState, plan_acquire
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_new_bucket_starts_full():
+    spec = BucketSpec("user:a", capacity=10, refill_per_second=1)
+
+    updated, wait = plan_acquire([(spec, 4)], {}, now=0)
+
+    assert wait == 0
+    assert updated == {"user:a": BucketState(6, 0)}
+
+
+def test_rejection_reports_wait_for_slowest_bucket_and_takes_nothing():
+    """모자란 버킷이 있으면 아무것도 차감하지 않고, 가장 늦게 차는 버킷 기준으로 기다린다"""
+    fast = BucketSpec("fast", capacity=10, refill_per_second=10)
+    slow = BucketSpec("slow", capacity=10, refill_per_second=1)
+    states = {"fast": BucketState(0, 0), "slow": BucketState(7, 0)}
+
+    updated, wait = plan_acquire([(fast, 5), (slow, 10)], states, now=0)
+
+    assert updated == {}
+    assert wait == 3
+
+
+def test_cost_above_capacity_passes_when_bucket_is_full():
+    spec = BucketSpec("global", capacity=5, refill_per_second=1)
+
+    updated, wait = plan_acquire([(spec, 50)], {}, now=0)
+
+    assert wait == 0
+    assert updated["global"].tokens == 0
+
+
+def test_bucket_without_refill_waits_forever():
+    spec = BucketSpec("closed", capacity=1, refill_per_second=0)
+
+    _, wait = plan_acquire([(spec, 1)], {"closed": BucketState(0, 0)}, now=100)
+
+    assert math.isinf(wait)
+
+
+def test_memory_backend_refills_over_time():
+    clock = FakeClock()
+    backend = MemoryTokenBucketBackend(clock=clock)
+    spec = BucketSpec("user:a", capacity=2, refill_per_second=1)
+
+    assert backend.acquire([(spec, 1)]) == 0
+    assert backend.acquire([(spec, 1)]) == 0
+    assert backend.acquire([(spec, 1)]) == 1
+
+    clock.now += 1
+    assert backend.acquire([(spec, 1)]) == 0
+
+
+def test_memory_backend_evicts_full_buckets_beyond_max_keys():
+    clock = FakeClock()
+    backend = MemoryTokenBucketBackend(clock=clock, max_keys=2)
+    for user in ("a", "b"):
+        backend.acquire([(BucketSpec(f"user:{user}", capacity=1, refill_per_second=1), 1)])
+
+    clock.now += 10
+    backend.acquire([(BucketSpec("user:c", capacity=1, refill_per_second=1), 1)])
+
+    assert set(backend._states) == {"user:c"}
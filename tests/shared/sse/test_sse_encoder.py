@@ -0,0 +1,23 @@
+from app.shared.sse.sse_encoder import encode_sse_event
+
+
+def test_encode_plain_data():
+    """data 필드 하나와 빈 줄로 이벤트를 끝낸다"""
+    assert encode_sse_event("안녕") == "data: 안녕\n\n"
+
+
+def test_encode_id_event_and_retry():
+    """id, event, retry 필드를 data 앞에 붙인다"""
+    assert encode_sse_event("x", event_id=3, event="done", retry_ms=1000) == (
+        "id: 3\nevent: done\nretry: 1000\ndata: x\n\n"
+    )
+
+
+def test_multiline_data_is_split_into_data_lines():
+    """줄바꿈(\\n, \\r\\n, \\r)마다 data 줄을 나눠 이벤트 경계를 지킨다"""
+    assert encode_sse_event("a\nb\r\nc\rd") == "data: a\ndata: b\ndata: c\ndata: d\n\n"
+
+
+def test_trailing_newline_is_preserved():
+    """끝의 줄바꿈도 빈 data 줄로 보존된다"""
+    assert encode_sse_event("a\n") == "data: a\ndata: \n\n"
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from app.shared.tracing.tracer import Trace, current_trace, end_trace, span, start_trace, traced
+
+
+@pytest.fixture
+def trace():
+    trace = Trace("GET /test")
+    start_trace(trace)
+    yield trace
+    end_trace()
+
+
+def test_span_is_noop_without_trace():
+    """진행 중인 Trace가 없으면 span/traced는 아무것도 기록하지 않는다"""
+    @traced("db.noop")
+    def work():
+        return 1
+
+    with span("noop") as s:
+        assert s is None
+    assert work() == 1
+    assert current_trace() is None
+
+
+def test_nested_spans_record_parent(trace):
+    """안쪽 span은 바깥 span을 부모로 기록한다"""
+    @traced("db.inner")
+    def inner():
+        return "ok"
+
+    with span("usecase.outer"):
+        inner()
+
+    outer, inner_span = trace.spans
+    assert outer.parent_id == trace.root.span_id
+    assert inner_span.parent_id == outer.span_id
+    assert inner_span.end_ns is not None
+
+
+def test_traced_supports_coroutines_threads_and_async_generators(trace):
+    """코루틴, 스레드풀 호출, 비동기 제너레이터 모두 같은 Trace에 기록된다"""
+    @traced("db.sync")
+    def blocking():
+        return 1
+
+    @traced("llm.stream")
+    async def stream():
+        for i in range(2):
+            yield i
+
+    @traced("usecase.run")
+    async def run():
+        await asyncio.to_thread(blocking)
+        return [item async for item in stream()]
+
+    assert asyncio.run(run()) == [0, 1]
+
+    names = {s.name: s for s in trace.spans}
+    assert set(names) == {"usecase.run", "db.sync", "llm.stream"}
+    assert names["db.sync"].parent_id == names["usecase.run"].span_id
+
+
+def test_span_records_error_type(trace):
+    """예외가 난 span은 예외 타입을 기록하고 예외를 그대로 전파한다"""
+    with pytest.raises(KeyError):
+        with span("db.fail"):
+            raise KeyError("x")
+
+    assert trace.spans[0].error == "KeyError"
+
+
+def test_server_timing_sums_spans_by_name(trace):
+    """Server-Timing은 같은 이름의 span을 합산하고 마지막에 total을 붙인다"""
+    for _ in range(2):
+        with span("db.consult.find_by_id"):
+            pass
+    with span("llm.generate_response"):
+        pass
+    trace.finish()
+
+    entries = [entry.split(";")[0] for entry in trace.server_timing().split(", ")]
+
+    assert entries == ["db.consult.find_by_id", "llm.generate_response", "total"]
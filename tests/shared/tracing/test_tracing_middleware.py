@@ -0,0 +1,78 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.shared.tracing.jsonl_trace_exporter import JsonlTraceExporter
+from app.shared.tracing.tracer import span, traced
+from app.shared.tracing.tracing_middleware import TracingMiddleware
+
+
+@traced("db.item.find_by_id")
+def _find(item_id: str) -> dict:
+    return {"id": item_id}
+
+
+def _app(sample_rate: float, exporter=None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: str):
+        with span("auth.session"):
+            pass
+        return _find(item_id)
+
+    app.add_middleware(TracingMiddleware, sample_rate=sample_rate, exporter=exporter)
+    return app
+
+
+def test_response_carries_server_timing_header():
+    """응답에 구간별 소요 시간이 Server-Timing 헤더로 붙는다"""
+    client = TestClient(_app(sample_rate=0.0))
+
+    response = client.get("/items/1")
+
+    names = [entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")]
+    assert names == ["auth.session", "db.item.find_by_id", "total"]
+
+
+def test_sampled_trace_is_exported_as_otlp_json(tmp_path):
+    """샘플링된 요청은 라우트 템플릿 이름의 OTLP JSON 한 줄로 내보낸다"""
+    path = tmp_path / "traces.jsonl"
+    client = TestClient(_app(sample_rate=1.0, exporter=JsonlTraceExporter(str(path))))
+
+    client.get("/items/1")
+
+    line = json.loads(path.read_text().splitlines()[0])
+    spans = line["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    root = spans[0]
+    assert root["name"] == "GET /items/{item_id}"
+    assert root["kind"] == 2
+    assert {s["name"] for s in spans[1:]} == {"auth.session", "db.item.find_by_id"}
+    assert all(s["parentSpanId"] == root["spanId"] for s in spans[1:])
+    assert len(root["traceId"]) == 32
+
+
+def test_traceparent_sampled_flag_forces_export(tmp_path):
+    """traceparent 헤더가 sampled면 샘플링 비율과 상관없이 그 trace_id로 내보낸다"""
+    path = tmp_path / "traces.jsonl"
+    client = TestClient(_app(sample_rate=0.0, exporter=JsonlTraceExporter(str(path))))
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+    client.get("/items/1", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"})
+    client.get("/items/2")
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"][0]["traceId"] == trace_id
+
+
+def test_request_id_header_is_echoed_or_generated():
+    """X-Request-ID를 보내면 그대로, 없으면 trace_id를 요청 id로 돌려준다"""
+    client = TestClient(_app(sample_rate=0.0))
+
+    given = client.get("/items/1", headers={"X-Request-ID": "req-123"})
+    generated = client.get("/items/1")
+
+    assert given.headers["x-request-id"] == "req-123"
+    assert len(generated.headers["x-request-id"]) == 32
@@ -138,3 +138,59 @@ def test_get_profile_user_not_found_returns_404(client, session_repo):
 
     assert response.status_code == 404
 
+
+
+def test_profile_uses_request_scoped_db_session(app, session_repo):
+    """저장소가 주입되지 않으면 요청마다 새 DB 세션으로 저장소를 만들고 요청 후 닫는다"""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.pool import StaticPool
+
+    from app.user.adapter.input.web import user_router as router_module
+    from app.auth.adapter.input.web import auth_dependency
+    from app.user.infrastructure.model.user_model import UserModel
+    from config.database import Base, get_db
+
+    # Given: 인메모리 DB와 요청마다 세션을 여는 get_db
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(bind=engine)
+    with SessionLocal() as db:
+        db.add(UserModel(id="user-123", email="test@example.com"))
+        db.commit()
+
+    opened, closed = [], []
+
+    def override_get_db():
+        db = SessionLocal()
+        opened.append(db)
+        try:
+            yield db
+        finally:
+            closed.append(db)
+            db.close()
+
+    router_module._user_repository = None
+    auth_dependency._session_repository = session_repo
+    session_repo.save(Session(session_id="valid-session", user_id="user-123"))
+    app.dependency_overrides[get_db] = override_get_db
+    client = TestClient(app)
+
+    # When: 프로필 저장 후 조회하면
+    put_response = client.put(
+        "/user/profile",
+        headers={"Authorization": "Bearer valid-session"},
+        json={"mbti": "enfp", "gender": "female"},
+    )
+    get_response = client.get("/user/profile", headers={"Authorization": "Bearer valid-session"})
+
+    # Then: DB에 반영되고, 요청마다 세션을 하나씩 열고 닫는다
+    assert put_response.status_code == 200
+    assert get_response.json()["mbti"] == "ENFP"
+    assert len(opened) == 2
+    assert opened[0] is not opened[1]
+    assert closed == opened